@@ -30,8 +30,8 @@ setup(
     ],
     package_data={
         '': ['*.pyi'],
-        'vital_ai_vitalsigns': ['models/**'],
-        'vital_ai_vitalsigns_core': ['vital-ontology/*.owl']
+        'vital_ai_vitalsigns': ['models/**', 'vitalsigns_manifest.json'],
+        'vital_ai_vitalsigns_core': ['vital-ontology/*.owl', 'vitalsigns_manifest.json']
     },
     license='Apache License 2.0',
     install_requires=[
@@ -49,6 +49,7 @@ setup(
         'SPARQLWrapper==2.0.0',
         'pyshacl==0.25.0',
         'requests>=2.31.0',
+        'aiohttp>=3.12.0',
         'PyODBC>=5.1.0',
         'onnxruntime>=1.18.0',
         'onnx>=1.16.1',
@@ -0,0 +1,161 @@
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+from rdflib import Dataset, URIRef
+
+_VALUES_PATTERN = re.compile(r'VALUES\s+\?(\w+)\s*\{([^}]*)\}')
+
+_EMPTY_RDF_XML = b'<?xml version="1.0" encoding="utf-8"?>\n' \
+                 b'<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"/>\n'
+
+
+def _echo_values_result(query: str) -> bytes:
+    # every value of a VALUES clause is reported as a match
+    if query.lstrip().upper().startswith('ASK') or ' ASK ' in f" {query.upper()} ":
+        return json.dumps({"head": {}, "boolean": True}).encode('utf-8')
+
+    bindings = []
+
+    match = _VALUES_PATTERN.search(query)
+
+    if match:
+        variable = match.group(1)
+        for uri in re.findall(r'<([^>]*)>', match.group(2)):
+            bindings.append({variable: {"type": "uri", "value": uri}})
+
+    return json.dumps({"head": {"vars": []}, "results": {"bindings": bindings}}).encode('utf-8')
+
+
+class LocalSparqlEndpoint:
+    """Local stand-in for the Virtuoso SPARQL and graph CRUD endpoints.
+
+    Serves /sparql-auth and /sparql-graph-crud-auth under its endpoint URL
+    so a VirtuosoGraphService can be pointed at it, and counts requests so
+    benchmarks can report round trips.
+
+    With execute=True requests run against an rdflib Dataset, which checks
+    the generated SPARQL but is far too slow on VALUES updates to time.
+    With execute=False requests are answered without doing any work after
+    a fixed latency: updates succeed, ASK is true and SELECT reports every
+    value of a VALUES clause as a match.
+
+    The first overloaded_responses requests are answered with a 503, to
+    exercise client retries.
+    """
+
+    def __init__(self, *, execute: bool = True, latency: float = 0.0, overloaded_responses: int = 0):
+        self.dataset = Dataset()
+        self.execute = execute
+        self.latency = latency
+        self.overloaded_responses = overloaded_responses
+        self.lock = threading.Lock()
+        self.request_count = 0
+
+        endpoint = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            protocol_version = "HTTP/1.1"
+
+            # headers and body are written separately, avoid delayed ack stalls on keep-alive
+            disable_nagle_algorithm = True
+
+            def log_message(self, format, *args):
+                pass
+
+            def send_body(self, status: int, content_type: str, body: bytes):
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def read_body(self) -> bytes:
+                length = int(self.headers.get('Content-Length', 0))
+                body = self.rfile.read(length)
+                with endpoint.lock:
+                    endpoint.request_count += 1
+                if endpoint.latency:
+                    time.sleep(endpoint.latency)
+                return body
+
+            def overloaded(self) -> bool:
+                with endpoint.lock:
+                    if endpoint.overloaded_responses <= 0:
+                        return False
+                    endpoint.overloaded_responses -= 1
+                self.send_body(503, 'text/plain', b'overloaded')
+                return True
+
+            def do_POST(self):
+                form = parse_qs(self.read_body().decode('utf-8'))
+
+                if self.overloaded():
+                    return
+
+                if not endpoint.execute:
+                    if 'update' in form:
+                        self.send_body(200, 'text/plain', b'')
+                    elif 'CONSTRUCT' in form['query'][0].upper():
+                        self.send_body(200, 'application/rdf+xml', _EMPTY_RDF_XML)
+                    else:
+                        self.send_body(200, 'application/sparql-results+json', _echo_values_result(form['query'][0]))
+                    return
+
+                try:
+                    with endpoint.lock:
+
+                        if 'update' in form:
+                            endpoint.dataset.update(form['update'][0])
+                            self.send_body(200, 'text/plain', b'')
+                            return
+
+                        result = endpoint.dataset.query(form['query'][0])
+
+                        if result.type == 'CONSTRUCT' and 'n-triples' in self.headers.get('Accept', ''):
+                            self.send_body(200, 'application/n-triples', result.serialize(format='nt'))
+                        elif result.type == 'CONSTRUCT':
+                            self.send_body(200, 'application/rdf+xml', result.serialize(format='xml'))
+                        else:
+                            self.send_body(200, 'application/sparql-results+json', result.serialize(format='json'))
+
+                except Exception as e:
+                    self.send_body(500, 'text/plain', str(e).encode('utf-8'))
+
+            def graph_uri(self) -> URIRef:
+                return URIRef(parse_qs(urlparse(self.path).query)['graph-uri'][0])
+
+            def do_PUT(self):
+                body = self.read_body()
+                if self.overloaded():
+                    return
+                if endpoint.execute:
+                    with endpoint.lock:
+                        graph = endpoint.dataset.graph(self.graph_uri())
+                        graph.remove((None, None, None))
+                        graph.parse(data=body.decode('utf-8'), format='nt')
+                self.send_body(201, 'text/plain', b'')
+
+            def do_DELETE(self):
+                self.read_body()
+                if self.overloaded():
+                    return
+                if endpoint.execute:
+                    with endpoint.lock:
+                        endpoint.dataset.remove_graph(self.graph_uri())
+                self.send_body(200, 'text/plain', b'')
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+
+        self.endpoint = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def start(self) -> 'LocalSparqlEndpoint':
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
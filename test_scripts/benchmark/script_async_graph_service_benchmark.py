@@ -0,0 +1,152 @@
+import asyncio
+import json
+import logging
+import multiprocessing
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs
+from vital_ai_vitalsigns.config.vitalsigns_config import GraphDatabaseConfig
+from vital_ai_vitalsigns.service.graph.virtuoso.async_virtuoso_service import AsyncVirtuosoGraphService
+from vital_ai_vitalsigns.service.graph.virtuoso.virtuoso_service import VirtuosoGraphService
+from vital_ai_vitalsigns.vitalsigns import VitalSigns
+
+_VALUES_PATTERN = re.compile(r'VALUES\s+\?s\s*\{\s*<([^>]*)>')
+
+
+# endpoint latency in seconds
+LATENCY = 0.01
+
+
+def node_result(query: str) -> dict:
+    # ASK is always true, a VALUES select gets the triples of a node for the uri
+
+    match = _VALUES_PATTERN.search(query)
+
+    if match is None:
+        return {"head": {}, "boolean": True}
+
+    uri = match.group(1)
+
+    s = {"type": "uri", "value": uri}
+
+    return {"head": {"vars": ["s", "p", "o"]}, "results": {"bindings": [
+        {"s": s,
+         "p": {"type": "uri", "value": "http://www.w3.org/1999/02/22-rdf-syntax-ns#type"},
+         "o": {"type": "uri", "value": "http://vital.ai/ontology/vital-core#VITAL_Node"}},
+        {"s": s,
+         "p": {"type": "uri", "value": "http://vital.ai/ontology/vital-core#hasName"},
+         "o": {"type": "literal", "value": uri.rsplit('/', 1)[-1]}}
+    ]}}
+
+
+async def handle_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    # minimal keep-alive HTTP/1.1, enough for the sparql POSTs of the services
+    try:
+        while True:
+            header = await reader.readuntil(b'\r\n\r\n')
+
+            length = 0
+
+            for line in header.split(b'\r\n'):
+                if line.lower().startswith(b'content-length:'):
+                    length = int(line.split(b':', 1)[1])
+
+            form = parse_qs((await reader.readexactly(length)).decode('utf-8'))
+
+            await asyncio.sleep(LATENCY)
+
+            body = json.dumps(node_result(form['query'][0])).encode('utf-8')
+
+            writer.write(b'HTTP/1.1 200 OK\r\n'
+                         b'Content-Type: application/sparql-results+json\r\n'
+                         b'Content-Length: ' + str(len(body)).encode('ascii') + b'\r\n\r\n' + body)
+
+            await writer.drain()
+
+    except (asyncio.IncompleteReadError, ConnectionError):
+        writer.close()
+
+
+def serve(port_queue):
+    # separate process so the endpoint does not share the client's GIL
+
+    async def run():
+        server = await asyncio.start_server(handle_connection, "127.0.0.1", 0, backlog=1024)
+        port_queue.put(server.sockets[0].getsockname()[1])
+        await server.serve_forever()
+
+    asyncio.run(run())
+
+
+def get_threaded(service: VirtuosoGraphService, graph_id: str, uri_list: list, workers: int) -> list:
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda uri: service.get_object(uri, graph_id=graph_id), uri_list))
+
+
+async def get_async(service: AsyncVirtuosoGraphService, graph_id: str, uri_list: list) -> list:
+    return await asyncio.gather(*(service.get_object(uri, graph_id=graph_id) for uri in uri_list))
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+
+    vs = VitalSigns()
+
+    count = 1_000
+
+    connections = 64
+
+    port_queue = multiprocessing.Queue()
+
+    server_process = multiprocessing.Process(target=serve, args=(port_queue,), daemon=True)
+    server_process.start()
+
+    config = GraphDatabaseConfig(database_type="virtuoso",
+                                 endpoint=f"http://127.0.0.1:{port_queue.get()}",
+                                 pool_size=connections)
+
+    graph_id = "async-benchmark"
+
+    uri_list = [f"http://vital.ai/test/node/{i}" for i in range(count)]
+
+    logging.info(f"{count} concurrent get_object calls, {connections} connections, "
+                 f"{LATENCY * 1000:.0f} ms endpoint latency")
+
+    service = VirtuosoGraphService(config, base_uri="http://vital.ai", namespace="benchmark")
+
+    start = time.perf_counter()
+    threaded_list = get_threaded(service, graph_id, uri_list, connections)
+    elapsed = time.perf_counter() - start
+
+    logging.info(f"thread pool: {elapsed:.2f} s, {count / elapsed:.0f} objects/s, "
+                 f"{service.rest_manager.get_request_count()} requests")
+
+    service.rest_manager.close()
+
+    async def run_async():
+
+        async_service = AsyncVirtuosoGraphService(config, base_uri="http://vital.ai", namespace="benchmark")
+
+        start = time.perf_counter()
+        object_list = await get_async(async_service, graph_id, uri_list)
+        elapsed = time.perf_counter() - start
+
+        logging.info(f"asyncio: {elapsed:.2f} s, {count / elapsed:.0f} objects/s, "
+                     f"{async_service.rest_manager.get_request_count()} requests")
+
+        await async_service.close()
+
+        return object_list
+
+    async_list = asyncio.run(run_async())
+
+    assert [o.to_json() for o in async_list] == [o.to_json() for o in threaded_list]
+
+    assert str(async_list[7].name) == "7"
+
+    server_process.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+import logging
+import time
+from vital_ai_vitalsigns.model.GraphObject import GraphObject
+from vital_ai_vitalsigns.model.VITAL_Node import VITAL_Node
+from vital_ai_vitalsigns.model.utils.graphobject_json_utils import GraphObjectJsonUtils
+from vital_ai_vitalsigns.vitalsigns import VitalSigns
+
+
+def time_loop(label, iterations, fn):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    elapsed = time.perf_counter() - start
+    per_call = elapsed / iterations * 1_000_000
+    logging.info(f"{label}: {per_call:.3f} us per object")
+    return per_call
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+
+    vs = VitalSigns()
+
+    iterations = 50_000
+
+    node = VITAL_Node()
+    node.URI = 'urn:node1'
+    node.name = 'Node'
+    node.timestamp = 1234567890
+    node.active = True
+
+    json_string = node.to_json()
+    property_map = GraphObjectJsonUtils.to_property_map(node.to_dict())
+
+    # per-property setattr as done by the deserializers before the bulk factory
+    before = time_loop("property map (setattr)", iterations,
+                       lambda: VITAL_Node.from_property_map(property_map, trusted=False))
+    after = time_loop("property map (trusted)", iterations,
+                      lambda: VITAL_Node.from_property_map(property_map))
+
+    logging.info(f"property map speedup: {before / after:.1f}x")
+
+    time_loop("from_json", iterations, lambda: GraphObject.from_json(json_string))
+
+    triples = node.to_triples()
+
+    time_loop("from_triples", iterations // 10, lambda: GraphObject.from_triples(triples))
+
+
+if __name__ == "__main__":
+    main()
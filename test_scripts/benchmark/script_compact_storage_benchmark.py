@@ -0,0 +1,69 @@
+import gc
+import logging
+import tracemalloc
+from vital_ai_vitalsigns.vitalsigns import VitalSigns
+from vital_ai_vitalsigns_generate.generate.class_generator import VitalSignsClassGenerator
+
+
+def generate_node_class(class_name: str, compact: bool):
+
+    class_string = VitalSignsClassGenerator.generate_class_string(
+        'vital_ai_vitalsigns.model.VITAL_Node',
+        'VITAL_Node',
+        class_name,
+        'http://vital.ai/ontology/vital-core#VITAL_Node',
+        [],
+        compact=compact)
+
+    namespace = {}
+    exec(class_string, namespace)
+    return namespace[class_name]
+
+
+def measure_bytes_per_object(node_class, count: int) -> float:
+
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+
+    node_list = []
+
+    for i in range(count):
+        node = node_class()
+        node.URI = f'urn:node:{i}'
+        node.name = f'Node {i}'
+        node.timestamp = i
+        node.active = True
+        node_list.append(node)
+
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return (after - before) / count
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+
+    vs = VitalSigns()
+
+    count = 100_000
+
+    default_class = generate_node_class('BenchmarkNode', compact=False)
+    compact_class = generate_node_class('CompactBenchmarkNode', compact=True)
+
+    default_bytes = measure_bytes_per_object(default_class, count)
+    compact_bytes = measure_bytes_per_object(compact_class, count)
+
+    logging.info(f"default storage: {default_bytes:.0f} bytes per object")
+    logging.info(f"compact storage: {compact_bytes:.0f} bytes per object")
+    logging.info(f"reduction: {default_bytes / compact_bytes:.1f}x")
+
+    node = compact_class()
+    node.URI = 'urn:node:check'
+    node.name = 'Check'
+    logging.info(node.to_json(False))
+
+
+if __name__ == "__main__":
+    main()
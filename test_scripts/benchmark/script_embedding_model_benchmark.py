@@ -0,0 +1,62 @@
+import logging
+import os
+import random
+import time
+from vital_ai_vitalsigns.embedding.embedding_model import EmbeddingModel
+
+WORDS = ("graph node edge vector model query index service ontology property class value "
+         "sentence embedding search result frame slot entity relation document text").split()
+
+
+def create_sentences(count: int) -> list:
+
+    rand = random.Random(1)
+
+    # short and long sentences mixed, as names and descriptions are
+    return [" ".join(rand.choice(WORDS) for _ in range(rand.choice((3, 5, 8, 20, 60)))) + f" {i}"
+            for i in range(count)]
+
+
+def timed(label: str, count: int, fn):
+
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+
+    logging.info(f"{label}: {count} sentences in {elapsed:.2f} s, {count / elapsed:.0f} sentences per second")
+
+    return result
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+
+    sentence_list = create_sentences(10_000)
+
+    # the whole list as one padded batch, as vectorize ran it before
+    model = EmbeddingModel(cache_size=0, batch_size=len(sentence_list))
+
+    timed("single batch", len(sentence_list), lambda: model.vectorize(sentence_list))
+
+    for batch_size in (16, 32, 64, 128, 256):
+
+        model = EmbeddingModel(cache_size=0, batch_size=batch_size)
+
+        timed(f"batch size {batch_size}", len(sentence_list), lambda: model.vectorize(sentence_list))
+
+    cpu_count = os.cpu_count() or 1
+
+    if cpu_count > 1:
+
+        model = EmbeddingModel(cache_size=0, batch_size=64, num_processes=cpu_count)
+
+        # start the workers before timing
+        model.vectorize(create_sentences(cpu_count * 64))
+
+        timed(f"batch size 64, {cpu_count} processes", len(sentence_list), lambda: model.vectorize(sentence_list))
+
+        model.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+import json
+import logging
+import time
+from vital_ai_vitalsigns.config.vitalsigns_config import GraphDatabaseConfig
+from vital_ai_vitalsigns.model.GraphObject import GraphObject
+from vital_ai_vitalsigns.model.VITAL_Node import VITAL_Node
+from vital_ai_vitalsigns.service.graph.virtuoso.virtuoso_service import VirtuosoGraphService
+from vital_ai_vitalsigns.vitalsigns import VitalSigns
+from test_scripts.benchmark.local_sparql_endpoint import LocalSparqlEndpoint
+
+
+def create_nodes(count: int) -> list:
+    node_list = []
+    for i in range(count):
+        node = VITAL_Node()
+        node.URI = f"http://vital.ai/test/node/{i}"
+        node.name = f"node {i}"
+        node.timestamp = 1_700_000_000_000 + i
+        node_list.append(node)
+    return node_list
+
+
+def get_per_object(service: VirtuosoGraphService, graph_uri: str, uri_list: list) -> list:
+    # the request pattern get_object_list used before bulk retrieval
+    vs = VitalSigns()
+    object_list = []
+    for object_uri in uri_list:
+        assert service._find_graph(graph_uri, object_uri)
+        graph = service.rest_manager.sparql_construct(
+            f"CONSTRUCT {{ <{object_uri}> ?p ?o . }} WHERE {{ GRAPH <{graph_uri}> {{ <{object_uri}> ?p ?o . }} }}")
+        object_list.append(vs.from_triples(graph.triples((None, None, None))))
+    return object_list
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+
+    vs = VitalSigns()
+
+    count = 1_000
+
+    endpoint = LocalSparqlEndpoint().start()
+
+    config = GraphDatabaseConfig(database_type="virtuoso", endpoint=endpoint.endpoint)
+
+    service = VirtuosoGraphService(config, base_uri="http://vital.ai", namespace="benchmark")
+
+    graph_id = "get-benchmark"
+
+    graph_uri = service.get_graph_uri(graph_id=graph_id)
+
+    endpoint.dataset.graph(graph_uri).parse(data=GraphObject.to_rdf_list(create_nodes(count)), format='nt')
+
+    uri_list = [f"http://vital.ai/test/node/{i}" for i in range(count)]
+
+    start_requests = endpoint.request_count
+    start = time.perf_counter()
+    object_list = get_per_object(service, graph_uri, uri_list)
+    elapsed = time.perf_counter() - start
+
+    logging.info(f"per object retrieval: {count} objects in {elapsed:.2f} s, "
+                 f"{endpoint.request_count - start_requests} requests")
+
+    start_requests = endpoint.request_count
+    start = time.perf_counter()
+    result_list = service.get_object_list(uri_list, graph_id=graph_id)
+    elapsed = time.perf_counter() - start
+
+    logging.info(f"bulk retrieval: {count} objects in {elapsed:.2f} s, "
+                 f"{endpoint.request_count - start_requests} requests")
+
+    bulk_list = [result.graph_object for result in result_list]
+
+    assert [str(o.URI) for o in bulk_list] == uri_list
+
+    # typed literals come back as their python types
+    for per_object, bulk in zip(object_list, bulk_list):
+        assert json.loads(per_object.to_json()) == json.loads(bulk.to_json())
+        assert isinstance(bulk.timestamp.value, int)
+
+    service.rest_manager.close()
+    endpoint.stop()
+
+
+if __name__ == "__main__":
+    main()
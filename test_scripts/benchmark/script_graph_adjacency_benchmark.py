@@ -0,0 +1,81 @@
+import logging
+import random
+import time
+from vital_ai_vitalsigns.collection.graph_collection import GraphCollection
+from vital_ai_vitalsigns.model.VITAL_Edge import VITAL_Edge
+from vital_ai_vitalsigns.model.VITAL_Node import VITAL_Node
+from vital_ai_vitalsigns.vitalsigns import VitalSigns
+
+
+def create_graph(node_count: int, edge_count: int) -> list:
+
+    rand = random.Random(1)
+
+    object_list = []
+
+    for i in range(node_count):
+        node = VITAL_Node()
+        node.URI = f"urn:node_{i}"
+        object_list.append(node)
+
+    for i in range(edge_count):
+        edge = VITAL_Edge()
+        edge.URI = f"urn:edge_{i}"
+        edge.edgeSource = f"urn:node_{rand.randrange(node_count)}"
+        edge.edgeDestination = f"urn:node_{rand.randrange(node_count)}"
+        object_list.append(edge)
+
+    return object_list
+
+
+# outgoing edges the way they were found before the index
+def scan_edges_outgoing(collection: GraphCollection, uri: str) -> list:
+    return [item for item in collection if isinstance(item, VITAL_Edge) and item.edgeSource == uri]
+
+
+def timed(label: str, count: int, fn):
+
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+
+    logging.info(f"{label}: {elapsed:.2f} s, {elapsed / count * 1_000:.3f} ms each")
+
+    return result
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+
+    vs = VitalSigns()
+
+    node_count = 100_000
+    edge_count = 500_000
+
+    object_list = create_graph(node_count, edge_count)
+
+    collection = GraphCollection(use_rdfstore=False, use_vectordb=False)
+
+    timed("add objects", len(object_list), lambda: collection.add_objects(object_list))
+
+    logging.info(f"{node_count} nodes, {edge_count} edges")
+
+    uri_list = [f"urn:node_{i}" for i in random.Random(2).sample(range(node_count), 1_000)]
+
+    indexed = timed("outgoing edges, indexed", len(uri_list),
+                    lambda: [collection.get_edges_outgoing(uri) for uri in uri_list])
+
+    scanned = timed("outgoing edges, scan", 5,
+                    lambda: [scan_edges_outgoing(collection, uri) for uri in uri_list[:5]])
+
+    assert [len(edges) for edges in indexed[:5]] == [len(edges) for edges in scanned]
+
+    timed("neighbors depth 2", len(uri_list), lambda: [collection.neighbors(uri, 2) for uri in uri_list])
+
+    reached = timed("bfs over the graph", 1, lambda: sum(1 for _ in collection.bfs(uri_list[0], direction="both")))
+
+    logging.info(f"bfs reached {reached} nodes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+import logging
+import random
+import time
+from vital_ai_vitalsigns.collection.graph_collection import GraphCollection
+from vital_ai_vitalsigns.model.VITAL_Node import VITAL_Node
+from vital_ai_vitalsigns.vitalsigns import VitalSigns
+
+
+def create_nodes(count: int, prefix: str = "node") -> list:
+
+    node_list = []
+
+    for i in range(count):
+        node = VITAL_Node()
+        node.URI = f"urn:{prefix}_{i}"
+        node.name = f"{prefix} {i}"
+        node_list.append(node)
+
+    return node_list
+
+
+def timed(label: str, count: int, fn):
+
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+
+    logging.info(f"{label}: {elapsed:.2f} s, {elapsed / count * 1_000_000:.2f} us per object")
+
+    return result
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+
+    vs = VitalSigns()
+
+    for count in (10_000, 100_000, 1_000_000):
+
+        logging.info(f"collection of {count} objects")
+
+        node_list = create_nodes(count)
+
+        uri_list = [str(node.URI) for node in node_list]
+
+        collection = GraphCollection(use_rdfstore=False, use_vectordb=False)
+
+        timed("add objects", count, lambda: collection.add_objects(node_list))
+
+        assert len(collection) == count
+
+        sample = random.Random(1).sample(uri_list, count // 10)
+
+        timed("get", len(sample), lambda: [collection.get(uri) for uri in sample])
+
+        # objects with the same URIs replace the ones in the collection
+        replace_list = create_nodes(count // 10, "node")
+
+        timed("replace", len(replace_list), lambda: collection.add_objects(replace_list))
+
+        timed("remove objects", len(sample), lambda: collection.remove_objects(sample))
+
+        timed("positional access", 1_000, lambda: [collection[i] for i in range(1_000)])
+
+        logging.info(f"{len(collection)} objects remain")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import logging
+import time
+from vital_ai_vitalsigns.collection.graph_collection import GraphCollection
+from vital_ai_vitalsigns.embedding.embedding_model import EmbeddingModel
+from vital_ai_vitalsigns.model.VITAL_Node import VITAL_Node
+from vital_ai_vitalsigns.vitalsigns import VitalSigns
+
+
+def create_nodes(count: int, prefix: str = "node") -> list:
+
+    node_list = []
+
+    for i in range(count):
+        node = VITAL_Node()
+        node.URI = f"urn:{prefix}_{i}"
+        node.name = f"{prefix} number {i}"
+        node_list.append(node)
+
+    return node_list
+
+
+def timed(label: str, count: int, fn):
+
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+
+    logging.info(f"{label}: {count} objects in {elapsed:.2f} s, {count / elapsed:.0f} objects per second")
+
+    return result
+
+
+def add_each(collection: GraphCollection, node_list: list):
+    # one vectorize and one index call per object, as add_objects did before batching
+    for node in node_list:
+        collection.add(node)
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+
+    vs = VitalSigns()
+
+    embedder = EmbeddingModel()
+
+    vs.put_embedding_model(embedder.get_model_id(), embedder)
+
+    collection = GraphCollection(use_rdfstore=False)
+
+    timed("add one at a time", 1_000, lambda: add_each(collection, create_nodes(1_000, "single")))
+
+    for batch_size in (64, 256, 1024):
+
+        collection = GraphCollection(use_rdfstore=False, embedding_batch_size=batch_size)
+
+        node_list = create_nodes(100_000)
+
+        timed(f"add objects, batch size {batch_size}", len(node_list), lambda: collection.add_objects(node_list))
+
+        assert len(collection._vectordb.doc_id_to_index) == len(node_list)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import json
+import logging
+import statistics
+import subprocess
+import sys
+
+# each run is a fresh process, the registry mode is set as the config file would
+startup_script = """
+import json
+import sys
+import time
+import psutil
+from vital_ai_vitalsigns.config.vitalsigns_config import VitalSignsConfigLoader
+yaml_config = "registry:\\n  lazy_import: %s\\n"
+VitalSignsConfigLoader.vitalsigns_load_config = staticmethod(lambda vital_home: VitalSignsConfigLoader.parse_yaml_config(yaml_config))
+start = time.perf_counter()
+from vital_ai_vitalsigns.vitalsigns import VitalSigns
+vs = VitalSigns(background_task=False)
+elapsed = time.perf_counter() - start
+print(json.dumps({"time": elapsed, "modules": len(sys.modules), "rss": psutil.Process().memory_info().rss}))
+"""
+
+
+def run_startup(lazy_import: bool) -> dict:
+    script = startup_script % ("true" if lazy_import else "false")
+    result = subprocess.run([sys.executable, "-c", script],
+                            capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+
+    runs = 5
+
+    for lazy_import in (False, True):
+
+        results = [run_startup(lazy_import) for _ in range(runs)]
+
+        mode = "lazy import" if lazy_import else "eager import"
+
+        elapsed = statistics.median(r["time"] for r in results)
+        modules = statistics.median(r["modules"] for r in results)
+        rss = statistics.median(r["rss"] for r in results) / (1024 * 1024)
+
+        logging.info(f"VitalSigns() {mode}: {elapsed:.3f} s, {modules:.0f} modules, {rss:.1f} MB RSS (median of {runs})")
+
+
+if __name__ == "__main__":
+    main()
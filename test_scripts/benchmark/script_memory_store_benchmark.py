@@ -0,0 +1,122 @@
+import logging
+import random
+import time
+from rdflib import URIRef
+from vital_ai_vitalsigns.config.vitalsigns_config import GraphDatabaseConfig
+from vital_ai_vitalsigns.model.VITAL_Node import VITAL_Node
+from vital_ai_vitalsigns.service.graph.memory.memory_graph_service import MemoryGraphService
+from vital_ai_vitalsigns.vitalsigns import VitalSigns
+
+
+def create_service(graph_uri: str, count: int) -> MemoryGraphService:
+
+    service = MemoryGraphService(GraphDatabaseConfig(database_type="memory", endpoint=None),
+                                 base_uri="http://vital.ai", namespace="benchmark")
+
+    service.create_graph(graph_uri)
+
+    node_list = []
+
+    for i in range(count):
+        node = VITAL_Node()
+        node.URI = f"http://vital.ai/test/node/{i:07d}"
+        node.name = f"node {i}"
+        node_list.append(node)
+
+    service.insert_object_list(graph_uri, node_list)
+
+    return service
+
+
+def sparql_page(service: MemoryGraphService, graph_uri: str, limit: int, offset: int) -> list:
+    # the subquery paging used before the subject index
+
+    vs = VitalSigns()
+
+    graph = service.graph.get_graph(URIRef(graph_uri))
+
+    query = f"""
+            CONSTRUCT {{ ?s ?p ?o . }}
+            WHERE {{
+                {{
+                    SELECT DISTINCT ?s WHERE {{ ?s ?p ?o . }}
+                    ORDER BY ?s
+                    LIMIT {limit}
+                    OFFSET {offset}
+                }}
+                ?s ?p ?o .
+            }}
+            """
+
+    result_graph = graph.query(query).graph
+
+    return [vs.from_triples(result_graph.triples((s, None, None))) for s in set(result_graph.subjects())]
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+
+    vs = VitalSigns()
+
+    count = 100_000
+
+    lookups = 2_000
+
+    graph_uri = "urn:benchmark_graph"
+
+    start = time.perf_counter()
+    service = create_service(graph_uri, count)
+    logging.info(f"insert {count} objects: {time.perf_counter() - start:.2f} s")
+
+    graph = service.graph.get_graph(URIRef(graph_uri))
+
+    uri_list = [f"http://vital.ai/test/node/{random.randrange(count):07d}" for _ in range(lookups)]
+
+    start = time.perf_counter()
+    triples_list = [vs.from_triples(graph.triples((URIRef(uri), None, None))) for uri in uri_list]
+    triples_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index_list = [service.get_object(uri, graph_uri=graph_uri) for uri in uri_list]
+    index_elapsed = time.perf_counter() - start
+
+    assert [o.to_json() for o in index_list] == [o.to_json() for o in triples_list]
+
+    logging.info(f"{lookups} point lookups, rdflib triples: {triples_elapsed:.2f} s, "
+                 f"subject index: {index_elapsed:.2f} s")
+
+    # SPARQL paging does not scale to the full graph, compare on a smaller one
+    page_count = 2_000
+
+    page_graph_uri = "urn:benchmark_page_graph"
+
+    page_service = create_service(page_graph_uri, page_count)
+
+    limit = 100
+
+    offset = page_count // 2
+
+    start = time.perf_counter()
+    sparql_list = sparql_page(page_service, page_graph_uri, limit, offset)
+    sparql_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    page_list = page_service.get_graph_all_objects(page_graph_uri, limit=limit, offset=offset)
+    page_elapsed = time.perf_counter() - start
+
+    # the segment object sorts after the nodes so the pages line up
+    assert sorted(str(o.URI) for o in sparql_list) == [str(r.graph_object.URI) for r in page_list]
+
+    logging.info(f"one page of {limit} from {page_count} objects, SPARQL: {sparql_elapsed:.2f} s, "
+                 f"subject index: {page_elapsed * 1000:.1f} ms")
+
+    start = time.perf_counter()
+    page_list = service.get_graph_all_objects(graph_uri, limit=limit, offset=count // 2)
+    logging.info(f"one page of {limit} from {count} objects, subject index: "
+                 f"{(time.perf_counter() - start) * 1000:.1f} ms")
+
+    assert len(page_list) == limit
+
+
+if __name__ == "__main__":
+    main()
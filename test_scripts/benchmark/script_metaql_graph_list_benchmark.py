@@ -0,0 +1,121 @@
+import logging
+import time
+from vital_ai_vitalsigns.config.vitalsigns_config import GraphDatabaseConfig
+from vital_ai_vitalsigns.metaql.query.query_builder import QueryBuilder, AndConstraintList, ClassConstraint, Arc, \
+    NodeBind
+from vital_ai_vitalsigns.model.GraphObject import GraphObject
+from vital_ai_vitalsigns.model.VITAL_Node import VITAL_Node
+from vital_ai_vitalsigns.ontology.ontology import Ontology
+from vital_ai_vitalsigns.service.graph.virtuoso.virtuoso_service import VirtuosoGraphService
+from vital_ai_vitalsigns.vitalsigns import VitalSigns
+from test_scripts.benchmark.local_sparql_endpoint import LocalSparqlEndpoint
+
+
+def create_nodes(graph_index: int, count: int) -> list:
+    node_list = []
+    for i in range(count):
+        node = VITAL_Node()
+        # every graph shares node 0, which is reported once
+        node.URI = f"http://vital.ai/test/node/{graph_index if i else 0}-{i:04d}"
+        node.name = f"node {graph_index}-{i}"
+        node_list.append(node)
+    return node_list
+
+
+def build_query(graph_id_list: list, limit: int, offset: int):
+
+    query = QueryBuilder.graph_query(offset=offset, limit=limit, resolve_objects=True)
+
+    for graph_id in graph_id_list:
+        query = query.graph_id(graph_id)
+
+    return (
+        query.arc(
+            Arc()
+            .node_bind(NodeBind(name="node"))
+            .constraint_list(
+                AndConstraintList()
+                .node_constraint(
+                    ClassConstraint(
+                        clazz=VITAL_Node.get_class_uri()
+                    )
+                )
+            )
+        )
+        .build()
+    )
+
+
+def run_query(service: VirtuosoGraphService, graph_query, namespace_list) -> tuple:
+
+    start = time.perf_counter()
+    result = service.metaql_graph_query(graph_query=graph_query, namespace_list=namespace_list)
+    elapsed = time.perf_counter() - start
+
+    uri_list = [str(gm.get_property("node")) for gm in (r.graph_object for r in result.get_result_list())]
+
+    return elapsed, uri_list
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+
+    vs = VitalSigns()
+
+    graph_count = 8
+
+    node_count = 20
+
+    endpoint = LocalSparqlEndpoint(latency=0.05).start()
+
+    config = GraphDatabaseConfig(database_type="virtuoso", endpoint=endpoint.endpoint, pool_size=graph_count)
+
+    service = VirtuosoGraphService(config, base_uri="http://vital.ai", namespace="benchmark")
+
+    namespace_list = [Ontology("vital-core", "http://vital.ai/ontology/vital-core#")]
+
+    graph_id_list = []
+
+    for g in range(graph_count):
+        graph_id = f"segment-{g}"
+        graph_id_list.append(graph_id)
+        graph_uri = service.get_graph_uri(graph_id=graph_id)
+        endpoint.dataset.graph(graph_uri).parse(
+            data=GraphObject.to_rdf_list(create_nodes(g, node_count)), format='nt')
+
+    # logging of each query would dominate the timing
+    logging.getLogger().setLevel(logging.WARNING)
+
+    limit = 10
+
+    offset = 15
+
+    graph_query = build_query(graph_id_list, limit, offset)
+
+    service.graph_query_workers = 1
+
+    serial_elapsed, serial_uri_list = run_query(service, graph_query, namespace_list)
+
+    service.graph_query_workers = graph_count
+
+    fanout_elapsed, fanout_uri_list = run_query(service, graph_query, namespace_list)
+
+    # the page of the union of all graphs, shared node reported once
+    expected = sorted({f"http://vital.ai/test/node/{g if i else 0}-{i:04d}"
+                       for g in range(graph_count) for i in range(node_count)})[offset:offset + limit]
+
+    assert serial_uri_list == expected
+    assert fanout_uri_list == expected
+
+    logging.getLogger().setLevel(logging.INFO)
+
+    logging.info(f"{graph_count} graphs, 50 ms endpoint latency")
+    logging.info(f"one graph at a time: {serial_elapsed:.2f} s")
+    logging.info(f"concurrent graphs: {fanout_elapsed:.2f} s")
+
+    service.rest_manager.close()
+    endpoint.stop()
+
+
+if __name__ == "__main__":
+    main()
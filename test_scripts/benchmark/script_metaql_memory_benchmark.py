@@ -0,0 +1,160 @@
+import logging
+import time
+from rdflib import URIRef
+from vital_ai_vitalsigns.config.vitalsigns_config import GraphDatabaseConfig
+from vital_ai_vitalsigns.metaql.query.query_builder import QueryBuilder, AndConstraintList, ClassConstraint, Arc, \
+    NodeBind, EdgeBind
+from vital_ai_vitalsigns.model.VITAL_Edge import VITAL_Edge
+from vital_ai_vitalsigns.model.VITAL_Node import VITAL_Node
+from vital_ai_vitalsigns.service.graph.memory.memory_graph_service import MemoryGraphService
+from vital_ai_vitalsigns.service.metaql.metaql_sparql_builder import MetaQLSparqlBuilder
+from vital_ai_vitalsigns.vitalsigns import VitalSigns
+
+
+def create_objects(count: int) -> list:
+
+    object_list = []
+
+    for i in range(count):
+        node = VITAL_Node()
+        node.URI = f"http://vital.ai/test/node/{i:06d}"
+        node.name = f"node {i}"
+        object_list.append(node)
+
+    # each node links to the next two
+    for i in range(count):
+        for j in (1, 2):
+            edge = VITAL_Edge()
+            edge.URI = f"http://vital.ai/test/edge/{i:06d}-{j}"
+            edge.edgeSource = f"http://vital.ai/test/node/{i:06d}"
+            edge.edgeDestination = f"http://vital.ai/test/node/{(i + j) % count:06d}"
+            object_list.append(edge)
+
+    return object_list
+
+
+def build_query(graph_id: str, limit: int, offset: int):
+
+    def node_constraint():
+        return AndConstraintList().node_constraint(ClassConstraint(clazz=VITAL_Node.get_class_uri()))
+
+    return (
+        QueryBuilder.graph_query(offset=offset, limit=limit, resolve_objects=True)
+        .graph_id(graph_id)
+        .arc(
+            Arc()
+            .node_bind(NodeBind(name="start"))
+            .constraint_list(node_constraint())
+            .arc(
+                Arc()
+                .node_bind(NodeBind(name="middle"))
+                .edge_bind(EdgeBind(name="edge"))
+                .constraint_list(node_constraint())
+                .arc(
+                    Arc()
+                    .node_bind(NodeBind(name="end"))
+                    .constraint_list(node_constraint())
+                )
+            )
+        )
+        .build()
+    )
+
+
+def sparql_select(service: MemoryGraphService, graph_id: str, graph_query) -> list:
+    # the pattern of the sparql builder, run by the rdflib engine
+
+    sparql_impl = MetaQLSparqlBuilder().build_sparql(graph_query)
+
+    binding_list = sparql_impl.get_binding_list()
+
+    variables = " ".join(f"?{binding}" for binding in binding_list)
+
+    terms = "\n".join(sparql_impl.get_arc_constraint_list() + sparql_impl.get_bind_constraint_list())
+
+    query = f"""
+    PREFIX vital-core: <http://vital.ai/ontology/vital-core#>
+    SELECT DISTINCT {variables} WHERE {{
+    {terms}
+    }}
+    ORDER BY {variables}
+    LIMIT {sparql_impl.get_limit()}
+    OFFSET {sparql_impl.get_offset()}
+    """
+
+    graph = service.graph.get_graph(URIRef(graph_id))
+
+    return [tuple(str(row[binding]) for binding in binding_list) for row in graph.query(query)]
+
+
+def create_service(graph_id: str, count: int) -> MemoryGraphService:
+
+    service = MemoryGraphService(GraphDatabaseConfig(database_type="memory", endpoint=None),
+                                 base_uri="http://vital.ai", namespace="benchmark")
+
+    service.create_graph(graph_id)
+
+    service.insert_object_list(graph_id, create_objects(count))
+
+    return service
+
+
+def run_native(service: MemoryGraphService, graph_query) -> tuple:
+
+    start = time.perf_counter()
+    metaql_result = service.metaql_graph_query(graph_query=graph_query)
+    elapsed = time.perf_counter() - start
+
+    binding_list = metaql_result.get_binding_list()
+
+    rows = [tuple(str(r.graph_object.get_property(binding)) for binding in binding_list)
+            for r in metaql_result.get_result_list()]
+
+    return elapsed, rows
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+
+    vs = VitalSigns()
+
+    graph_id = "urn:metaql_benchmark"
+
+    # the rdflib engine slows down sharply with graph size, compare on a small graph
+    count = 40
+
+    limit = 20
+
+    service = create_service(graph_id, count)
+
+    for offset in (0, count):
+
+        graph_query = build_query(graph_id, limit, offset)
+
+        start = time.perf_counter()
+        sparql_rows = sparql_select(service, graph_id, graph_query)
+        sparql_elapsed = time.perf_counter() - start
+
+        native_elapsed, native_rows = run_native(service, graph_query)
+
+        assert native_rows == sparql_rows
+
+        logging.info(f"two hop query over {count} nodes, page of {limit} at offset {offset}: "
+                     f"rdflib SPARQL {sparql_elapsed:.2f} s, native {native_elapsed * 1000:.1f} ms")
+
+    large_count = 100_000
+
+    service = create_service(graph_id, large_count)
+
+    for offset in (0, large_count):
+
+        native_elapsed, native_rows = run_native(service, build_query(graph_id, limit, offset))
+
+        assert len(native_rows) == limit
+
+        logging.info(f"two hop query over {large_count} nodes, page of {limit} at offset {offset}: "
+                     f"native {native_elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+import logging
+import time
+from vital_ai_vitalsigns.metaql.query.query_builder import QueryBuilder, AndConstraintList, OrConstraintList, \
+    ClassConstraint, PropertyConstraint, ConstraintType, Arc, NodeBind, EdgeBind, AndArcList, OrArcList
+from vital_ai_vitalsigns.model.VITAL_Node import VITAL_Node
+from vital_ai_vitalsigns.service.metaql.metaql_plan_cache import MetaQLPlanCache
+from vital_ai_vitalsigns.service.metaql.metaql_sparql_builder import MetaQLSparqlBuilder
+from vital_ai_vitalsigns.vitalsigns import VitalSigns
+
+HAS_NAME = "http://vital.ai/ontology/vital-core#hasName"
+HAS_PROVENANCE = "http://vital.ai/ontology/vital-core#hasProvenance"
+
+
+def slot_arc(slot_name: str, entity_name: str, slot_type: str, search: str) -> Arc:
+
+    return (
+        Arc()
+        .node_bind(NodeBind(name=slot_name))
+        .edge_bind(EdgeBind(name=f"{slot_name}_edge"))
+        .constraint_list(
+            AndConstraintList()
+            .node_constraint(
+                PropertyConstraint(property=HAS_PROVENANCE, comparator=ConstraintType.EQUAL_TO, value=slot_type))
+            .node_constraint(ClassConstraint(clazz=VITAL_Node.get_class_uri(), include_subclasses=True))
+        )
+        .arc(
+            Arc()
+            .node_bind(NodeBind(name=entity_name))
+            .constraint_list(
+                OrConstraintList()
+                .node_constraint(
+                    PropertyConstraint(property=HAS_NAME, comparator=ConstraintType.STRING_CONTAINS, value=search))
+                .node_constraint(
+                    PropertyConstraint(property=HAS_NAME, comparator=ConstraintType.STRING_CONTAINS,
+                                       value=search.upper()))
+            )
+            .constraint_list(AndConstraintList().node_constraint(ClassConstraint(clazz=VITAL_Node.get_class_uri())))
+        )
+    )
+
+
+# a frame query in the shape the API sends, only the search values change
+def build_query(i: int):
+
+    search = f"term {i}"
+
+    return (
+        QueryBuilder.graph_query(offset=i % 5 * 10, limit=10, resolve_objects=True)
+        .graph_id(f"graph_{i % 3}")
+        .arc(
+            Arc()
+            .node_bind(NodeBind(name="frame"))
+            .constraint_list(AndConstraintList().node_constraint(ClassConstraint(clazz=VITAL_Node.get_class_uri())))
+            .arc_list(
+                OrArcList()
+                .arc_list(
+                    AndArcList()
+                    .arc(slot_arc("source_slot", "source_entity", f"urn:source_{i}", search))
+                    .arc(slot_arc("destination_slot", "destination_entity", "urn:destination", search))
+                )
+                .arc_list(
+                    AndArcList()
+                    .arc(slot_arc("source_slot", "source_entity", f"urn:source_{i}", search))
+                )
+            )
+        )
+        .build()
+    )
+
+
+def time_builds(label: str, query_list: list, build) -> float:
+
+    start = time.perf_counter()
+    for query in query_list:
+        build(query)
+    elapsed = time.perf_counter() - start
+
+    per_query = elapsed / len(query_list) * 1_000_000
+    logging.info(f"{label}: {per_query:.1f} us per query")
+
+    return per_query
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+
+    vs = VitalSigns()
+
+    count = 200
+
+    query_list = [build_query(i) for i in range(count)]
+
+    builder_time = time_builds("MetaQLSparqlBuilder", query_list,
+                               lambda q: MetaQLSparqlBuilder().build_sparql(q))
+
+    # every query a miss: hashing, building the template and binding it
+    cold_cache = MetaQLPlanCache()
+
+    def build_cold(query):
+        cold_cache.clear()
+        cold_cache.build_sparql(query)
+
+    cold_time = time_builds("plan cache, cold", query_list, build_cold)
+
+    warm_cache = MetaQLPlanCache()
+    warm_cache.build_sparql(query_list[0])
+
+    warm_time = time_builds("plan cache, warm", query_list, warm_cache.build_sparql)
+
+    logging.info(f"plan cache stats: {warm_cache.get_stats()}")
+
+    logging.info(f"warm speedup over the builder: {builder_time / warm_time:.1f}x, "
+                 f"cold overhead: {cold_time / builder_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import logging
+import time
+from rdflib import Graph
+from vital_ai_vitalsigns.model.GraphObject import GraphObject
+from vital_ai_vitalsigns.model.VITAL_Node import VITAL_Node
+from vital_ai_vitalsigns.vitalsigns import VitalSigns
+
+
+# serialization as done before the direct writer:
+# a Graph per object, serialized by rdflib
+def rdflib_to_rdf(graph_object) -> str:
+    g = Graph()
+    for triple in graph_object.to_triples():
+        g.add(triple)
+    return g.serialize(format='nt')
+
+
+def time_loop(label, graph_object_list, fn):
+    start = time.perf_counter()
+    fn(graph_object_list)
+    elapsed = time.perf_counter() - start
+    per_object = elapsed / len(graph_object_list) * 1_000_000
+    logging.info(f"{label}: {per_object:.3f} us per object")
+    return per_object
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+
+    vs = VitalSigns()
+
+    graph_object_list = []
+
+    for i in range(10_000):
+        node = VITAL_Node()
+        node.URI = f'urn:node{i}'
+        node.name = f'Node "{i}"'
+        node.timestamp = 1718000000000 + i
+        node.active = i % 2 == 0
+        graph_object_list.append(node)
+
+    before = time_loop("to_rdf (rdflib graph)", graph_object_list,
+                       lambda objects: "\n".join(rdflib_to_rdf(o) for o in objects))
+    after = time_loop("to_rdf (direct)", graph_object_list,
+                      lambda objects: "\n".join(o.to_rdf() for o in objects))
+    after_list = time_loop("to_rdf_list (direct)", graph_object_list, GraphObject.to_rdf_list)
+
+    logging.info(f"to_rdf speedup: {before / after:.1f}x")
+    logging.info(f"to_rdf_list speedup: {before / after_list:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
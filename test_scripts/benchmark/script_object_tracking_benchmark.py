@@ -0,0 +1,43 @@
+import logging
+import time
+from vital_ai_vitalsigns.impl.graph_object_tracker import GraphObjectTrackingPolicy
+from vital_ai_vitalsigns.model.VITAL_Node import VITAL_Node
+from vital_ai_vitalsigns.vitalsigns import VitalSigns
+
+
+def create_objects(count: int):
+    for i in range(count):
+        node = VITAL_Node()
+        node.URI = f'urn:node:{i}'
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+
+    vs = VitalSigns()
+
+    count = 200_000
+
+    policy_list = [
+        GraphObjectTrackingPolicy.OFF,
+        GraphObjectTrackingPolicy.SAMPLED,
+        GraphObjectTrackingPolicy.FULL
+    ]
+
+    for policy in policy_list:
+
+        vs.set_graph_object_tracking(policy, sample_interval=100)
+
+        start = time.perf_counter()
+        create_objects(count)
+        elapsed = time.perf_counter() - start
+
+        tracked = vs.get_graph_object_tracker().tracked_count()
+
+        logging.info(f"policy {policy}: {count / elapsed:,.0f} objects/sec (still tracked: {tracked})")
+
+    vs.set_graph_object_tracking(GraphObjectTrackingPolicy.FULL)
+
+
+if __name__ == "__main__":
+    main()
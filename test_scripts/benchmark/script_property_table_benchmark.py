@@ -0,0 +1,63 @@
+import logging
+import time
+from vital_ai_vitalsigns.impl.vitalsigns_impl import VitalSignsImpl
+from vital_ai_vitalsigns.model.VITAL_Node import VITAL_Node
+from vital_ai_vitalsigns.vitalsigns import VitalSigns
+
+
+# per-attribute resolution as done before the property table:
+# a scan of the allowed domain properties with a trait lookup per property
+def linear_scan_set(graph_object, name, value):
+    for prop_info in graph_object.get_allowed_domain_properties():
+        uri = prop_info['uri']
+        prop_class = prop_info['prop_class']
+        trait_class = VitalSignsImpl.get_trait_class_from_uri(uri)
+        if trait_class and (uri == name or trait_class.get_short_name() == name):
+            graph_object._properties[uri] = VitalSignsImpl.create_property_with_trait(prop_class, uri, value)
+            return
+
+
+def linear_scan_get(graph_object, name):
+    for prop_info in graph_object.get_allowed_domain_properties():
+        uri = prop_info['uri']
+        trait_class = VitalSignsImpl.get_trait_class_from_uri(uri)
+        if trait_class and trait_class.get_short_name() == name:
+            return graph_object._properties.get(uri)
+
+
+def time_loop(label, iterations, fn):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    elapsed = time.perf_counter() - start
+    per_call = elapsed / iterations * 1_000_000
+    logging.info(f"{label}: {per_call:.3f} us per attribute")
+    return per_call
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+
+    vs = VitalSigns()
+
+    iterations = 200_000
+
+    node = VITAL_Node()
+    node.URI = 'urn:node1'
+
+    prop_count = len(VITAL_Node.get_property_table().uri_map)
+
+    logging.info(f"VITAL_Node property count: {prop_count}")
+
+    before_set = time_loop("set (linear scan)", iterations, lambda: linear_scan_set(node, 'name', 'Node'))
+    after_set = time_loop("set (property table)", iterations, lambda: setattr(node, 'name', 'Node'))
+
+    before_get = time_loop("get (linear scan)", iterations, lambda: linear_scan_get(node, 'name'))
+    after_get = time_loop("get (property table)", iterations, lambda: node.name)
+
+    logging.info(f"set speedup: {before_set / after_set:.1f}x")
+    logging.info(f"get speedup: {before_get / after_get:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
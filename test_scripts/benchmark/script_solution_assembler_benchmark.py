@@ -0,0 +1,115 @@
+import logging
+import time
+import tracemalloc
+from rdflib import Graph, URIRef, BNode
+from vital_ai_vitalsigns.query.solution import Solution
+from vital_ai_vitalsigns.query.solution_assembler import SolutionAssembler
+from vital_ai_vitalsigns.service.graph.binding import Binding, BindingValueType
+
+
+BINDING_LIST = [
+    Binding("?start", "urn:start"),
+    Binding("?end", "urn:end"),
+    Binding("?edge", "urn:edge"),
+]
+
+
+# construct result rows in the order a response is read,
+# the triples of a solution are not next to each other
+def construct_rows(count: int) -> list:
+
+    subject_list = [BNode() for _ in range(count)]
+
+    row_list = []
+
+    for binding in BINDING_LIST:
+        for i, subject in enumerate(subject_list):
+            row_list.append((subject, URIRef(binding.property_uri), URIRef(f"urn:{binding.variable[1:]}_{i}")))
+
+    return row_list
+
+
+# the solution assembly before, kept for comparison:
+# rows copied into a graph, de-duplicated into a second graph,
+# and the bindings searched for every triple
+def assemble_two_graphs(row_list: list, object_map: dict) -> list:
+
+    graph = Graph()
+
+    for s, p, o in row_list:
+        graph.add((URIRef(str(s)), URIRef(str(p)), URIRef(str(o))))
+
+    unique_graph = Graph()
+
+    for triple in set(graph.triples((None, None, None))):
+        unique_graph.add(triple)
+
+    solutions = []
+
+    for subject in set(unique_graph.subjects()):
+
+        uri_map = {}
+        obj_map = {}
+
+        for s, p, o in unique_graph.triples((subject, None, None)):
+
+            matching_bindings = [binding for binding in BINDING_LIST if binding.property_uri == str(p)]
+
+            if len(matching_bindings) == 1:
+                uri_map[matching_bindings[0].variable] = str(o)
+                if matching_bindings[0].value_type == BindingValueType.URIREF:
+                    obj_map[matching_bindings[0].variable] = object_map.get(str(o))
+
+        solutions.append(Solution(uri_map, obj_map, "?start", obj_map.get("?start")))
+
+    return solutions
+
+
+def assemble_single_pass(row_list: list, object_map: dict) -> list:
+
+    assembler = SolutionAssembler(BINDING_LIST, "?start")
+
+    for s, p, o in row_list:
+        assembler.add(s, p, str(o))
+
+    return list(assembler.iter_solutions(object_map.get))
+
+
+def measure(name: str, assemble, row_list: list, object_map: dict) -> int:
+
+    start = time.perf_counter()
+    solutions = assemble(row_list, object_map)
+    elapsed = time.perf_counter() - start
+
+    count = len(solutions)
+
+    del solutions
+
+    tracemalloc.start()
+    assemble(row_list, object_map)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    logging.info(f"{name}: {count} solutions in {elapsed:.2f} s, peak {peak / 1024 / 1024:.1f} MB")
+
+    return count
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+
+    count = 100_000
+
+    row_list = construct_rows(count)
+
+    # objects already retrieved, only the assembly is measured
+    object_map = {str(o): object() for _, _, o in row_list}
+
+    logging.info(f"{count} solutions, {len(row_list)} construct rows")
+
+    assert measure("two graphs", assemble_two_graphs, row_list, object_map) == count
+    assert measure("single pass", assemble_single_pass, row_list, object_map) == count
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+import json
+import logging
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from rdflib import Graph, URIRef
+from vital_ai_vitalsigns.model.GraphObject import GraphObject
+from vital_ai_vitalsigns.model.VITAL_Node import VITAL_Node
+from vital_ai_vitalsigns.service.graph.utils.virtuoso_utils import VirtuosoUtils
+from vital_ai_vitalsigns.service.graph.virtuoso.rest.rest_manager import VirtuosoRESTManager
+from vital_ai_vitalsigns.service.graph.virtuoso.rest.sparql_stream import group_by_subject
+from vital_ai_vitalsigns.vitalsigns import VitalSigns
+
+
+class CannedResponseHandler(BaseHTTPRequestHandler):
+    """Stand-in SPARQL endpoint, answers with a prepared result in the requested format."""
+
+    protocol_version = "HTTP/1.1"
+
+    # headers and body are written separately, avoid delayed ack stalls on keep-alive
+    disable_nagle_algorithm = True
+
+    bodies = {}
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        self.rfile.read(length)
+
+        accept = self.headers.get('Accept', '')
+
+        if 'n-triples' in accept:
+            content_type = 'application/n-triples'
+        elif 'rdf+xml' in accept:
+            content_type = 'application/rdf+xml'
+        else:
+            content_type = 'application/sparql-results+json'
+
+        body = self.bodies[content_type]
+
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+
+        view = memoryview(body)
+
+        for start in range(0, len(body), 64 * 1024):
+            self.wfile.write(view[start:start + 64 * 1024])
+
+
+def prepare_bodies(count: int):
+
+    node_list = []
+
+    for i in range(count):
+        node = VITAL_Node()
+        node.URI = f"http://vital.ai/test/node/{i:08d}"
+        node.name = f"node {i}"
+        node.timestamp = 1_700_000_000_000 + i
+        node_list.append(node)
+
+    graph = Graph()
+    graph.parse(data=GraphObject.to_rdf_list(node_list), format='nt')
+
+    bindings = []
+
+    for s, p, o in sorted(graph):
+        binding = {"s": {"type": "uri", "value": str(s)}, "p": {"type": "uri", "value": str(p)}}
+        if isinstance(o, URIRef):
+            binding["o"] = {"type": "uri", "value": str(o)}
+        elif o.datatype is not None:
+            binding["o"] = {"type": "typed-literal", "value": str(o), "datatype": str(o.datatype)}
+        else:
+            binding["o"] = {"type": "literal", "value": str(o)}
+        bindings.append(binding)
+
+    CannedResponseHandler.bodies = {
+        'application/sparql-results+json': json.dumps(
+            {"head": {"vars": ["s", "p", "o"]}, "results": {"bindings": bindings}}).encode('utf-8'),
+        'application/n-triples': graph.serialize(format='nt').encode('utf-8'),
+        'application/rdf+xml': graph.serialize(format='xml').encode('utf-8')
+    }
+
+    return len(graph)
+
+
+def select_objects_loaded(rest_manager: VirtuosoRESTManager):
+    # the pattern before streaming, whole json result then objects
+    vs = VitalSigns()
+    results = rest_manager.sparql_select("SELECT ?s ?p ?o WHERE { ?s ?p ?o }")
+    triples = ((URIRef(b['s']['value']), URIRef(b['p']['value']), VirtuosoUtils.binding_to_rdf_term(b['o']))
+               for b in results['results']['bindings'])
+    for subject, subject_triples in group_by_subject(triples):
+        yield vs.from_triples(subject_triples)
+
+
+def select_objects_streamed(rest_manager: VirtuosoRESTManager):
+    vs = VitalSigns()
+    bindings = rest_manager.iter_sparql_select("SELECT ?s ?p ?o WHERE { ?s ?p ?o }")
+    triples = ((URIRef(b['s']['value']), URIRef(b['p']['value']), VirtuosoUtils.binding_to_rdf_term(b['o']))
+               for b in bindings)
+    for subject, subject_triples in group_by_subject(triples):
+        yield vs.from_triples(subject_triples)
+
+
+def construct_loaded(rest_manager: VirtuosoRESTManager):
+    # the pattern before streaming, rdf+xml parsed into a Graph
+    graph = rest_manager.sparql_construct("CONSTRUCT { ?s ?p ?o } WHERE { ?s ?p ?o }")
+    yield from graph.triples((None, None, None))
+
+
+def construct_streamed(rest_manager: VirtuosoRESTManager):
+    yield from rest_manager.iter_sparql_construct("CONSTRUCT { ?s ?p ?o } WHERE { ?s ?p ?o }")
+
+
+def measure(name: str, results_fn, rest_manager: VirtuosoRESTManager):
+
+    start = time.perf_counter()
+    first = None
+    count = 0
+
+    for _ in results_fn(rest_manager):
+        if first is None:
+            first = time.perf_counter() - start
+        count += 1
+
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+
+    for _ in results_fn(rest_manager):
+        pass
+
+    peak = tracemalloc.get_traced_memory()[1]
+
+    tracemalloc.stop()
+
+    logging.info(f"{name}: {count} results, first after {first * 1000:.0f} ms, "
+                 f"all in {elapsed:.2f} s, peak {peak / 1024 / 1024:.1f} MB")
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+
+    vs = VitalSigns()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), CannedResponseHandler)
+    server.daemon_threads = True
+
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    endpoint = f"http://127.0.0.1:{server.server_address[1]}/sparql"
+
+    rest_manager = VirtuosoRESTManager(endpoint, endpoint)
+
+    for count in (2_000, 20_000):
+
+        triple_count = prepare_bodies(count)
+
+        logging.info(f"page of {count} objects, {triple_count} triples")
+
+        measure("select loaded", select_objects_loaded, rest_manager)
+        measure("select streamed", select_objects_streamed, rest_manager)
+        measure("construct loaded", construct_loaded, rest_manager)
+        measure("construct streamed", construct_streamed, rest_manager)
+
+    rest_manager.close()
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+import json
+import logging
+import statistics
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from SPARQLWrapper import SPARQLWrapper, DIGEST, JSON, POST
+from vital_ai_vitalsigns.service.graph.virtuoso.rest.rest_manager import VirtuosoRESTManager
+
+ASK_QUERY = "ASK WHERE { GRAPH <http://vital.ai/graph/test> { <urn:test> ?p ?o } }"
+
+ASK_RESULT = json.dumps({"head": {}, "boolean": True}).encode('utf-8')
+
+
+class SparqlEndpointHandler(BaseHTTPRequestHandler):
+    """Stand-in for a digest protected SPARQL endpoint, answers every query with an ASK result."""
+
+    protocol_version = "HTTP/1.1"
+
+    # headers and body are written separately, avoid delayed ack stalls on keep-alive
+    disable_nagle_algorithm = True
+
+    nonce = uuid.uuid4().hex
+
+    # simulated network round trip per request
+    latency = 0.002
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        self.rfile.read(length)
+
+        time.sleep(self.latency)
+
+        authorization = self.headers.get('Authorization', '')
+
+        if f'nonce="{self.nonce}"' not in authorization:
+            body = b"Unauthorized"
+            self.send_response(401)
+            self.send_header('WWW-Authenticate',
+                             f'Digest realm="SPARQL", nonce="{self.nonce}", qop="auth", algorithm=MD5')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/sparql-results+json')
+        self.send_header('Content-Length', str(len(ASK_RESULT)))
+        self.end_headers()
+        self.wfile.write(ASK_RESULT)
+
+
+def ask_sparqlwrapper(endpoint: str) -> bool:
+    # the per call pattern the service used before the shared transport
+    sparql = SPARQLWrapper(endpoint)
+    sparql.setCredentials("user", "pass")
+    sparql.setHTTPAuth(DIGEST)
+    sparql.setQuery(ASK_QUERY)
+    sparql.setMethod(POST)
+    sparql.setReturnFormat(JSON)
+    return sparql.query().convert()["boolean"]
+
+
+def run_serial(ask, count: int) -> list:
+    latencies = []
+    for _ in range(count):
+        start = time.perf_counter()
+        assert ask()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def run_threaded(ask, count: int, threads: int) -> float:
+
+    def worker():
+        for _ in range(count // threads):
+            assert ask()
+
+    start = time.perf_counter()
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+
+    return (count // threads * threads) / (time.perf_counter() - start)
+
+
+def report(name: str, latencies: list, throughput: float):
+    median = statistics.median(latencies) * 1000
+    p95 = statistics.quantiles(latencies, n=20)[18] * 1000
+    logging.info(f"{name}: median {median:.2f} ms, p95 {p95:.2f} ms, {throughput:.0f} requests/s with 8 threads")
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SparqlEndpointHandler)
+    server.daemon_threads = True
+
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    endpoint = f"http://127.0.0.1:{server.server_address[1]}/sparql-auth"
+
+    count = 400
+
+    rest_manager = VirtuosoRESTManager(endpoint, endpoint, "user", "pass", pool_size=8)
+
+    def ask_pooled():
+        return rest_manager.sparql_ask(ASK_QUERY)
+
+    logging.info(f"stand-in endpoint latency: {SparqlEndpointHandler.latency * 1000:.1f} ms per request")
+
+    report("SPARQLWrapper per call",
+           run_serial(lambda: ask_sparqlwrapper(endpoint), count),
+           run_threaded(lambda: ask_sparqlwrapper(endpoint), count, 8))
+
+    report("pooled rest manager",
+           run_serial(ask_pooled, count),
+           run_threaded(ask_pooled, count, 8))
+
+    rest_manager.close()
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
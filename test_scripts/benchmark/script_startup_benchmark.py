@@ -0,0 +1,62 @@
+import logging
+import statistics
+import subprocess
+import sys
+from vital_ai_vitalsigns.config.vitalsigns_config import VitalSignsConfigLoader
+from vital_ai_vitalsigns.impl.vitalsigns_snapshot import VitalSignsSnapshotCache
+from vital_ai_vitalsigns.utils.find_vitalhome import find_vitalhome
+
+# each run is a fresh process, as a worker would be
+startup_script = """
+import time
+start = time.perf_counter()
+from vital_ai_vitalsigns.vitalsigns import VitalSigns
+vs = VitalSigns(background_task=False)
+print(time.perf_counter() - start)
+"""
+
+
+def time_startup() -> float:
+    result = subprocess.run([sys.executable, "-c", startup_script],
+                            capture_output=True, text=True, check=True)
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+
+    runs = 5
+
+    vital_home = find_vitalhome()
+
+    if not vital_home:
+        logging.info("VITAL_HOME is not set, snapshots are disabled.")
+        return
+
+    snapshot_config = VitalSignsConfigLoader.vitalsigns_load_config(vital_home).registry_snapshot
+
+    if snapshot_config is None or not snapshot_config.enabled:
+        logging.info("Set registry_snapshot: enabled: true in vitalsigns_config.yaml to compare start-up with snapshots.")
+        return
+
+    snapshot_cache = VitalSignsSnapshotCache.for_vital_home(vital_home, snapshot_config.cache_dir)
+
+    cold_times = []
+
+    for _ in range(runs):
+        snapshot_cache.clear()
+        cold_times.append(time_startup())
+
+    # the last cold run left a snapshot behind
+    warm_times = [time_startup() for _ in range(runs)]
+
+    cold = statistics.median(cold_times)
+    warm = statistics.median(warm_times)
+
+    logging.info(f"VitalSigns() startup without snapshot: {cold:.3f} s (median of {runs})")
+    logging.info(f"VitalSigns() startup with snapshot: {warm:.3f} s (median of {runs})")
+    logging.info(f"startup speedup: {cold / warm:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
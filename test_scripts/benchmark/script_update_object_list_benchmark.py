@@ -0,0 +1,122 @@
+import logging
+import time
+from rdflib import URIRef
+from vital_ai_vitalsigns.config.vitalsigns_config import GraphDatabaseConfig
+from vital_ai_vitalsigns.model.GraphObject import GraphObject
+from vital_ai_vitalsigns.model.VITAL_Node import VITAL_Node
+from vital_ai_vitalsigns.service.graph.virtuoso.virtuoso_service import VirtuosoGraphService
+from vital_ai_vitalsigns.vitalsigns import VitalSigns
+from test_scripts.benchmark.local_sparql_endpoint import LocalSparqlEndpoint
+
+
+def create_nodes(count: int, version: int) -> list:
+    node_list = []
+    for i in range(count):
+        node = VITAL_Node()
+        node.URI = f"http://vital.ai/test/node/{i}"
+        node.name = f"node {i} version {version}"
+        node.timestamp = version
+        node_list.append(node)
+    return node_list
+
+
+def update_per_object(service: VirtuosoGraphService, graph_uri: str, node_list: list):
+    # the request pattern update_object_list used before batching
+    for node in node_list:
+        object_uri = str(node.URI)
+        assert service._find_graph(graph_uri, object_uri)
+        service.rest_manager.sparql_update(
+            f"DELETE WHERE {{ GRAPH <{graph_uri}> {{ <{object_uri}> ?p ?o . }} }}")
+        service.rest_manager.sparql_update(
+            f"INSERT DATA {{ GRAPH <{graph_uri}> {{ {node.to_rdf()} }} }}")
+
+
+def check_update(vs: VitalSigns):
+    # run a small update against rdflib to check the replace update is correct
+
+    endpoint = LocalSparqlEndpoint().start()
+
+    config = GraphDatabaseConfig(database_type="virtuoso", endpoint=endpoint.endpoint)
+
+    service = VirtuosoGraphService(config, base_uri="http://vital.ai", namespace="benchmark")
+
+    graph_uri = service.get_graph_uri(graph_id="update-check")
+
+    graph = endpoint.dataset.graph(graph_uri)
+
+    graph.parse(data=GraphObject.to_rdf_list(create_nodes(50, 0)), format='nt')
+
+    triple_count = len(graph)
+
+    status = service.update_object_list(create_nodes(20, 1), graph_id="update-check", chunk_size=8)
+
+    assert status.status == 0, status.message
+    assert status.updated_objects == 20
+    assert len(graph) == triple_count
+
+    updated = GraphObject.from_triples(graph.triples((URIRef("http://vital.ai/test/node/7"), None, None)))
+    assert str(updated.name) == "node 7 version 1"
+
+    untouched = GraphObject.from_triples(graph.triples((URIRef("http://vital.ai/test/node/30"), None, None)))
+    assert str(untouched.name) == "node 30 version 0"
+
+    status = service.update_object_list(create_nodes(60, 2), graph_id="update-check")
+    assert status.status == -1
+
+    service.rest_manager.close()
+    endpoint.stop()
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+
+    vs = VitalSigns()
+
+    check_update(vs)
+
+    count = 10_000
+
+    # the old pattern is 3 requests per object, time it on a sample
+    per_object_count = 1_000
+
+    # stand-in does no work, the timings are round trips plus request building
+    endpoint = LocalSparqlEndpoint(execute=False, latency=0.002).start()
+
+    config = GraphDatabaseConfig(database_type="virtuoso", endpoint=endpoint.endpoint)
+
+    service = VirtuosoGraphService(config, base_uri="http://vital.ai", namespace="benchmark")
+
+    graph_id = "update-benchmark"
+
+    graph_uri = service.get_graph_uri(graph_id=graph_id)
+
+    logging.info(f"stand-in endpoint latency: {endpoint.latency * 1000:.1f} ms per request")
+
+    start_requests = endpoint.request_count
+    start = time.perf_counter()
+    update_per_object(service, graph_uri, create_nodes(per_object_count, 1))
+    elapsed = time.perf_counter() - start
+
+    logging.info(f"per object updates: {per_object_count} objects in {elapsed:.2f} s, "
+                 f"{per_object_count / elapsed:.0f} objects/s, {endpoint.request_count - start_requests} requests")
+
+    for chunk_size in (100, 1_000):
+
+        node_list = create_nodes(count, chunk_size)
+
+        start_requests = endpoint.request_count
+        start = time.perf_counter()
+        status = service.update_object_list(node_list, graph_id=graph_id, chunk_size=chunk_size)
+        elapsed = time.perf_counter() - start
+
+        assert status.status == 0, status.message
+
+        logging.info(f"batched updates, chunk size {chunk_size}: {count} objects in {elapsed:.2f} s, "
+                     f"{count / elapsed:.0f} objects/s, {endpoint.request_count - start_requests} requests")
+
+    service.rest_manager.close()
+    endpoint.stop()
+
+
+if __name__ == "__main__":
+    main()
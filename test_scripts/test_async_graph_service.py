@@ -0,0 +1,47 @@
+"""
+Tests for the asyncio graph service wrapper around the memory service.
+"""
+
+import asyncio
+
+from vital_ai_vitalsigns.config.vitalsigns_config import GraphDatabaseConfig
+from vital_ai_vitalsigns.model.VITAL_Node import VITAL_Node
+from vital_ai_vitalsigns.service.graph.memory.async_memory_graph_service import AsyncMemoryGraphService
+from vital_ai_vitalsigns.vitalsigns import VitalSigns
+
+
+def test_async_memory_service_concurrent_calls():
+
+    vs = VitalSigns()
+
+    async def run():
+
+        service = AsyncMemoryGraphService(GraphDatabaseConfig(database_type="memory", endpoint=None),
+                                          base_uri="http://vital.ai", namespace="test")
+
+        assert await service.create_graph("urn:async_graph")
+
+        node_list = []
+
+        for i in range(10):
+            node = VITAL_Node()
+            node.URI = f"urn:async_node_{i}"
+            node.name = f"node {i}"
+            node_list.append(node)
+
+        # concurrent writes are serialized by the wrapper
+        status_list = await asyncio.gather(
+            *(service.insert_object("urn:async_graph", node) for node in node_list))
+
+        assert all(status.get_status() == 0 for status in status_list)
+
+        result_list = await asyncio.gather(
+            *(service.get_object(f"urn:async_node_{i}", graph_uri="urn:async_graph") for i in range(10)))
+
+        await service.close()
+
+        return result_list
+
+    result_list = asyncio.run(run())
+
+    assert [str(node.name) for node in result_list] == [f"node {i}" for i in range(10)]
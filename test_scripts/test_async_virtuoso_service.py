@@ -0,0 +1,115 @@
+"""
+Tests for AsyncVirtuosoGraphService against the local SPARQL endpoint.
+"""
+
+import asyncio
+import pytest
+
+# the service module imports pyodbc, which needs the unixODBC library
+pytest.importorskip("pyodbc", exc_type=ImportError)
+
+from test_scripts.benchmark.local_sparql_endpoint import LocalSparqlEndpoint
+from vital_ai_vitalsigns.config.vitalsigns_config import GraphDatabaseConfig
+from vital_ai_vitalsigns.model.GraphObject import GraphObject
+from vital_ai_vitalsigns.model.VITAL_Node import VITAL_Node
+from vital_ai_vitalsigns.service.graph.virtuoso.async_virtuoso_service import AsyncVirtuosoGraphService
+from vital_ai_vitalsigns.vitalsigns import VitalSigns
+
+GRAPH_ID = "async-test"
+
+
+def node(i: int, version: int = 0) -> VITAL_Node:
+    n = VITAL_Node()
+    n.URI = f"http://vital.ai/test/node/{i}"
+    n.name = f"node {i} version {version}"
+    return n
+
+
+@pytest.fixture
+def service():
+    vs = VitalSigns()
+    endpoint = LocalSparqlEndpoint().start()
+    config = GraphDatabaseConfig(database_type="virtuoso", endpoint=endpoint.endpoint, retry_backoff_factor=0)
+    service = AsyncVirtuosoGraphService(config, base_uri="http://vital.ai", namespace="test")
+    graph = endpoint.dataset.graph(service.get_graph_uri(graph_id=GRAPH_ID))
+    graph.parse(data=GraphObject.to_rdf_list([node(0)]), format='nt')
+    yield service, endpoint
+    asyncio.run(service.close())
+    endpoint.stop()
+
+
+def test_insert_get_update_delete(service):
+
+    service, endpoint = service
+
+    async def run():
+
+        status = await service.insert_object(GRAPH_ID, node(1))
+        assert status.status == 0, status.message
+
+        status = await service.insert_object_list(GRAPH_ID, [node(2), node(3)])
+        assert status.status == 0, status.message
+
+        # the URI exists already
+        status = await service.insert_object(GRAPH_ID, node(1))
+        assert status.status == -1
+
+        graph_object = await service.get_object(node(1).URI, graph_id=GRAPH_ID)
+        assert str(graph_object.name) == "node 1 version 0"
+
+        result_list = await service.get_object_list([node(3).URI, node(2).URI], graph_id=GRAPH_ID)
+        assert [str(result.graph_object.URI) for result in result_list] == [str(node(3).URI), str(node(2).URI)]
+
+        status = await service.update_object(node(1, 1), graph_id=GRAPH_ID)
+        assert status.status == 0, status.message
+
+        graph_object = await service.get_object(node(1).URI, graph_id=GRAPH_ID)
+        assert str(graph_object.name) == "node 1 version 1"
+
+        status = await service.delete_object_list([node(2).URI, node(3).URI], graph_id=GRAPH_ID)
+        assert status.status == 0, status.message
+
+        assert await service.get_object(node(2).URI, graph_id=GRAPH_ID) is None
+        assert await service.get_object(node(1).URI, graph_id=GRAPH_ID) is not None
+
+    asyncio.run(run())
+
+
+def test_not_found(service):
+
+    service, endpoint = service
+
+    async def run():
+
+        assert await service.get_object(node(9).URI, graph_id=GRAPH_ID) is None
+
+        with pytest.raises(ValueError):
+            await service.get_object_list([node(0).URI, node(9).URI], graph_id=GRAPH_ID)
+
+        with pytest.raises(ValueError):
+            await service.get_object(node(0).URI, graph_id="missing-graph")
+
+        status = await service.update_object(node(9), graph_id=GRAPH_ID)
+        assert status.status == -1
+
+        status = await service.delete_object(node(9).URI, graph_id=GRAPH_ID)
+        assert status.status == -1
+
+    asyncio.run(run())
+
+
+def test_retry_and_new_event_loop(service):
+
+    service, endpoint = service
+
+    endpoint.overloaded_responses = 2
+
+    graph_object = asyncio.run(service.get_object(node(0).URI, graph_id=GRAPH_ID))
+
+    assert str(graph_object.name) == "node 0 version 0"
+    assert endpoint.overloaded_responses == 0
+
+    # the session of the first loop cannot be used from a second one
+    graph_object = asyncio.run(service.get_object(node(0).URI, graph_id=GRAPH_ID))
+
+    assert str(graph_object.name) == "node 0 version 0"
@@ -0,0 +1,108 @@
+"""
+Tests that generated classes with compact slotted storage read and write properties like the default classes.
+"""
+
+import json
+from vital_ai_vitalsigns.model.utils.compact_property_map import CompactPropertyMap
+from vital_ai_vitalsigns.vitalsigns import VitalSigns
+from vital_ai_vitalsigns_core.model.VITAL_Category import VITAL_Category
+from vital_ai_vitalsigns_generate.generate.class_generator import VitalSignsClassGenerator
+from vital_ai_vitalsigns_generate.vitalsigns_ontology_generator import VitalSignsOntologyGenerator
+
+
+def generate_node_class(class_name: str, compact: bool,
+                        parent_class_import: str = 'vital_ai_vitalsigns.model.VITAL_Node',
+                        parent_class_name: str = 'VITAL_Node'):
+
+    class_string = VitalSignsClassGenerator.generate_class_string(
+        parent_class_import,
+        parent_class_name,
+        class_name,
+        'http://vital.ai/ontology/vital-core#VITAL_Node',
+        [],
+        compact=compact)
+
+    namespace = {}
+    exec(class_string, namespace)
+    return namespace[class_name]
+
+
+def fill(node_class):
+
+    node = node_class()
+    node.URI = 'urn:node_1'
+    node.name = 'Node 1'
+    node.timestamp = 100
+    node.active = True
+
+    return node
+
+
+def test_generator_option():
+
+    assert VitalSignsOntologyGenerator().compact_storage is False
+    assert VitalSignsOntologyGenerator(compact_storage=True).compact_storage is True
+
+    class_string = VitalSignsClassGenerator.generate_class_string(
+        'vital_ai_vitalsigns.model.VITAL_Node', 'VITAL_Node', 'CompactNode',
+        'http://vital.ai/ontology/vital-core#VITAL_Node', [], compact=True)
+
+    assert "__slots__ = ()" in class_string
+    assert "_compact_storage = True" in class_string
+
+
+def test_compact_and_default_storage_behave_the_same():
+
+    vs = VitalSigns()
+
+    default_class = generate_node_class('DefaultTestNode', compact=False)
+    compact_class = generate_node_class('CompactTestNode', compact=True)
+
+    default_node = fill(default_class)
+    compact_node = fill(compact_class)
+
+    assert isinstance(compact_node._properties, CompactPropertyMap)
+    assert not isinstance(default_node._properties, CompactPropertyMap)
+    assert not hasattr(compact_node, '__dict__')
+
+    for node in (default_node, compact_node):
+        assert str(node.URI) == 'urn:node_1'
+        assert str(node.name) == 'Node 1'
+        assert int(node.timestamp) == 100
+        assert bool(node.active) is True
+
+    # overwrite and clear a property
+    for node in (default_node, compact_node):
+        node.name = 'Renamed'
+        node.timestamp = 200
+        node.active = None
+
+    for node in (default_node, compact_node):
+        assert str(node.name) == 'Renamed'
+        assert int(node.timestamp) == 200
+        assert node.active is None
+
+    assert set(default_node._properties) == set(compact_node._properties)
+
+    default_json = json.loads(default_node.to_json())
+    compact_json = json.loads(compact_node.to_json())
+
+    assert default_json == compact_json
+
+
+def test_compact_class_under_core_class_has_no_dict():
+
+    vs = VitalSigns()
+
+    compact_class = generate_node_class('CompactCategory', compact=True,
+                                        parent_class_import='vital_ai_vitalsigns_core.model.VITAL_Category',
+                                        parent_class_name='VITAL_Category')
+
+    node = fill(compact_class)
+
+    assert not hasattr(node, '__dict__')
+    assert compact_class.__dictoffset__ == 0
+    assert str(node.name) == 'Node 1'
+
+    # the core model classes declare __slots__, so their subclasses can drop the __dict__
+    assert not hasattr(VITAL_Category(), '__dict__')
@@ -0,0 +1,156 @@
+"""
+Tests for the batching, caching and ordering of EmbeddingModel.vectorize, with a stub tokenizer and session.
+"""
+
+import gc
+import numpy as np
+import pytest
+
+# the embedding model imports the tokenizer from transformers
+pytest.importorskip("transformers")
+
+from vital_ai_vitalsigns.embedding import embedding_model
+
+
+class StubTokenizer:
+    """Token ids are the character codes of the text, padded with 0."""
+
+    def __call__(self, texts, **kwargs):
+
+        length = max(len(text) for text in texts)
+
+        input_ids = np.array([[ord(c) for c in text] + [0] * (length - len(text)) for text in texts])
+
+        return {
+            "input_ids": input_ids,
+            "attention_mask": (input_ids > 0).astype(np.int64),
+            "token_type_ids": np.zeros_like(input_ids)
+        }
+
+
+class StubSession:
+    """The embedding of a text is the sum of its character codes and its length."""
+
+    def __init__(self, *args, **kwargs):
+        self.embedded_texts = 0
+
+    def run(self, output_names, ort_inputs):
+
+        input_ids = ort_inputs["input_ids"]
+        attention_mask = ort_inputs["attention_mask"]
+
+        self.embedded_texts += len(input_ids)
+
+        embeddings = np.stack([(input_ids * attention_mask).sum(1), attention_mask.sum(1)], 1)
+
+        return [None, embeddings.astype(np.float32)]
+
+
+def expected(text: str) -> np.ndarray:
+    return np.array([sum(ord(c) for c in text), len(text)], dtype=np.float32)
+
+
+@pytest.fixture
+def create_model(monkeypatch):
+
+    monkeypatch.setattr(embedding_model.AutoTokenizer, "from_pretrained", lambda path: StubTokenizer())
+    monkeypatch.setattr(embedding_model.ort, "InferenceSession", StubSession)
+    monkeypatch.setattr(embedding_model, "get_model_file", lambda package_name, file_name: file_name)
+
+    return embedding_model.EmbeddingModel
+
+
+def test_vectorize_keeps_input_order(create_model):
+
+    model = create_model(batch_size=4)
+
+    text_list = ["x" * (i * 7 % 23 + 1) + str(i) for i in range(30)]
+
+    # cache some of the texts first
+    model.vectorize(text_list[::3])
+
+    model.ort_session.embedded_texts = 0
+
+    text_list = text_list + text_list[:5]
+
+    vector_list = model.vectorize(text_list)
+
+    assert len(vector_list) == len(text_list)
+    assert all((vector == expected(text)).all() for vector, text in zip(vector_list, text_list))
+
+    # the uncached texts, each embedded once
+    assert model.ort_session.embedded_texts == 20
+
+    assert (model.vectorize("single text") == expected("single text")).all()
+
+
+def test_vectorize_raises_errors(create_model):
+
+    model = create_model(batch_size=4)
+
+    def fail_tokenize(texts, **kwargs):
+        raise KeyError("tokenizer failed")
+
+    def fail_run(output_names, ort_inputs):
+        raise RuntimeError("session failed")
+
+    model.tokenizer = fail_tokenize
+
+    # raised in the tokenizer thread of the pipeline
+    with pytest.raises(KeyError):
+        model.vectorize([f"text {i}" for i in range(20)])
+
+    with pytest.raises(KeyError):
+        model.vectorize("text")
+
+    model.tokenizer = StubTokenizer()
+    model.ort_session.run = fail_run
+
+    with pytest.raises(RuntimeError):
+        model.vectorize([f"text {i}" for i in range(20)])
+
+    assert len(model.cache.cache) == 0
+
+
+class StubProcessPool:
+    """Runs the batches in this process, recording shutdown."""
+
+    shutdown_count = 0
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def map(self, fn, batch_list):
+        return [np.stack([expected(text) for text in batch]) for batch in batch_list]
+
+    def shutdown(self):
+        StubProcessPool.shutdown_count += 1
+
+
+def test_process_pool_is_shut_down(create_model, monkeypatch):
+
+    monkeypatch.setattr(embedding_model, "ProcessPoolExecutor", StubProcessPool)
+
+    StubProcessPool.shutdown_count = 0
+
+    text_list = [f"text {i}" for i in range(20)]
+
+    model = create_model(batch_size=4, num_processes=2)
+
+    vector_list = model.vectorize(text_list)
+
+    assert all((vector == expected(text)).all() for vector, text in zip(vector_list, text_list))
+
+    model.close()
+    model.close()
+
+    assert StubProcessPool.shutdown_count == 1
+
+    # a model that is never closed, as the models shared through VitalSigns are
+    model = create_model(batch_size=4, num_processes=2)
+    model.vectorize(text_list)
+
+    del model
+    gc.collect()
+
+    assert StubProcessPool.shutdown_count == 2
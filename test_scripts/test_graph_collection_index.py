@@ -0,0 +1,134 @@
+"""
+Tests for the URI and adjacency indexes of GraphCollection and the URI index of GraphPart.
+"""
+
+from vital_ai_vitalsigns.collection.graph_collection import GraphCollection
+from vital_ai_vitalsigns.model.VITAL_Edge import VITAL_Edge
+from vital_ai_vitalsigns.model.VITAL_HyperEdge import VITAL_HyperEdge
+from vital_ai_vitalsigns.model.VITAL_Node import VITAL_Node
+from vital_ai_vitalsigns.part.graph_part import GraphPart
+from vital_ai_vitalsigns.vitalsigns import VitalSigns
+
+
+def node(i: int, name: str | None = None) -> VITAL_Node:
+    n = VITAL_Node()
+    n.URI = f"urn:node_{i}"
+    n.name = name or f"node {i}"
+    return n
+
+
+def uri_list(sequence) -> list:
+    return [str(obj.URI) for obj in sequence]
+
+
+def test_collection_keeps_sequence_semantics():
+
+    vs = VitalSigns()
+
+    collection = GraphCollection(use_rdfstore=False, use_vectordb=False)
+
+    collection.add_objects([node(i) for i in range(6)])
+
+    assert len(collection) == 6
+    assert str(collection.get("urn:node_3").name) == "node 3"
+    assert collection.get("urn:missing") is None
+
+    # adding a URI again replaces the object and moves it to the end
+    collection.add(node(1, "node one"))
+
+    assert uri_list(collection) == ["urn:node_0", "urn:node_2", "urn:node_3", "urn:node_4", "urn:node_5", "urn:node_1"]
+    assert str(collection.get("urn:node_1").name) == "node one"
+
+    assert str(collection.pop_uri("urn:node_3").URI) == "urn:node_3"
+    assert collection.pop_uri("urn:node_3") is None
+
+    # positions count the remaining objects only
+    assert str(collection[2].URI) == "urn:node_4"
+    assert str(collection[-1].URI) == "urn:node_1"
+
+    collection.insert(1, node(7))
+    collection[0] = node(8)
+
+    assert uri_list(collection) == ["urn:node_8", "urn:node_7", "urn:node_2", "urn:node_4", "urn:node_5", "urn:node_1"]
+    assert collection.get("urn:node_0") is None
+    assert str(collection.get("urn:node_5").URI) == "urn:node_5"
+
+    collection.remove_objects(["urn:node_7", "urn:node_5", "urn:missing"])
+
+    del collection[0]
+
+    assert uri_list(collection) == ["urn:node_2", "urn:node_4", "urn:node_1"]
+    assert str(collection.pop().URI) == "urn:node_1"
+    assert str(collection.get("urn:node_4").URI) == "urn:node_4"
+    assert len(collection) == 2
+
+
+def test_part_keeps_sequence_semantics():
+
+    vs = VitalSigns()
+
+    part = GraphPart([node(i) for i in range(4)])
+
+    part.add(node(0, "node zero"))
+    part.remove_objects(["urn:node_2"])
+
+    assert uri_list(part) == ["urn:node_1", "urn:node_3", "urn:node_0"]
+    assert str(part.get("urn:node_0").name) == "node zero"
+    assert str(part.pop("urn:node_1").URI) == "urn:node_1"
+    assert part.pop("urn:node_1") is None
+    assert str(part[0].URI) == "urn:node_3"
+
+
+def edge(source: int, destination: int) -> VITAL_Edge:
+    e = VITAL_Edge()
+    e.URI = f"urn:edge_{source}_{destination}"
+    e.edgeSource = f"urn:node_{source}"
+    e.edgeDestination = f"urn:node_{destination}"
+    return e
+
+
+def test_collection_adjacency_index():
+
+    vs = VitalSigns()
+
+    collection = GraphCollection(use_rdfstore=False, use_vectordb=False)
+
+    collection.add_objects([node(i) for i in range(6)])
+
+    # 0 -> 1 -> 2 -> 3, 0 -> 4
+    collection.add_objects([edge(0, 1), edge(1, 2), edge(2, 3), edge(0, 4)])
+
+    hyper_edge = VITAL_HyperEdge()
+    hyper_edge.URI = "urn:hyper_edge"
+    hyper_edge.hyperEdgeSource = "urn:node_3"
+    hyper_edge.hyperEdgeDestination = "urn:edge_0_1"
+
+    collection.add(hyper_edge)
+
+    assert uri_list(collection.get_edges_outgoing("urn:node_0")) == ["urn:edge_0_1", "urn:edge_0_4"]
+    assert uri_list(collection.get_edges_incoming("urn:node_2")) == ["urn:edge_1_2"]
+    assert uri_list(collection.get_nodes_incoming("urn:node_1")) == ["urn:node_0"]
+    assert uri_list(collection.get_nodes_outgoing("urn:node_0")) == ["urn:node_1", "urn:node_4"]
+
+    assert collection.get_edges_outgoing("urn:node_3") == []
+    assert uri_list(collection.get_edges_outgoing("urn:node_3", VITAL_HyperEdge)) == ["urn:hyper_edge"]
+
+    assert uri_list(collection.neighbors("urn:node_0", 2)) == ["urn:node_1", "urn:node_4", "urn:node_2"]
+    assert uri_list(collection.neighbors("urn:node_3", 1, direction="incoming", edge_class=VITAL_Edge)) == \
+        ["urn:node_2"]
+
+    # the hyperedge leads from node 3 to the edge from node 0
+    assert [(str(obj.URI), depth) for obj, depth in collection.bfs("urn:node_2")] == \
+        [("urn:node_2", 0), ("urn:node_3", 1), ("urn:edge_0_1", 2)]
+
+    # an edge moved in place is re-indexed
+    collection.get("urn:edge_0_4").edgeDestination = "urn:node_5"
+
+    assert uri_list(collection.get_nodes_outgoing("urn:node_0")) == ["urn:node_1", "urn:node_5"]
+    assert collection.get_edges_incoming("urn:node_4") == []
+
+    collection.remove_objects(["urn:edge_1_2"])
+    collection.pop_uri("urn:edge_0_1")
+
+    assert uri_list(collection.neighbors("urn:node_0", 3)) == ["urn:node_5"]
+    assert collection.get_edges_incoming("urn:node_2") == []
@@ -0,0 +1,112 @@
+"""
+Tests for the graph object tracker and the per-class property tables of GraphObject.
+"""
+
+import gc
+import pytest
+from vital_ai_vitalsigns.impl.graph_object_tracker import GraphObjectTracker, GraphObjectTrackingPolicy
+from vital_ai_vitalsigns.model.VITAL_GraphContainerObject import VITAL_GraphContainerObject
+from vital_ai_vitalsigns.model.VITAL_Node import VITAL_Node
+from vital_ai_vitalsigns.model.utils.graphobject_property_table import GraphObjectPropertyTable
+from vital_ai_vitalsigns.model.vital_constants import VitalConstants
+from vital_ai_vitalsigns.vitalsigns import VitalSigns
+
+NAME_URI = "http://vital.ai/ontology/vital-core#hasName"
+
+
+@pytest.fixture
+def vs():
+    vs = VitalSigns()
+    yield vs
+    vs.set_graph_object_tracking(GraphObjectTrackingPolicy.FULL)
+
+
+def test_full_tracking_registers_and_releases(vs):
+
+    vs.set_graph_object_tracking(GraphObjectTrackingPolicy.FULL)
+
+    tracker = vs.get_graph_object_tracker()
+
+    node = VITAL_Node()
+    other = VITAL_Node()
+
+    assert tracker.tracked_count() == 2
+    assert any(obj is node for obj in tracker.tracked_objects())
+
+    vs.remove_graph_object(other)
+
+    assert tracker.tracked_count() == 1
+
+    # untracking an object that is not tracked changes nothing
+    vs.remove_graph_object(other)
+
+    assert tracker.tracked_count() == 1
+
+    # collected objects drop out without a sweep
+    del node
+    gc.collect()
+
+    assert tracker.tracked_count() == 0
+
+
+def test_sampled_and_off_tracking(vs):
+
+    vs.set_graph_object_tracking(GraphObjectTrackingPolicy.SAMPLED, sample_interval=3)
+
+    node_list = [VITAL_Node() for _ in range(9)]
+
+    assert vs.get_graph_object_tracker().tracked_count() == 3
+
+    vs.set_graph_object_tracking(GraphObjectTrackingPolicy.OFF)
+
+    assert GraphObjectTracker.active_tracker is None
+
+    node_list.append(VITAL_Node())
+
+    assert vs.get_graph_object_tracker().tracked_count() == 0
+
+    with pytest.raises(ValueError):
+        GraphObjectTracker("everything")
+
+    with pytest.raises(ValueError):
+        GraphObjectTracker(GraphObjectTrackingPolicy.SAMPLED, sample_interval=0)
+
+
+def test_property_table_resolves_names_and_uris(vs):
+
+    table = VITAL_Node.get_property_table()
+
+    assert GraphObjectPropertyTable.get_table(VITAL_Node) is table
+
+    entry = table.resolve("name")
+
+    assert entry is not None
+    assert entry.uri == NAME_URI
+    assert table.resolve(NAME_URI) is entry
+    assert table.resolve("noSuchProperty") is None
+
+    # the URI property takes the first position for compact storage
+    assert table.entries[0].uri == VitalConstants.uri_prop_uri
+    assert table.positions[NAME_URI] == table.entries.index(entry)
+
+    assert str(entry.create_property("Node").value) == "Node"
+
+    assert table.allows_extern is False
+    assert VITAL_GraphContainerObject.get_property_table().allows_extern is True
+
+    node = VITAL_Node()
+    node.name = "Node"
+
+    assert str(node._properties[NAME_URI].value) == "Node"
+
+    with pytest.raises(AttributeError):
+        node.noSuchProperty = "value"
+
+    GraphObjectPropertyTable.invalidate()
+
+    assert GraphObjectPropertyTable.table_count() == 0
+
+    rebuilt = VITAL_Node.get_property_table()
+
+    assert rebuilt is not table
+    assert rebuilt.resolve("name").uri == NAME_URI
@@ -0,0 +1,177 @@
+"""
+Tests for MetaQL aggregate queries.
+"""
+
+from rdflib import Dataset, URIRef, Literal, RDF
+
+from vital_ai_vitalsigns.config.vitalsigns_config import GraphDatabaseConfig
+from vital_ai_vitalsigns.metaql.query.query_builder import QueryBuilder, AndConstraintList, ClassConstraint, Arc, \
+    NodeBind, EdgeBind, PropertyConstraint, ConstraintType, Aggregate
+from vital_ai_vitalsigns.model.VITAL_Edge import VITAL_Edge
+from vital_ai_vitalsigns.model.VITAL_Node import VITAL_Node
+from vital_ai_vitalsigns.service.graph.memory.memory_graph_service import MemoryGraphService
+from vital_ai_vitalsigns.service.metaql.metaql_aggregate_impl import build_aggregate_sparql, AGGREGATE_VALUE_BINDING
+from vital_ai_vitalsigns.service.metaql.metaql_sparql_builder import MetaQLSparqlBuilder
+from vital_ai_vitalsigns.vitalsigns import VitalSigns
+
+GRAPH_ID = "urn:metaql_aggregate_graph"
+
+VITAL_CORE = "http://vital.ai/ontology/vital-core#"
+HAS_NAME = VITAL_CORE + "hasName"
+HAS_TIMESTAMP = VITAL_CORE + "hasTimestamp"
+
+
+def create_service() -> MemoryGraphService:
+
+    service = MemoryGraphService(GraphDatabaseConfig(database_type="memory", endpoint=None),
+                                 base_uri="http://vital.ai", namespace="test")
+
+    service.create_graph(GRAPH_ID)
+
+    object_list = []
+
+    for i in range(6):
+        node = VITAL_Node()
+        node.URI = f"urn:node_{i}"
+        node.name = f"node {i}"
+        node.timestamp = i * 10
+        object_list.append(node)
+
+    # node 0 links to every other node, node 1 to node 2 as well
+    for i in range(1, 6):
+        edge = VITAL_Edge()
+        edge.URI = f"urn:edge_0_{i}"
+        edge.edgeSource = "urn:node_0"
+        edge.edgeDestination = f"urn:node_{i}"
+        object_list.append(edge)
+
+    edge = VITAL_Edge()
+    edge.URI = "urn:edge_1_2"
+    edge.edgeSource = "urn:node_1"
+    edge.edgeDestination = "urn:node_2"
+    object_list.append(edge)
+
+    service.insert_object_list(GRAPH_ID, object_list)
+
+    return service
+
+
+def aggregate_graph_query(aggregate: Aggregate):
+
+    return (
+        QueryBuilder.aggregate_graph_query()
+        .graph_id(GRAPH_ID)
+        .arc(
+            Arc()
+            .node_bind(NodeBind(name="start"))
+            .constraint_list(AndConstraintList().node_constraint(ClassConstraint(clazz=VITAL_Node.get_class_uri())))
+            .arc(
+                Arc()
+                .node_bind(NodeBind(name="end"))
+                .edge_bind(EdgeBind(name="edge"))
+                .constraint_list(
+                    AndConstraintList().node_constraint(ClassConstraint(clazz=VITAL_Node.get_class_uri())))
+            )
+        )
+        .aggregate(aggregate)
+        .build()
+    )
+
+
+def aggregate_value(metaql_result):
+
+    result_list = metaql_result.get_result_list()
+
+    assert len(result_list) == 1
+
+    aggregation_result = result_list[0].graph_object
+
+    return aggregation_result.aggregationType, aggregation_result.value
+
+
+def test_memory_aggregate_graph_query():
+
+    vs = VitalSigns()
+
+    service = create_service()
+
+    # node 2 is the end of two arcs but counts once
+    count_query = aggregate_graph_query(Aggregate(aggregate_type="COUNT", binding="end", provides_name="end_count"))
+
+    metaql_result = service.metaql_graph_query(graph_query=count_query)
+
+    assert aggregate_value(metaql_result) == ("COUNT", 5.0)
+    assert str(metaql_result.get_result_list()[0].graph_object.name) == "end_count"
+
+    expected = {
+        "SUM": 150.0,
+        "AVERAGE": 30.0,
+        "MINIMUM": 10.0,
+        "MAXIMUM": 50.0,
+    }
+
+    for aggregate_type, value in expected.items():
+        query = aggregate_graph_query(Aggregate(aggregate_type=aggregate_type, binding="end", property=HAS_TIMESTAMP))
+        assert aggregate_value(service.metaql_graph_query(graph_query=query)) == (aggregate_type, value)
+
+    # the root binding by default
+    query = aggregate_graph_query(Aggregate(aggregate_type="SUM", property=HAS_TIMESTAMP))
+    assert aggregate_value(service.metaql_graph_query(graph_query=query)) == ("SUM", 10.0)
+
+
+def test_memory_aggregate_select_query():
+
+    vs = VitalSigns()
+
+    service = create_service()
+
+    select_query = (
+        QueryBuilder.aggregate_select_query()
+        .graph_id(GRAPH_ID)
+        .constraint_list(
+            AndConstraintList()
+            .node_constraint(ClassConstraint(clazz=VITAL_Node.get_class_uri()))
+            .node_constraint(PropertyConstraint(property=HAS_NAME, comparator=ConstraintType.STRING_CONTAINS,
+                                                value="node"))
+        )
+        .aggregate(Aggregate(aggregate_type="MAXIMUM", property=HAS_TIMESTAMP))
+        .build()
+    )
+
+    assert aggregate_value(service.metaql_select_query(select_query=select_query)) == ("MAXIMUM", 50.0)
+
+
+def test_aggregate_sparql_matches_memory_aggregate():
+
+    vs = VitalSigns()
+
+    dataset = Dataset()
+
+    graph = dataset.graph(URIRef(GRAPH_ID))
+
+    node_type = URIRef(VITAL_Node.get_class_uri())
+
+    for i in range(6):
+        node = URIRef(f"urn:node_{i}")
+        graph.add((node, RDF.type, node_type))
+        graph.add((node, URIRef(HAS_TIMESTAMP), Literal(i * 10)))
+
+    for i in range(1, 6):
+        edge = URIRef(f"urn:edge_0_{i}")
+        graph.add((edge, RDF.type, URIRef(VITAL_Edge.get_class_uri())))
+        graph.add((edge, URIRef(VITAL_CORE + "hasEdgeSource"), URIRef("urn:node_0")))
+        graph.add((edge, URIRef(VITAL_CORE + "hasEdgeDestination"), URIRef(f"urn:node_{i}")))
+
+    query = aggregate_graph_query(Aggregate(aggregate_type="AVERAGE", binding="end", property=HAS_TIMESTAMP))
+
+    sparql_impl = MetaQLSparqlBuilder().build_sparql(query)
+
+    sparql = build_aggregate_sparql(
+        graph_uri_list=[GRAPH_ID],
+        query_string="\n".join(sparql_impl.get_arc_constraint_list()),
+        binding="end",
+        aggregate=query['aggregate'])
+
+    row_list = list(dataset.query(sparql))
+
+    assert float(row_list[0][AGGREGATE_VALUE_BINDING]) == 30.0
@@ -0,0 +1,124 @@
+"""
+Tests for ordering the terms of a MetaQL graph query by estimated selectivity.
+"""
+
+import logging
+
+from rdflib import Graph, URIRef, RDF
+
+from vital_ai_vitalsigns.metaql.query.query_builder import QueryBuilder, AndConstraintList, ClassConstraint, Arc, \
+    NodeBind, EdgeBind, PropertyConstraint, ConstraintType
+from vital_ai_vitalsigns.model.VITAL_Edge import VITAL_Edge
+from vital_ai_vitalsigns.model.VITAL_Node import VITAL_Node
+from vital_ai_vitalsigns.service.metaql.metaql_arc_optimizer import MetaQLArcOptimizer, MetaQLGraphStatistics
+from vital_ai_vitalsigns.service.metaql.metaql_sparql_builder import MetaQLSparqlBuilder
+from vital_ai_vitalsigns.vitalsigns import VitalSigns
+
+VITAL_CORE = "http://vital.ai/ontology/vital-core#"
+HAS_PROVENANCE = VITAL_CORE + "hasProvenance"
+
+
+def graph_query():
+
+    return (
+        QueryBuilder.graph_query(limit=100)
+        .graph_id("graph1")
+        .arc(
+            Arc()
+            .node_bind(NodeBind(name="start"))
+            .constraint_list(AndConstraintList().node_constraint(ClassConstraint(clazz=VITAL_Node.get_class_uri())))
+            .arc(
+                Arc()
+                .node_bind(NodeBind(name="end"))
+                .edge_bind(EdgeBind(name="edge"))
+                .constraint_list(
+                    AndConstraintList()
+                    .node_constraint(ClassConstraint(clazz=VITAL_Node.get_class_uri()))
+                    .node_constraint(
+                        PropertyConstraint(property=HAS_PROVENANCE, comparator=ConstraintType.EQUAL_TO,
+                                           value="urn:source_3"))
+                )
+            )
+        )
+        .build()
+    )
+
+
+def select_rows(graph: Graph, sparql_impl) -> list:
+
+    binding_list = sparql_impl.get_binding_list()
+
+    variables = " ".join(f"?{binding}" for binding in binding_list)
+
+    terms = "\n".join(sparql_impl.get_arc_constraint_list())
+
+    query = f"""
+    PREFIX vital-core: <{VITAL_CORE}>
+    SELECT DISTINCT {variables} WHERE {{
+    {terms}
+    }}
+    ORDER BY {variables}
+    """
+
+    return [tuple(str(row[binding]) for binding in binding_list) for row in graph.query(query)]
+
+
+def test_optimizer_starts_from_the_selective_term(caplog):
+
+    vs = VitalSigns()
+
+    sparql_impl = MetaQLSparqlBuilder().build_sparql(graph_query())
+
+    request_order = list(sparql_impl.get_arc_constraint_list())
+
+    statistics = MetaQLGraphStatistics({VITAL_Node.get_class_uri(): 50_000})
+
+    with caplog.at_level(logging.INFO):
+        MetaQLArcOptimizer(statistics).optimize(sparql_impl, explain=True)
+
+    term_list = sparql_impl.get_arc_constraint_list()
+
+    assert sorted(term_list) == sorted(request_order)
+
+    # the provenance value first, the class check on the bound node,
+    # then the edge back to the start node
+    assert term_list[0] == f"?end <{HAS_PROVENANCE}> <urn:source_3> ."
+    assert term_list[1] == f"?end a <{VITAL_Node.get_class_uri()}> ."
+    assert term_list[2].startswith("?edge vital-core:hasEdgeDestination ?end")
+    assert term_list[-1] == f"?start a <{VITAL_Node.get_class_uri()}> ."
+
+    assert "MetaQL term order:" in caplog.text
+
+
+def test_optimized_order_returns_the_same_solutions():
+
+    vs = VitalSigns()
+
+    graph = Graph()
+
+    node_type = URIRef(VITAL_Node.get_class_uri())
+    edge_type = URIRef(VITAL_Edge.get_class_uri())
+
+    for i in range(10):
+        node = URIRef(f"urn:node_{i}")
+        graph.add((node, RDF.type, node_type))
+        graph.add((node, URIRef(HAS_PROVENANCE), URIRef(f"urn:source_{i % 4}")))
+
+    for i in range(10):
+        for j in (1, 2):
+            edge = URIRef(f"urn:edge_{i}_{j}")
+            graph.add((edge, RDF.type, edge_type))
+            graph.add((edge, URIRef(VITAL_CORE + "hasEdgeSource"), URIRef(f"urn:node_{i}")))
+            graph.add((edge, URIRef(VITAL_CORE + "hasEdgeDestination"), URIRef(f"urn:node_{(i + j) % 10}")))
+
+    sparql_impl = MetaQLSparqlBuilder().build_sparql(graph_query())
+
+    expected = select_rows(graph, sparql_impl)
+
+    assert len(expected) == 4
+
+    statistics = MetaQLGraphStatistics({VITAL_Node.get_class_uri(): 10, VITAL_Edge.get_class_uri(): 20})
+
+    MetaQLArcOptimizer(statistics).optimize(sparql_impl)
+
+    assert select_rows(graph, sparql_impl) == expected
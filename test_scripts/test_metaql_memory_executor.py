@@ -0,0 +1,122 @@
+"""
+Tests for running MetaQL queries natively against the memory graph service.
+"""
+
+from vital_ai_vitalsigns.config.vitalsigns_config import GraphDatabaseConfig
+from vital_ai_vitalsigns.metaql.query.query_builder import QueryBuilder, AndConstraintList, ClassConstraint, Arc, \
+    NodeBind, EdgeBind, PropertyConstraint, ConstraintType
+from vital_ai_vitalsigns.model.VITAL_Edge import VITAL_Edge
+from vital_ai_vitalsigns.model.VITAL_Node import VITAL_Node
+from vital_ai_vitalsigns.service.graph.memory.memory_graph_service import MemoryGraphService
+from vital_ai_vitalsigns.vitalsigns import VitalSigns
+
+GRAPH_ID = "urn:metaql_memory_graph"
+
+HAS_NAME = "http://vital.ai/ontology/vital-core#hasName"
+
+
+def create_service() -> MemoryGraphService:
+
+    service = MemoryGraphService(GraphDatabaseConfig(database_type="memory", endpoint=None),
+                                 base_uri="http://vital.ai", namespace="test")
+
+    service.create_graph(GRAPH_ID)
+
+    object_list = []
+
+    for i in range(6):
+        node = VITAL_Node()
+        node.URI = f"urn:node_{i}"
+        node.name = f"node {i}"
+        object_list.append(node)
+
+    # a chain 0 -> 1 -> ... -> 5
+    for i in range(5):
+        edge = VITAL_Edge()
+        edge.URI = f"urn:edge_{i}"
+        edge.edgeSource = f"urn:node_{i}"
+        edge.edgeDestination = f"urn:node_{i + 1}"
+        object_list.append(edge)
+
+    service.insert_object_list(GRAPH_ID, object_list)
+
+    return service
+
+
+def node_constraint():
+    return AndConstraintList().node_constraint(ClassConstraint(clazz=VITAL_Node.get_class_uri()))
+
+
+def test_graph_query_two_hops():
+
+    vs = VitalSigns()
+
+    service = create_service()
+
+    def graph_query(limit, offset):
+        return (
+            QueryBuilder.graph_query(offset=offset, limit=limit, resolve_objects=True)
+            .graph_id(GRAPH_ID)
+            .arc(
+                Arc()
+                .node_bind(NodeBind(name="start"))
+                .constraint_list(node_constraint())
+                .arc(
+                    Arc()
+                    .node_bind(NodeBind(name="middle"))
+                    .edge_bind(EdgeBind(name="edge"))
+                    .constraint_list(node_constraint())
+                    .arc(
+                        Arc()
+                        .node_bind(NodeBind(name="end"))
+                        .constraint_list(node_constraint())
+                    )
+                )
+            )
+            .build()
+        )
+
+    metaql_result = service.metaql_graph_query(graph_query=graph_query(10, 0))
+
+    binding_list = metaql_result.get_binding_list()
+
+    assert binding_list[0] == "start"
+
+    rows = [tuple(str(r.graph_object.get_property(binding)) for binding in ("start", "middle", "end"))
+            for r in metaql_result.get_result_list()]
+
+    assert rows == [(f"urn:node_{i}", f"urn:node_{i + 1}", f"urn:node_{i + 2}") for i in range(4)]
+
+    # pages follow the same order
+    metaql_result = service.metaql_graph_query(graph_query=graph_query(2, 1))
+
+    assert [str(r.graph_object.get_property("start")) for r in metaql_result.get_result_list()] == \
+           ["urn:node_1", "urn:node_2"]
+
+
+def test_select_query_string_constraint():
+
+    vs = VitalSigns()
+
+    service = create_service()
+
+    select_query = (
+        QueryBuilder.select_query(limit=10, offset=0)
+        .graph_id(GRAPH_ID)
+        .constraint_list(
+            AndConstraintList()
+            .node_constraint(
+                PropertyConstraint(
+                    property=HAS_NAME,
+                    comparator=ConstraintType.STRING_CONTAINS,
+                    value="Node 3"
+                )
+            )
+            .node_constraint(ClassConstraint(clazz=VITAL_Node.get_class_uri()))
+        )
+        .build()
+    )
+
+    metaql_result = service.metaql_select_query(select_query=select_query)
+
+    assert [str(r.graph_object.URI) for r in metaql_result.get_result_list()] == ["urn:node_3"]
@@ -0,0 +1,166 @@
+"""
+Tests for MetaQL total counts and cursor pagination.
+"""
+
+import pytest
+
+from rdflib import Dataset, URIRef, RDF
+
+from vital_ai_vitalsigns.config.vitalsigns_config import GraphDatabaseConfig
+from vital_ai_vitalsigns.metaql.query.query_builder import QueryBuilder, AndConstraintList, ClassConstraint, Arc, \
+    NodeBind, EdgeBind
+from vital_ai_vitalsigns.model.VITAL_Edge import VITAL_Edge
+from vital_ai_vitalsigns.model.VITAL_Node import VITAL_Node
+from vital_ai_vitalsigns.service.graph.memory.memory_graph_service import MemoryGraphService
+from vital_ai_vitalsigns.service.metaql.metaql_pagination import build_count_sparql, build_cursor_filter, \
+    decode_cursor, encode_cursor, COUNT_BINDING
+from vital_ai_vitalsigns.vitalsigns import VitalSigns
+
+GRAPH_ID = "urn:metaql_pagination_graph"
+
+VITAL_CORE = "http://vital.ai/ontology/vital-core#"
+
+
+def create_service() -> MemoryGraphService:
+
+    service = MemoryGraphService(GraphDatabaseConfig(database_type="memory", endpoint=None),
+                                 base_uri="http://vital.ai", namespace="test")
+
+    service.create_graph(GRAPH_ID)
+
+    object_list = []
+
+    for i in range(5):
+        node = VITAL_Node()
+        node.URI = f"urn:node_{i}"
+        node.name = f"node {i}"
+        object_list.append(node)
+
+    # every node links to the two nodes after it
+    for i in range(5):
+        for j in (1, 2):
+            edge = VITAL_Edge()
+            edge.URI = f"urn:edge_{i}_{j}"
+            edge.edgeSource = f"urn:node_{i}"
+            edge.edgeDestination = f"urn:node_{(i + j) % 5}"
+            object_list.append(edge)
+
+    service.insert_object_list(GRAPH_ID, object_list)
+
+    return service
+
+
+def graph_query(*, limit: int, cursor: str | None = None, total_count: bool = False):
+
+    return (
+        QueryBuilder.graph_query(limit=limit, cursor=cursor, total_count=total_count)
+        .graph_id(GRAPH_ID)
+        .arc(
+            Arc()
+            .node_bind(NodeBind(name="start"))
+            .constraint_list(AndConstraintList().node_constraint(ClassConstraint(clazz=VITAL_Node.get_class_uri())))
+            .arc(
+                Arc()
+                .node_bind(NodeBind(name="end"))
+                .edge_bind(EdgeBind(name="edge"))
+                .constraint_list(
+                    AndConstraintList().node_constraint(ClassConstraint(clazz=VITAL_Node.get_class_uri())))
+            )
+        )
+        .build()
+    )
+
+
+def match_list(metaql_result) -> list:
+
+    return [(str(gm.graph_object.get_property("start")), str(gm.graph_object.get_property("end")))
+            for gm in metaql_result.get_result_list()]
+
+
+def test_cursor_pages_cover_the_offset_results():
+
+    vs = VitalSigns()
+
+    service = create_service()
+
+    expected = match_list(service.metaql_graph_query(graph_query=graph_query(limit=100)))
+
+    assert len(expected) == 10
+
+    page_list = []
+
+    cursor = None
+
+    while True:
+        metaql_result = service.metaql_graph_query(graph_query=graph_query(limit=3, cursor=cursor, total_count=True))
+        assert metaql_result.get_total_result_count() == 10
+        page_list.extend(match_list(metaql_result))
+        cursor = metaql_result.get_next_cursor()
+        if cursor is None:
+            break
+
+    assert sorted(page_list) == sorted(expected)
+    assert len(page_list) == len(set(page_list))
+
+
+def test_select_query_total_count():
+
+    vs = VitalSigns()
+
+    service = create_service()
+
+    select_query = (
+        QueryBuilder.select_query(limit=2, total_count=True)
+        .graph_id(GRAPH_ID)
+        .constraint_list(AndConstraintList().node_constraint(ClassConstraint(clazz=VITAL_Node.get_class_uri())))
+        .build()
+    )
+
+    metaql_result = service.metaql_select_query(select_query=select_query)
+
+    assert len(metaql_result.get_result_list()) == 2
+    assert metaql_result.get_total_result_count() == 5
+    assert decode_cursor(metaql_result.get_next_cursor()) == ["urn:node_1"]
+
+
+def test_cursor_filter_and_count_sparql():
+
+    vs = VitalSigns()
+
+    with pytest.raises(ValueError):
+        decode_cursor("not a cursor")
+
+    dataset = Dataset()
+
+    graph = dataset.graph(URIRef(GRAPH_ID))
+
+    for i in range(4):
+        for j in range(3):
+            graph.add((URIRef(f"urn:a_{i}"), URIRef("urn:link"), URIRef(f"urn:b_{j}")))
+
+    pattern = "?a <urn:link> ?b ."
+
+    cursor_filter = build_cursor_filter(["?a", "?b"], decode_cursor(encode_cursor(["urn:a_1", "urn:b_1"])))
+
+    query = f"""
+    SELECT ?a ?b WHERE {{
+        GRAPH <{GRAPH_ID}> {{
+            {pattern}
+            {cursor_filter}
+        }}
+    }}
+    ORDER BY STR(?a) STR(?b)
+    """
+
+    row_list = [(str(row.a), str(row.b)) for row in dataset.query(query)]
+
+    assert row_list[0] == ("urn:a_1", "urn:b_2")
+    assert len(row_list) == 7
+
+    count_query = build_count_sparql(
+        prefix_section="",
+        graph_uri_list=[GRAPH_ID],
+        query_string=pattern,
+        variable_list=["?a"])
+
+    assert int(list(dataset.query(count_query))[0][COUNT_BINDING]) == 4
@@ -0,0 +1,112 @@
+"""
+Tests for the compiled MetaQL graph query plan cache.
+"""
+
+import pytest
+
+from vital_ai_vitalsigns.metaql.query.query_builder import QueryBuilder, AndConstraintList, ClassConstraint, Arc, \
+    NodeBind, EdgeBind, PropertyConstraint, ConstraintType
+from vital_ai_vitalsigns.model.VITAL_Node import VITAL_Node
+from vital_ai_vitalsigns.service.metaql.metaql_plan_cache import MetaQLPlanCache
+from vital_ai_vitalsigns.service.metaql.metaql_sparql_builder import MetaQLSparqlBuilder
+from vital_ai_vitalsigns.vitalsigns import VitalSigns
+
+HAS_NAME = "http://vital.ai/ontology/vital-core#hasName"
+HAS_PROVENANCE = "http://vital.ai/ontology/vital-core#hasProvenance"
+
+
+def graph_query(name: str, provenance: str, *, limit: int = 10, offset: int = 0, graph_id: str = "graph1"):
+
+    return (
+        QueryBuilder.graph_query(offset=offset, limit=limit, resolve_objects=True)
+        .graph_id(graph_id)
+        .arc(
+            Arc()
+            .node_bind(NodeBind(name="start"))
+            .constraint_list(
+                AndConstraintList()
+                .node_constraint(ClassConstraint(clazz=VITAL_Node.get_class_uri()))
+                .node_constraint(
+                    PropertyConstraint(property=HAS_NAME, comparator=ConstraintType.STRING_CONTAINS, value=name))
+            )
+            .arc(
+                Arc()
+                .node_bind(NodeBind(name="end"))
+                .edge_bind(EdgeBind(name="edge"))
+                .constraint_list(
+                    AndConstraintList()
+                    .node_constraint(
+                        PropertyConstraint(property=HAS_PROVENANCE, comparator=ConstraintType.EQUAL_TO,
+                                           value=provenance))
+                )
+            )
+        )
+        .build()
+    )
+
+
+def test_plan_cache_reuses_plans_across_values():
+
+    vs = VitalSigns()
+
+    cache = MetaQLPlanCache(maxsize=4)
+
+    first = cache.build_sparql(graph_query("john", "urn:source_1"))
+
+    second = cache.build_sparql(graph_query("mary", "urn:source_2", limit=50, offset=100, graph_id="graph2"))
+
+    assert cache.get_stats()['hits'] == 1
+    assert cache.get_stats()['misses'] == 1
+
+    # the same terms the builder produces for the values
+    expected = MetaQLSparqlBuilder().build_sparql(
+        graph_query("mary", "urn:source_2", limit=50, offset=100, graph_id="graph2"))
+
+    assert second.get_binding_list() == expected.get_binding_list() == ["start", "end", "edge"]
+    assert second.get_root_binding() == "start"
+    assert second.get_limit() == 50
+    assert second.get_offset() == 100
+    assert second.get_graph_id_list() == ["graph2"]
+
+    assert second.get_arc_constraint_list() == expected.get_arc_constraint_list()
+
+    assert any('"john"' in term for term in first.get_arc_constraint_list())
+    assert not any("john" in term for term in second.get_arc_constraint_list())
+
+
+def test_plan_cache_substitutes_values_safely():
+
+    vs = VitalSigns()
+
+    cache = MetaQLPlanCache()
+
+    sparql_impl = cache.build_sparql(graph_query('say "hi" \\ bye', "urn:source_1"))
+
+    assert any('"say \\"hi\\" \\\\ bye"' in term for term in sparql_impl.get_arc_constraint_list())
+
+    with pytest.raises(ValueError):
+        cache.build_sparql(graph_query("john", "urn:source_1> . ?s ?p ?o . <urn:x"))
+
+
+def test_plan_cache_evicts_least_recently_used():
+
+    vs = VitalSigns()
+
+    cache = MetaQLPlanCache(maxsize=1)
+
+    cache.build_sparql(graph_query("john", "urn:source_1"))
+
+    # a different shape, without the provenance constraint arc
+    cache.build_sparql(
+        QueryBuilder.graph_query(limit=10).graph_id("graph1")
+        .arc(
+            Arc()
+            .node_bind(NodeBind(name="start"))
+            .constraint_list(AndConstraintList().node_constraint(ClassConstraint(clazz=VITAL_Node.get_class_uri())))
+        )
+        .build()
+    )
+
+    cache.build_sparql(graph_query("mary", "urn:source_2"))
+
+    assert cache.get_stats() == {'hits': 0, 'misses': 3, 'size': 1, 'maxsize': 1}
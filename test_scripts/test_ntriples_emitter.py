@@ -0,0 +1,117 @@
+"""
+Golden file tests for the direct N-Triples/N-Quads writer used by GraphObject.to_rdf.
+
+The golden file holds the rdflib serialization of a fixed list of objects.
+rdflib does not write triples in a stable order, so lines are compared sorted.
+"""
+
+import io
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+
+from rdflib import Graph, Dataset, URIRef
+
+from vital_ai_vitalsigns.vitalsigns import VitalSigns
+from vital_ai_vitalsigns.collection.rdf_collection_impl import RdfCollectionImpl
+from vital_ai_vitalsigns.model.GraphObject import GraphObject
+from vital_ai_vitalsigns.model.VITAL_Node import VITAL_Node
+from vital_ai_vitalsigns_core.model.AggregationResult import AggregationResult
+from vital_ai_vitalsigns_core.model.Dataset import Dataset as VitalDataset
+from vital_ai_vitalsigns_core.model.DomainModel import DomainModel
+from vital_ai_vitalsigns_core.model.GraphMatch import GraphMatch
+
+GOLDEN_PATH = Path(__file__).parent / "golden" / "graphobject_list.nt"
+
+GRAPH_URI = "http://vital.ai/graph/golden"
+
+
+def create_graph_objects() -> list:
+
+    node = VITAL_Node()
+    node.URI = "http://vital.ai/test/node/1"
+    node.name = 'Name with "quotes", a back\\slash,\na newline,\r\na tab\t and ünïcode 😀'
+    node.timestamp = 1718000000000
+    node.updateTime = -42
+    node.active = False
+
+    aggregation = AggregationResult()
+    aggregation.URI = "http://vital.ai/test/aggregation/1"
+    aggregation.value = 1.5e-07
+
+    dataset = VitalDataset()
+    dataset.URI = "http://vital.ai/test/dataset/1"
+    dataset.dateRetrieved = datetime(2024, 6, 1, 12, 30, 5, 250000, tzinfo=timezone(timedelta(hours=-5)))
+
+    domain_model = DomainModel()
+    domain_model.URI = "http://vital.ai/test/domain/1"
+    domain_model.preferredImportVersions = ["1.0.0", "2.0.0", "1.0.0"]
+    domain_model.types = ["http://vital.ai/test/type/A", "http://vital.ai/test/type/B"]
+
+    graph_match = GraphMatch()
+    graph_match.URI = "http://vital.ai/test/match/1"
+    graph_match["urn:score"] = 0.25
+    graph_match["urn:label"] = "match"
+
+    return [node, aggregation, dataset, domain_model, graph_match]
+
+
+def sorted_lines(rdf_string: str) -> list:
+    return sorted(line for line in rdf_string.splitlines() if line)
+
+
+class TestNTriplesEmitter:
+
+    @classmethod
+    def setup_class(cls):
+        vs = VitalSigns()
+        cls.graph_objects = create_graph_objects()
+        cls.golden_lines = sorted_lines(GOLDEN_PATH.read_text(encoding="utf-8"))
+
+    def test_golden_matches_rdflib(self):
+        g = Graph()
+        for triple in GraphObject.to_triples_list(self.graph_objects):
+            g.add(triple)
+
+        assert sorted_lines(g.serialize(format="nt")) == self.golden_lines
+
+    def test_to_rdf_matches_golden(self):
+        lines = []
+        for graph_object in self.graph_objects:
+            lines.extend(graph_object.to_rdf().splitlines())
+
+        assert sorted(lines) == self.golden_lines
+
+    def test_to_rdf_list_stream_matches_golden(self):
+        buffer = io.StringIO()
+
+        assert GraphObject.to_rdf_list(self.graph_objects, stream=buffer) is None
+
+        assert sorted_lines(buffer.getvalue()) == self.golden_lines
+        assert sorted_lines(GraphObject.to_rdf_list(self.graph_objects)) == self.golden_lines
+
+    def test_nquads_matches_rdflib(self):
+        dataset = Dataset()
+        graph = dataset.graph(URIRef(GRAPH_URI))
+        for triple in GraphObject.to_triples_list(self.graph_objects):
+            graph.add(triple)
+
+        expected = sorted_lines(dataset.serialize(format="nquads"))
+
+        nquads = GraphObject.to_rdf_list(self.graph_objects, format="nquads", graph_uri=GRAPH_URI)
+
+        assert sorted_lines(nquads) == expected
+
+    def test_round_trip(self):
+        for graph_object in self.graph_objects:
+            restored = GraphObject.from_rdf(graph_object.to_rdf())
+            assert sorted_lines(restored.to_rdf()) == sorted_lines(graph_object.to_rdf())
+
+    def test_collection_adds_objects_to_named_graph(self):
+        store = RdfCollectionImpl(multigraph=True)
+
+        store.add_graph_objects(self.graph_objects, graph_uri=GRAPH_URI)
+
+        graph = store.graph.graph(URIRef(GRAPH_URI))
+
+        assert sorted_lines(graph.serialize(format="nt")) == self.golden_lines
+        assert len(store.graph.default_graph) == 0
@@ -0,0 +1,89 @@
+"""
+Tests for creating graph objects from property maps with GraphObject.from_property_map.
+"""
+
+import pytest
+from vital_ai_vitalsigns.model.VITAL_GraphContainerObject import VITAL_GraphContainerObject
+from vital_ai_vitalsigns.model.VITAL_Node import VITAL_Node
+from vital_ai_vitalsigns.model.vital_constants import VitalConstants
+from vital_ai_vitalsigns.vitalsigns import VitalSigns
+
+NAME_URI = "http://vital.ai/ontology/vital-core#hasName"
+TIMESTAMP_URI = "http://vital.ai/ontology/vital-core#hasTimestamp"
+
+
+def test_trusted_property_map():
+
+    vs = VitalSigns()
+
+    node = VITAL_Node.from_property_map({
+        VitalConstants.uri_prop_uri: "urn:node_1",
+        NAME_URI: "Node 1",
+        "timestamp": 100,
+        "active": None,
+    })
+
+    assert str(node.URI) == "urn:node_1"
+    assert str(node.name) == "Node 1"
+    assert int(node.timestamp) == 100
+    assert node.active is None
+    assert set(node._properties) == {VitalConstants.uri_prop_uri, NAME_URI, TIMESTAMP_URI}
+
+    container = VITAL_GraphContainerObject.from_property_map({
+        VitalConstants.uri_prop_uri: "urn:container_1",
+        "urn:extern:score": 0.5,
+        "label": "extern label",
+    })
+
+    assert str(container.URI) == "urn:container_1"
+    assert float(container.score) == 0.5
+    assert str(container.label) == "extern label"
+
+    # the URI by name is the URI property, not an extern property
+    container = VITAL_GraphContainerObject.from_property_map({"URI": "urn:container_2"})
+
+    assert str(container.URI) == "urn:container_2"
+    assert container._extern_properties == {}
+
+
+def test_untrusted_property_map_uses_setattr():
+
+    vs = VitalSigns()
+
+    property_map = {"URI": "urn:node_2", "name": "Node 2", "timestamp": 200}
+
+    trusted = VITAL_Node.from_property_map(property_map)
+    untrusted = VITAL_Node.from_property_map(property_map, trusted=False)
+
+    assert untrusted.to_json() == trusted.to_json()
+
+    with pytest.raises(AttributeError):
+        VITAL_Node.from_property_map({"URI": "urn:node_2", "noSuchProperty": 1}, trusted=False)
+
+
+def test_modified_flag():
+
+    vs = VitalSigns()
+
+    property_map = {"URI": "urn:node_3", "name": "Node 3"}
+
+    # loaded objects are left serialized, as nothing changed since they were read
+    for trusted in (True, False):
+        assert VITAL_Node.from_property_map(property_map, trusted=trusted).is_modified() is False
+        assert VITAL_Node.from_property_map(property_map, modified=True, trusted=trusted).is_modified() is True
+
+    node = VITAL_Node.from_property_map(property_map)
+    node.name = "Renamed"
+
+    assert node.is_modified() is True
+
+
+def test_unknown_key_without_extern_properties():
+
+    vs = VitalSigns()
+
+    with pytest.raises(AttributeError, match="noSuchProperty"):
+        VITAL_Node.from_property_map({"URI": "urn:node_4", "noSuchProperty": 1})
+
+    with pytest.raises(AttributeError):
+        VITAL_Node.from_property_map({"URI": "urn:node_4", "urn:extern:score": 1})
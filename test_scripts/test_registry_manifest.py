@@ -0,0 +1,50 @@
+"""
+Tests for the package manifests used by the lazy import registry mode.
+
+The manifests shipped with the packages are compared to a full scan so a
+class added or moved without regenerating the manifest fails here.
+"""
+
+import importlib
+from pathlib import Path
+
+import pytest
+
+from vital_ai_vitalsigns.impl.vitalsigns_manifest import VitalSignsManifest, LazyClassMap, resolve_class_ref
+from vital_ai_vitalsigns_generate.vitalsigns_manifest_generator import VitalSignsManifestGenerator
+
+
+@pytest.mark.parametrize("package_name", ["vital_ai_vitalsigns", "vital_ai_vitalsigns_core"])
+def test_manifest_matches_scan(package_name):
+    package = importlib.import_module(package_name)
+
+    manifest = VitalSignsManifest.load(Path(package.__file__).parent)
+
+    assert manifest is not None, f"regenerate with: python -m vital_ai_vitalsigns_generate.vitalsigns_manifest_generator {package_name}"
+
+    scanned = VitalSignsManifestGenerator().create_manifest(package_name)
+
+    assert manifest.to_dict() == scanned.to_dict()
+
+
+def test_lazy_class_map_imports_on_lookup():
+    manifest = VitalSignsManifest.load(Path(importlib.import_module("vital_ai_vitalsigns_core").__file__).parent)
+
+    class_map = LazyClassMap(manifest.classes)
+
+    uri = "http://vital.ai/ontology/vital-core#DomainModel"
+
+    assert uri in class_map
+    assert len(class_map) == len(manifest.classes)
+    assert class_map.loaded_count() == 0
+
+    cls = class_map[uri]
+
+    assert cls is resolve_class_ref(manifest.classes[uri])
+    assert cls.get_class_uri() == uri
+    assert class_map.is_loaded(uri)
+    assert class_map.loaded_count() == 1
+
+    assert class_map.get("urn:missing") is None
+    with pytest.raises(KeyError):
+        class_map["urn:missing"]
@@ -0,0 +1,49 @@
+"""
+Tests that registry snapshots are opt-in and only loaded from files no other user can write.
+"""
+
+import os
+from vital_ai_vitalsigns.config.vitalsigns_config import RegistrySnapshotConfig, VitalSignsConfigLoader
+from vital_ai_vitalsigns.impl.vitalsigns_snapshot import VitalSignsSnapshotCache
+
+
+def test_snapshot_is_opt_in():
+
+    assert RegistrySnapshotConfig().enabled is False
+
+    config = VitalSignsConfigLoader.parse_yaml_config("registry_snapshot:\n  enabled: true\n")
+
+    assert config.registry_snapshot.enabled is True
+
+
+def test_snapshot_is_not_loaded_when_writable_by_others(tmp_path):
+
+    cache_dir = tmp_path / "vitalsigns"
+
+    snapshot_cache = VitalSignsSnapshotCache(str(cache_dir))
+
+    assert snapshot_cache.save('registry', 'key', {'classes': [1, 2, 3]})
+
+    assert snapshot_cache.load('registry', 'key') == {'classes': [1, 2, 3]}
+
+    path = snapshot_cache.get_snapshot_path('registry', 'key')
+
+    os.chmod(path, 0o666)
+
+    assert snapshot_cache.load('registry', 'key') is None
+
+    os.chmod(path, 0o644)
+    os.chmod(cache_dir, 0o777)
+
+    assert snapshot_cache.load('registry', 'key') is None
+
+    os.chmod(cache_dir, 0o755)
+
+    # a symlink to a trusted file is not followed
+    link_cache = VitalSignsSnapshotCache(str(tmp_path / "linked"))
+    link_cache.cache_dir.mkdir(mode=0o755)
+    link_cache.get_snapshot_path('registry', 'key').symlink_to(path)
+
+    assert link_cache.load('registry', 'key') is None
+
+    assert snapshot_cache.load('registry', 'key') == {'classes': [1, 2, 3]}
@@ -0,0 +1,71 @@
+"""
+Tests for assembling construct query results into solutions.
+"""
+
+from rdflib import BNode, URIRef, Literal
+
+from vital_ai_vitalsigns.query.solution_assembler import SolutionAssembler
+from vital_ai_vitalsigns.service.graph.binding import Binding, BindingValueType
+
+
+def test_assembler_groups_triples_by_subject():
+
+    binding_list = [
+        Binding("?start", "urn:start"),
+        Binding("?name", "urn:name", value_type=BindingValueType.LITERAL),
+        Binding("?end", "urn:end"),
+    ]
+
+    assembler = SolutionAssembler(binding_list, "?start")
+
+    first = BNode()
+    second = BNode()
+
+    # interleaved, repeated and unbound triples as a response may have them
+    row_list = [
+        (first, URIRef("urn:start"), URIRef("urn:a")),
+        (second, URIRef("urn:start"), URIRef("urn:b")),
+        (first, URIRef("urn:name"), Literal("a")),
+        (first, URIRef("urn:other"), URIRef("urn:x")),
+        (second, URIRef("urn:end"), URIRef("urn:c")),
+        (first, URIRef("urn:end"), URIRef("urn:c")),
+        (first, URIRef("urn:start"), URIRef("urn:a")),
+    ]
+
+    for s, p, o in row_list:
+        assembler.add(s, p, str(o))
+
+    assert assembler.get_solution_count() == 2
+    assert assembler.get_object_uri_set() == {"urn:a", "urn:b", "urn:c"}
+
+    request_list = []
+
+    def get_object(uri: str):
+        request_list.append(uri)
+        return f"object {uri}"
+
+    solution_list = list(assembler.iter_solutions(get_object))
+
+    assert solution_list[0].uri_map == {"?start": "urn:a", "?name": "a", "?end": "urn:c"}
+    assert solution_list[0].object_map == {"?start": "object urn:a", "?end": "object urn:c"}
+    assert solution_list[0].root_object == "object urn:a"
+
+    assert solution_list[1].uri_map == {"?start": "urn:b", "?end": "urn:c"}
+    assert solution_list[1].root_binding == "?start"
+
+    assert "a" not in request_list
+
+
+def test_assembler_leaves_unresolved_objects_unbound():
+
+    assembler = SolutionAssembler([Binding("?start", "urn:start"), Binding("?end", "urn:end")], "?start")
+
+    solution = BNode()
+
+    assembler.add(solution, URIRef("urn:start"), "urn:a")
+    assembler.add(solution, URIRef("urn:end"), "urn:missing")
+
+    solution_list = list(assembler.iter_solutions({"urn:a": "object urn:a"}.get))
+
+    assert solution_list[0].uri_map == {"?start": "urn:a", "?end": "urn:missing"}
+    assert solution_list[0].object_map == {"?start": "object urn:a"}
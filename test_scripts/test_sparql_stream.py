@@ -0,0 +1,68 @@
+"""
+Tests for the incremental SPARQL result parsers, results must not depend
+on where the response is split into chunks.
+"""
+
+import json
+
+import pytest
+from rdflib import Graph, Literal, URIRef, BNode
+
+from vital_ai_vitalsigns.service.graph.virtuoso.rest.sparql_stream import iter_json_bindings, iter_ntriples, group_by_subject
+
+
+def split(data: bytes, size: int) -> list:
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 64, 65536])
+def test_iter_json_bindings(chunk_size):
+    bindings = [{"s": {"type": "uri", "value": f"http://vital.ai/test/{i}"},
+                 "o": {"type": "literal", "value": "ünïcode \"quoted\" ]} , text", "xml:lang": "en"}}
+                for i in range(200)]
+
+    # a variable named bindings in the head must not be taken for the results
+    body = json.dumps({"head": {"vars": ["s", "bindings"]}, "results": {"bindings": bindings}},
+                      ensure_ascii=False).encode('utf-8')
+
+    assert list(iter_json_bindings(split(body, chunk_size))) == bindings
+
+
+def test_iter_json_bindings_truncated():
+    body = b'{"head": {"vars": ["s"]}, "results": {"bindings": [{"s": {"type": "uri", "value": "urn:a"}}, {"s": '
+
+    with pytest.raises(ValueError):
+        list(iter_json_bindings(split(body, 8)))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 65536])
+def test_iter_ntriples(chunk_size):
+    graph = Graph()
+
+    for i in range(50):
+        subject = URIRef(f"http://vital.ai/test/{i}")
+        graph.add((subject, URIRef("http://vital.ai/test/value"), Literal(i)))
+        graph.add((subject, URIRef("http://vital.ai/test/label"), Literal("multi\nline ü", lang="en")))
+        graph.add((subject, URIRef("http://vital.ai/test/link"), BNode(f"b{i}")))
+
+    body = b"# comment\n" + graph.serialize(format='nt').encode('utf-8').replace(b"\n", b"\r\n")
+
+    triples = list(iter_ntriples(split(body, chunk_size)))
+
+    parsed = Graph()
+
+    for triple in triples:
+        parsed.add(triple)
+
+    assert len(triples) == len(graph)
+    assert parsed.isomorphic(graph)
+
+
+def test_group_by_subject():
+    triples = [("a", "p", 1), ("a", "p", 2), ("b", "p", 3), ("a", "p", 4)]
+
+    assert list(group_by_subject(triples)) == [
+        ("a", [("a", "p", 1), ("a", "p", 2)]),
+        ("b", [("b", "p", 3)]),
+        ("a", [("a", "p", 4)])
+    ]
@@ -0,0 +1,46 @@
+"""
+Tests for the subject indexes kept by the rdflib memory store.
+"""
+
+from rdflib import Dataset, URIRef, Literal, RDF
+
+from vital_ai_vitalsigns.impl.rdflib.subject_index_store import SubjectIndexStore
+
+NAME = URIRef("http://vital.ai/ontology/vital-core#hasName")
+NODE = URIRef("http://vital.ai/ontology/vital-core#VITAL_Node")
+
+
+def test_subject_index_follows_graph_changes():
+
+    dataset = Dataset(store=SubjectIndexStore(indexed_properties=[NAME]))
+
+    graph = dataset.graph(URIRef("urn:index_graph"))
+
+    for i in range(10):
+        subject = URIRef(f"urn:node_{i}")
+        graph.add((subject, RDF.type, NODE))
+        graph.add((subject, NAME, Literal(f"node {i}")))
+
+    index = dataset.store.get_index(URIRef("urn:index_graph"))
+
+    assert index.page(3, 0) == [URIRef(f"urn:node_{i}") for i in range(3)]
+    assert index.page(3, 0, exclude=URIRef("urn:node_1")) == [URIRef("urn:node_0"), URIRef("urn:node_2"),
+                                                               URIRef("urn:node_3")]
+    assert index.page(3, 1, exclude=URIRef("urn:node_0")) == [URIRef(f"urn:node_{i}") for i in range(2, 5)]
+
+    # removed and re-added subjects keep one place in the sorted list
+    graph.remove((URIRef("urn:node_2"), None, None))
+    graph.add((URIRef("urn:node_2"), RDF.type, NODE))
+    graph.remove((URIRef("urn:node_3"), None, None))
+
+    assert index.page(10, 0) == [URIRef(f"urn:node_{i}") for i in range(10) if i != 3]
+    assert index.types[NODE] == {URIRef(f"urn:node_{i}") for i in range(10) if i != 3}
+    assert index.property_indexes[NAME][Literal("node 5")] == {URIRef("urn:node_5")}
+    assert URIRef("urn:node_2") not in index.property_indexes[NAME].get(Literal("node 2"), set())
+
+    # SPARQL updates go through the same store
+    dataset.update("DELETE WHERE { GRAPH <urn:index_graph> { <urn:node_4> ?p ?o } }")
+
+    assert URIRef("urn:node_4") not in index.subjects
+
+    assert len(list(graph.query("SELECT ?s WHERE { ?s a ?type }"))) == 8
@@ -0,0 +1,149 @@
+"""
+Tests for growth, deletion, class filtering and persistence of the vector index of a graph collection,
+and for the batched indexing of the objects added to a collection.
+"""
+
+import hashlib
+import numpy as np
+from vital_ai_vitalsigns.collection.graph_collection import GraphCollection
+from vital_ai_vitalsigns.collection.vector_collection_impl import VectorCollectionImpl
+from vital_ai_vitalsigns.model.VITAL_Node import VITAL_Node
+from vital_ai_vitalsigns.vitalsigns import VitalSigns
+
+NODE_CLASS = "http://vital.ai/ontology/vital-core#VITAL_Node"
+EDGE_CLASS = "http://vital.ai/ontology/vital-core#VITAL_Edge"
+
+
+def match_list(results: dict) -> list:
+    return [match['URI'] for match in results['matches']]
+
+
+class StubEmbeddingModel:
+    """Vectors from a hash of the text, recording the size of each vectorize call."""
+
+    def __init__(self):
+        self.batch_size_list = []
+
+    def vectorize(self, texts):
+
+        if isinstance(texts, str):
+            texts = [texts]
+
+        self.batch_size_list.append(len(texts))
+
+        return np.array([np.frombuffer(hashlib.sha256(text.encode()).digest(), dtype=np.uint8)
+                         for text in texts], dtype=np.float32) + 1.0
+
+
+def create_node(i: int, name: str = None) -> VITAL_Node:
+    node = VITAL_Node()
+    node.URI = f"urn:node_{i}"
+    node.name = name if name is not None else f"node number {i}"
+    return node
+
+
+def test_vector_index_grows_deletes_and_filters():
+
+    vs = VitalSigns()
+
+    vectors = np.random.default_rng(1).random((300, 16), dtype=np.float32)
+
+    uri_list = [f"urn:doc_{i}" for i in range(300)]
+    class_uri_list = [EDGE_CLASS if i % 10 == 0 else NODE_CLASS for i in range(300)]
+
+    vectordb = VectorCollectionImpl(GraphCollection(use_rdfstore=False, use_vectordb=False), max_elements=64)
+
+    for start in range(0, 300, 100):
+        vectordb.add_vectors(uri_list[start:start + 100], vectors[start:start + 100], class_uri_list[start:start + 100])
+
+    assert vectordb.dim == 16
+    assert vectordb.index.get_max_elements() >= 300
+
+    assert match_list(vectordb.search(vectors[[5]], limit=1)) == ["urn:doc_5"]
+
+    edge_matches = match_list(vectordb.search(vectors[[5]], class_uri=EDGE_CLASS, limit=50))
+
+    assert len(edge_matches) == 30
+    assert all(int(uri.split("_")[1]) % 10 == 0 for uri in edge_matches)
+
+    for uri in uri_list[:200]:
+        vectordb.remove_doc(uri)
+
+    vectordb.remove_doc("urn:missing")
+
+    assert vectordb.deleted_count == 200
+    assert "urn:doc_5" not in match_list(vectordb.search(vectors[[5]], limit=100))
+    assert len(match_list(vectordb.search(vectors[[5]], class_uri=EDGE_CLASS, limit=50))) == 10
+
+    vectordb.compact()
+
+    assert vectordb.deleted_count == 0
+    assert vectordb.index.element_count == 100
+    assert match_list(vectordb.search(vectors[[250]], limit=1)) == ["urn:doc_250"]
+
+
+def test_vector_index_save_and_load(tmp_path):
+
+    vs = VitalSigns()
+
+    vectors = np.random.default_rng(2).random((50, 8), dtype=np.float32)
+
+    graph = GraphCollection(use_rdfstore=False, use_vectordb=False)
+
+    vectordb = VectorCollectionImpl(graph)
+    vectordb.add_vectors([f"urn:doc_{i}" for i in range(50)], vectors, [NODE_CLASS] * 50)
+    vectordb.remove_doc("urn:doc_0")
+
+    path = str(tmp_path / "vectors.bin")
+
+    vectordb.save(path)
+
+    loaded = VectorCollectionImpl(graph)
+    loaded.load(path)
+
+    assert loaded.doc_id_to_index == vectordb.doc_id_to_index
+    assert loaded.class_uri_count == {NODE_CLASS: 49}
+    assert match_list(loaded.search(vectors[[7]], class_uri=NODE_CLASS, limit=1)) == ["urn:doc_7"]
+    assert "urn:doc_0" not in match_list(loaded.search(vectors[[0]], limit=49))
+
+    # labels continue after the saved ones
+    loaded.add_vectors(["urn:doc_new"], vectors[[0]], [NODE_CLASS])
+
+    assert loaded.doc_id_to_index["urn:doc_new"] == 50
+
+
+def test_add_objects_in_embedding_batches():
+
+    vs = VitalSigns()
+
+    model = StubEmbeddingModel()
+
+    vs.put_embedding_model("stub-embedding-model", model)
+
+    collection = GraphCollection(use_rdfstore=False, embedding_model_id="stub-embedding-model", embedding_batch_size=4)
+
+    vectordb = collection._vectordb
+
+    collection.add_objects([create_node(i) for i in range(10)])
+
+    assert model.batch_size_list == [4, 4, 2]
+
+    assert len(vectordb.doc_id_to_index) == 10
+    assert {vectordb.index_to_doc_id[label]: label for label in vectordb.index_to_doc_id} == vectordb.doc_id_to_index
+    assert set(vectordb.index_to_class_uri) == set(vectordb.index_to_doc_id)
+    assert vectordb.class_uri_count == {NODE_CLASS: 10}
+
+    # replacing objects removes their earlier vectors
+    collection.add(create_node(3, "renamed node"))
+    collection.add_objects([create_node(4, "first"), create_node(4, "second")])
+
+    assert model.batch_size_list[3:] == [1, 1]
+    assert len(collection) == 10
+    assert len(vectordb.doc_id_to_index) == 10
+    assert len(vectordb.index_to_doc_id) == 10
+    assert vectordb.class_uri_count == {NODE_CLASS: 10}
+    assert vectordb.deleted_count == 2
+
+    assert str(collection.get("urn:node_4").name) == "second"
+    assert [str(result.graph_object.URI) for result in collection.search("renamed node", limit=1)] == ["urn:node_3"]
+    assert [str(result.graph_object.URI) for result in collection.search("second", limit=1)] == ["urn:node_4"]
@@ -0,0 +1,179 @@
+"""
+Tests for VirtuosoGraphService queries against the local SPARQL endpoint.
+"""
+
+import pytest
+from rdflib import BNode, URIRef
+
+# the service module imports pyodbc, which needs the unixODBC library
+pytest.importorskip("pyodbc", exc_type=ImportError)
+
+from test_scripts.benchmark.local_sparql_endpoint import LocalSparqlEndpoint
+from vital_ai_vitalsigns.config.vitalsigns_config import GraphDatabaseConfig
+from vital_ai_vitalsigns.model.GraphObject import GraphObject
+from vital_ai_vitalsigns.model.VITAL_Edge import VITAL_Edge
+from vital_ai_vitalsigns.model.VITAL_Node import VITAL_Node
+from vital_ai_vitalsigns.ontology.ontology import Ontology
+from vital_ai_vitalsigns.query.solution import Solution
+from vital_ai_vitalsigns.query.solution_list import SolutionList
+from vital_ai_vitalsigns.service.graph.binding import Binding
+from vital_ai_vitalsigns.service.graph.virtuoso.virtuoso_service import VirtuosoGraphService
+from vital_ai_vitalsigns.vitalsigns import VitalSigns
+
+GRAPH_ID = "query-test"
+
+DESTINATION_QUERY = "?edge vital-core:hasEdgeDestination ?uri ."
+
+NAMESPACE_LIST = [Ontology("vital-core", "http://vital.ai/ontology/vital-core#")]
+
+BINDING_LIST = [
+    Binding("?edge", "urn:hasEdge"),
+    Binding("?uri", "urn:hasDestination"),
+]
+
+
+def node_uri(i: int) -> str:
+    return f"http://vital.ai/test/node/{i}"
+
+
+def node(i: int) -> VITAL_Node:
+    n = VITAL_Node()
+    n.URI = node_uri(i)
+    n.name = f"node {i}"
+    return n
+
+
+def edge(i: int, destination: int) -> VITAL_Edge:
+    e = VITAL_Edge()
+    e.URI = f"http://vital.ai/test/edge/{i}"
+    e.edgeSource = node_uri(0)
+    e.edgeDestination = node_uri(destination)
+    return e
+
+
+@pytest.fixture
+def service():
+    vs = VitalSigns()
+    endpoint = LocalSparqlEndpoint().start()
+    config = GraphDatabaseConfig(database_type="virtuoso", endpoint=endpoint.endpoint)
+    service = VirtuosoGraphService(config, base_uri="http://vital.ai", namespace="test")
+    graph = endpoint.dataset.graph(service.get_graph_uri(graph_id=GRAPH_ID))
+    graph.parse(data=GraphObject.to_rdf_list([node(i) for i in range(4)] +
+                                             [edge(i, i) for i in range(1, 4)]), format='nt')
+    yield service, graph, endpoint
+    service.rest_manager.close()
+    endpoint.stop()
+
+
+def test_iter_query_matches_query(service):
+
+    service, graph, endpoint = service
+
+    service.retrieve_chunk_size = 2
+
+    result_list = service.query(GRAPH_ID, DESTINATION_QUERY)
+    object_list = list(service.iter_query(GRAPH_ID, DESTINATION_QUERY))
+
+    assert [str(result.graph_object.URI) for result in result_list] == [node_uri(i) for i in range(1, 4)]
+    assert [str(graph_object.URI) for graph_object in object_list] == [node_uri(i) for i in range(1, 4)]
+
+
+def test_iter_query_fails_on_missing_object_as_query_does(service):
+
+    service, graph, endpoint = service
+
+    # an edge to a node that is not in the graph
+    graph.parse(data=GraphObject.to_rdf_list([edge(9, 9)]), format='nt')
+
+    with pytest.raises(ValueError, match="node/9"):
+        service.query(GRAPH_ID, DESTINATION_QUERY)
+
+    with pytest.raises(ValueError, match="node/9"):
+        list(service.iter_query(GRAPH_ID, DESTINATION_QUERY))
+
+
+def test_construct_solution_leaves_missing_object_unbound(service):
+
+    service, graph, endpoint = service
+
+    # solutions for edges 1 and 9, node 9 is not in the graph
+    triple_list = []
+
+    for i in (1, 9):
+        solution = BNode()
+        triple_list.append((solution, URIRef("urn:hasEdge"), URIRef(f"http://vital.ai/test/edge/{i}")))
+        triple_list.append((solution, URIRef("urn:hasDestination"), URIRef(node_uri(i))))
+
+    service._iter_construct_triples = lambda *args, **kwargs: iter(triple_list)
+
+    def get_object(*args, **kwargs):
+        raise AssertionError("objects are only retrieved in bulk")
+
+    service.get_object = get_object
+
+    request_count = endpoint.request_count
+
+    solution_list = service.query_construct_solution(GRAPH_ID, DESTINATION_QUERY, NAMESPACE_LIST,
+                                                     BINDING_LIST, "?edge")
+
+    assert endpoint.request_count - request_count == 1
+
+    solution_map = {solution.uri_map["?uri"]: solution for solution in solution_list.solution_list}
+
+    assert sorted(solution_map) == [node_uri(1), node_uri(9)]
+
+    assert str(solution_map[node_uri(1)].object_map["?uri"].URI) == node_uri(1)
+    assert str(solution_map[node_uri(1)].root_object.URI) == "http://vital.ai/test/edge/1"
+
+    # neither the edge nor the node is in the graph
+    assert solution_map[node_uri(9)].object_map == {}
+    assert solution_map[node_uri(9)].root_object is None
+
+
+def test_construct_solution_pages_over_graphs(service):
+
+    service, graph, endpoint = service
+
+    def solution(edge_uri: str, uri: str) -> Solution:
+        return Solution({"?edge": edge_uri, "?uri": uri}, {}, "?edge")
+
+    # overlapping solutions in the first two graphs, disjoint ones in the third
+    shared = [solution("urn:edge_c", "urn:node_1"), solution("urn:edge_f", "urn:node_2")]
+
+    graph_solution_map = {
+        "graph-a": shared + [solution(f"urn:edge_{c}", "urn:node_3") for c in "abdg"],
+        "graph-b": shared + [solution(f"urn:edge_{c}", "urn:node_3") for c in "beh"],
+        "graph-c": [solution("urn:edge_f", "urn:node_0"), solution("urn:edge_z", "urn:node_9")],
+    }
+
+    def key(s: Solution) -> tuple:
+        return s.uri_map["?edge"], s.uri_map["?uri"]
+
+    request_list = []
+
+    # each graph answers in the ORDER BY of the construct query
+    def query_construct_solution(graph_id, sparql_query, namespace_list, binding_list, root_binding, *,
+                                 limit=100, offset=0, **kwargs):
+        request_list.append((graph_id, limit, offset))
+        solutions = sorted(graph_solution_map[graph_id], key=key)
+        return SolutionList(solutions[offset:offset + limit], limit, offset)
+
+    service.query_construct_solution = query_construct_solution
+
+    union = sorted({key(s) for solution_list in graph_solution_map.values() for s in solution_list})
+
+    assert len(union) == 10
+
+    for offset, limit in ((0, 3), (2, 3), (4, 4), (8, 5), (10, 2)):
+
+        request_list.clear()
+
+        solution_list = service._query_construct_solution_graph_list(
+            list(graph_solution_map), DESTINATION_QUERY, NAMESPACE_LIST, BINDING_LIST, "?edge",
+            limit=limit, offset=offset)
+
+        # the page of a single graph holding all the solutions
+        assert [key(s) for s in solution_list.solution_list] == union[offset:offset + limit]
+        assert (solution_list.limit, solution_list.offset) == (limit, offset)
+
+        assert sorted(request_list) == [(graph_id, offset + limit, 0) for graph_id in sorted(graph_solution_map)]
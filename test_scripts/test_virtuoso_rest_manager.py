@@ -0,0 +1,90 @@
+"""
+Tests for the retry policy of the sync and async Virtuoso REST transports.
+"""
+
+import asyncio
+import pytest
+import requests
+import aiohttp
+from test_scripts.benchmark.local_sparql_endpoint import LocalSparqlEndpoint
+from vital_ai_vitalsigns.service.graph.virtuoso.rest.async_rest_manager import AsyncVirtuosoRESTManager
+from vital_ai_vitalsigns.service.graph.virtuoso.rest.rest_manager import VirtuosoRESTManager
+
+ASK_QUERY = "ASK { ?s ?p ?o }"
+UPDATE_QUERY = "INSERT DATA { GRAPH <urn:graph> { <urn:s> <urn:p> <urn:o> } }"
+
+
+@pytest.fixture
+def endpoint():
+    endpoint = LocalSparqlEndpoint().start()
+    yield endpoint
+    endpoint.stop()
+
+
+def create_manager(endpoint: LocalSparqlEndpoint, manager_class, max_retries: int):
+    return manager_class(endpoint.endpoint + "/sparql-auth", endpoint.endpoint + "/sparql-graph-crud-auth",
+                         max_retries=max_retries, backoff_factor=0)
+
+
+def test_sync_retries_overload_max_retries_times(endpoint):
+
+    rest_manager = create_manager(endpoint, VirtuosoRESTManager, max_retries=2)
+
+    endpoint.overloaded_responses = 2
+
+    assert rest_manager.sparql_ask(ASK_QUERY) is False
+
+    # one attempt and two retries, no retries in the adapter
+    assert endpoint.request_count == 3
+    assert rest_manager.get_request_count() == 3
+
+    endpoint.overloaded_responses = 3
+
+    with pytest.raises(requests.HTTPError):
+        rest_manager.sparql_ask(ASK_QUERY)
+
+    assert endpoint.request_count == 6
+
+    rest_manager.close()
+
+
+def test_sync_update_is_not_replayed(endpoint):
+
+    rest_manager = create_manager(endpoint, VirtuosoRESTManager, max_retries=2)
+
+    endpoint.overloaded_responses = 1
+
+    with pytest.raises(requests.HTTPError):
+        rest_manager.sparql_update(UPDATE_QUERY)
+
+    assert endpoint.request_count == 1
+
+    rest_manager.sparql_update(UPDATE_QUERY)
+
+    assert rest_manager.sparql_ask("ASK { GRAPH <urn:graph> { <urn:s> <urn:p> <urn:o> } }") is True
+
+    rest_manager.close()
+
+
+def test_async_retries_match_sync(endpoint):
+
+    async def run():
+
+        rest_manager = create_manager(endpoint, AsyncVirtuosoRESTManager, max_retries=2)
+
+        try:
+            endpoint.overloaded_responses = 2
+
+            assert await rest_manager.sparql_ask(ASK_QUERY) is False
+            assert endpoint.request_count == 3
+
+            endpoint.overloaded_responses = 1
+
+            with pytest.raises(aiohttp.ClientResponseError):
+                await rest_manager.sparql_update(UPDATE_QUERY)
+
+            assert endpoint.request_count == 4
+        finally:
+            await rest_manager.close()
+
+    asyncio.run(run())
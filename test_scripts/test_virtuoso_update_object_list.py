@@ -0,0 +1,83 @@
+"""
+Tests for chunked VirtuosoGraphService.update_object_list against the local SPARQL endpoint.
+"""
+
+import pytest
+from rdflib import URIRef
+
+# the service module imports pyodbc, which needs the unixODBC library
+pytest.importorskip("pyodbc", exc_type=ImportError)
+
+from test_scripts.benchmark.local_sparql_endpoint import LocalSparqlEndpoint
+from vital_ai_vitalsigns.config.vitalsigns_config import GraphDatabaseConfig
+from vital_ai_vitalsigns.model.GraphObject import GraphObject
+from vital_ai_vitalsigns.model.VITAL_Node import VITAL_Node
+from vital_ai_vitalsigns.service.graph.virtuoso.virtuoso_service import VirtuosoGraphService
+from vital_ai_vitalsigns.vitalsigns import VitalSigns
+
+GRAPH_ID = "update-test"
+
+
+def node(i: int, version: int) -> VITAL_Node:
+    n = VITAL_Node()
+    n.URI = f"http://vital.ai/test/node/{i}"
+    n.name = f"node {i} version {version}"
+    return n
+
+
+@pytest.fixture
+def service():
+    vs = VitalSigns()
+    endpoint = LocalSparqlEndpoint().start()
+    config = GraphDatabaseConfig(database_type="virtuoso", endpoint=endpoint.endpoint)
+    service = VirtuosoGraphService(config, base_uri="http://vital.ai", namespace="test")
+    graph = endpoint.dataset.graph(service.get_graph_uri(graph_id=GRAPH_ID))
+    graph.parse(data=GraphObject.to_rdf_list([node(i, 0) for i in range(4)]), format='nt')
+    yield service, graph
+    service.rest_manager.close()
+    endpoint.stop()
+
+
+def name_of(graph, i: int) -> list:
+    return sorted(str(o) for o in graph.objects(URIRef(f"http://vital.ai/test/node/{i}"),
+                                               URIRef("http://vital.ai/ontology/vital-core#hasName")))
+
+
+def test_duplicate_uris_keep_the_last_object(service):
+
+    service, graph = service
+
+    status = service.update_object_list([node(1, 1), node(2, 1), node(1, 2)], graph_id=GRAPH_ID)
+
+    assert status.status == 0, status.message
+    assert status.updated_objects == 2
+    assert name_of(graph, 1) == ["node 1 version 2"]
+    assert name_of(graph, 2) == ["node 2 version 1"]
+
+
+def test_failed_chunk_reports_applied_objects(service):
+
+    service, graph = service
+
+    sparql_update = service.rest_manager.sparql_update
+
+    update_count = 0
+
+    def fail_second_update(update: str):
+        nonlocal update_count
+        update_count += 1
+        if update_count == 2:
+            raise RuntimeError("connection lost")
+        sparql_update(update)
+
+    service.rest_manager.sparql_update = fail_second_update
+
+    status = service.update_object_list([node(i, 1) for i in range(4)], graph_id=GRAPH_ID, chunk_size=2)
+
+    assert status.status == -1
+    assert status.updated_objects == 2
+    assert "not atomic" in status.message
+
+    # the first chunk stays applied
+    assert name_of(graph, 1) == ["node 1 version 1"]
+    assert name_of(graph, 2) == ["node 2 version 0"]
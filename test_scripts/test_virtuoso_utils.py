@@ -0,0 +1,33 @@
+"""
+Tests for converting SPARQL JSON result bindings to rdflib terms.
+"""
+
+from rdflib import URIRef, BNode, Literal, XSD
+
+from vital_ai_vitalsigns.service.graph.utils.virtuoso_utils import VirtuosoUtils
+
+
+def test_binding_to_rdf_term_keeps_datatype_and_language():
+    typed = VirtuosoUtils.binding_to_rdf_term(
+        {"type": "typed-literal", "value": "42", "datatype": str(XSD.long)})
+
+    assert typed == Literal("42", datatype=XSD.long)
+    assert typed.toPython() == 42
+
+    assert VirtuosoUtils.binding_to_rdf_term(
+        {"type": "literal", "value": "chat", "xml:lang": "fr"}) == Literal("chat", lang="fr")
+
+    assert VirtuosoUtils.binding_to_rdf_term(
+        {"type": "literal", "value": "plain"}) == Literal("plain")
+
+    assert VirtuosoUtils.binding_to_rdf_term(
+        {"type": "uri", "value": "http://vital.ai/test"}) == URIRef("http://vital.ai/test")
+
+    assert VirtuosoUtils.binding_to_rdf_term({"type": "bnode", "value": "b0"}) == BNode("b0")
+
+
+def test_format_as_ntriples_typed_literal():
+    line = VirtuosoUtils.format_as_ntriples(
+        "http://vital.ai/s", "http://vital.ai/p", "1", "typed-literal", str(XSD.integer))
+
+    assert line == f'<http://vital.ai/s> <http://vital.ai/p> "1"^^<{XSD.integer}> .\n'
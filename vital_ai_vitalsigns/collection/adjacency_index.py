@@ -0,0 +1,172 @@
+from collections import deque
+from typing import Dict, Iterator, List, Literal, Optional, Tuple, Type, TypeVar
+from vital_ai_vitalsigns.model.GraphObject import GraphObject
+from vital_ai_vitalsigns.model.VITAL_Edge import VITAL_Edge
+from vital_ai_vitalsigns.model.VITAL_HyperEdge import VITAL_HyperEdge
+
+G = TypeVar('G', bound=Optional[GraphObject])
+
+EDGE_SOURCE = "http://vital.ai/ontology/vital-core#hasEdgeSource"
+EDGE_DESTINATION = "http://vital.ai/ontology/vital-core#hasEdgeDestination"
+HYPER_EDGE_SOURCE = "http://vital.ai/ontology/vital-core#hasHyperEdgeSource"
+HYPER_EDGE_DESTINATION = "http://vital.ai/ontology/vital-core#hasHyperEdgeDestination"
+
+DIRECTION = Literal["outgoing", "incoming", "both"]
+
+
+def _uri_value(obj: GraphObject, property_uri: str) -> str | None:
+
+    # read from the property map, not through attribute lookup
+    prop = obj._properties.get(property_uri)
+
+    return str(prop.value) if prop is not None else None
+
+
+def edge_endpoints(obj: GraphObject) -> Tuple[str | None, str | None] | None:
+    """The source and destination URIs of an edge or hyperedge, None for other objects."""
+
+    if isinstance(obj, VITAL_Edge):
+        return _uri_value(obj, EDGE_SOURCE), _uri_value(obj, EDGE_DESTINATION)
+
+    if isinstance(obj, VITAL_HyperEdge):
+        return _uri_value(obj, HYPER_EDGE_SOURCE), _uri_value(obj, HYPER_EDGE_DESTINATION)
+
+    return None
+
+
+class AdjacencyIndex:
+    """The edges and hyperedges of a collection by source and by destination URI.
+
+    Each edge is indexed under the endpoints it had when it was added,
+    which are kept so it can be moved or removed without reading it
+    again.  Traversals follow the index from URI to URI, the objects
+    at the URIs are looked up by the caller.
+    """
+
+    def __init__(self):
+
+        # endpoint uri -> edge uri -> edge, in the order edges were added
+        self._outgoing: Dict[str, Dict[str, GraphObject]] = {}
+        self._incoming: Dict[str, Dict[str, GraphObject]] = {}
+
+        # edge uri -> (source uri, destination uri) it is indexed under
+        self._endpoint_map: Dict[str, Tuple[str | None, str | None]] = {}
+
+    def __len__(self):
+        return len(self._endpoint_map)
+
+    def add(self, obj: GraphObject):
+
+        endpoints = edge_endpoints(obj)
+
+        if endpoints is None:
+            return
+
+        edge_uri = str(obj.URI)
+
+        # an edge with the same URI is replaced
+        self.remove_uri(edge_uri)
+
+        source, destination = endpoints
+
+        self._endpoint_map[edge_uri] = endpoints
+
+        if source is not None:
+            self._outgoing.setdefault(source, {})[edge_uri] = obj
+
+        if destination is not None:
+            self._incoming.setdefault(destination, {})[edge_uri] = obj
+
+    def remove(self, obj: GraphObject):
+        if obj is not None and isinstance(obj, (VITAL_Edge, VITAL_HyperEdge)):
+            self.remove_uri(str(obj.URI))
+
+    def remove_uri(self, edge_uri: str):
+
+        endpoints = self._endpoint_map.pop(edge_uri, None)
+
+        if endpoints is None:
+            return
+
+        source, destination = endpoints
+
+        self._discard(self._outgoing, source, edge_uri)
+        self._discard(self._incoming, destination, edge_uri)
+
+    @staticmethod
+    def _discard(adjacency: Dict[str, Dict[str, GraphObject]], uri: str | None, edge_uri: str):
+
+        edge_map = adjacency.get(uri)
+
+        if edge_map is None:
+            return
+
+        edge_map.pop(edge_uri, None)
+
+        if not edge_map:
+            del adjacency[uri]
+
+    def edges_outgoing(self, uri: str, edge_class: Type | Tuple[Type, ...] | None = None) -> List[GraphObject]:
+        return self._edges(self._outgoing, uri, edge_class)
+
+    def edges_incoming(self, uri: str, edge_class: Type | Tuple[Type, ...] | None = None) -> List[GraphObject]:
+        return self._edges(self._incoming, uri, edge_class)
+
+    @staticmethod
+    def _edges(adjacency: Dict[str, Dict[str, GraphObject]], uri: str,
+               edge_class: Type | Tuple[Type, ...] | None) -> List[GraphObject]:
+
+        edge_map = adjacency.get(str(uri))
+
+        if not edge_map:
+            return []
+
+        if edge_class is None:
+            return list(edge_map.values())
+
+        return [edge for edge in edge_map.values() if isinstance(edge, edge_class)]
+
+    def adjacent(self, uri: str, *,
+                 edge_class: Type | Tuple[Type, ...] | None = None,
+                 direction: DIRECTION = "outgoing") -> Iterator[Tuple[str, GraphObject]]:
+        """The URIs one hop from uri, with the edge to each."""
+
+        uri = str(uri)
+
+        if direction in ("outgoing", "both"):
+            for edge_uri, edge in self._outgoing.get(uri, {}).items():
+                destination = self._endpoint_map[edge_uri][1]
+                if destination is not None and (edge_class is None or isinstance(edge, edge_class)):
+                    yield destination, edge
+
+        if direction in ("incoming", "both"):
+            for edge_uri, edge in self._incoming.get(uri, {}).items():
+                source = self._endpoint_map[edge_uri][0]
+                if source is not None and (edge_class is None or isinstance(edge, edge_class)):
+                    yield source, edge
+
+    def bfs(self, uri: str, *,
+            max_depth: int | None = None,
+            edge_class: Type | Tuple[Type, ...] | None = None,
+            direction: DIRECTION = "outgoing") -> Iterator[Tuple[str, int]]:
+        """Breadth first from uri, yielding each URI reached once with its depth, uri itself at 0."""
+
+        uri = str(uri)
+
+        visited = {uri}
+
+        queue = deque([(uri, 0)])
+
+        while queue:
+
+            current, depth = queue.popleft()
+
+            yield current, depth
+
+            if max_depth is not None and depth >= max_depth:
+                continue
+
+            for adjacent_uri, _ in self.adjacent(current, edge_class=edge_class, direction=direction):
+                if adjacent_uri not in visited:
+                    visited.add(adjacent_uri)
+                    queue.append((adjacent_uri, depth + 1))
@@ -1,9 +1,13 @@
+import os
 from collections.abc import MutableSequence
+from vital_ai_vitalsigns.collection.adjacency_index import AdjacencyIndex, DIRECTION
+from vital_ai_vitalsigns.collection.ordered_uri_index import OrderedURIIndex
 from vital_ai_vitalsigns.collection.rdf_collection_impl import RdfCollectionImpl
 from vital_ai_vitalsigns.query.result_element import ResultElement
 from vital_ai_vitalsigns.query.result_list import ResultList
-from typing import Optional, TypeVar, List, Iterator
+from typing import Optional, TypeVar, List, Iterable, Iterator, Tuple, Type
 from vital_ai_vitalsigns.model.GraphObject import GraphObject
+from vital_ai_vitalsigns.model.VITAL_Edge import VITAL_Edge
 
 G = TypeVar('G', bound=Optional[GraphObject])
 
@@ -14,21 +18,32 @@ class GraphCollection(MutableSequence[G]):
                  use_rdfstore: bool = True,
                  use_multigraph_store: bool = False,
                  use_vectordb: bool = True,
-                 embedding_model_id: str = 'paraphrase-MiniLM-L3-v2'):
+                 embedding_model_id: str = 'paraphrase-MiniLM-L3-v2',
+                 embedding_batch_size: int = 256,
+                 vector_index_path: str | None = None):
 
         from vital_ai_vitalsigns.vitalsigns import VitalSigns
 
+        if embedding_batch_size < 1:
+            raise ValueError("embedding_batch_size must be at least 1")
+
         self._use_rdfstore = use_rdfstore
         self._use_multigraph_store = use_multigraph_store
         self._use_vectordb = use_vectordb
         self._embedding_model_id = embedding_model_id
 
+        # texts vectorized per call to the embedding model
+        self._embedding_batch_size = embedding_batch_size
+
+        # objects in order, indexed by URI
         if data is None:
-            self._data = []
+            self._data: OrderedURIIndex[G] = OrderedURIIndex()
         else:
-            self._data = [item for item in data if isinstance(item, GraphObject)]
+            self._data: OrderedURIIndex[G] = OrderedURIIndex(item for item in data if isinstance(item, GraphObject))
+
+        # edges and hyperedges by source and destination
+        self._adjacency = AdjacencyIndex()
 
-        self._uri_map = {}
         self._vector_properties = {}
 
         vs = VitalSigns()
@@ -46,28 +61,21 @@ class GraphCollection(MutableSequence[G]):
             self._rdfstore = RdfCollectionImpl(multigraph=True)
 
         for item in self._data:
-            if hasattr(item, 'URI'):
 
-                self._uri_map[item.URI] = item
+            item.include_on_graph(self)
 
-                if self._use_rdfstore is True:
-                    obj_nt = item.to_rdf()
-                    self._rdfstore.add_triples(obj_nt)
+            self._adjacency.add(item)
 
-                if self._use_vectordb is True:
-                    embedding_model = VitalSigns.get_embedding_model(self._embedding_model_id)
-
-                    uri = str(item.URI)
-                    name = str(item.name)
-
-                    if len(self._vector_properties) == 0:
-                        text = name
-                    else:
-                        text = self.get_object_text(item)
+            if hasattr(item, 'URI'):
 
-                    encoding = embedding_model.vectorize(text)
+                if self._use_rdfstore is True:
+                    self._rdfstore.add_graph_objects([item])
 
-                    # todo index data
+        if self._use_vectordb is True:
+            if vector_index_path is not None and os.path.exists(vector_index_path + '.json'):
+                self.load_vector_index(vector_index_path)
+            else:
+                self._index_vectors(self._data)
 
     def __del__(self):
 
@@ -91,28 +99,20 @@ class GraphCollection(MutableSequence[G]):
         if not isinstance(value, GraphObject):
             raise ValueError("All items must be instances of GraphObject or its subclasses")
 
-        if hasattr(self._data[index], 'URI'):
-            self._uri_map.pop(self._data[index].URI, None)
-
-        if hasattr(value, 'URI'):
-            self._uri_map[value.URI] = value
-
         value.include_on_graph(self)
 
-        self._data[index] = value
+        self._adjacency.remove(self._data.set(index, value))
+        self._adjacency.add(value)
 
     def __delitem__(self, index):
 
-        if hasattr(self._data[index], 'URI'):
-            self._uri_map.pop(self._data[index].URI, None)
+        value = self._data.pop(index)
 
-        value = self._data[index]
+        self._adjacency.remove(value)
 
         if value:
             value.remove_from_graph(self)
 
-        del self._data[index]
-
     def insert(self, index, value: G):
 
         if not isinstance(value, GraphObject):
@@ -120,25 +120,21 @@ class GraphCollection(MutableSequence[G]):
 
         self.pop_uri(value.URI)
 
-        if hasattr(value, 'URI'):
-            self._uri_map[value.URI] = value
-
         value.include_on_graph(self)
 
         self._data.insert(index, value)
 
-    def get(self, uri, default=None) -> G:
-
-        for item in self._data:
-            if item.URI == uri:
-                return item
+        self._adjacency.add(value)
 
-        return default
+    def get(self, uri, default=None) -> G:
+        return self._data.get(uri, default)
 
     def pop(self, index: int = -1):
 
         obj = self._data.pop(index)
 
+        self._adjacency.remove(obj)
+
         if obj:
             obj.remove_from_graph(self)
             obj_uri = obj.URI
@@ -153,36 +149,29 @@ class GraphCollection(MutableSequence[G]):
 
     def pop_uri(self, uri, default=None):
 
-        for i, item in enumerate(self._data):
+        value = self._data.pop_uri(uri)
 
-            if item.URI == uri:
-
-                if self._use_rdfstore is True:
-                    self._rdfstore.delete_triples(uri)
+        if value is None:
+            # raise ValueError("No item found with the specified URI.")
+            return default
 
-                if self._use_vectordb is True:
-                    self._vectordb.remove_doc(uri)
+        if self._use_rdfstore is True:
+            self._rdfstore.delete_triples(uri)
 
-                value = self._data[i]
+        if self._use_vectordb is True:
+            self._vectordb.remove_doc(uri)
 
-                if value:
-                    value.remove_from_graph(self)
+        self._adjacency.remove(value)
 
-                return self._data.pop(i)  # Removes and returns the item
+        value.remove_from_graph(self)
 
-        if default is not None:
-            return default
-
-        # raise ValueError("No item found with the specified URI.")
-        return None
+        return value
 
     def remove(self, uri, default=None) -> G:
         return self.pop_uri(uri, default)
 
     def add(self, obj: G, graph_uri: str = None):
 
-        from vital_ai_vitalsigns.vitalsigns import VitalSigns
-
         if not isinstance(obj, GraphObject):
             raise ValueError("Item must be instances of GraphObject or its subclasses")
 
@@ -195,90 +184,85 @@ class GraphCollection(MutableSequence[G]):
 
         self._data.append(obj)
 
-        if self._use_vectordb is True:
+        self._adjacency.add(obj)
 
-            vs = VitalSigns()
+        if self._use_vectordb is True:
+            self._index_vectors([obj])
 
-            embedding_model = vs.get_embedding_model(self._embedding_model_id)
+        if self._use_rdfstore is True:
+            self._rdfstore.add_graph_objects([obj])
 
-            uri = str(obj.URI)
-            name = str(obj.name)
-            class_uri = str(obj.get_class_uri())
+    def add_objects(self, objects: List[G]):
 
-            if len(self._vector_properties) == 0:
-                text = name
-            else:
-                text = self.get_object_text(obj)
+        if not all(isinstance(obj, GraphObject) for obj in objects):
+            raise ValueError("All items must be instances of GraphObject or its subclasses")
 
-            encoding = embedding_model.vectorize(text)
+        for obj in objects:
 
-            # index_docs = [GraphObjectDoc(id=uri, URI=uri, ClassURI=class_uri, name=name, text=text, embedding=encoding)]
+            self.pop_uri(obj.URI)
 
-            # self._vectordb.index_documents(DocList[GraphObjectDoc](index_docs))
+            obj.include_on_graph(self)
 
-            vector = encoding  # np.array(encoding, dtype=np.float32)
-            # vector = vector / np.linalg.norm(vector)
-            # vector = vector.reshape(1, -1)
+            self._data.append(obj)
 
-            self._vectordb.index.add_items([vector])
+            self._adjacency.add(obj)
 
-            self._vectordbdoc_id_to_index[uri] = self._vectordb.current_index
-            self._vectordb.index_to_doc_id[self._vectordb.current_index] = uri
-            self._vectordb.current_index += 1
+            if self._use_rdfstore is True:
+                self._rdfstore.add_graph_objects([obj])
 
-        if self._use_rdfstore is True:
-            obj_nt = obj.to_rdf()
-            self._rdfstore.add_triples(obj_nt)
+        if self._use_vectordb is True:
+            self._index_vectors(objects)
 
-    def add_objects(self, objects: List[G]):
+    def _index_vectors(self, objects: Iterable[G]):
+        """Vectorize the text of the objects in batches and add the vectors to the vector index."""
 
         from vital_ai_vitalsigns.vitalsigns import VitalSigns
 
-        if not all(isinstance(obj, GraphObject) for obj in objects):
-            raise ValueError("All items must be instances of GraphObject or its subclasses")
+        vs = VitalSigns()
 
-        for obj in objects:
+        embedding_model = vs.get_embedding_model(self._embedding_model_id)
 
-            self.pop_uri(obj.URI)
+        doc_id_to_index = self._vectordb.doc_id_to_index
 
-            obj.include_on_graph(self)
+        # one object per URI, an object added again replaces the earlier one,
+        # objects with a vector loaded from a saved index are skipped
+        object_map = {str(obj.URI): obj for obj in objects if str(obj.URI) not in doc_id_to_index}
 
-            self._data.append(obj)
+        uri_list = list(object_map)
 
-            if self._use_vectordb is True:
+        for start in range(0, len(uri_list), self._embedding_batch_size):
 
-                vs = VitalSigns()
+            batch_uri_list = uri_list[start:start + self._embedding_batch_size]
 
-                embedding_model = vs.get_embedding_model(self._embedding_model_id)
+            batch_object_list = [object_map[uri] for uri in batch_uri_list]
 
-                uri = str(obj.URI)
-                name = str(obj.name)
-                class_uri = str(obj.get_class_uri())
+            vector_list = embedding_model.vectorize([self._object_text(obj) for obj in batch_object_list])
 
-                if len(self._vector_properties) == 0:
-                    text = name
-                else:
-                    text = self.get_object_text(obj)
+            self._vectordb.add_vectors(batch_uri_list, vector_list,
+                                       [str(obj.get_class_uri()) for obj in batch_object_list])
 
-                encoding = embedding_model.vectorize(text)
+    def _object_text(self, obj: G) -> str:
 
-                # index_docs = [GraphObjectDoc(id=uri, URI=uri, ClassURI=class_uri, name=name, text=text, embedding=encoding)]
+        if len(self._vector_properties) == 0:
+            return str(obj.name)
 
-                # self._vectordb.index_documents(DocList[GraphObjectDoc](index_docs))
+        return self.get_object_text(obj)
 
-                vector = encoding  # np.array(encoding, dtype=np.float32)
-                # vector = vector / np.linalg.norm(vector)
-                # vector = vector.reshape(1, -1)
+    def save_vector_index(self, path: str):
+        """Save the vector index to path, with the URI mapping in path.json."""
+        self._vectordb.save(path)
 
-                self._vectordb.index.add_items([vector])
+    def load_vector_index(self, path: str):
+        """
+        Load the vector index saved at path in place of the current one.
+        Vectors of URIs not in the collection are removed and objects without a vector are vectorized.
+        """
+        self._vectordb.load(path)
 
-                self._vectordb.doc_id_to_index[uri] = self._vectordb.current_index
-                self._vectordb.index_to_doc_id[self._vectordb.current_index] = uri
-                self._vectordb.current_index += 1
+        for uri in [uri for uri in self._vectordb.doc_id_to_index if uri not in self._data]:
+            self._vectordb.remove_doc(uri)
 
-            if self._use_rdfstore is True:
-                obj_nt = obj.to_rdf()
-                self._rdfstore.add_triples(obj_nt)
+        self._index_vectors(self._data)
 
     def get_object_text(self, obj: G):
         text = ""
@@ -295,23 +279,14 @@ class GraphCollection(MutableSequence[G]):
 
     def remove_objects(self, uris: List[str]):
         """Remove objects from the collection by a list of URI values."""
-        to_remove_indexes = []
-        for uri in uris:
-            for i, item in enumerate(self._data):
-                if item.URI == uri:
-                    to_remove_indexes.append(i)
-                    if self._use_rdfstore is True:
-                        self._rdfstore.delete_triples(uri)
-                    if self._use_vectordb is True:
-                        self._vectordb.remove_doc(uri)
-                    break  # Assuming URIs are unique, stop after finding the first match
-
-        # Iterate in reverse order to avoid altering the indexes of items to be removed
-        for i in sorted(to_remove_indexes, reverse=True):
-            value = self._data[i]
-            if value:
-                value.remove_from_graph(self)
-            del self._data[i]
+        for value in self._data.pop_uris(uris):
+            uri = value.URI
+            if self._use_rdfstore is True:
+                self._rdfstore.delete_triples(uri)
+            if self._use_vectordb is True:
+                self._vectordb.remove_doc(uri)
+            self._adjacency.remove(value)
+            value.remove_from_graph(self)
 
     def set_vector_properties(self, class_uri, property_uris: List):
         """Set the vector properties for a given class URI."""
@@ -331,41 +306,61 @@ class GraphCollection(MutableSequence[G]):
     def get_vector_class_uris(self):
         return list(self._vector_properties.keys())
 
-    def get_edges_incoming(self, uri: str) -> List[G]:
-        from vital_ai_vitalsigns.model.VITAL_Edge import VITAL_Edge
-
-        incoming_edges = [item for item in self._data if isinstance(item, VITAL_Edge) and item.edgeDestination == uri]
-        return incoming_edges
+    def update_index(self, obj: G):
+        """Re-index an object of the collection after its edge source or destination changed."""
+        if self._data.get(obj.URI) is obj:
+            self._adjacency.add(obj)
 
-    def get_edges_outgoing(self, uri: str) -> List[G]:
-        from vital_ai_vitalsigns.model.VITAL_Edge import VITAL_Edge
+    def get_edges_incoming(self, uri: str, edge_class: Type | Tuple[Type, ...] = VITAL_Edge) -> List[G]:
+        return self._adjacency.edges_incoming(uri, edge_class)
 
-        outgoing_edges = [item for item in self._data if isinstance(item, VITAL_Edge) and item.edgeSource == uri]
-        return outgoing_edges
+    def get_edges_outgoing(self, uri: str, edge_class: Type | Tuple[Type, ...] = VITAL_Edge) -> List[G]:
+        return self._adjacency.edges_outgoing(uri, edge_class)
 
     def get_nodes_incoming(self, uri: str) -> List[G]:
         """
         Return the node objects that have an outgoing edge to the given URI.
         """
-        from vital_ai_vitalsigns.model.VITAL_Edge import VITAL_Edge
-
-        # Use a set to avoid duplicates and collect URIs of source nodes
-        incoming_node_uris = {item.edgeSource for item in self._data if
-                              isinstance(item, VITAL_Edge) and item.edgeDestination == uri}
-        # Use the existing get method to convert URIs to node objects
-        incoming_nodes = [self.get(node_uri) for node_uri in incoming_node_uris]
-        return [node for node in incoming_nodes if node is not None]  # Filter out any None results
+        return self._adjacent_objects(uri, "incoming")
 
     def get_nodes_outgoing(self, uri: str) -> List[G]:
         """
         Return the node objects that are the destination of an outgoing edge from the given URI.
         """
-        from vital_ai_vitalsigns.model.VITAL_Edge import VITAL_Edge
+        return self._adjacent_objects(uri, "outgoing")
+
+    def _adjacent_objects(self, uri: str, direction: DIRECTION) -> List[G]:
+
+        # unique URIs of the nodes at the other end of the edges
+        uri_list = dict.fromkeys(adjacent_uri for adjacent_uri, _ in
+                                 self._adjacency.adjacent(uri, edge_class=VITAL_Edge, direction=direction))
+
+        adjacent_objects = [self.get(adjacent_uri) for adjacent_uri in uri_list]
+        return [obj for obj in adjacent_objects if obj is not None]  # Filter out any None results
 
-        outgoing_node_uris = {item.edgeDestination for item in self._data if
-                              isinstance(item, VITAL_Edge) and item.edgeSource == uri}
-        outgoing_nodes = [self.get(node_uri) for node_uri in outgoing_node_uris]
-        return [node for node in outgoing_nodes if node is not None]  # Filter out any None results
+    def bfs(self, uri: str, *,
+            max_depth: int | None = None,
+            edge_class: Type | Tuple[Type, ...] | None = None,
+            direction: DIRECTION = "outgoing") -> Iterator[Tuple[G, int]]:
+        """
+        Breadth first from the object with the given URI, following edges of edge_class
+        (edges and hyperedges by default), yielding each object reached with its depth.
+        URIs without an object in the collection are followed but not yielded.
+        """
+        for reached_uri, depth in self._adjacency.bfs(uri, max_depth=max_depth, edge_class=edge_class,
+                                                      direction=direction):
+            obj = self.get(reached_uri)
+            if obj is not None:
+                yield obj, depth
+
+    def neighbors(self, uri: str, depth: int = 1, *,
+                  edge_class: Type | Tuple[Type, ...] | None = None,
+                  direction: DIRECTION = "outgoing") -> List[G]:
+        """
+        Return the objects within depth hops of the given URI, nearest first.
+        """
+        return [obj for obj, obj_depth in self.bfs(uri, max_depth=depth, edge_class=edge_class,
+                                                   direction=direction) if obj_depth > 0]
 
     def search(self, query: str, class_uri: str = None, limit: int = 10):
 
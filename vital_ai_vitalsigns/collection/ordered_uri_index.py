@@ -0,0 +1,164 @@
+from typing import Dict, Generic, Iterable, Iterator, List, Optional, TypeVar
+from vital_ai_vitalsigns.model.GraphObject import GraphObject
+
+G = TypeVar('G', bound=Optional[GraphObject])
+
+
+def _uri_key(uri) -> str | None:
+    return str(uri) if uri is not None else None
+
+
+class OrderedURIIndex(Generic[G]):
+    """Graph objects in order, indexed by URI, one object per URI.
+
+    Objects are kept in a list of slots with the slot of each URI in a
+    dict, so lookup, append and removal by URI are O(1).  A removed
+    object leaves an empty slot which is compacted away in one pass
+    before the next access by position, or when half the slots are
+    empty, so positions always count live objects only.
+    """
+
+    def __init__(self, data: Iterable[G] | None = None):
+
+        self._slots: List[G | None] = []
+        self._slot_map: Dict[str | None, int] = {}
+        self._empty_count = 0
+
+        for obj in data or []:
+            self.append(obj)
+
+    def __len__(self):
+        return len(self._slot_map)
+
+    def __iter__(self) -> Iterator[G]:
+        for obj in self._slots:
+            if obj is not None:
+                yield obj
+
+    def __contains__(self, uri) -> bool:
+        return _uri_key(uri) in self._slot_map
+
+    def __getitem__(self, index):
+        self._compact()
+        return self._slots[index]
+
+    def get(self, uri, default=None) -> G:
+
+        slot = self._slot_map.get(_uri_key(uri))
+
+        if slot is None:
+            return default
+
+        return self._slots[slot]
+
+    def append(self, obj: G) -> G | None:
+        """Add obj at the end, returns the object it replaces with the same URI."""
+
+        replaced = self.pop_uri(obj.URI)
+
+        self._slot_map[_uri_key(obj.URI)] = len(self._slots)
+        self._slots.append(obj)
+
+        return replaced
+
+    def set(self, index: int, obj: G) -> G:
+        """Put obj at index, returns the object it replaces."""
+
+        self._compact()
+
+        old = self._slots[index]
+
+        key = _uri_key(obj.URI)
+
+        if key != _uri_key(old.URI):
+
+            # a different object with the URI elsewhere is replaced too
+            if key in self._slot_map:
+                self._clear_slot(self._slot_map.pop(key))
+
+            del self._slot_map[_uri_key(old.URI)]
+
+        index = index % len(self._slots)
+
+        self._slots[index] = obj
+        self._slot_map[key] = index
+
+        return old
+
+    def insert(self, index: int, obj: G) -> G | None:
+        """Insert obj before index, returns the object it replaces with the same URI."""
+
+        replaced = self.pop_uri(obj.URI)
+
+        self._compact()
+
+        self._slots.insert(index, obj)
+
+        self._reindex(0 if index < 0 else min(index, len(self._slots) - 1))
+
+        return replaced
+
+    def pop(self, index: int = -1) -> G:
+
+        self._compact()
+
+        obj = self._slots.pop(index)
+
+        del self._slot_map[_uri_key(obj.URI)]
+
+        if index != -1:
+            self._reindex(0 if index < 0 else index)
+
+        return obj
+
+    def pop_uri(self, uri) -> G | None:
+
+        slot = self._slot_map.pop(_uri_key(uri), None)
+
+        if slot is None:
+            return None
+
+        obj = self._clear_slot(slot)
+
+        if self._empty_count > len(self._slot_map):
+            self._compact()
+
+        return obj
+
+    def pop_uris(self, uris: Iterable) -> List[G]:
+        """Remove the objects with the given URIs, with a single compaction."""
+
+        removed = []
+
+        for uri in uris:
+            slot = self._slot_map.pop(_uri_key(uri), None)
+            if slot is not None:
+                removed.append(self._clear_slot(slot))
+
+        self._compact()
+
+        return removed
+
+    def _clear_slot(self, slot: int) -> G:
+
+        obj = self._slots[slot]
+
+        self._slots[slot] = None
+        self._empty_count += 1
+
+        return obj
+
+    def _compact(self):
+
+        if self._empty_count == 0:
+            return
+
+        self._slots = [obj for obj in self._slots if obj is not None]
+        self._empty_count = 0
+
+        self._reindex(0)
+
+    def _reindex(self, start: int):
+
+        for slot in range(start, len(self._slots)):
+            self._slot_map[_uri_key(self._slots[slot].URI)] = slot
@@ -31,14 +31,27 @@ class RdfCollectionImpl(RDFlibSparqlImpl):
         """
         self.graph.parse(data=nt_string, format="nt")
 
+    def add_graph_objects(self, graph_object_list: List[G], *, graph_uri: str = None):
+        """
+        Add the triples of graph objects to the graph without going through NT text.
+        :param graph_uri: The named graph to add to, when the collection is a multigraph.
+        :param graph_object_list: The graph objects to add.
+        """
+        graph = self.graph
+
+        if self._multigraph and graph_uri is not None:
+            # created when it does not exist yet
+            graph = self.graph.graph(URIRef(graph_uri))
+
+        for graph_object in graph_object_list:
+            for triple in graph_object.to_triples():
+                graph.add(triple)
+
     def clear_graph(self):
         """
         Clear all triples from the graph.
         """
-        if self._multigraph:
-            self.graph = Dataset()
-        else:
-            self.graph = Graph()
+        self.graph = self._new_graph()
 
     def query_graph(self, sparql_query: str, *, graph_uri: str = None):
         """
@@ -202,11 +215,15 @@ class RdfCollectionImpl(RDFlibSparqlImpl):
             safety_check=safety_check)
 
     def metaql_select_query(self, *, namespace: str = None, select_query: MetaQLSelectQuery,
-                            namespace_list: List[Ontology]) -> MetaQLResult:
-        pass
+                            namespace_list: List[Ontology] = None,
+                            account_id: str | None = None, is_global: bool = False) -> MetaQLResult:
+
+        return self._metaql_select_query_impl(select_query=select_query)
 
     def metaql_graph_query(self, *, namespace: str = None, graph_query: MetaQLGraphQuery,
-                           namespace_list: List[Ontology]) -> MetaQLResult:
-        pass
+                           namespace_list: List[Ontology] = None,
+                           account_id: str | None = None, is_global: bool = False) -> MetaQLResult:
+
+        return self._metaql_graph_query_impl(graph_query=graph_query)
 
 
@@ -1,31 +1,60 @@
 from vital_ai_vitalsigns.collection.graph_collection import GraphCollection
-from typing import List, Union, TypeVar, Generic
-from tempfile import TemporaryDirectory
+from typing import Dict, List
+import json
 import hnswlib
 import numpy as np
 
 
 class VectorCollectionImpl:
 
-    def __init__(self, graph: GraphCollection):
+    # deleted labels kept before compaction is considered
+    COMPACT_MIN_DELETED = 10_000
+
+    def __init__(self, graph: GraphCollection,
+                 dim: int | None = None,
+                 space: str = 'cosine',
+                 max_elements: int = 1024,
+                 ef_construction: int = 200,
+                 M: int = 16):
         """
-        Initializes the VectorCollectionImpl with a specific schema and workspace.
+        Initializes the VectorCollectionImpl for a graph collection.
+        :param graph: The graph collection of the indexed objects.
+        :param dim: The vector dimension, taken from the first vectors added when None.
+        :param space: The hnswlib distance space.
+        :param max_elements: The initial capacity of the index, which grows as vectors are added.
+        :param ef_construction: The hnswlib construction time accuracy.
+        :param M: The hnswlib number of links per element.
         """
 
-        embedding_vector_size = 384
-        max_size = 100000
-
         self.graph = graph
-        self.index = hnswlib.Index(space='cosine', dim=embedding_vector_size)
 
-        self.index.init_index(max_elements=max_size, ef_construction=200, M=16)
+        self.dim = dim
+        self.space = space
+        self.max_elements = max_elements
+        self.ef_construction = ef_construction
+        self.M = M
 
-        # self.index.set_ef(100)
+        self.index = self._new_index(max_elements) if dim is not None else None
 
         self.current_index = 0
         self.doc_id_to_index = {}
         self.index_to_doc_id = {}
 
+        # label -> class URI, and the number of live labels per class URI
+        self.index_to_class_uri: Dict[int, str] = {}
+        self.class_uri_count: Dict[str, int] = {}
+
+        # labels marked deleted in the index and not yet compacted away
+        self.deleted_count = 0
+
+    def _new_index(self, max_elements: int) -> hnswlib.Index:
+
+        index = hnswlib.Index(space=self.space, dim=self.dim)
+
+        index.init_index(max_elements=max_elements, ef_construction=self.ef_construction, M=self.M)
+
+        return index
+
     def index_documents(self, documents):
         """
         Indexes a list of documents in the vector database.
@@ -33,78 +62,188 @@ class VectorCollectionImpl:
         """
         # self.db.index(documents)
 
-    def search(self, query_embedding, class_uri: str = None, limit: int = 10) -> List:
+    def add_vectors(self, doc_id_list: List[str], vector_list, class_uri_list: List[str] | None = None) -> None:
         """
-        Searches the vector database for the closest matches to the provided embedding.
-        :param class_uri:
-        :param query_embedding: A vector used to search for similar documents.
-        :param limit: The maximum number of results to return.
-        :return: A list of objects matching the query.
+        Adds vectors to the index in one call, labelled in order from the current index.
+        :param doc_id_list: The document ids, one per vector.
+        :param vector_list: The vectors, as a 2D array or a list of vectors.
+        :param class_uri_list: The class URIs of the documents, used to filter searches.
         """
 
-        search_vector = query_embedding  # np.array(search_vector, dtype=np.float32)
-        # search_vector /= np.linalg.norm(search_vector)
+        if len(doc_id_list) == 0:
+            return
+
+        vectors = np.asarray(vector_list, dtype=np.float32)
 
-        self.index.set_ef(50)
+        if self.index is None:
+            self.dim = vectors.shape[1]
+            self.index = self._new_index(self.max_elements)
 
-        current_count = self.index.element_count
-        print(f"Current number of elements in the index: {current_count}")
+        # grow by doubling, deleted labels still take their place until compaction
+        required = self.index.element_count + len(doc_id_list)
 
-        k = limit
+        if required > self.index.get_max_elements():
+            self.index.resize_index(max(required, 2 * self.index.get_max_elements()))
 
-        if k > current_count:
-            k = current_count
+        start = self.current_index
 
-        # print(f"Index space: { self.index.space}, dimension: { self.index.dim}")
-        # print(f"Max elements: { self.index.max_elements}, M: { self.index.M}, ef_construction: { self.index.ef_construction}")
+        labels = np.arange(start, start + len(doc_id_list))
 
-        # print(search_vector)
+        self.index.add_items(vectors, labels)
 
-        # model_id = 'paraphrase-MiniLM-L3-v2'
-        # model = SentenceTransformer(model_id)
+        label_list = labels.tolist()
 
-        # new_sentence = "A new sentence similar to the previous ones"
-        # new_embedding = model.encode([new_sentence])
+        self.doc_id_to_index.update(zip(doc_id_list, label_list))
+        self.index_to_doc_id.update(zip(label_list, doc_id_list))
 
-        # labels, distances = self.index.knn_query(new_embedding, k=1)
+        if class_uri_list is not None:
+            self.index_to_class_uri.update(zip(label_list, class_uri_list))
+            for class_uri in class_uri_list:
+                self.class_uri_count[class_uri] = self.class_uri_count.get(class_uri, 0) + 1
 
-        labels, distances = self.index.knn_query(query_embedding, k=k)
+        self.current_index += len(doc_id_list)
 
-        # print(labels[0][0])
-        # print(distances[0][0])
+    def search(self, query_embedding, class_uri: str = None, limit: int = 10) -> Dict:
+        """
+        Searches the vector database for the closest matches to the provided embedding.
+        :param class_uri: Only match documents of this class URI when given.
+        :param query_embedding: A vector used to search for similar documents.
+        :param limit: The maximum number of results to return.
+        :return: The matching document URIs and their distances.
+        """
 
         results = {
             'matches': [],
             'scores': []
         }
 
-        # print(self.index_to_doc_id)
-        # print(self.doc_id_to_index)
+        if class_uri is None:
+            current_count = len(self.doc_id_to_index)
+            label_filter = None
+        else:
+            current_count = self.class_uri_count.get(class_uri, 0)
+            index_to_class_uri = self.index_to_class_uri
+            label_filter = lambda label: index_to_class_uri.get(label) == class_uri
+
+        k = min(limit, current_count)
+
+        if k == 0:
+            return results
+
+        self.index.set_ef(max(50, k))
+
+        try:
+            labels, distances = self.index.knn_query(query_embedding, k=k, filter=label_filter)
+        except RuntimeError:
+            # fewer than k matches were found within ef, which happens for rare classes
+            self.index.set_ef(max(self.index.element_count, k))
+            labels, distances = self.index.knn_query(query_embedding, k=k, filter=label_filter)
 
         for label, score in zip(labels[0], distances[0]):
             doc_id = self.index_to_doc_id.get(label, None)
-            # print(f"doc_id: {doc_id}")
             if doc_id:
                 results['matches'].append({'URI': doc_id})
                 results['scores'].append(score)
 
         return results
 
+    def remove_doc(self, doc_id: str):
+
+        label = self.doc_id_to_index.pop(str(doc_id), None)
+
+        if label is None:
+            return
 
+        del self.index_to_doc_id[label]
+
+        class_uri = self.index_to_class_uri.pop(label, None)
+
+        if class_uri is not None:
+            self.class_uri_count[class_uri] -= 1
+            if self.class_uri_count[class_uri] == 0:
+                del self.class_uri_count[class_uri]
+
+        self.index.mark_deleted(label)
+
+        self.deleted_count += 1
+
+        if self.deleted_count >= self.COMPACT_MIN_DELETED and self.deleted_count > len(self.doc_id_to_index):
+            self.compact()
+
+    def compact(self):
+        """
+        Rebuilds the index from the live vectors, dropping the deleted labels.
+        Labels are kept, so the document mapping is unchanged.
         """
-        if class_uri is None:
-            query_doc = self.schema(embedding=query_embedding)
 
-            results = self.db.search(query_doc, limit=limit)
+        if self.index is None or self.deleted_count == 0:
+            return
 
-            return results if results else []
-        else:
-            query_doc = self.schema(embedding=query_embedding)
+        label_list = list(self.index_to_doc_id)
+
+        index = self._new_index(max(len(label_list), self.max_elements))
 
-            results = self.db.filter(query_doc, limit=limit, ClassURI=class_uri)
+        if label_list:
+            index.add_items(self.index.get_items(label_list), label_list)
 
-            return results if results else []
+        self.index = index
+        self.deleted_count = 0
+
+    def save(self, path: str):
+        """
+        Saves the index to path and the document mapping to path.json,
+        so the vectors can be loaded without embedding the documents again.
+        :param path: The file path of the index.
         """
 
-    def remove_doc(self, doc_id: str):
-        self.db.delete([doc_id])
\ No newline at end of file
+        if self.index is not None:
+            self.index.save_index(path)
+
+        metadata = {
+            'dim': self.dim,
+            'space': self.space,
+            'ef_construction': self.ef_construction,
+            'M': self.M,
+            'current_index': self.current_index,
+            'deleted_count': self.deleted_count,
+            'documents': [[label, doc_id, self.index_to_class_uri.get(label)]
+                          for label, doc_id in self.index_to_doc_id.items()]
+        }
+
+        with open(path + '.json', 'w') as metadata_file:
+            json.dump(metadata, metadata_file)
+
+    def load(self, path: str):
+        """
+        Replaces the index and document mapping with the ones saved at path.
+        :param path: The file path of the index.
+        """
+
+        with open(path + '.json') as metadata_file:
+            metadata = json.load(metadata_file)
+
+        self.dim = metadata['dim']
+        self.space = metadata['space']
+        self.ef_construction = metadata['ef_construction']
+        self.M = metadata['M']
+
+        if self.dim is None:
+            self.index = None
+        else:
+            self.index = hnswlib.Index(space=self.space, dim=self.dim)
+            self.index.load_index(path)
+
+        self.current_index = metadata['current_index']
+        self.deleted_count = metadata['deleted_count']
+
+        self.doc_id_to_index = {}
+        self.index_to_doc_id = {}
+        self.index_to_class_uri = {}
+        self.class_uri_count = {}
+
+        for label, doc_id, class_uri in metadata['documents']:
+            self.doc_id_to_index[doc_id] = label
+            self.index_to_doc_id[label] = doc_id
+            if class_uri is not None:
+                self.index_to_class_uri[label] = class_uri
+                self.class_uri_count[class_uri] = self.class_uri_count.get(class_uri, 0) + 1
@@ -82,6 +82,15 @@ class GraphDatabaseConfig:
     username: Optional[str] = None
     password: Optional[str] = None
     apikey: Optional[str] = None
+    # http connection pool and retry settings
+    pool_size: Optional[int] = 10
+    max_retries: Optional[int] = 3
+    retry_backoff_factor: Optional[float] = 0.5
+    # number of compiled metaql query plans kept
+    metaql_plan_cache_size: Optional[int] = 256
+    # order metaql query terms by estimated selectivity, and log the order
+    metaql_optimize_order: Optional[bool] = True
+    metaql_explain_order: Optional[bool] = False
 
 
 @dataclass
@@ -105,9 +114,33 @@ class VitalServiceSection:
     implementation_mapping: Optional[ImplementationMappingConfig] = None
 
 
+@dataclass
+class GraphObjectTrackingConfig:
+    # one of: off, sampled, full
+    policy: str = "full"
+    sample_interval: int = 100
+
+
+@dataclass
+class RegistrySnapshotConfig:
+    # opt in, snapshots are pickles loaded at start-up
+    enabled: bool = False
+    # defaults to vital-cache/vitalsigns under vital home
+    cache_dir: Optional[str] = None
+
+
+@dataclass
+class RegistryConfig:
+    # import classes listed in package manifests on first use instead of at start-up
+    lazy_import: bool = False
+
+
 @dataclass
 class VitalSignsConfig:
     vitalservice: Optional[VitalServiceSection] = None
+    graph_object_tracking: Optional[GraphObjectTrackingConfig] = None
+    registry_snapshot: Optional[RegistrySnapshotConfig] = None
+    registry: Optional[RegistryConfig] = None
     
     # Legacy property for backward compatibility
     @property
@@ -225,6 +258,24 @@ class VitalSignsConfigLoader:
                 implementation_mapping=implementation_mapping
             )
 
-        return VitalSignsConfig(vitalservice=vitalservice_section)
+        graph_object_tracking = None
+
+        if 'graph_object_tracking' in config_data:
+            graph_object_tracking = GraphObjectTrackingConfig(**config_data['graph_object_tracking'])
+
+        registry_snapshot = None
+
+        if 'registry_snapshot' in config_data:
+            registry_snapshot = RegistrySnapshotConfig(**config_data['registry_snapshot'])
+
+        registry = None
+
+        if 'registry' in config_data:
+            registry = RegistryConfig(**config_data['registry'])
+
+        return VitalSignsConfig(vitalservice=vitalservice_section,
+                                graph_object_tracking=graph_object_tracking,
+                                registry_snapshot=registry_snapshot,
+                                registry=registry)
 
 
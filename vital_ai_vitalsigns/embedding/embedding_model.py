@@ -1,7 +1,12 @@
-from typing import List, Union
+from typing import Iterator, List, Union
 import hashlib
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 import logging
+import multiprocessing
+import queue
+import threading
+import weakref
 import numpy as np
 import onnxruntime as ort
 # Suppress ONNX Runtime warnings about GPU device discovery
@@ -57,8 +62,53 @@ class LRUEmbeddingCache:
             self.cache.popitem(last=False)
 
 
+# ONNX Runtime graph optimization levels by name
+GRAPH_OPTIMIZATION_LEVELS = {
+    "disable": ort.GraphOptimizationLevel.ORT_DISABLE_ALL,
+    "basic": ort.GraphOptimizationLevel.ORT_ENABLE_BASIC,
+    "extended": ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED,
+    "all": ort.GraphOptimizationLevel.ORT_ENABLE_ALL,
+}
+
+# the model of each worker process of the process pool
+_worker_model = None
+
+
+def _init_worker(model_kwargs: dict) -> None:
+    global _worker_model
+    _worker_model = EmbeddingModel(**model_kwargs)
+
+
+def _worker_vectorize(texts: List[str]) -> np.ndarray:
+    return _worker_model.embed_batch(_worker_model.tokenize(texts))
+
+
 class EmbeddingModel:
-    def __init__(self, cache_size: int = 1000):
+    def __init__(self, cache_size: int = 1000, *,
+                 batch_size: int = 64,
+                 intra_op_num_threads: int = 0,
+                 inter_op_num_threads: int = 0,
+                 graph_optimization_level: str = "all",
+                 pipeline_depth: int = 2,
+                 num_processes: int = 0):
+        """
+        :param cache_size: The number of embeddings kept by text.
+        :param batch_size: The number of texts run through the model at a time,
+            texts are batched by length so each batch is padded to similar lengths.
+        :param intra_op_num_threads: ONNX Runtime threads within an operator, 0 for its default.
+        :param inter_op_num_threads: ONNX Runtime threads across operators, 0 for its default.
+        :param graph_optimization_level: disable, basic, extended or all.
+        :param pipeline_depth: The number of tokenized batches prepared ahead of the model.
+        :param num_processes: Worker processes to run batches in, each with its own session,
+            0 to run them in this process.
+        """
+
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        if graph_optimization_level not in GRAPH_OPTIMIZATION_LEVELS:
+            raise ValueError(f"graph_optimization_level must be one of {list(GRAPH_OPTIMIZATION_LEVELS)}")
+
         package_name = 'vital-model-paraphrase-MiniLM-onnx'
         model_name = 'paraphrase-MiniLM-L3-v2.onnx'
         model_id = 'paraphrase-MiniLM-L3-v2'
@@ -67,21 +117,132 @@ class EmbeddingModel:
         tokenizer_path = get_models_directory() + '/tokenizer'
         self.tokenizer = AutoTokenizer.from_pretrained(tokenizer_path)
 
+        session_options = ort.SessionOptions()
+        session_options.intra_op_num_threads = intra_op_num_threads
+        session_options.inter_op_num_threads = inter_op_num_threads
+        session_options.graph_optimization_level = GRAPH_OPTIMIZATION_LEVELS[graph_optimization_level]
+
         # Create an ONNXRuntime session for inference
         model_path = get_model_file(package_name, model_name)
         # Use CPU provider only to avoid GPU device discovery warnings
         providers = ['CPUExecutionProvider']
-        self.ort_session = ort.InferenceSession(model_path, providers=providers)
+        self.ort_session = ort.InferenceSession(model_path, sess_options=session_options, providers=providers)
 
         self.model_id = model_id
         self.cache = LRUEmbeddingCache(maxsize=cache_size)
 
+        self.batch_size = batch_size
+        self.pipeline_depth = max(1, pipeline_depth)
+        self.num_processes = num_processes
+
+        # workers run single threaded sessions, the processes are the parallelism
+        self._worker_kwargs = dict(cache_size=0, batch_size=batch_size,
+                                   intra_op_num_threads=1, inter_op_num_threads=1,
+                                   graph_optimization_level=graph_optimization_level)
+        self._process_pool = None
+        self._process_pool_finalizer = None
+
     def get_model_id(self) -> str:
         return self.model_id
 
     def hash_text(self, text: str) -> str:
         return hashlib.sha256(text.encode('utf-8')).hexdigest()
 
+    def close(self) -> None:
+        """Shut down the worker processes, if any were started.
+        Otherwise they are shut down when the model is collected or at exit."""
+        if self._process_pool is not None:
+            self._process_pool_finalizer()
+            self._process_pool = None
+            self._process_pool_finalizer = None
+
+    def tokenize(self, texts: List[str]) -> dict:
+        inputs = self.tokenizer(
+            texts, return_tensors="np", padding=True, truncation=True
+        )
+        return {
+            k: v for k, v in inputs.items()
+            if k in ("input_ids", "attention_mask")
+        }
+
+    def embed_batch(self, ort_inputs: dict) -> np.ndarray:
+        ort_outs = self.ort_session.run(None, ort_inputs)
+        return ort_outs[-1]
+
+    def _length_batches(self, texts: List[str]) -> List[List[int]]:
+
+        # positions by text length, so the texts of a batch pad to about the same length
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+
+        return [order[start:start + self.batch_size] for start in range(0, len(order), self.batch_size)]
+
+    def _embed(self, texts: List[str]) -> List[np.ndarray]:
+
+        batches = self._length_batches(texts)
+
+        embeddings: List[np.ndarray | None] = [None] * len(texts)
+
+        if self.num_processes > 0 and len(batches) > 1:
+            batch_vectors = self._embed_in_processes(texts, batches)
+        else:
+            batch_vectors = self._embed_in_pipeline(texts, batches)
+
+        for batch, vectors in zip(batches, batch_vectors):
+            for i, vec in zip(batch, vectors):
+                embeddings[i] = vec
+
+        return embeddings
+
+    def _embed_in_pipeline(self, texts: List[str], batches: List[List[int]]) -> Iterator[np.ndarray]:
+
+        if len(batches) == 1:
+            yield self.embed_batch(self.tokenize([texts[i] for i in batches[0]]))
+            return
+
+        # tokenize ahead in a thread while the session runs, both release the GIL
+        tokenized = queue.Queue(maxsize=self.pipeline_depth)
+        stop = threading.Event()
+
+        def produce():
+            try:
+                for batch in batches:
+                    if stop.is_set():
+                        return
+                    tokenized.put(self.tokenize([texts[i] for i in batch]))
+            except BaseException as e:
+                tokenized.put(e)
+
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+
+        try:
+            for _ in batches:
+                item = tokenized.get()
+                if isinstance(item, BaseException):
+                    raise item
+                yield self.embed_batch(item)
+        finally:
+            stop.set()
+            # unblock the producer if it is waiting on a full queue
+            while producer.is_alive():
+                try:
+                    tokenized.get_nowait()
+                except queue.Empty:
+                    producer.join(0.01)
+
+    def _embed_in_processes(self, texts: List[str], batches: List[List[int]]) -> Iterator[np.ndarray]:
+
+        if self._process_pool is None:
+            # spawned, a forked child can inherit locks held by ONNX Runtime or pipeline threads and deadlock
+            self._process_pool = ProcessPoolExecutor(max_workers=self.num_processes,
+                                                     mp_context=multiprocessing.get_context("spawn"),
+                                                     initializer=_init_worker,
+                                                     initargs=(self._worker_kwargs,))
+            # models shared through VitalSigns are not closed, so the pool goes with the model
+            self._process_pool_finalizer = weakref.finalize(self, self._process_pool.shutdown)
+
+        return self._process_pool.map(_worker_vectorize, [[texts[i] for i in batch] for batch in batches])
+
     def vectorize(
         self, text: Union[str, List[str]]
     ) -> Union[List[float], List[List[float]]]:
@@ -90,33 +251,22 @@ class EmbeddingModel:
             text = [text]
             single_string = True
 
-        results, uncached = [], []
-        for t in text:
-            key = self.hash_text(t)
-            vec = self.cache.get(key)
-            if vec is not None:
-                results.append(vec)
-            else:
-                uncached.append(t)
+        # the cache is keyed by the text itself, a dict hashes strings natively
+        results = [self.cache.get(t) for t in text]
+
+        # each distinct uncached text is embedded once
+        uncached = list(dict.fromkeys(t for t, vec in zip(text, results) if vec is None))
 
         logging.info(
-            f"Cached: {len(results)} | To compute: {len(uncached)}"
+            f"Cached: {len(text) - len(uncached)} | To compute: {len(uncached)}"
         )
 
         if uncached:
-            inputs = self.tokenizer(
-                uncached, return_tensors="np", padding=True, truncation=True
-            )
-            ort_inputs = {
-                k: v for k, v in inputs.items()
-                if k in ("input_ids", "attention_mask")
-            }
-            ort_outs = self.ort_session.run(None, ort_inputs)
-            embeddings = ort_outs[-1]
-
-            for t, vec in zip(uncached, embeddings):
-                key = self.hash_text(t)
-                self.cache.set(key, vec)
-                results.append(vec)
+            embedding_map = dict(zip(uncached, self._embed(uncached)))
+
+            for t, vec in embedding_map.items():
+                self.cache.set(t, vec)
+
+            results = [vec if vec is not None else embedding_map[t] for t, vec in zip(text, results)]
 
         return results[0] if single_string else results
@@ -0,0 +1,62 @@
+import itertools
+import weakref
+from typing import List, Optional
+
+
+class GraphObjectTrackingPolicy:
+    OFF = "off"
+    SAMPLED = "sampled"
+    FULL = "full"
+
+
+class GraphObjectTracker:
+    """Tracks live GraphObject instances without a destructor hook.
+
+    Entries are held in a WeakValueDictionary so they disappear when the
+    object is collected, no sweep or __del__ is needed.  With the sampled
+    policy only every sample_interval-th object is tracked.
+    """
+
+    # tracker consulted by GraphObject.__init__, None when tracking is off
+    active_tracker: Optional['GraphObjectTracker'] = None
+
+    def __init__(self, policy: str = GraphObjectTrackingPolicy.FULL, sample_interval: int = 100):
+
+        if policy not in (GraphObjectTrackingPolicy.OFF, GraphObjectTrackingPolicy.SAMPLED, GraphObjectTrackingPolicy.FULL):
+            raise ValueError(f"Unknown graph object tracking policy: {policy}")
+
+        if sample_interval < 1:
+            raise ValueError(f"sample_interval must be at least 1: {sample_interval}")
+
+        self.policy = policy
+        self.sample_interval = sample_interval
+        self._objects = weakref.WeakValueDictionary()
+        self._counter = itertools.count()
+
+    def track(self, graph_object):
+        if self.policy == GraphObjectTrackingPolicy.SAMPLED:
+            if next(self._counter) % self.sample_interval:
+                return
+        elif self.policy == GraphObjectTrackingPolicy.OFF:
+            return
+        self._objects[id(graph_object)] = graph_object
+
+    def untrack(self, graph_object):
+        go_id = id(graph_object)
+        if self._objects.get(go_id) is graph_object:
+            del self._objects[go_id]
+
+    def tracked_count(self) -> int:
+        return len(self._objects)
+
+    def tracked_objects(self) -> List:
+        return list(self._objects.values())
+
+    def clear(self):
+        self._objects.clear()
+
+    def activate(self):
+        if self.policy == GraphObjectTrackingPolicy.OFF:
+            GraphObjectTracker.active_tracker = None
+        else:
+            GraphObjectTracker.active_tracker = self
@@ -1,21 +1,30 @@
 import os
 import threading
-from typing import List, TypeVar
-from rdflib import Dataset, URIRef, Graph, Literal
+from typing import Iterator, List, Tuple, TypeVar
+from rdflib import Dataset, URIRef, Graph, Literal, XSD
+from vital_ai_vitalsigns.impl.rdflib.subject_index_store import SubjectIndexStore, GraphSubjectIndex
+from vital_ai_vitalsigns.metaql.metaql_query import GraphQuery as MetaQLGraphQuery, SelectQuery as MetaQLSelectQuery
+from vital_ai_vitalsigns.model.GraphObject import GraphObject
 from vital_ai_vitalsigns.ontology.ontology import Ontology
+from vital_ai_vitalsigns.query.metaql_result import MetaQLResult
 from vital_ai_vitalsigns.query.result_list import ResultList
 from vital_ai_vitalsigns.query.solution import Solution
+from vital_ai_vitalsigns.query.solution_assembler import SolutionAssembler
 from vital_ai_vitalsigns.query.solution_list import SolutionList
 from vital_ai_vitalsigns.service.graph.binding import Binding, BindingValueType
 from vital_ai_vitalsigns.service.vital_name_graph import VitalNameGraph
 from vital_ai_vitalsigns.service.graph.vital_graph_status import VitalGraphStatus
 from vital_ai_vitalsigns.service.graph.graph_service_constants import VitalGraphServiceConstants
+from vital_ai_vitalsigns.service.metaql.metaql_memory_executor import MetaQLMemoryExecutor, EDGE_SOURCE, \
+    EDGE_DESTINATION
 from vital_ai_vitalsigns.utils.uri_generator import URIGenerator
 from vital_ai_vitalsigns_core.model.RDFStatement import RDFStatement
 from vital_ai_vitalsigns_core.model.VitalSegment import VitalSegment
 
 G = TypeVar('G', bound='GraphObject')
 
+SEGMENT_ID_PROPERTY_URI = 'http://vital.ai/ontology/vital-core#hasSegmentID'
+
 # TODO switch to using graph_id in place of graph_uri
 # to match service definition?
 
@@ -31,13 +40,38 @@ class RDFlibSparqlImpl:
 
         self._multigraph = multigraph
 
-        if multigraph:
-            self.graph = Dataset()
-        else:
-            self.graph = Graph()
+        self.graph = self._new_graph()
 
         self.lock = threading.Lock()
 
+    def _new_graph(self) -> Graph:
+
+        # the store keeps the rdflib triple indexes used by SPARQL
+        # plus per subject indexes for direct object access
+        store = SubjectIndexStore(indexed_properties=[SEGMENT_ID_PROPERTY_URI, EDGE_SOURCE, EDGE_DESTINATION])
+
+        if self._multigraph:
+            return Dataset(store=store)
+
+        return Graph(store=store)
+
+    def _get_graph_index(self, graph_uri: str | None) -> GraphSubjectIndex | None:
+
+        if self._multigraph:
+            identifier = URIRef(graph_uri)
+        else:
+            identifier = self.graph.identifier
+
+        return self.graph.store.get_index(identifier)
+
+    @staticmethod
+    def _object_from_index(index: GraphSubjectIndex | None, subject: URIRef) -> G | None:
+
+        if index is None:
+            return None
+
+        return index.get_object(subject)
+
     def _list_graphs_impl(self) -> List[VitalNameGraph]:
 
         name_graph_list = []
@@ -59,12 +93,8 @@ class RDFlibSparqlImpl:
 
         # only handle multigraph case
         if self._multigraph:
-            if isinstance(self.graph, Dataset):
-                for c in self.graph.graphs():
-                    context_graph_uri = str(c.identifier)
-                    if context_graph_uri == graph_uri:
-                        name_graph = VitalNameGraph(graph_uri)
-                        return name_graph
+            if self.graph.store.has_graph(URIRef(graph_uri)):
+                return VitalNameGraph(graph_uri)
         else:
             # uni-graph case
             return None
@@ -126,7 +156,7 @@ class RDFlibSparqlImpl:
 
         if not self._multigraph:
             # uni-graph case
-            self.graph = Graph()
+            self.graph = self._new_graph()
             return True
 
         if not enforce_segment:
@@ -186,7 +216,7 @@ class RDFlibSparqlImpl:
 
         if not self._multigraph:
             # uni-graph case
-            self.graph = Graph()
+            self.graph = self._new_graph()
             return True
 
         if not enforce_segment:
@@ -237,98 +267,41 @@ class RDFlibSparqlImpl:
 
     def _get_graph_all_objects_impl(self, *, graph_uri: str, limit=100, offset=0, enforce_segment: bool = True, safety_check: bool = True) -> ResultList:
 
-        from vital_ai_vitalsigns.vitalsigns import VitalSigns
-
-        vs = VitalSigns()
-
-        # include limit, offset
-        # sort by subject uri
+        # pages the sorted subjects of the graph index
         # count total unique subjects and throw exception if over some number?
 
-        # TODO this should be "not" ?
-
-        if self._multigraph:
-            graph = self.graph
-        else:
-            graph = self.graph.get_graph(URIRef(graph_uri))
-
-        filter_term = ""
-
-        if enforce_segment:
-
-            query = f"""
-                    SELECT ?subject
-                        WHERE {{
-                            ?subject <http://vital.ai/ontology/vital-core#hasSegmentID> "{graph_uri}"^^<http://www.w3.org/2001/XMLSchema#string> .
-                        }}
-                    """
-
-            result = graph.query(query)
-
-            subject = None
-
-            for row in result:
-                # print(row)
-                subject = row.subject
-
-            filter_term = f"FILTER(?s != <{subject}>)"
-
-        query = f"""
-                CONSTRUCT {{
-                    ?s ?p ?o .
-                }}
-                WHERE {{
-                    {{
-                        SELECT DISTINCT ?s WHERE {{
-                                ?s ?p ?o .
-                                {filter_term}
-                        }}
-                        ORDER BY ?s
-                        LIMIT {limit}
-                        OFFSET {offset}
-                    }}
-
-                    ?s ?p ?o .
-
-                }}
-                """
-
-        # print(query)
-
-        result = graph.query(query)
-
-        # print(result)
+        result_list = ResultList()
 
-        result_graph = Graph()
+        index = self._get_graph_index(graph_uri)
 
-        for triple in result:
-            # print(triple)
-            result_graph.add(triple)
+        if index is None:
+            return result_list
 
-        subjects = set(result_graph.subjects())
+        segment_subject = None
 
-        result_list = ResultList()
+        if enforce_segment:
+            segment_value = Literal(graph_uri, datatype=XSD.string)
+            segment_subjects = index.property_indexes[URIRef(SEGMENT_ID_PROPERTY_URI)].get(segment_value, ())
+            for subject in segment_subjects:
+                segment_subject = subject
 
-        for s in subjects:
-            # print(s)
-            triples = result_graph.triples((s, None, None))
-            vitalsigns_object = vs.from_triples(triples)
-            result_list.add_result(vitalsigns_object)
+        for subject in index.page(limit, offset, exclude=segment_subject):
+            vitalsigns_object = self._object_from_index(index, subject)
+            if vitalsigns_object is not None:
+                result_list.add_result(vitalsigns_object)
 
         return result_list
 
     def _insert_object_impl(self, *, graph_object: G, graph_uri: str, enforce_segment: bool = True, safety_check: bool = True) -> VitalGraphStatus:
 
-        # TODO this should be "not" ?
-
-        if self._multigraph:
+        if not self._multigraph:
             graph = self.graph
         else:
             graph = self.graph.get_graph(URIRef(graph_uri))
 
-        graph_object_rdf_data = graph_object.to_rdf()
-
-        graph.parse(data=graph_object_rdf_data, format="nt")
+        # add the terms directly rather than round tripping through N-Triples text
+        for triple in graph_object.to_triples():
+            graph.add(triple)
 
         status = VitalGraphStatus()
 
@@ -348,30 +321,25 @@ class RDFlibSparqlImpl:
         # Parse the combined RDF data string once
         # graph.parse(data=combined_rdf_data, format="nt")
 
-        if not self._multigraph:
-            # todo, confirm this works
-            insert_graph = Graph()
+        triples = GraphObject.to_triples_list(graph_object_list)
 
-            for graph_object in graph_object_list:
-                graph_object.add_to_graph(insert_graph)
+        if not self._multigraph:
 
             with self.lock:
                 graph = self.graph
-                graph += insert_graph
+                for triple in triples:
+                    graph.add(triple)
 
             status = VitalGraphStatus()
             return status
         else:
-            insert_graph = Graph(identifier=URIRef(graph_uri))
-
-            for graph_object in graph_object_list:
-                graph_object.add_to_graph(insert_graph)
 
             with self.lock:
 
                 if isinstance(self.graph, Dataset):
                     graph = self.graph.get_graph(URIRef(graph_uri))
-                    graph += insert_graph
+                    for triple in triples:
+                        graph.add(triple)
 
             status = VitalGraphStatus()
             return status
@@ -412,13 +380,9 @@ class RDFlibSparqlImpl:
 
         # check if all objects exist
         if upsert is False:
-            all_found = True
-            for graph_object in graph_object_list:
-                object_uri = str(graph_object.URI)
-                service_graph_object = self._get_object_impl(object_uri=object_uri, graph_uri=graph_uri)
-                if service_graph_object is None:
-                    all_found = False
-                    break
+            index = self._get_graph_index(graph_uri)
+            subjects = index.subjects if index is not None else {}
+            all_found = all(URIRef(str(graph_object.URI)) in subjects for graph_object in graph_object_list)
             if all_found is False:
                 status = VitalGraphStatus(status=-1, message="Not all objects found")
                 return status
@@ -433,37 +397,10 @@ class RDFlibSparqlImpl:
 
     def _get_object_impl(self, *, object_uri: str, graph_uri: str = None, safety_check: bool = True) -> G:
 
-        from vital_ai_vitalsigns.vitalsigns import VitalSigns
-
-        vs = VitalSigns()
-
-        graph = None
-
-        if self._multigraph:
-            if isinstance(self.graph, Dataset):
-                graph = self.graph.get_graph(URIRef(graph_uri))
-        else:
-            graph = self.graph
-
-        # print(f"Graph URI {graph_uri}")
-        # print(f"Graph Length: {len(graph)}")
-
-        subject = URIRef(object_uri)
+        index = self._get_graph_index(graph_uri)
 
         try:
-
-            triples = graph.triples((subject, None, None))
-
-            if triples is None:
-                return None
-
-            vitalsigns_object = vs.from_triples(triples)
-
-            if vitalsigns_object is None:
-                return None
-
-            return vitalsigns_object
-
+            return self._object_from_index(index, URIRef(object_uri))
         except Exception as e:
             # log
             print(f"get_object Exception {e}")
@@ -472,25 +409,17 @@ class RDFlibSparqlImpl:
 
     def _get_object_list_impl(self, *, object_uri_list: List[str], graph_uri: str = None, safety_check: bool = True) -> ResultList:
 
-        from vital_ai_vitalsigns.vitalsigns import VitalSigns
-
-        vs = VitalSigns()
-
-        graph = None
-
-        if self._multigraph:
-            if isinstance(self.graph, Dataset):
-                graph = self.graph.get_graph(URIRef(graph_uri))
-        else:
-            graph = self.graph
+        index = self._get_graph_index(graph_uri)
 
         result_list = ResultList()
 
         for object_uri in object_uri_list:
 
-            subject = URIRef(object_uri)
-            triples = graph.triples((subject, None, None))
-            graph_object = vs.from_triples(triples)
+            graph_object = self._object_from_index(index, URIRef(object_uri))
+
+            if graph_object is None:
+                raise ValueError(f"Object not found: {object_uri}")
+
             result_list.add_result(graph_object)
 
         return result_list
@@ -623,9 +552,8 @@ class RDFlibSparqlImpl:
 
             return result_list
 
-    def _query_construct_impl(self, *, graph_uri: str, sparql_query: str, namespace_list: List[Ontology],
-                              binding_list: List[Binding], limit=100, offset=0, safety_check: bool = True,
-                              ) -> ResultList:
+    def _iter_construct_triples_impl(self, *, graph_uri: str, sparql_query: str, namespace_list: List[Ontology],
+                                     binding_list: List[Binding], limit=100, offset=0) -> Iterator[Tuple]:
 
         graph = None
 
@@ -639,12 +567,6 @@ class RDFlibSparqlImpl:
 
         # TODO handle uni-graph case
 
-        if graph_uri is None:
-            result_list = ResultList()
-            result_list.set_status(-1)
-            result_list.set_message("Error: graph_uri is not set.")
-            return result_list
-
         prefix_section = "\n".join([f"PREFIX {ns.prefix}: <{ns.ontology_iri}>" for ns in namespace_list])
 
         order_by_section = " ".join([binding.variable for binding in binding_list])
@@ -694,21 +616,27 @@ class RDFlibSparqlImpl:
 
         # results = self.graph.query(query)
 
-        results = graph.query(query)
-
-        print(results)
+        # the construct result is a graph, so each triple is returned once
+        yield from graph.query(query)
 
-        result_graph = Graph()
-
-        for triple in results:
-            print(triple)
-            result_graph.add(triple)
+    def _query_construct_impl(self, *, graph_uri: str, sparql_query: str, namespace_list: List[Ontology],
+                              binding_list: List[Binding], limit=100, offset=0, safety_check: bool = True,
+                              ) -> ResultList:
 
-        subjects = set(result_graph.subjects())
+        if graph_uri is None:
+            result_list = ResultList()
+            result_list.set_status(-1)
+            result_list.set_message("Error: graph_uri is not set.")
+            return result_list
 
         result_list = ResultList()
 
-        triples = result_graph.triples((None, None, None))
+        triples = self._iter_construct_triples_impl(
+            graph_uri=graph_uri,
+            sparql_query=sparql_query,
+            namespace_list=namespace_list,
+            binding_list=binding_list,
+            limit=limit, offset=offset)
 
         for s, p, o in triples:
             rdf_triple = RDFStatement()
@@ -743,82 +671,72 @@ class RDFlibSparqlImpl:
         # object cache to use during query
         graph_collection = GraphCollection(use_rdfstore=False, use_vectordb=False)
 
-        result_list = self._query_construct_impl(
+        assembler = SolutionAssembler(binding_list, root_binding)
+
+        triples = self._iter_construct_triples_impl(
             graph_uri=graph_uri,
             sparql_query=sparql_query,
             namespace_list=namespace_list,
             binding_list=binding_list,
             limit=limit, offset=offset)
 
-        result_graph = Graph()
-
-        for result in result_list:
-            rs = result.graph_object
-            if isinstance(rs, RDFStatement):
-                s = rs.rdfSubject
-                p = rs.rdfPredicate
+        for s, p, o in triples:
 
-                value_type = BindingValueType.URIREF
+            binding = assembler.get_binding(p)
 
-                for binding in binding_list:
-                    if binding.property_uri == str(p):
-                        value_type = binding.value_type
-                        break
+            if binding is None:
+                continue
 
-                o = rs.rdfObject
-                if value_type == BindingValueType.URIREF:
-                    result_graph.add((URIRef(str(s)), URIRef(str(p)), URIRef(str(o))))
-                else:
-                    result_graph.add((URIRef(str(s)), URIRef(str(p)), Literal(str(o))))
-
-        solutions = []
+            if binding.value_type == BindingValueType.URIREF:
+                assembler.add(s, p, URIRef(str(o)))
+            else:
+                assembler.add(s, p, Literal(str(o)))
 
-        unique_subjects = set(result_graph.subjects())
+        def get_object(uri: str):
 
-        for subject in unique_subjects:
+            binding_obj = graph_collection.get(uri)
 
-            uri_map = {}
-            obj_map = {}
+            if binding_obj is None:
+                binding_obj = self._get_object_impl(object_uri=uri, graph_uri=graph_uri)
+                graph_collection.add(binding_obj)
 
-            root_binding_obj = None
+            return binding_obj
 
-            triples = set(result_graph.triples((subject, None, None)))
+        solution_list = SolutionList(list(assembler.iter_solutions(get_object)), limit, offset)
 
-            for s, p, o in triples:
+        return solution_list
 
-                matching_bindings = [binding for binding in binding_list if binding.property_uri == str(p)]
+    def _metaql_executor(self, graph_uri_list: List[str]) -> MetaQLMemoryExecutor:
 
-                if len(matching_bindings) == 1:
+        if self._multigraph:
+            index_list = [self._get_graph_index(graph_uri) for graph_uri in graph_uri_list]
+        else:
+            # uni-graph case
+            index_list = [self._get_graph_index(None)]
 
-                    matching_binding = matching_bindings[0]
+        return MetaQLMemoryExecutor([index for index in index_list if index is not None])
 
-                    binding_var = matching_binding.variable
-                    binding_value = o
+    def _metaql_select_query_impl(self, *, select_query: MetaQLSelectQuery) -> MetaQLResult:
 
-                    uri_map[binding_var] = binding_value
+        graph_uri_list = (select_query.get('graph_uri_list', None) or []) + (select_query.get('graph_id_list', None) or [])
 
-                    if matching_binding.value_type == BindingValueType.URIREF:
+        executor = self._metaql_executor(graph_uri_list)
 
-                        cache_obj = graph_collection.get(str(o))
+        if select_query.get('metaql_class', None) == 'AggregateSelectQuery':
+            return executor.metaql_aggregate_query(select_query)
 
-                        if cache_obj is None:
-                            binding_obj = self._get_object_impl(object_uri=str(o), graph_uri=graph_uri)
-                            graph_collection.add(binding_obj)
-                        else:
-                            binding_obj = cache_obj
+        return executor.metaql_select_query(select_query)
 
-                        obj_map[binding_var] = binding_obj
+    def _metaql_graph_query_impl(self, *, graph_query: MetaQLGraphQuery) -> MetaQLResult:
 
-                        if binding_var == root_binding:
-                            # root_binding_uri = binding_value
-                            root_binding_obj = binding_obj
+        graph_uri_list = (graph_query.get('graph_uri_list', None) or []) + (graph_query.get('graph_id_list', None) or [])
 
-            solution = Solution(uri_map, obj_map, root_binding, root_binding_obj)
-            solutions.append(solution)
+        executor = self._metaql_executor(graph_uri_list)
 
-        solution_list = SolutionList(solutions, limit, offset)
+        if graph_query.get('metaql_class', None) == 'AggregateGraphQuery':
+            return executor.metaql_aggregate_query(graph_query)
 
-        return solution_list
+        return executor.metaql_graph_query(graph_query)
 
     def _export_ntriples_impl(self, file_path: str, *,
                               graph_uri=None,
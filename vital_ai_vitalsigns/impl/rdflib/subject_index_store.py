@@ -0,0 +1,284 @@
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional, Set
+from rdflib import RDF, URIRef
+from rdflib.plugins.stores.memory import Memory
+from vital_ai_vitalsigns.model.utils.graphobject_triples_utils import GraphObjectTriplesUtils
+
+
+# pending changes applied to the sorted subject list one at a time,
+# beyond this the list is sorted again
+_SORTED_PATCH_LIMIT = 64
+
+
+def _subject_sort_key(subject):
+    # ORDER BY order, blank nodes before IRIs
+    return isinstance(subject, URIRef), str(subject)
+
+
+class GraphSubjectIndex:
+    """Subject oriented indexes over the triples of one graph.
+
+    Triples are grouped by subject, with the class and property map of
+    each subject kept once built so objects are created without going
+    through triples again.  Subjects are also indexed by rdf:type and by
+    the value of selected properties, and a sorted subject list is kept
+    for paging.
+    """
+
+    __slots__ = ('subjects', 'rows', 'types', 'property_indexes',
+                 '_sorted', '_added', '_removed')
+
+    def __init__(self, indexed_properties: Iterable[URIRef] = ()):
+        # subject -> {(predicate, object): None}, an ordered set
+        self.subjects: Dict = {}
+        # subject -> (class, property map)
+        self.rows: Dict = {}
+        # type uri -> subjects
+        self.types: Dict[URIRef, Set] = {}
+        # property uri -> value -> subjects
+        self.property_indexes: Dict[URIRef, Dict] = {p: {} for p in indexed_properties}
+
+        self._sorted: Optional[List] = None
+        self._added: Set = set()
+        self._removed: Set = set()
+
+    def add(self, triple):
+
+        s, p, o = triple
+
+        pairs = self.subjects.get(s)
+
+        if pairs is None:
+            pairs = self.subjects[s] = {}
+            if self._sorted is not None:
+                # a pending removal is still in the sorted list
+                if s in self._removed:
+                    self._removed.discard(s)
+                else:
+                    self._added.add(s)
+
+        if (p, o) in pairs:
+            return
+
+        pairs[(p, o)] = None
+
+        self.rows.pop(s, None)
+
+        if p == RDF.type:
+            self.types.setdefault(o, set()).add(s)
+
+        value_index = self.property_indexes.get(p)
+
+        if value_index is not None:
+            value_index.setdefault(o, set()).add(s)
+
+    def remove(self, triple):
+
+        s, p, o = triple
+
+        pairs = self.subjects.get(s)
+
+        if pairs is None or pairs.pop((p, o), False) is False:
+            return
+
+        self.rows.pop(s, None)
+
+        if p == RDF.type:
+            self._discard(self.types, o, s)
+
+        value_index = self.property_indexes.get(p)
+
+        if value_index is not None:
+            self._discard(value_index, o, s)
+
+        if not pairs:
+            del self.subjects[s]
+            if self._sorted is not None:
+                if s in self._added:
+                    self._added.discard(s)
+                else:
+                    self._removed.add(s)
+
+    @staticmethod
+    def _discard(index: dict, key, subject):
+        subject_set = index.get(key)
+        if subject_set is not None:
+            subject_set.discard(subject)
+            if not subject_set:
+                del index[key]
+
+    def add_property_index(self, property_uri: URIRef):
+
+        if property_uri in self.property_indexes:
+            return
+
+        value_index = self.property_indexes[property_uri] = {}
+
+        for s, pairs in self.subjects.items():
+            for p, o in pairs:
+                if p == property_uri:
+                    value_index.setdefault(o, set()).add(s)
+
+    def value_index(self, property_uri: URIRef) -> Dict:
+        """The value -> subjects index of a property, built on first use."""
+
+        value_index = self.property_indexes.get(property_uri)
+
+        if value_index is None:
+            self.add_property_index(property_uri)
+            value_index = self.property_indexes[property_uri]
+
+        return value_index
+
+    def objects(self, subject, predicate) -> List:
+        return [o for p, o in self.subjects.get(subject, ()) if p == predicate]
+
+    def sorted_subjects(self) -> List:
+
+        if self._sorted is None or len(self._added) + len(self._removed) > _SORTED_PATCH_LIMIT:
+            self._sorted = sorted(self.subjects, key=_subject_sort_key)
+        else:
+            for s in self._removed:
+                key = _subject_sort_key(s)
+                i = bisect_left(self._sorted, key, key=_subject_sort_key)
+                if i < len(self._sorted) and self._sorted[i] == s:
+                    del self._sorted[i]
+            for s in self._added:
+                insort(self._sorted, s, key=_subject_sort_key)
+
+        self._added.clear()
+        self._removed.clear()
+
+        return self._sorted
+
+    def page(self, limit: int, offset: int, exclude=None) -> List:
+        """Subjects in sorted order from offset, skipping exclude."""
+
+        subject_list = self.sorted_subjects()
+
+        start = offset
+
+        if exclude is not None and exclude in self.subjects:
+            i = bisect_left(subject_list, _subject_sort_key(exclude), key=_subject_sort_key)
+            if i < offset:
+                start += 1
+            elif i < offset + limit:
+                return [s for s in subject_list[start:start + limit + 1] if s != exclude]
+
+        return subject_list[start:start + limit]
+
+    def get_row(self, subject):
+
+        row = self.rows.get(subject)
+
+        if row is not None:
+            return row
+
+        pairs = self.subjects.get(subject)
+
+        if not pairs:
+            return None
+
+        type_uri = None
+
+        for p, o in pairs:
+            if p == RDF.type:
+                type_uri = str(o)
+                break
+
+        if type_uri is None:
+            return None
+
+        from vital_ai_vitalsigns.vitalsigns import VitalSigns
+
+        graph_object_cls = VitalSigns().get_registry().get_vitalsigns_class(type_uri)
+
+        property_map = GraphObjectTriplesUtils.to_property_map(graph_object_cls, str(subject), pairs)
+
+        row = self.rows[subject] = (graph_object_cls, property_map)
+
+        return row
+
+    def get_object(self, subject):
+
+        row = self.get_row(subject)
+
+        if row is None:
+            return None
+
+        graph_object_cls, property_map = row
+
+        return graph_object_cls.from_property_map(property_map)
+
+
+class SubjectIndexStore(Memory):
+    """rdflib memory store that keeps a GraphSubjectIndex per graph.
+
+    Every change made through rdflib, including SPARQL updates and
+    parsing, keeps the indexes current, so the store can be queried
+    with SPARQL and read directly by subject at the same time.
+    """
+
+    def __init__(self, configuration: Optional[str] = None, identifier=None, *,
+                 indexed_properties: Iterable[str] = ()):
+        super().__init__(configuration, identifier)
+        self.indexed_properties = [URIRef(p) for p in indexed_properties]
+        # graph identifier -> index
+        self.graph_indexes: Dict = {}
+
+    def _index_for(self, context) -> GraphSubjectIndex:
+
+        identifier = context.identifier if context is not None else None
+
+        index = self.graph_indexes.get(identifier)
+
+        if index is None:
+            index = self.graph_indexes[identifier] = GraphSubjectIndex(self.indexed_properties)
+
+        return index
+
+    def add(self, triple, context, quoted: bool = False) -> None:
+        super().add(triple, context, quoted=quoted)
+        if not quoted:
+            self._index_for(context).add(triple)
+
+    def remove(self, triple_pattern, context=None) -> None:
+
+        # the contexts each matching triple is removed from
+        if context is None:
+            removed = [(triple, list(contexts)) for triple, contexts in self.triples(triple_pattern)]
+        else:
+            removed = [(triple, [context]) for triple, _ in self.triples(triple_pattern, context=context)]
+
+        super().remove(triple_pattern, context)
+
+        for triple, contexts in removed:
+            for c in contexts:
+                index = self.graph_indexes.get(c.identifier if c is not None else None)
+                if index is not None:
+                    index.remove(triple)
+
+    def add_graph(self, graph) -> None:
+        super().add_graph(graph)
+        self._index_for(graph)
+
+    def remove_graph(self, graph) -> None:
+        super().remove_graph(graph)
+        self.graph_indexes.pop(graph.identifier, None)
+
+    def add_property_index(self, property_uri: str):
+        """Index the subjects of every graph by the value of a property."""
+
+        property_uri = URIRef(property_uri)
+
+        if property_uri not in self.indexed_properties:
+            self.indexed_properties.append(property_uri)
+
+        for index in self.graph_indexes.values():
+            index.add_property_index(property_uri)
+
+    def has_graph(self, identifier) -> bool:
+        return identifier in self.graph_indexes
+
+    def get_index(self, identifier) -> GraphSubjectIndex | None:
+        return self.graph_indexes.get(identifier)
@@ -0,0 +1,157 @@
+import importlib
+import json
+import logging
+import sys
+from collections.abc import MutableMapping
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+# written into the root of a vitalsigns package, next to its __init__.py
+vitalsigns_manifest_filename = "vitalsigns_manifest.json"
+
+
+def get_class_ref(cls) -> str:
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def resolve_class_ref(class_ref: str):
+    module_name, qualname = class_ref.split(':', 1)
+    module = sys.modules.get(module_name)
+    if module is None:
+        module = importlib.import_module(module_name)
+    target = module
+    for name in qualname.split('.'):
+        target = getattr(target, name)
+    return target
+
+
+class LazyClassMap(MutableMapping):
+    """URI to class map that imports the module of a class on first lookup.
+
+    Keys come from a manifest of "module:qualname" references, so listing,
+    counting and membership tests never import anything.  Classes that are
+    assigned directly are stored as loaded.
+    """
+
+    def __init__(self, class_refs: Optional[Dict[str, str]] = None):
+        self._class_refs: Dict[str, str] = dict(class_refs or {})
+        self._classes: Dict[str, type] = {}
+
+    def add_class_refs(self, class_refs: Dict[str, str]):
+        for uri, class_ref in class_refs.items():
+            self._class_refs[uri] = class_ref
+            # a later package overrides an earlier one, as with a scan
+            self._classes.pop(uri, None)
+
+    def get_class_ref(self, uri: str) -> str:
+        return self._class_refs[uri]
+
+    def is_loaded(self, uri: str) -> bool:
+        return uri in self._classes
+
+    def loaded_count(self) -> int:
+        return len(self._classes)
+
+    def __getitem__(self, uri: str) -> type:
+        cls = self._classes.get(uri)
+        if cls is not None:
+            return cls
+        class_ref = self._class_refs[uri]
+        # importing is thread safe and resolves to the same class, so a
+        # concurrent first lookup at worst repeats the getattr
+        cls = resolve_class_ref(class_ref)
+        self._classes[uri] = cls
+        return cls
+
+    def __setitem__(self, uri: str, cls: type):
+        self._class_refs[uri] = get_class_ref(cls)
+        self._classes[uri] = cls
+
+    def __delitem__(self, uri: str):
+        del self._class_refs[uri]
+        self._classes.pop(uri, None)
+
+    def __contains__(self, uri) -> bool:
+        return uri in self._class_refs
+
+    def __iter__(self):
+        return iter(self._class_refs)
+
+    def __len__(self) -> int:
+        return len(self._class_refs)
+
+    def __repr__(self) -> str:
+        return f"LazyClassMap({len(self._class_refs)} classes, {len(self._classes)} loaded)"
+
+
+class VitalSignsManifest:
+    """Manifest of the classes a vitalsigns package provides.
+
+    Maps class URIs and property trait URIs to "module:qualname" references
+    so the registry can be built without importing every module of the
+    package.  The generator writes it alongside the generated code.
+    """
+
+    MANIFEST_VERSION = 1
+
+    def __init__(self, package_name: str,
+                 classes: Dict[str, str],
+                 properties: Dict[str, str],
+                 ontologies: Iterable[str]):
+        self.package_name = package_name
+        self.classes = dict(classes)
+        self.properties = dict(properties)
+        self.ontologies = list(ontologies)
+
+    @classmethod
+    def from_classes(cls, package_name: str, classes: Dict[str, type], properties: Dict[str, type],
+                     ontologies: Iterable[type]) -> 'VitalSignsManifest':
+        return cls(package_name,
+                   {uri: get_class_ref(c) for uri, c in classes.items()},
+                   {uri: get_class_ref(c) for uri, c in properties.items()},
+                   sorted(get_class_ref(c) for c in ontologies))
+
+    @staticmethod
+    def get_manifest_path(package_dir) -> Path:
+        return Path(package_dir) / vitalsigns_manifest_filename
+
+    @classmethod
+    def load(cls, package_dir) -> Optional['VitalSignsManifest']:
+
+        path = cls.get_manifest_path(package_dir)
+
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            if data.get("manifest_version") != cls.MANIFEST_VERSION:
+                logging.info(f"Ignoring manifest {path} with version {data.get('manifest_version')}")
+                return None
+
+            return cls(data["package"], data["classes"], data["properties"], data["ontologies"])
+
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logging.warning(f"Could not read manifest {path}: {e}")
+            return None
+
+    def to_dict(self) -> dict:
+        return {
+            "manifest_version": self.MANIFEST_VERSION,
+            "package": self.package_name,
+            "classes": dict(sorted(self.classes.items())),
+            "properties": dict(sorted(self.properties.items())),
+            "ontologies": self.ontologies,
+        }
+
+    def write(self, package_dir) -> Path:
+
+        path = self.get_manifest_path(package_dir)
+
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+            f.write('\n')
+
+        return path
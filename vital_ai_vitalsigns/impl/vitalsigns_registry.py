@@ -10,7 +10,10 @@ import importlib.resources as resources
 import concurrent.futures
 from typing import Type, Dict
 from importlib.metadata import entry_points
+from vital_ai_vitalsigns.impl.vitalsigns_manifest import VitalSignsManifest, LazyClassMap, resolve_class_ref
+from vital_ai_vitalsigns.impl.vitalsigns_snapshot import VitalSignsSnapshotCache
 from vital_ai_vitalsigns.model.GraphObject import GraphObject
+from vital_ai_vitalsigns.model.utils.graphobject_property_table import GraphObjectPropertyTable
 from vital_ai_vitalsigns.ontology.vitalsigns_ontology_manager import VitalSignsOntologyManager
 
 
@@ -180,10 +183,13 @@ class VitalSignsRegistry:
     def get_vitalsigns_property_class(self, property_uri: str) -> Type[PropertyTrait]:
         return self.vitalsigns_property_classes[property_uri]
 
-    def build_registry(self):
+    def build_registry(self, *, snapshot_cache: VitalSignsSnapshotCache | None = None, lazy_import: bool = False):
         self.vitalsigns_packages = []
         self.vitalsigns_ontologies = set()
-        self.vitalsigns_classes = {}
+
+        # in lazy mode classes listed in a package manifest are imported on first lookup
+        self.vitalsigns_classes = LazyClassMap() if lazy_import else {}
+        self.vitalsigns_property_classes = LazyClassMap() if lazy_import else {}
 
         logging.info('building vitalsigns class and property registry...')
 
@@ -202,8 +208,6 @@ class VitalSignsRegistry:
         self.vitalsigns_classes[VITAL_HyperEdge.get_class_uri()] = VITAL_HyperEdge
         self.vitalsigns_classes[VITAL_GraphContainerObject.get_class_uri()] = VITAL_GraphContainerObject
 
-        self.vitalsigns_property_classes = {}
-
         ont_tuple_list = []
 
         # for ep in entry_points().get('vitalsigns_packages', []):
@@ -228,6 +232,26 @@ class VitalSignsRegistry:
 
         logging.info('completed vitalsigns entry point scan.')
 
+        if lazy_import:
+            self.build_lazy_registry(ont_tuple_list, snapshot_cache=snapshot_cache)
+            return
+
+        snapshot_key = None
+
+        if snapshot_cache is not None:
+            snapshot_key = self.get_snapshot_key(ont_tuple_list)
+
+        if snapshot_key is not None:
+            if self.restore_snapshot(snapshot_cache.load('registry', snapshot_key)):
+
+                logging.info(f"Restored {len(self.vitalsigns_classes)} classes from registry snapshot.")
+
+                if len(ont_tuple_list) > 0:
+                    self.ontology_manager.add_ontology_list(ont_tuple_list, snapshot_cache=snapshot_cache)
+
+                self.build_property_tables()
+                return
+
         current_time = datetime.now()
 
         # print(f"Scan: Before Time: {current_time}")
@@ -267,7 +291,7 @@ class VitalSignsRegistry:
 
         if len(ont_tuple_list) > 0:
 
-            self.ontology_manager.add_ontology_list(ont_tuple_list)
+            self.ontology_manager.add_ontology_list(ont_tuple_list, snapshot_cache=snapshot_cache)
 
             current_time = datetime.now()
 
@@ -275,6 +299,103 @@ class VitalSignsRegistry:
 
             # print(f"Scan: After Ontology Load: {current_time}")
 
+        if snapshot_key is not None:
+            snapshot_cache.save('registry', snapshot_key, self.create_snapshot())
+
+        self.build_property_tables()
+
+    def build_lazy_registry(self, ont_tuple_list, *, snapshot_cache: VitalSignsSnapshotCache | None = None):
+
+        # the registry snapshot is not used here, restoring it imports every class
+
+        for p in self.vitalsigns_packages:
+
+            manifest = VitalSignsManifest.load(Path(p.__file__).parent)
+
+            if manifest is None:
+                logging.info(f"No manifest for {p.__name__}, scanning package.")
+                self.scan_vitalsigns_classes(p)
+                continue
+
+            self.add_manifest(manifest)
+
+        logging.info(f"Registered {len(self.vitalsigns_classes)} classes and "
+                     f"{len(self.vitalsigns_property_classes)} properties for lazy import.")
+
+        if len(ont_tuple_list) > 0:
+            self.ontology_manager.add_ontology_list(ont_tuple_list, snapshot_cache=snapshot_cache)
+
+        # property tables are built per class on first use
+
+    def add_manifest(self, manifest: VitalSignsManifest):
+        self.vitalsigns_classes.add_class_refs(manifest.classes)
+        self.vitalsigns_property_classes.add_class_refs(manifest.properties)
+        # ontology classes are few and small, one per package
+        self.vitalsigns_ontologies.update(resolve_class_ref(ref) for ref in manifest.ontologies)
+
+    def build_property_tables(self):
+        GraphObjectPropertyTable.build_tables(self.vitalsigns_classes.values(),
+                                              ontology_manager=self.ontology_manager,
+                                              property_classes=self.vitalsigns_property_classes)
+
+        logging.info(f"Built property tables for {GraphObjectPropertyTable.table_count()} classes.")
+
+    def get_snapshot_key(self, ont_tuple_list) -> str | None:
+
+        ontology_key_parts = self.ontology_manager.get_snapshot_key_parts(ont_tuple_list)
+
+        if ontology_key_parts is None:
+            return None
+
+        package_key_parts = []
+
+        for ep in entry_points(group='vitalsigns_packages'):
+            dist = ep.dist
+            package_key_parts.append([ep.name, ep.value,
+                                      dist.name if dist else None,
+                                      dist.version if dist else None])
+
+        return VitalSignsSnapshotCache.compute_key([sorted(package_key_parts), ontology_key_parts])
+
+    @staticmethod
+    def _class_ref(cls) -> tuple:
+        return cls.__module__, cls.__qualname__
+
+    @staticmethod
+    def _resolve_class_ref(class_ref: tuple):
+        module_name, qualname = class_ref
+        module = sys.modules.get(module_name)
+        if module is None:
+            module = importlib.import_module(module_name)
+        return getattr(module, qualname)
+
+    def create_snapshot(self) -> dict:
+        return {
+            "classes": {uri: self._class_ref(cls) for uri, cls in self.vitalsigns_classes.items()},
+            "property_classes": {uri: self._class_ref(cls) for uri, cls in self.vitalsigns_property_classes.items()},
+            "ontologies": [self._class_ref(cls) for cls in self.vitalsigns_ontologies],
+        }
+
+    def restore_snapshot(self, snapshot: dict | None) -> bool:
+
+        if not snapshot:
+            return False
+
+        try:
+            classes = {uri: self._resolve_class_ref(ref) for uri, ref in snapshot["classes"].items()}
+            property_classes = {uri: self._resolve_class_ref(ref) for uri, ref in snapshot["property_classes"].items()}
+            ontologies = {self._resolve_class_ref(ref) for ref in snapshot["ontologies"]}
+        except (ImportError, AttributeError, KeyError, TypeError, ValueError) as e:
+            # a module moved or was removed without a version change, fall back to a full scan
+            logging.info(f"Registry snapshot could not be restored: {e}")
+            return False
+
+        self.vitalsigns_classes.update(classes)
+        self.vitalsigns_property_classes.update(property_classes)
+        self.vitalsigns_ontologies.update(ontologies)
+
+        return True
+
     def _scan_module(self, module_name):
         try:
             if module_name in sys.modules:
@@ -0,0 +1,151 @@
+import hashlib
+import json
+import logging
+import os
+import pickle
+import stat
+import sys
+import tempfile
+from importlib.metadata import version, PackageNotFoundError
+from pathlib import Path
+from typing import Optional
+
+# Snapshot Path Components, relative to vital home
+vitalhome_cache_dir = "vital-cache"
+vitalsigns_cache_dir = "vitalsigns"
+
+
+class VitalSignsSnapshotCache:
+    """Versioned pickle snapshots of start-up state kept under $VITAL_HOME.
+
+    Each snapshot is stored under a key computed from the inputs it was
+    built from (package versions, OWL file hashes), so a change to any
+    input is a cache miss rather than a stale hit.  Only the latest
+    snapshot for a name is kept.
+
+    The key does not protect against a tampered file, and unpickling runs
+    code, so a snapshot is only loaded when it and its directory are owned
+    by the current user and writable by no one else.
+    """
+
+    # bump when the layout of any snapshot changes
+    SNAPSHOT_VERSION = 1
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = Path(cache_dir)
+
+    @classmethod
+    def for_vital_home(cls, vital_home: str | None, cache_dir: str | None = None) -> Optional['VitalSignsSnapshotCache']:
+        if cache_dir:
+            return cls(cache_dir)
+        if not vital_home:
+            return None
+        return cls(os.path.join(vital_home, vitalhome_cache_dir, vitalsigns_cache_dir))
+
+    @staticmethod
+    def file_hash(path: str) -> str:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @classmethod
+    def compute_key(cls, parts) -> str:
+
+        try:
+            vitalsigns_version = version('vital-ai-vitalsigns')
+        except PackageNotFoundError:
+            vitalsigns_version = None
+
+        import rdflib
+
+        # pickled rdflib and python objects are only valid for the versions that wrote them
+        key_data = [cls.SNAPSHOT_VERSION, sys.version, rdflib.__version__, vitalsigns_version, parts]
+
+        payload = json.dumps(key_data, sort_keys=True, default=str)
+
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:32]
+
+    def get_snapshot_path(self, name: str, key: str) -> Path:
+        return self.cache_dir / f"{name}-{key}.pickle"
+
+    @staticmethod
+    def is_trusted(path: Path) -> bool:
+        """True if path is not a symlink, is owned by the current user and is not group or world writable."""
+
+        if not hasattr(os, 'getuid'):
+            # no POSIX ownership to check
+            return False
+
+        path_stat = os.lstat(path)
+
+        if stat.S_ISLNK(path_stat.st_mode):
+            return False
+
+        if path_stat.st_uid != os.getuid():
+            return False
+
+        return not path_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+    def load(self, name: str, key: str) -> dict | None:
+
+        path = self.get_snapshot_path(name, key)
+
+        if not path.exists():
+            return None
+
+        if not (self.is_trusted(self.cache_dir) and self.is_trusted(path)):
+            logging.warning(f"Not loading snapshot {path}: it or its directory is not owned by "
+                            f"the current user or is writable by other users.")
+            return None
+
+        try:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            logging.warning(f"Could not read snapshot {path}: {e}")
+            return None
+
+    def save(self, name: str, key: str, snapshot: dict) -> bool:
+
+        path = self.get_snapshot_path(name, key)
+
+        tmp_path = None
+
+        try:
+            self.cache_dir.mkdir(mode=0o755, parents=True, exist_ok=True)
+
+            # write then rename so concurrent readers never see a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=f".{name}-", suffix=".tmp")
+
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+            # mkstemp creates owner only files, other worker users need to read them
+            os.chmod(tmp_path, 0o644)
+
+            os.replace(tmp_path, path)
+
+            tmp_path = None
+
+            for old_path in self.cache_dir.glob(f"{name}-*.pickle"):
+                if old_path != path:
+                    old_path.unlink(missing_ok=True)
+
+        except Exception as e:
+            logging.warning(f"Could not write snapshot {path}: {e}")
+            return False
+
+        finally:
+            if tmp_path is not None:
+                Path(tmp_path).unlink(missing_ok=True)
+
+        logging.info(f"Wrote snapshot {path}")
+
+        return True
+
+    def clear(self):
+        if self.cache_dir.exists():
+            for path in self.cache_dir.glob("*.pickle"):
+                path.unlink(missing_ok=True)
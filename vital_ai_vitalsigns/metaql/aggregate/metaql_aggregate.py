@@ -1,4 +1,4 @@
-from typing import Literal
+from typing import Literal, Optional
 from typing_extensions import TypedDict
 
 
@@ -6,13 +6,21 @@ AGGREGATE = Literal[
     "AVERAGE",
     "SUM",
     "MAXIMUM",
-    "MINIMUM"
+    "MINIMUM",
+    "COUNT"
     ]
 
 
+# aggregates are computed over the distinct nodes bound to binding
+# (the root binding if not set), with the values of property_uri when set.
+# COUNT without a property counts the distinct nodes.
+
 class MetaQLAggregate(TypedDict):
 
     metaql_class: str
 
     provides_name: str
     aggregate_type: AGGREGATE
+
+    binding: Optional[str]
+    property_uri: Optional[str]
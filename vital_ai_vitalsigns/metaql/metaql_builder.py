@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import List, Dict, Callable, Any, Union
 
-from vital_ai_vitalsigns.metaql.aggregate.metaql_aggregate import MetaQLAggregate
+from vital_ai_vitalsigns.metaql.aggregate.metaql_aggregate import MetaQLAggregate, AGGREGATE
 from vital_ai_vitalsigns.metaql.arc.metaql_arc import Arc, ArcRoot, ARC_TYPE_ARC_ROOT, ARC_TYPE_ARC, \
     ARC_TRAVERSE_TYPE_EDGE, ARC_DIRECTION_TYPE_FORWARD, MetaQLPropertyPath, MetaQLArc, ARC_TRAVERSE_TYPE, \
     ARC_DIRECTION_TYPE, NodeArcBinding, EdgeArcBinding, PathArcBinding, SolutionArcBinding
@@ -72,6 +72,8 @@ class MetaQLBuilder:
                            offset: int = 0,
                            limit: int = 100,
                            resolve_objects: bool = False,
+                           cursor: str | None = None,
+                           total_count: bool = False,
                            aggregate: MetaQLAggregate | None = None) -> SelectQuery | GraphQuery | AggregateSelectQuery | AggregateGraphQuery | None:
 
         if not graph_uri_list:
@@ -99,6 +101,8 @@ class MetaQLBuilder:
                 graph_id_list=graph_id_list,
                 offset=offset,
                 limit=limit,
+                cursor=cursor,
+                total_count=total_count,
                 arc=root_arc
             )
 
@@ -116,6 +120,8 @@ class MetaQLBuilder:
                 resolve_objects=resolve_objects,
                 offset=offset,
                 limit=limit,
+                cursor=cursor,
+                total_count=total_count,
                 arc=root_arc
             )
 
@@ -181,6 +187,23 @@ class MetaQLBuilder:
 
         return property_path
 
+    @classmethod
+    def build_aggregate(cls, *,
+                        aggregate_type: AGGREGATE,
+                        provides_name: str | None = None,
+                        binding: str | None = None,
+                        property_uri: str | None = None) -> MetaQLAggregate:
+
+        aggregate = MetaQLAggregate(
+            metaql_class="MetaQLAggregate",
+            provides_name=provides_name,
+            aggregate_type=aggregate_type,
+            binding=binding,
+            property_uri=property_uri
+        )
+
+        return aggregate
+
     @classmethod
     def build_node_binding(cls, *, name: str):
 
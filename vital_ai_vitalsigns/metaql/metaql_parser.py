@@ -104,6 +104,8 @@ class MetaQLParser:
             params_dict['root_arc'] = parse_dict.get('arc', None)
             params_dict['offset'] = parse_dict.get('offset', 0)
             params_dict['limit'] = parse_dict.get('limit', 10)
+            params_dict['cursor'] = parse_dict.get('cursor', None)
+            params_dict['total_count'] = parse_dict.get('total_count', False)
 
             select_query = MetaQLBuilder.build_metaql_query(**params_dict)
             return select_query
@@ -119,6 +121,8 @@ class MetaQLParser:
             params_dict['offset'] = parse_dict.get('offset', 0)
             params_dict['limit'] = parse_dict.get('limit', 10)
             params_dict['resolve_objects'] = parse_dict.get('resolve_objects', False)
+            params_dict['cursor'] = parse_dict.get('cursor', None)
+            params_dict['total_count'] = parse_dict.get('total_count', False)
 
 
             graph_query = MetaQLBuilder.build_metaql_query(**params_dict)
@@ -159,6 +163,19 @@ class MetaQLParser:
             aggregate_graph_query = MetaQLBuilder.build_metaql_query(**params_dict)
             return aggregate_graph_query
 
+        if metaql_class == 'MetaQLAggregate':
+
+            params_dict = {}
+
+            params_dict['aggregate_type'] = parse_dict.get('aggregate_type', None)
+            params_dict['provides_name'] = parse_dict.get('provides_name', None)
+            params_dict['binding'] = parse_dict.get('binding', None)
+            params_dict['property_uri'] = parse_dict.get('property_uri', None)
+
+            aggregate = MetaQLBuilder.build_aggregate(**params_dict)
+
+            return aggregate
+
         if metaql_class == 'MetaQLPropertyPath':
 
             params_dict = {}
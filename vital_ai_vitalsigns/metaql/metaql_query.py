@@ -39,6 +39,8 @@ class SelectQuery(MetaQLQuery):
 
     offset: int
     limit: int
+    cursor: Optional[str]
+    total_count: Optional[bool]
 
 
 class AggregateSelectQuery(SelectQuery):
@@ -51,6 +53,8 @@ class GraphQuery(MetaQLQuery):
     resolve_objects: bool
     offset: int
     limit: int
+    cursor: Optional[str]
+    total_count: Optional[bool]
 
 
 class AggregateGraphQuery(GraphQuery):
@@ -279,6 +279,25 @@ class SolutionBind(Bind):
         return f"SolutionBind(name={self._name})"
 
 
+class Aggregate:
+    def __init__(self, *,
+                 aggregate_type: str,
+                 property=None,
+                 binding: str | None = None,
+                 provides_name: str | None = None):
+        self._aggregate_type = aggregate_type
+        self._property = property
+        self._binding = binding
+        self._provides_name = provides_name
+        self._container = None
+
+    def set_container(self, container: "QueryContainer"):
+        self._container = container
+
+    def __repr__(self):
+        return f"Aggregate(aggregate_type={self._aggregate_type}, property={self._property}, binding={self._binding}, provides_name={self._provides_name})"
+
+
 class Arc:
     def __init__(self, *,
                  arc_traverse_type: ARC_TRAVERSE_TYPE = None,
@@ -355,12 +374,16 @@ class Query:
 
 class SelectQuery(Query):
     def __init__(self, *, offset: int = 0, limit: int = 100,
+                 cursor: str | None = None,
+                 total_count: bool = False,
                  container: "QueryContainer"):
         self._graph_uri_list = []
         self._graph_id_list = []
         self._constraint_list_list = []
         self._offset = offset
         self._limit = limit
+        self._cursor = cursor
+        self._total_count = total_count
         self._container = container
 
     def constraint_list(self, constraint_list: ConstraintList):
@@ -388,6 +411,8 @@ class GraphQuery(Query):
                  offset: int = 0,
                  limit: int = 100,
                  resolve_objects: bool = False,
+                 cursor: str | None = None,
+                 total_count: bool = False,
                  container: "QueryContainer"):
         self._graph_uri_list = []
         self._graph_id_list = []
@@ -395,6 +420,8 @@ class GraphQuery(Query):
         self._resolve_objects = resolve_objects
         self._offset = offset
         self._limit = limit
+        self._cursor = cursor
+        self._total_count = total_count
         self._container = container
 
     def arc(self, arc: Arc):
@@ -426,6 +453,7 @@ class AggregateSelectQuery:
         self._constraint_list_list = []
         self._offset = offset
         self._limit = limit
+        self._aggregate = None
         self._container = container
 
     def constraint_list(self, constraint_list: ConstraintList):
@@ -441,6 +469,11 @@ class AggregateSelectQuery:
         self._graph_id_list.append(graph_id)
         return self
 
+    def aggregate(self, aggregate: Aggregate):
+        aggregate.set_container(self._container)
+        self._aggregate = aggregate
+        return self
+
     def __repr__(self):
         return f"AggregateSelectQuery(graph_id_list={self._graph_id_list}, graph_uri_list={self._graph_uri_list}, constraint_list={self._constraint_list_list}, offset={self._offset}, limit={self._limit})"
 
@@ -456,6 +489,7 @@ class AggregateGraphQuery:
         self._root_arc = None
         self._offset = offset
         self._limit = limit
+        self._aggregate = None
         self._container = container
 
     def graph_uri(self, graph_uri: str):
@@ -472,6 +506,11 @@ class AggregateGraphQuery:
         self._root_arc = arc
         return self
 
+    def aggregate(self, aggregate: Aggregate):
+        aggregate.set_container(self._container)
+        self._aggregate = aggregate
+        return self
+
     def __repr__(self):
         return f"AggregateGraphQuery(graph_id_list={self._graph_id_list}, graph_uri_list={self._graph_uri_list}, arc={self._root_arc}, offset={self._offset}, limit={self._limit})"
 
@@ -607,6 +646,18 @@ class QueryContainer:
 
         return constraint_list_list
 
+    def build_aggregate(self, aggregate: Aggregate | None):
+
+        if aggregate is None:
+            return None
+
+        return MetaQLBuilder.build_aggregate(
+            aggregate_type=aggregate._aggregate_type,
+            provides_name=aggregate._provides_name,
+            binding=aggregate._binding,
+            property_uri=str(aggregate._property) if aggregate._property is not None else None
+        )
+
     def build_property_path(self, property_path: MetaQLPropertyPath):
 
         property_uri = property_path._property_uri
@@ -867,6 +918,8 @@ class QueryContainer:
                 graph_id_list=self.query._graph_id_list,
                 limit=self.query._limit,
                 offset=self.query._offset,
+                cursor=self.query._cursor,
+                total_count=self.query._total_count,
                 root_arc=root_arc
             )
 
@@ -893,6 +946,8 @@ class QueryContainer:
                 resolve_objects=self.query._resolve_objects,
                 limit=self.query._limit,
                 offset=self.query._offset,
+                cursor=self.query._cursor,
+                total_count=self.query._total_count,
                 root_arc=root_arc
             )
 
@@ -917,7 +972,8 @@ class QueryContainer:
                 graph_id_list=self.query._graph_id_list,
                 limit=self.query._limit,
                 offset=self.query._offset,
-                root_arc=root_arc
+                root_arc=root_arc,
+                aggregate=self.build_aggregate(self.query._aggregate)
             )
 
             return asq
@@ -940,7 +996,8 @@ class QueryContainer:
                 graph_id_list=self.query._graph_id_list,
                 limit=self.query._limit,
                 offset=self.query._offset,
-                root_arc=root_arc
+                root_arc=root_arc,
+                aggregate=self.build_aggregate(self.query._aggregate)
             )
 
             return agq
@@ -952,13 +1009,17 @@ class QueryBuilder:
     @classmethod
     def select_query(cls, *,
                      offset: int = 0,
-                     limit: int = 100):
+                     limit: int = 100,
+                     cursor: str | None = None,
+                     total_count: bool = False):
 
         query_container = QueryContainer()
 
         select_query = SelectQuery(
             offset=offset,
             limit=limit,
+            cursor=cursor,
+            total_count=total_count,
             container=query_container)
 
         query_container.query = select_query
@@ -969,7 +1030,9 @@ class QueryBuilder:
     def graph_query(cls, *,
                     offset: int = 0,
                     limit: int = 100,
-                    resolve_objects: bool = False):
+                    resolve_objects: bool = False,
+                    cursor: str | None = None,
+                    total_count: bool = False):
 
         query_container = QueryContainer()
 
@@ -977,9 +1040,39 @@ class QueryBuilder:
             offset=offset,
             limit=limit,
             resolve_objects=resolve_objects,
+            cursor=cursor,
+            total_count=total_count,
             container=query_container)
 
         query_container.query = graph_query
 
         return graph_query
 
+
+    @classmethod
+    def aggregate_select_query(cls):
+
+        query_container = QueryContainer()
+
+        aggregate_select_query = AggregateSelectQuery(
+            offset=0,
+            limit=1,
+            container=query_container)
+
+        query_container.query = aggregate_select_query
+
+        return aggregate_select_query
+
+    @classmethod
+    def aggregate_graph_query(cls):
+
+        query_container = QueryContainer()
+
+        aggregate_graph_query = AggregateGraphQuery(
+            offset=0,
+            limit=1,
+            container=query_container)
+
+        query_container.query = aggregate_graph_query
+
+        return aggregate_graph_query
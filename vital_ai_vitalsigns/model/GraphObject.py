@@ -5,10 +5,11 @@ import sys
 from abc import ABC, abstractmethod
 import json
 from datetime import datetime
-from typing import TypeVar, List, Generator, Tuple, Optional, Set
+from typing import TypeVar, List, Generator, Tuple, Optional, Set, TextIO
 import rdflib
 from rdflib import Graph, Literal, URIRef, RDF, Dataset
 from vital_ai_vitalsigns.impl.vitalsigns_impl import VitalSignsImpl
+from vital_ai_vitalsigns.impl.graph_object_tracker import GraphObjectTracker
 from vital_ai_vitalsigns.model.vital_constants import VitalConstants
 from vital_ai_vitalsigns.model.properties.IProperty import IProperty
 from vital_ai_vitalsigns.model.properties.URIProperty import URIProperty
@@ -21,6 +22,9 @@ from vital_ai_vitalsigns.model.utils.graphobject_rdf_utils import GraphObjectRdf
 from vital_ai_vitalsigns.model.utils.graphobject_json_utils import GraphObjectJsonUtils
 from vital_ai_vitalsigns.model.utils.graphobject_dict_utils import GraphObjectDictUtils
 from vital_ai_vitalsigns.model.utils.graphobject_jsonld_utils import GraphObjectJsonldUtils
+from vital_ai_vitalsigns.model.utils.graphobject_property_table import GraphObjectPropertyTable
+from vital_ai_vitalsigns.model.utils.compact_property_map import CompactPropertyMap
+from types import MappingProxyType
 from collections import defaultdict
 
 # Pydantic v2 imports (optional)
@@ -39,6 +43,17 @@ except ImportError:
 # Create logger for this module
 logger = logging.getLogger(__name__)
 
+# shared read-only extern property map for non-container objects
+_NO_EXTERN_PROPERTIES = MappingProxyType({})
+
+# edge and hyperedge properties that move an edge in a collection's adjacency index
+_EDGE_ENDPOINT_PROPERTIES = frozenset([
+    'http://vital.ai/ontology/vital-core#hasEdgeSource',
+    'http://vital.ai/ontology/vital-core#hasEdgeDestination',
+    'http://vital.ai/ontology/vital-core#hasHyperEdgeSource',
+    'http://vital.ai/ontology/vital-core#hasHyperEdgeDestination',
+])
+
 def cacheable_method(method):
     @lru_cache(None)
     @wraps(method)
@@ -111,6 +126,14 @@ GC = TypeVar('GC', bound='GraphCollection')
 class GraphObject(metaclass=GraphObjectMeta):
     _allowed_properties = []
 
+    # generated classes opt into compact storage by declaring empty
+    # __slots__ and setting _compact_storage, which stores raw property
+    # values positionally instead of a dict of property instances
+    _compact_storage = False
+
+    __slots__ = ('_properties', '_extern_properties', '_graph_collection_set', '_graph_uri_set',
+                 '_modified', '_object_hash', '__weakref__')
+
     @classmethod
     @cacheable_method
     def get_allowed_properties(cls):
@@ -136,43 +159,37 @@ class GraphObject(metaclass=GraphObjectMeta):
         return property_list
 
     def __init__(self, *, modified=True):
-        super().__setattr__('_properties', {})
-        super().__setattr__('_extern_properties', {})
-        super().__setattr__('_graph_collection_set', set())
-        super().__setattr__('_graph_uri_set', set())
+        property_table = GraphObjectPropertyTable.get_table(type(self))
+        if self._compact_storage:
+            super().__setattr__('_properties', CompactPropertyMap(property_table))
+        else:
+            super().__setattr__('_properties', {})
+        # only container objects may hold extern properties
+        if property_table.allows_extern:
+            super().__setattr__('_extern_properties', {})
+        else:
+            super().__setattr__('_extern_properties', _NO_EXTERN_PROPERTIES)
+        # created on first use
+        super().__setattr__('_graph_collection_set', None)
+        super().__setattr__('_graph_uri_set', None)
         super().__setattr__('_modified', modified)
         super().__setattr__('_object_hash', "")
 
-        from vital_ai_vitalsigns.vitalsigns import VitalSigns
-        vs = VitalSigns()
-        vs.include_graph_object(self)
+        tracker = GraphObjectTracker.active_tracker
+        if tracker is not None:
+            tracker.track(self)
 
     def __repr__(self):
         go_json = self.to_json(False)
         clazz=type(self)
         return f"GraphObject(class={clazz}, json={go_json})"
 
-    def __del__(self):
-        # logger.debug(f"deleting: {self}")
-
-        if sys.meta_path is None or not hasattr(sys, 'modules'):
-            # Python is shutting down, skip cleanup
-            # logger.debug("shutting down")
-            return
-
-        try:
-            from vital_ai_vitalsigns.vitalsigns import VitalSigns
-            # logger.debug(f"deleting: {self.URI}")
-            vs = VitalSigns()
-            vs.remove_graph_object(self)
-        except Exception as ex:
-            # logger.debug(ex)
-            pass
+    @classmethod
+    def get_property_table(cls) -> GraphObjectPropertyTable:
+        return GraphObjectPropertyTable.get_table(cls)
 
     def __setattr__(self, name, value):
 
-        from vital_ai_vitalsigns.model.VITAL_GraphContainerObject import VITAL_GraphContainerObject
-
         if name == 'URI':
             if value is None:
                 self._properties.pop('http://vital.ai/ontology/vital-core#URIProp', None)
@@ -183,51 +200,27 @@ class GraphObject(metaclass=GraphObjectMeta):
 
             return
 
-        # this list should be the general all-inclusive list
-        # including properties added to classes after the
-        # class was defined
-        # this list is built using all OWL ontologies
-        # currently loaded
-        domain_prop_list = self.get_allowed_domain_properties()
-
-        # for d in domain_prop_list:
-        #    logger.debug(f"Domain Prop: {d}")
-
-        # this includes properties defined when the class was defined
-        # including properties associated with parent classes when
-        # those were defined
-        # if an extending ontology adds a property to an existing class
-        # this list will not include it
-        # prop_list = self.get_allowed_properties()
-        # for prop_info in prop_list:
-
-        for prop_info in domain_prop_list:
-
-            uri = prop_info['uri']
-            prop_class = prop_info['prop_class']
-            trait_class = VitalSignsImpl.get_trait_class_from_uri(uri)
-
-            # full uri case
-            # logger.debug(f"uri: {uri} :: name: {name}")
-
-            if trait_class and uri == name:
-                if value is None:
-                    self._properties.pop(uri, None)
-                else:
-                    self._properties[uri] = VitalSignsImpl.create_property_with_trait(prop_class, uri, value)
-                super().__setattr__('_modified', True)
-                return
-
-            # short name case
-            if trait_class and trait_class.get_short_name() == name:
-                if value is None:
-                    self._properties.pop(uri, None)
-                else:
-                    self._properties[uri] = VitalSignsImpl.create_property_with_trait(prop_class, uri, value)
-                super().__setattr__('_modified', True)
-                return
+        # the table is built from the general all-inclusive domain
+        # property list, including properties added to classes after
+        # the class was defined, using all OWL ontologies currently loaded
+        # it resolves both the full property uri and the short name
+        property_table = GraphObjectPropertyTable.get_table(type(self))
 
-        if isinstance(self, VITAL_GraphContainerObject):
+        entry = property_table.resolve(name)
+
+        if entry is not None:
+            if value is None:
+                self._properties.pop(entry.uri, None)
+            else:
+                self._properties[entry.uri] = entry.create_property(value)
+            super().__setattr__('_modified', True)
+            # collections index edges by their source and destination
+            if self._graph_collection_set and entry.uri in _EDGE_ENDPOINT_PROPERTIES:
+                for graph_collection in self._graph_collection_set:
+                    graph_collection.update_index(self)
+            return
+
+        if property_table.allows_extern:
             # arbitrary properties are allowed
             if value is None:
                 self._extern_properties.pop(name, None)
@@ -241,12 +234,6 @@ class GraphObject(metaclass=GraphObjectMeta):
 
     def my_getattr(self, name):
 
-        from vital_ai_vitalsigns.model.VITAL_GraphContainerObject import VITAL_GraphContainerObject
-        from vital_ai_vitalsigns_core.model.GraphMatch import GraphMatch
-        from vital_ai_vitalsigns.vitalsigns import VitalSigns
-
-        vs = VitalSigns()
-
         if name == 'URI':
             if VitalConstants.uri_prop_uri in self._properties:
                 return self._properties[VitalConstants.uri_prop_uri]
@@ -260,18 +247,17 @@ class GraphObject(metaclass=GraphObjectMeta):
             return self._properties[name]
             
         # Then check for short names
-        for prop_info in self.get_allowed_domain_properties():
-            uri = prop_info['uri']
-            # logger.debug(uri)
-            trait_class = VitalSignsImpl.get_trait_class_from_uri(uri)
-            # logger.debug(trait_class)
-            if trait_class and trait_class.get_short_name() == name:
-                if uri in self._properties:
-                    return self._properties[uri]
-                else:
-                    return None
-        if isinstance(self, VITAL_GraphContainerObject):
+        property_table = GraphObjectPropertyTable.get_table(type(self))
+
+        entry = property_table.name_map.get(name)
+
+        if entry is not None:
+            return self._properties.get(entry.uri)
+
+        if property_table.allows_extern:
             if name in self._extern_properties:
+                from vital_ai_vitalsigns_core.model.GraphMatch import GraphMatch
+
                 value = self._extern_properties[name]
                 # GraphMatch case of expanding embedded objects
                 if isinstance(self, GraphMatch):
@@ -279,6 +265,8 @@ class GraphObject(metaclass=GraphObjectMeta):
                         try:
                             parsed_json = json.loads(str(value))
                             if isinstance(parsed_json, dict):
+                                from vital_ai_vitalsigns.vitalsigns import VitalSigns
+                                vs = VitalSigns()
                                 go = vs.from_json(str(value))
                                 if go:
                                     return go
@@ -359,24 +347,37 @@ class GraphObject(metaclass=GraphObjectMeta):
         return go_map.items()
 
     def graph_uri_set(self) -> Set[str]:
+        if self._graph_uri_set is None:
+            return set()
         return self._graph_uri_set.copy()
 
     def add_graph_uri(self, uri: str):
+        if self._graph_uri_set is None:
+            super().__setattr__('_graph_uri_set', set())
         self._graph_uri_set.add(uri)
 
     def remove_graph_uri(self, uri: str):
+        if self._graph_uri_set is None:
+            raise KeyError(uri)
         self._graph_uri_set.remove(uri)
 
     def clear_graph_uri(self):
-        self._graph_uri_set.clear()
+        if self._graph_uri_set is not None:
+            self._graph_uri_set.clear()
 
     def include_on_graph(self, graph_collection: GC):
+        if self._graph_collection_set is None:
+            super().__setattr__('_graph_collection_set', set())
         self._graph_collection_set.add(graph_collection)
 
     def remove_from_graph(self, graph_collection: GC):
+        if self._graph_collection_set is None:
+            raise KeyError(graph_collection)
         self._graph_collection_set.remove(graph_collection)
 
     def graph_locations(self) -> Set[G]:
+        if self._graph_collection_set is None:
+            return set()
         return self._graph_collection_set.copy()
 
     def is_modified(self) -> bool:
@@ -455,11 +456,60 @@ class GraphObject(metaclass=GraphObjectMeta):
     def to_rdf(self, format='nt', graph_uri: str = None) -> str:
         return GraphObjectRdfUtils.to_rdf_impl(self, format, graph_uri)
 
+    @staticmethod
+    def to_rdf_list(graph_object_list: List, format='nt', graph_uri: str = None, stream: TextIO = None) -> str | None:
+        return GraphObjectRdfUtils.to_rdf_list_impl(graph_object_list, format, graph_uri, stream)
+
     @staticmethod
     @lru_cache(maxsize=1000)
     def valid_uri(uri_string: str) -> bool:
         return _is_valid_uri(uri_string)
 
+    @classmethod
+    def from_property_map(cls, property_map: dict, *, modified=False, trusted=True) -> G:
+        """Create an instance of this class from a map of property URI to value.
+
+        With trusted=True the properties are filled in one pass using the
+        class property table, without going through __setattr__ for each
+        property.  Keys may be property URIs, short names, or extern names
+        for container objects.  With trusted=False each entry is set with
+        setattr.
+        """
+
+        graph_object = cls(modified=modified)
+
+        if not trusted:
+            for key, value in property_map.items():
+                setattr(graph_object, key, value)
+            if modified is False:
+                graph_object.mark_serialized()
+            return graph_object
+
+        property_table = GraphObjectPropertyTable.get_table(cls)
+
+        properties = graph_object._properties
+
+        for key, value in property_map.items():
+
+            if value is None:
+                continue
+
+            entry = property_table.resolve(key)
+
+            # the URI is set by name as in __setattr__, or by its property uri
+            if entry is None and key in ('URI', VitalConstants.uri_prop_uri):
+                entry = property_table.uri_entry
+
+            if entry is not None:
+                properties[entry.uri] = entry.create_property(value)
+            elif property_table.allows_extern:
+                prop_name = key.removeprefix('urn:extern:')
+                graph_object._extern_properties[prop_name] = VitalSignsImpl.create_extern_property(value)
+            else:
+                raise AttributeError(f"'{cls.__name__}' object has no attribute '{key}'")
+
+        return graph_object
+
     @classmethod
     def from_json_triples(cls, json_string: str) -> list:
         return GraphObjectTriplesUtils.from_json_triples_impl(cls, json_string)
@@ -7,6 +7,8 @@ from vital_ai_vitalsigns.model.properties.URIProperty import URIProperty
 
 class VITAL_HyperEdge(GraphObject):
 
+    __slots__ = ()
+
     _allowed_properties = [
         # {'uri': 'http://vital.ai/ontology/vital-core#URIProp', 'prop_class': URIProperty},
         {'uri': 'http://vital.ai/ontology/vital-core#isActive', 'prop_class': BooleanProperty},
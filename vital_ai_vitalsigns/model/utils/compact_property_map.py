@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from collections.abc import MutableMapping
+
+from vital_ai_vitalsigns.model.properties.IProperty import IProperty
+from vital_ai_vitalsigns.model.properties.MultiValueProperty import MultiValueProperty
+
+
+class CompactPropertyMap(MutableMapping):
+    """Property storage for GraphObject classes using compact storage.
+
+    Raw values are kept in a list laid out by the positions of the class
+    property table and are only wrapped into property instances on access,
+    so an object holds one list instead of a dict of property instances.
+    Iteration follows table position order rather than insertion order.
+    """
+
+    __slots__ = ('_table', '_values')
+
+    def __init__(self, table):
+        self._table = table
+        self._values = [None] * len(table.entries)
+
+    def _position(self, uri) -> int:
+        position = self._table.positions.get(uri)
+        if position is None:
+            raise KeyError(uri)
+        return position
+
+    def __getitem__(self, uri):
+        position = self._position(uri)
+        value = self._values[position]
+        if value is None:
+            raise KeyError(uri)
+        return self._table.entries[position].create_property(value)
+
+    def __setitem__(self, uri, prop):
+        position = self._position(uri)
+        if isinstance(prop, MultiValueProperty):
+            self._values[position] = prop.get_value()
+        elif isinstance(prop, IProperty):
+            self._values[position] = prop.value
+        else:
+            self._values[position] = prop
+
+    def __delitem__(self, uri):
+        position = self._position(uri)
+        if self._values[position] is None:
+            raise KeyError(uri)
+        self._values[position] = None
+
+    def __contains__(self, uri) -> bool:
+        position = self._table.positions.get(uri)
+        return position is not None and self._values[position] is not None
+
+    def __iter__(self):
+        entries = self._table.entries
+        for position, value in enumerate(self._values):
+            if value is not None:
+                yield entries[position].uri
+
+    def __len__(self) -> int:
+        return sum(1 for value in self._values if value is not None)
+
+    def pop(self, uri, *default):
+        position = self._table.positions.get(uri)
+        if position is None or self._values[position] is None:
+            if default:
+                return default[0]
+            raise KeyError(uri)
+        prop = self._table.entries[position].create_property(self._values[position])
+        self._values[position] = None
+        return prop
+
+    def raw_value(self, uri):
+        """Return the stored value for a property without wrapping it."""
+        position = self._table.positions.get(uri)
+        if position is None:
+            return None
+        return self._values[position]
+
+    def __repr__(self) -> str:
+        return f"CompactPropertyMap({dict(self.items())})"
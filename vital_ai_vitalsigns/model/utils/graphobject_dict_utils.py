@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import TypeVar, List, Optional
 from vital_ai_vitalsigns.model.vital_constants import VitalConstants
+from vital_ai_vitalsigns.model.utils.graphobject_json_utils import GraphObjectJsonUtils
 
 G = TypeVar('G', bound=Optional['GraphObject'])
 
@@ -61,24 +62,9 @@ class GraphObjectDictUtils:
         # TODO switch to this
         # graph_object_cls = registry.get_vitalsigns_class(vitaltype_class_uri)
 
-        graph_object = graph_object_cls(modified=modified)
+        property_map = GraphObjectJsonUtils.to_property_map(data)
 
-        for key, value in data.items():
-            if key == 'type':
-                continue
-            if key == 'types':
-                continue
-            if key == 'vitaltype':  # is this used?
-                continue
-            if key == VitalConstants.vitaltype_uri:
-                continue
-            if key == VitalConstants.uri_prop_uri:
-                graph_object.URI = value
-                continue
-
-            setattr(graph_object, key, value)
-
-        return graph_object
+        return graph_object_cls.from_property_map(property_map, modified=modified)
 
     @staticmethod
     def to_dict_list_impl(graph_object_list) -> List[dict]:
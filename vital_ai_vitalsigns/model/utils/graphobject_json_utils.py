@@ -57,43 +57,10 @@ class GraphObjectJsonUtils:
     @staticmethod
     def from_json_impl(cls, json_map: str, *, modified=False) -> G:
         """Implementation of from_json functionality."""
-        from vital_ai_vitalsigns.vitalsigns import VitalSigns
 
         data = json.loads(json_map)
 
-        type_uri = data['type']
-
-        vitaltype_class_uri = data.get(VitalConstants.vitaltype_uri)
-
-        vs = VitalSigns()
-
-        registry = vs.get_registry()
-
-        # graph_object_cls = registry.vitalsigns_classes[type_uri]
-
-        graph_object_cls = registry.get_vitalsigns_class(type_uri)
-
-        # TODO switch to this
-        # graph_object_cls = registry.get_vitalsigns_class(vitaltype_class_uri)
-
-        graph_object = graph_object_cls(modified=modified)
-
-        for key, value in data.items():
-            if key == 'type':
-                continue
-            if key == 'types':
-                continue
-            if key == 'vitaltype':  # is this used?
-                continue
-            if key == VitalConstants.vitaltype_uri:
-                continue
-            if key == VitalConstants.uri_prop_uri:
-                graph_object.URI = value
-                continue
-
-            setattr(graph_object, key, value)
-
-        return graph_object
+        return GraphObjectJsonUtils.from_json_map_impl(cls, data, modified=modified)
 
     @staticmethod
     def from_json_map_impl(cls, json_map: dict, *, modified=False) -> G:
@@ -117,7 +84,15 @@ class GraphObjectJsonUtils:
         # TODO switch to this
         # graph_object_cls = registry.get_vitalsigns_class(vitaltype_class_uri)
 
-        graph_object = graph_object_cls(modified=modified)
+        property_map = GraphObjectJsonUtils.to_property_map(data)
+
+        return graph_object_cls.from_property_map(property_map, modified=modified)
+
+    @staticmethod
+    def to_property_map(data: dict) -> dict:
+        """Map a serialized object to property URI keys, dropping the type keys."""
+
+        property_map = {}
 
         for key, value in data.items():
             if key == 'type':
@@ -128,13 +103,13 @@ class GraphObjectJsonUtils:
                 continue
             if key == VitalConstants.vitaltype_uri:
                 continue
-            if key == VitalConstants.uri_prop_uri:
-                graph_object.URI = value
+            if key == 'URI':
+                property_map[VitalConstants.uri_prop_uri] = value
                 continue
 
-            setattr(graph_object, key, value)
+            property_map[key] = value
 
-        return graph_object
+        return property_map
 
     @staticmethod
     def from_json_list_impl(cls, json_map_list: str, *, modified=False) -> List[G]:
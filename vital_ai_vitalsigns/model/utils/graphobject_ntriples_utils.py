@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import io
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import Iterator, List, Optional, TextIO
+import rdflib
+from rdflib import Literal, URIRef, RDF
+from rdflib.plugins.serializers.nt import _quoteLiteral
+from vital_ai_vitalsigns.model.properties.IProperty import IProperty
+from vital_ai_vitalsigns.model.properties.MultiValueProperty import MultiValueProperty
+from vital_ai_vitalsigns.model.vital_constants import VitalConstants
+
+# characters rdflib refuses to serialize in a URI term
+_INVALID_URI_CHARS = re.compile(r'[<>" {}|\\^`]')
+
+_RDF_TYPE_TERM = f"<{RDF.type}>"
+
+_VITALTYPE_TERM = f"<{VitalConstants.vitaltype_uri}>"
+
+_XSD_STRING = rdflib.XSD.string
+_XSD_BOOLEAN = rdflib.XSD.boolean
+_XSD_INTEGER = rdflib.XSD.integer
+_XSD_FLOAT = rdflib.XSD.float
+_XSD_DATETIME = rdflib.XSD.dateTime
+
+_DATA_CLASS_DATATYPES = {
+    datetime: _XSD_DATETIME,
+    int: _XSD_INTEGER,
+    float: _XSD_FLOAT,
+    bool: _XSD_BOOLEAN,
+}
+
+
+def _uri_term(uri: str) -> str:
+    if _INVALID_URI_CHARS.search(uri):
+        raise Exception(
+            f'"{uri}" does not look like a valid URI, I cannot serialize this as N3/Turtle. Perhaps you wanted to urlencode it?')
+    return f"<{uri}>"
+
+
+@lru_cache(maxsize=4096)
+def _cached_uri_term(uri: str) -> str:
+    return _uri_term(uri)
+
+
+def _quote(lexical: str) -> str:
+    return '"%s"' % lexical.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"').replace("\r", "\\r")
+
+
+def _value_term(value) -> str:
+    # same datatype selection as IProperty.to_rdf, values of the exact
+    # builtin types are written in the lexical form rdflib normalizes to
+    value_type = type(value)
+    if value_type is str:
+        return f"{_quote(value)}^^<{_XSD_STRING}>"
+    if value_type is bool:
+        return f"\"{'true' if value else 'false'}\"^^<{_XSD_BOOLEAN}>"
+    if value_type is int:
+        return f"\"{value}\"^^<{_XSD_INTEGER}>"
+    if value_type is float:
+        return f"\"{value}\"^^<{_XSD_FLOAT}>"
+    if value_type is datetime:
+        return f"{_quote(value.isoformat())}^^<{_XSD_DATETIME}>"
+    if isinstance(value, datetime):
+        return _quoteLiteral(Literal(value.isoformat(), datatype=_XSD_DATETIME))
+    if isinstance(value, bool):
+        return _quoteLiteral(Literal(str(value), datatype=_XSD_BOOLEAN))
+    if isinstance(value, int):
+        return _quoteLiteral(Literal(str(value), datatype=_XSD_INTEGER))
+    if isinstance(value, float):
+        return _quoteLiteral(Literal(str(value), datatype=_XSD_FLOAT))
+    return f"{_quote(str(value))}^^<{_XSD_STRING}>"
+
+
+def _typed_term(value, datatype) -> str:
+    # multi-valued items are typed by the property data class, anything
+    # that does not match it exactly goes through rdflib
+    value_type = type(value)
+    if datatype is _XSD_STRING and value_type is str:
+        return f"{_quote(value)}^^<{_XSD_STRING}>"
+    if datatype is _XSD_BOOLEAN and value_type is bool:
+        return f"\"{'true' if value else 'false'}\"^^<{_XSD_BOOLEAN}>"
+    if datatype is _XSD_INTEGER and value_type is int:
+        return f"\"{value}\"^^<{_XSD_INTEGER}>"
+    if datatype is _XSD_FLOAT and value_type is float:
+        return f"\"{value}\"^^<{_XSD_FLOAT}>"
+    if datatype is _XSD_DATETIME and value_type is datetime:
+        return f"{_quote(value.isoformat())}^^<{_XSD_DATETIME}>"
+    return _quoteLiteral(Literal(value, datatype=datatype))
+
+
+def _object_terms(prop_instance) -> List[str]:
+    if isinstance(prop_instance, MultiValueProperty):
+        data_class = prop_instance.property_class.get_data_class()
+        if data_class == URIRef:
+            terms = [_uri_term(str(v)) for v in prop_instance.value.to_list()]
+        else:
+            datatype = _DATA_CLASS_DATATYPES.get(data_class, _XSD_STRING)
+            terms = [_typed_term(v, datatype) for v in prop_instance.value.to_list()]
+        # a graph holds each triple once
+        return list(dict.fromkeys(terms))
+
+    if type(prop_instance).to_rdf is IProperty.to_rdf:
+        return [_value_term(prop_instance.value)]
+
+    rdf_data = prop_instance.to_rdf()
+
+    if rdf_data["datatype"] == URIRef:
+        return [_uri_term(rdf_data["value"])]
+
+    return [_quoteLiteral(Literal(rdf_data["value"], datatype=rdf_data["datatype"]))]
+
+
+class GraphObjectNTriplesUtils:
+    """Utility class writing GraphObjects directly as N-Triples or N-Quads.
+
+    Lines are produced from the object properties without building an
+    rdflib Graph, and carry the same terms rdflib serializes for the
+    object.  When a graph URI is given lines are written as N-Quads.
+    """
+
+    @staticmethod
+    def iter_lines(graph_object, graph_uri: str = None) -> Iterator[str]:
+        """Yield one N-Triples line per triple of the object, or N-Quads lines with a graph URI."""
+        from vital_ai_vitalsigns.model.VITAL_GraphContainerObject import VITAL_GraphContainerObject
+
+        properties = graph_object._properties
+
+        if VitalConstants.uri_prop_uri not in properties:
+            raise ValueError("Cannot convert GraphObject to RDF - missing URI property")
+
+        subject = _uri_term(str(properties[VitalConstants.uri_prop_uri]))
+
+        end = f" {_uri_term(graph_uri)} .\n" if graph_uri else " .\n"
+
+        class_term = _cached_uri_term(graph_object.get_class_uri())
+
+        yield f"{subject} {_RDF_TYPE_TERM} {class_term}{end}"
+
+        yield f"{subject} {_VITALTYPE_TERM} {class_term}{end}"
+
+        for prop_uri, prop_instance in properties.items():
+            predicate = _cached_uri_term(prop_uri)
+            for term in _object_terms(prop_instance):
+                yield f"{subject} {predicate} {term}{end}"
+
+        if isinstance(graph_object, VITAL_GraphContainerObject):
+            for name, prop_instance in graph_object._extern_properties.items():
+                predicate = _cached_uri_term("urn:extern:" + name)
+                for term in _object_terms(prop_instance):
+                    yield f"{subject} {predicate} {term}{end}"
+
+    @staticmethod
+    def to_ntriples_impl(graph_object, graph_uri: str = None) -> str:
+        """Implementation of the N-Triples/N-Quads case of to_rdf."""
+        return "".join(GraphObjectNTriplesUtils.iter_lines(graph_object, graph_uri))
+
+    @staticmethod
+    def write_list_impl(graph_object_list, stream: TextIO, graph_uri: str = None) -> int:
+        """Write the lines of all objects to a text stream, returns the number of lines written."""
+        count = 0
+        write = stream.write
+        for graph_object in graph_object_list:
+            for line in GraphObjectNTriplesUtils.iter_lines(graph_object, graph_uri):
+                write(line)
+                count += 1
+        return count
+
+    @staticmethod
+    def to_ntriples_list_impl(graph_object_list, graph_uri: str = None, stream: Optional[TextIO] = None) -> Optional[str]:
+        """Implementation of to_rdf_list, writes to stream when given, otherwise returns the text."""
+        if stream is not None:
+            GraphObjectNTriplesUtils.write_list_impl(graph_object_list, stream, graph_uri)
+            return None
+
+        buffer = io.StringIO()
+        GraphObjectNTriplesUtils.write_list_impl(graph_object_list, buffer, graph_uri)
+        return buffer.getvalue()
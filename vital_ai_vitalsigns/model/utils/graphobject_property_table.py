@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import threading
+from types import MappingProxyType
+from typing import NamedTuple, Optional, Dict, Mapping, Type
+
+
+class PropertyTableEntry(NamedTuple):
+    uri: str
+    prop_class: type
+    trait_class: type
+    combined_class: type
+    multiple_values: bool
+
+    def create_property(self, value):
+        if self.multiple_values:
+            return self.combined_class(value, self.prop_class)
+        return self.combined_class(value)
+
+
+class GraphObjectPropertyTable:
+    """Frozen per-class property resolution table.
+
+    Maps both short names and full property URIs to a PropertyTableEntry
+    so that attribute get and set on a GraphObject is a dictionary hit
+    instead of a scan over the allowed domain properties.
+    """
+
+    _tables: Dict[type, GraphObjectPropertyTable] = {}
+    _lock = threading.RLock()
+
+    __slots__ = ('graph_object_class', 'name_map', 'uri_map', 'allows_extern', 'uri_entry', 'entries', 'positions')
+
+    def __init__(self, graph_object_class: type,
+                 name_map: Mapping[str, PropertyTableEntry],
+                 uri_map: Mapping[str, PropertyTableEntry],
+                 allows_extern: bool,
+                 uri_entry: Optional[PropertyTableEntry] = None):
+        self.graph_object_class = graph_object_class
+        self.name_map = MappingProxyType(dict(name_map))
+        self.uri_map = MappingProxyType(dict(uri_map))
+        self.allows_extern = allows_extern
+        self.uri_entry = uri_entry
+
+        # positional layout used by compact storage, the URI property
+        # always takes the first position
+        entries = [uri_entry] if uri_entry is not None else []
+        entries.extend(entry for entry in uri_map.values() if uri_entry is None or entry.uri != uri_entry.uri)
+        self.entries = tuple(entries)
+        self.positions = MappingProxyType({entry.uri: i for i, entry in enumerate(entries)})
+
+    def resolve(self, name: str) -> Optional[PropertyTableEntry]:
+        entry = self.uri_map.get(name)
+        if entry is None:
+            entry = self.name_map.get(name)
+        return entry
+
+    @classmethod
+    def build(cls, graph_object_class: type, *, ontology_manager, property_classes: dict) -> GraphObjectPropertyTable:
+        """Build the table for a class from the ontology manager and the trait class map.
+
+        Takes its dependencies explicitly so the registry can build tables
+        while VitalSigns itself is still being constructed.
+        """
+        from vital_ai_vitalsigns.impl.vitalsigns_impl import VitalSignsImpl
+        from vital_ai_vitalsigns.model.GraphObject import GraphObject
+        from vital_ai_vitalsigns.model.VITAL_GraphContainerObject import VITAL_GraphContainerObject
+        from vital_ai_vitalsigns.model.utils.class_utils import ClassUtils
+        from vital_ai_vitalsigns.model.vital_constants import VitalConstants
+        from vital_ai_vitalsigns.model.properties.URIProperty import URIProperty
+
+        name_map = {}
+        uri_map = {}
+
+        uri_entry = None
+
+        uri_trait_class = property_classes.get(VitalConstants.uri_prop_uri)
+
+        if uri_trait_class is not None:
+            uri_entry = PropertyTableEntry(VitalConstants.uri_prop_uri, URIProperty, uri_trait_class,
+                                           VitalSignsImpl.create_property_with_trait_class(URIProperty, uri_trait_class),
+                                           False)
+
+        parent_list = ClassUtils.get_class_hierarchy(graph_object_class, GraphObject)
+
+        for p in parent_list:
+            for prop_info in ontology_manager.get_domain_property_list(p):
+
+                uri = prop_info['uri']
+                prop_class = prop_info['prop_class']
+
+                if uri in uri_map:
+                    continue
+
+                trait_class = property_classes.get(uri)
+
+                if trait_class is None or prop_class is None:
+                    continue
+
+                combined_class = VitalSignsImpl.create_property_with_trait_class(prop_class, trait_class)
+
+                entry = PropertyTableEntry(uri, prop_class, trait_class, combined_class, trait_class.multiple_values)
+
+                uri_map[uri] = entry
+                # first definition wins on a short name collision
+                name_map.setdefault(trait_class.get_short_name(), entry)
+
+        allows_extern = issubclass(graph_object_class, VITAL_GraphContainerObject)
+
+        return cls(graph_object_class, name_map, uri_map, allows_extern, uri_entry)
+
+    @classmethod
+    def get_table(cls, graph_object_class: type) -> GraphObjectPropertyTable:
+        table = cls._tables.get(graph_object_class)
+        if table is not None:
+            return table
+
+        from vital_ai_vitalsigns.vitalsigns import VitalSigns
+
+        vs = VitalSigns()
+
+        with cls._lock:
+            table = cls._tables.get(graph_object_class)
+            if table is None:
+                table = cls.build(graph_object_class,
+                                  ontology_manager=vs.get_ontology_manager(),
+                                  property_classes=vs.get_registry().vitalsigns_property_classes)
+                cls._tables[graph_object_class] = table
+
+        return table
+
+    @classmethod
+    def build_tables(cls, class_list, *, ontology_manager, property_classes: dict):
+        """Precompute tables for a list of classes, replacing any existing ones."""
+        tables = {}
+        for graph_object_class in class_list:
+            tables[graph_object_class] = cls.build(graph_object_class,
+                                                   ontology_manager=ontology_manager,
+                                                   property_classes=property_classes)
+        with cls._lock:
+            cls._tables.update(tables)
+
+    @classmethod
+    def invalidate(cls):
+        """Drop all tables, called when the domain property map changes."""
+        from vital_ai_vitalsigns.model.GraphObject import GraphObject
+
+        with cls._lock:
+            cls._tables.clear()
+            # cached per-class property lists are derived from the same map
+            GraphObject.get_allowed_domain_properties.__func__.cache_clear()
+
+    @classmethod
+    def table_count(cls) -> int:
+        return len(cls._tables)
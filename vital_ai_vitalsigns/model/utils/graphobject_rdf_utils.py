@@ -7,9 +7,15 @@ import rdflib
 from rdflib import Graph, Literal, URIRef, RDF
 from vital_ai_vitalsigns.impl.vitalsigns_impl import VitalSignsImpl
 from vital_ai_vitalsigns.model.vital_constants import VitalConstants
+from vital_ai_vitalsigns.model.utils.graphobject_ntriples_utils import GraphObjectNTriplesUtils
+from vital_ai_vitalsigns.model.utils.graphobject_triples_utils import GraphObjectTriplesUtils
 
 G = TypeVar('G', bound=Optional['GraphObject'])
 
+NTRIPLES_FORMATS = ('nt', 'nt11', 'ntriples', 'application/n-triples')
+
+NQUADS_FORMATS = ('nquads', 'application/n-quads')
+
 
 class GraphObjectRdfUtils:
     """Utility class containing RDF-related functionality for GraphObject."""
@@ -19,6 +25,13 @@ class GraphObjectRdfUtils:
         """Implementation of to_rdf functionality."""
         from vital_ai_vitalsigns.model.VITAL_GraphContainerObject import VITAL_GraphContainerObject
 
+        # line based formats are written directly without a Graph
+        if format in NTRIPLES_FORMATS:
+            return GraphObjectNTriplesUtils.to_ntriples_impl(graph_object)
+
+        if format in NQUADS_FORMATS:
+            return GraphObjectNTriplesUtils.to_ntriples_impl(graph_object, graph_uri)
+
         g = Graph(identifier=URIRef(graph_uri) if graph_uri else None)
 
         # Check if URI property exists
@@ -101,6 +114,17 @@ class GraphObjectRdfUtils:
 
         return g.serialize(format=format)
 
+    @staticmethod
+    def to_rdf_list_impl(graph_object_list, format='nt', graph_uri: str = None, stream=None):
+        """Implementation of to_rdf_list functionality."""
+        if format in NTRIPLES_FORMATS:
+            return GraphObjectNTriplesUtils.to_ntriples_list_impl(graph_object_list, stream=stream)
+
+        if format in NQUADS_FORMATS:
+            return GraphObjectNTriplesUtils.to_ntriples_list_impl(graph_object_list, graph_uri, stream=stream)
+
+        raise ValueError(f"Unsupported format for to_rdf_list: {format}")
+
     @staticmethod
     def from_rdf_impl(cls, rdf_string: str, *, modified=False) -> G:
         """Implementation of from_rdf functionality."""
@@ -172,62 +196,10 @@ class GraphObjectRdfUtils:
 
         graph_object_cls = registry.get_vitalsigns_class(type_uri)
 
-        graph_object = graph_object_cls(modified=modified)
-
-        graph_object.URI = subject_uri
-
-        multi_valued_props = []
-
-        for subject, predicate, obj_value in g:
-
-            if predicate == RDF.type:
-                continue
-
-            predicate = str(predicate)
-
-            if predicate == VitalConstants.vitaltype_uri:
-                continue
-
-            if predicate == VitalConstants.uri_prop_uri:
-                continue
-
-            trait_cls = registry.vitalsigns_property_classes.get(predicate, None)
-
-            multiple_values = False
-
-            # for GCO this is not set
-            # need to inspect the literal to detect multiple values?
-            if trait_cls:
-                multiple_values = trait_cls.multiple_values
-
-            if multiple_values is True:
+        property_map = GraphObjectTriplesUtils.to_property_map(
+            graph_object_cls, str(subject_uri), ((predicate, obj_value) for subject, predicate, obj_value in g))
 
-                if predicate in multi_valued_props:
-                    continue
-
-                value_list = []
-
-                for multi_value_subject, multi_value_predicate, multi_obj_value in g.triples((subject, URIRef(predicate), None)):
-                    value_list.append(multi_obj_value)
-
-                setattr(graph_object, predicate, value_list)
-
-                multi_valued_props.append(predicate)
-
-                continue
-
-            value = None
-            if isinstance(obj_value, Literal):
-                value = obj_value.toPython()
-            elif isinstance(obj_value, URIRef):
-                value = str(obj_value)
-
-            setattr(graph_object, predicate, value)
-
-        if modified is False:
-            graph_object.mark_serialized()
-
-        return graph_object
+        return graph_object_cls.from_property_map(property_map, modified=modified)
 
     @staticmethod
     def from_rdf_list_impl(cls, rdf_string: str, *, modified=False) -> List[G]:
@@ -236,28 +208,4 @@ class GraphObjectRdfUtils:
 
         g.parse(data=rdf_string, format='nt')
 
-        subjects = set(g.subjects())
-
-        split_rdf_strings = []
-
-        for subj in subjects:
-
-            subj_graph = Graph()
-
-            for s, p, o in g.triples((subj, None, None)):
-                subj_graph.add((s, p, o))
-
-            serialized = subj_graph.serialize(format='nt')
-            # Handle both string and bytes return types from serialize
-            if isinstance(serialized, bytes):
-                split_rdf_strings.append(serialized.decode('utf-8'))
-            else:
-                split_rdf_strings.append(serialized)
-
-        graph_object_list = []
-
-        for rdf_split in split_rdf_strings:
-            graph_object = cls.from_rdf(rdf_split, modified=modified)
-            graph_object_list.append(graph_object)
-
-        return graph_object_list
\ No newline at end of file
+        return GraphObjectTriplesUtils.from_triples_list_impl(cls, g, modified=modified)
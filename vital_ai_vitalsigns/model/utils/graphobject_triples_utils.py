@@ -142,37 +142,10 @@ class GraphObjectTriplesUtils:
 
         graph_object_cls = registry.get_vitalsigns_class(type_uri)
 
-        graph_object = graph_object_cls(modified=modified)
+        property_map = GraphObjectTriplesUtils.to_property_map(
+            graph_object_cls, subject_uri, ((predicate, obj_value) for subject, predicate, obj_value in generated_triples))
 
-        graph_object.URI = subject_uri
-
-        for subject, predicate, obj_value in generated_triples:
-
-            if predicate == RDF.type:
-                continue
-
-            predicate = str(predicate)
-
-            # skip
-            if predicate == VitalConstants.vitaltype_uri:
-                continue
-
-            if predicate == VitalConstants.uri_prop_uri:
-                continue
-
-            value = None
-
-            if isinstance(obj_value, Literal):
-                value = obj_value.toPython()
-            elif isinstance(obj_value, URIRef):
-                value = str(obj_value)
-
-            setattr(graph_object, predicate, value)
-
-        if modified is False:
-            graph_object.mark_serialized()
-
-        return graph_object
+        return graph_object_cls.from_property_map(property_map, modified=modified)
 
     @staticmethod
     def from_triples_list_impl(cls, triples_list: Generator[Tuple, None, None], *, modified=False) -> List[G]:
@@ -221,39 +194,55 @@ class GraphObjectTriplesUtils:
 
             graph_object_cls = registry.get_vitalsigns_class(type_uri)
 
-            graph_object = graph_object_cls(modified=modified)
+            property_map = GraphObjectTriplesUtils.to_property_map(graph_object_cls, subject_uri, triples)
 
-            graph_object.URI = subject_uri
+            graph_object = graph_object_cls.from_property_map(property_map, modified=modified)
 
-            for predicate, obj_value in triples:
+            graph_object_list.append(graph_object)
 
-                if predicate == RDF.type:
-                    continue
+        return graph_object_list
 
-                predicate = str(predicate)
+    @staticmethod
+    def to_property_map(graph_object_cls, subject_uri: str, predicate_objects) -> dict:
+        """Convert the (predicate, object) pairs of one subject into a property map.
 
-                # skip
-                if predicate == VitalConstants.vitaltype_uri:
-                    continue
+        Values of multi-valued properties are collected into a list,
+        otherwise the last value for a predicate wins.
+        """
 
-                if predicate == VitalConstants.uri_prop_uri:
-                    continue
+        property_table = graph_object_cls.get_property_table()
 
-                value = None
+        property_map = {VitalConstants.uri_prop_uri: subject_uri}
 
-                if isinstance(obj_value, Literal):
-                    value = obj_value.toPython()
-                elif isinstance(obj_value, URIRef):
-                    value = str(obj_value)
+        for predicate, obj_value in predicate_objects:
 
-                setattr(graph_object, predicate, value)
+            if predicate == RDF.type:
+                continue
 
-            if modified is False:
-                graph_object.mark_serialized()
+            predicate = str(predicate)
 
-            graph_object_list.append(graph_object)
+            # skip
+            if predicate == VitalConstants.vitaltype_uri:
+                continue
 
-        return graph_object_list
+            if predicate == VitalConstants.uri_prop_uri:
+                continue
+
+            value = None
+
+            if isinstance(obj_value, Literal):
+                value = obj_value.toPython()
+            elif isinstance(obj_value, URIRef):
+                value = str(obj_value)
+
+            entry = property_table.uri_map.get(predicate)
+
+            if entry is not None and entry.multiple_values:
+                property_map.setdefault(predicate, []).append(value)
+            else:
+                property_map[predicate] = value
+
+        return property_map
 
     @staticmethod
     def add_to_list_impl(graph_object, triple_list: list):
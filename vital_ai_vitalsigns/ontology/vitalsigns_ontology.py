@@ -72,4 +72,31 @@ class VitalSignsOntology:
         return self._ontology_path
 
     def get_ontology_graph(self) -> Graph:
+        # restored from a snapshot, parse the file on first use
+        if self._graph is None:
+            graph = Graph()
+            graph.parse(self._ontology_path, format='xml')
+            self._graph = graph
         return self._graph
+
+    def get_snapshot_state(self) -> dict:
+        return {
+            "package_name": self._package_name,
+            "ontology_path": self._ontology_path,
+            "ontology_iri": getattr(self, '_ontology_iri', None),
+            "import_list": getattr(self, '_import_list', []),
+            "namespace_map": getattr(self, '_namespace_map', {}),
+            "ontology_hash": self._ontology_hash,
+        }
+
+    @classmethod
+    def from_snapshot_state(cls, state: dict) -> 'VitalSignsOntology':
+        vitalsigns_ontology = cls.__new__(cls)
+        vitalsigns_ontology._package_name = state["package_name"]
+        vitalsigns_ontology._ontology_path = state["ontology_path"]
+        vitalsigns_ontology._ontology_iri = state["ontology_iri"]
+        vitalsigns_ontology._import_list = state["import_list"]
+        vitalsigns_ontology._namespace_map = state["namespace_map"]
+        vitalsigns_ontology._ontology_hash = state["ontology_hash"]
+        vitalsigns_ontology._graph = None
+        return vitalsigns_ontology
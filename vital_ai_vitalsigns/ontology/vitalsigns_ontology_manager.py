@@ -4,7 +4,9 @@ from pathlib import Path
 from typing import List
 from owlready2 import get_ontology, onto_path, default_world, PREDEFINED_ONTOLOGIES
 from rdflib import Graph, URIRef, Namespace, RDF, BNode, OWL, RDFS
+from vital_ai_vitalsigns.impl.vitalsigns_snapshot import VitalSignsSnapshotCache
 from vital_ai_vitalsigns.model.properties.URIProperty import URIProperty
+from vital_ai_vitalsigns.model.utils.graphobject_property_table import GraphObjectPropertyTable
 from vital_ai_vitalsigns.ontology.ontology import Ontology
 from vital_ai_vitalsigns.ontology.vitalsigns_ontology import VitalSignsOntology
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -28,6 +30,7 @@ class VitalSignsOntologyManager:
         self._data_prop_results_dict = {}
         self._ont_prop_results_dict = {}
         self._range_property_map = {}
+        self._predefined_ontologies = {}
 
     # TODO adding single ontology to check if imports are already
     # loaded, and don't import if not
@@ -226,6 +229,8 @@ class VitalSignsOntologyManager:
 
             PREDEFINED_ONTOLOGIES[ont_iri] = file
 
+            self._predefined_ontologies[ont_iri] = file
+
         # Load each ontology in the correct order
         # reversing to start with vital-core, should the function sort differently?
         for file_path in reversed(sorted_files):
@@ -293,10 +298,20 @@ class VitalSignsOntologyManager:
 
     # TODO check that the IRIs are unique
 
-    def add_ontology_list(self, ontology_list):
+    def add_ontology_list(self, ontology_list, *, snapshot_cache: VitalSignsSnapshotCache | None = None):
 
         logging.info(f"Ontology List: {ontology_list}")
 
+        snapshot_key = None
+
+        if snapshot_cache is not None:
+            snapshot_key = self.get_snapshot_key(ontology_list)
+
+        if snapshot_key is not None:
+            if self.restore_snapshot(snapshot_cache.load('ontology', snapshot_key)):
+                logging.info(f"Restored {len(self._ont_map)} ontologies from snapshot.")
+                return
+
         file_paths = []
 
         for [ont_module, owl_file] in ontology_list:
@@ -329,9 +344,82 @@ class VitalSignsOntologyManager:
 
             self.build_domain_property_map()
 
+            if snapshot_key is not None:
+                snapshot_cache.save('ontology', snapshot_key, self.create_snapshot())
+
         else:
             logging.error('Failed to load ontology metadata.')
 
+    @staticmethod
+    def get_snapshot_key_parts(ontology_list) -> list | None:
+        """Module name, path and content hash of each OWL file, None if a file can't be read."""
+        try:
+            return sorted([str(ont_module), str(owl_file), VitalSignsSnapshotCache.file_hash(owl_file)]
+                          for ont_module, owl_file in ontology_list)
+        except OSError as e:
+            logging.info(f"Ontology snapshot disabled, could not hash ontology files: {e}")
+            return None
+
+    def get_snapshot_key(self, ontology_list) -> str | None:
+        key_parts = self.get_snapshot_key_parts(ontology_list)
+        if key_parts is None:
+            return None
+        return VitalSignsSnapshotCache.compute_key(key_parts)
+
+    def create_snapshot(self) -> dict:
+        return {
+            "domain_graph": self._domain_graph,
+            "domain_property_map": self._domain_property_map,
+            "range_property_map": self._range_property_map,
+            "data_prop_results_dict": self._data_prop_results_dict,
+            "ont_prop_results_dict": self._ont_prop_results_dict,
+            "predefined_ontologies": self._predefined_ontologies,
+            "ontologies": [ont.get_snapshot_state() for ont in self._ont_map.values()],
+        }
+
+    def restore_snapshot(self, snapshot: dict | None) -> bool:
+
+        if not snapshot:
+            return False
+
+        try:
+            ontologies = [VitalSignsOntology.from_snapshot_state(state) for state in snapshot["ontologies"]]
+            domain_graph = snapshot["domain_graph"]
+            domain_property_map = snapshot["domain_property_map"]
+            range_property_map = snapshot["range_property_map"]
+            data_prop_results_dict = snapshot["data_prop_results_dict"]
+            ont_prop_results_dict = snapshot["ont_prop_results_dict"]
+            predefined_ontologies = snapshot["predefined_ontologies"]
+        except (KeyError, TypeError) as e:
+            logging.warning(f"Ignoring incompatible ontology snapshot: {e}")
+            return False
+
+        if len(self._domain_graph) == 0:
+            self._domain_graph = domain_graph
+        else:
+            for triple in domain_graph:
+                self._domain_graph.add(triple)
+
+        self._domain_property_map.update(domain_property_map)
+        self._range_property_map.update(range_property_map)
+        self._data_prop_results_dict.update(data_prop_results_dict)
+        self._ont_prop_results_dict.update(ont_prop_results_dict)
+
+        for ont in ontologies:
+            self._ont_map[ont.get_ontology_iri()] = ont
+
+        # owlready2 resolves imports through these when ontologies are loaded later
+        for ont_iri, file in predefined_ontologies.items():
+            PREDEFINED_ONTOLOGIES[ont_iri] = file
+            self._predefined_ontologies[ont_iri] = file
+            directory = str(Path(file).parent)
+            if directory not in onto_path:
+                onto_path.append(directory)
+
+        GraphObjectPropertyTable.invalidate()
+
+        return True
+
     def get_domain_graph(self) -> Graph:
         return self._domain_graph
 
@@ -526,6 +614,9 @@ class VitalSignsOntologyManager:
 
             self._range_property_map[uri_prop_uri] = uri_property_range_map
 
+        # per-class property resolution tables are derived from these maps
+        GraphObjectPropertyTable.invalidate()
+
     def get_ontology_iri_list(self) -> List[str]:
         return list(self._ont_map.keys())
 
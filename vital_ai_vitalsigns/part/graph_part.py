@@ -1,5 +1,6 @@
 from typing import MutableSequence, TypeVar, List, Optional, Iterator, Any
 from vital_ai_vitalsigns.collection.graph_collection import GraphCollection
+from vital_ai_vitalsigns.collection.ordered_uri_index import OrderedURIIndex
 from vital_ai_vitalsigns.model.GraphObject import GraphObject
 
 
@@ -8,9 +9,9 @@ G = TypeVar('G', bound=Optional[GraphObject])
 
 class GraphPart(MutableSequence[G]):
     def __init__(self, data: List[G] = None, score: float = 1.0, *, graph_collection: GraphCollection | None = None):
-        self._data = data
+        # objects in order, indexed by URI
+        self._data: OrderedURIIndex[G] = OrderedURIIndex(data)
         self._graph_collection = graph_collection
-        self._uri_map = {}
         self._score = score
 
     def __iter__(self) -> Iterator[G]:
@@ -27,53 +28,29 @@ class GraphPart(MutableSequence[G]):
         if not isinstance(value, GraphObject):
             raise ValueError("All items must be instances of GraphObject or its subclasses")
 
-        if hasattr(self._data[index], 'URI'):
-            self._uri_map.pop(self._data[index].URI, None)
-
-        if hasattr(value, 'URI'):
-            self._uri_map[value.URI] = value
-
-        self._data[index] = value
+        self._data.set(index, value)
 
     def __delitem__(self, index):
-
-        if hasattr(self._data[index], 'URI'):
-            self._uri_map.pop(self._data[index].URI, None)
-
-        del self._data[index]
+        self._data.pop(index)
 
     def insert(self, index, value: G):
 
         if not isinstance(value, GraphObject):
             raise ValueError("All items must be instances of GraphObject or its subclasses")
 
-        self.pop(value.URI)
-
-        if hasattr(value, 'URI'):
-            self._uri_map[value.URI] = value
-
         self._data.insert(index, value)
 
     def get(self, uri, default=None):
-
-        for item in self._data:
-            if item.URI == uri:
-                return item
-
-        return default
+        return self._data.get(uri, default)
 
     def pop(self, uri, default=None):
 
-        for i, item in enumerate(self._data):
-
-            if item.URI == uri:
+        value = self._data.pop_uri(uri)
 
-                return self._data.pop(i)  # Removes and returns the item
-
-        if default is not None:
+        if value is None:
             return default
 
-        return None
+        return value
 
     def remove(self, uri, default=None):
         return self.pop(uri, default)
@@ -83,8 +60,6 @@ class GraphPart(MutableSequence[G]):
         if not isinstance(obj, GraphObject):
             raise ValueError("Item must be instances of GraphObject or its subclasses")
 
-        self.pop(obj.URI)
-
         self._data.append(obj)
 
     def add_objects(self, objects: List[G]):
@@ -93,22 +68,11 @@ class GraphPart(MutableSequence[G]):
             raise ValueError("All items must be instances of GraphObject or its subclasses")
 
         for obj in objects:
-
-            self.pop(obj.URI)
             self._data.append(obj)
 
     def remove_objects(self, uris: List[str]):
         """Remove objects from the part by a list of URI values."""
-        to_remove_indexes = []
-        for uri in uris:
-            for i, item in enumerate(self._data):
-                if item.URI == uri:
-                    to_remove_indexes.append(i)
-                    break  # Assuming URIs are unique, stop after finding the first match
-
-        # Iterate in reverse order to avoid altering the indexes of items to be removed
-        for i in sorted(to_remove_indexes, reverse=True):
-            del self._data[i]
+        self._data.pop_uris(uris)
 
     def set_score(self, score: float):
         self._score = score
@@ -11,7 +11,8 @@ class MetaQLResult:
                  binding_list: List[str] = None,
                  result_list: List[ResultElement] = None,
                  result_object_list: List[GraphObject] = None,
-                 total_result_count: int = 0):
+                 total_result_count: int = 0,
+                 next_cursor: str = None):
 
         self._offset: int = offset
         self._limit: int = limit
@@ -31,6 +32,7 @@ class MetaQLResult:
 
         self._result_count: int = len(self._result_list)
         self._total_result_count: int = total_result_count
+        self._next_cursor: str = next_cursor
 
     def __repr__(self):
         return f"MetaQLResult(offset={self._offset}, limit={self._limit}, binding_list={self._binding_list}, result_list={self._result_list}, result_object_list={self._result_object_list})"
@@ -78,3 +80,9 @@ class MetaQLResult:
 
     def get_total_result_count(self) -> int:
         return self._total_result_count
+
+    def set_next_cursor(self, next_cursor: str):
+        self._next_cursor = next_cursor
+
+    def get_next_cursor(self) -> str:
+        return self._next_cursor
@@ -0,0 +1,89 @@
+from typing import Callable, Dict, Iterator, List, Set, TypeVar
+from vital_ai_vitalsigns.query.solution import Solution
+from vital_ai_vitalsigns.service.graph.binding import Binding, BindingValueType
+
+G = TypeVar('G', bound='GraphObject')
+
+
+class SolutionAssembler:
+    """Assembles Solutions from the triples of a construct query.
+
+    Each solution of the query is a subject in the construct result with
+    a triple per binding, from the binding property to the bound value.
+    Triples are grouped by subject as they are added, in a single pass,
+    with the bindings looked up by property, and the solutions are then
+    produced one at a time.  A repeated triple is kept once.
+    """
+
+    def __init__(self, binding_list: List[Binding], root_binding: str | None = None):
+
+        self.root_binding = root_binding
+
+        # property uri -> binding, None for a property bound more than once
+        self._binding_map: Dict[str, Binding | None] = {}
+
+        for binding in binding_list:
+            if binding.property_uri in self._binding_map:
+                self._binding_map[binding.property_uri] = None
+            else:
+                self._binding_map[binding.property_uri] = binding
+
+        # subject -> binding variable -> value, in the order subjects are seen
+        self._subject_map: Dict[str, Dict[str, object]] = {}
+
+    def get_binding(self, property_uri: str) -> Binding | None:
+        return self._binding_map.get(str(property_uri))
+
+    def add(self, subject, property_uri, value):
+
+        binding = self._binding_map.get(str(property_uri))
+
+        if binding is None:
+            return
+
+        uri_map = self._subject_map.get(subject)
+
+        if uri_map is None:
+            uri_map = self._subject_map[subject] = {}
+
+        uri_map[binding.variable] = value
+
+    def get_solution_count(self) -> int:
+        return len(self._subject_map)
+
+    def get_object_uri_set(self) -> Set[str]:
+        """The URIs bound to URI bindings, for retrieving their objects in bulk."""
+
+        uri_binding_list = [binding.variable for binding in self._binding_map.values()
+                            if binding is not None and binding.value_type == BindingValueType.URIREF]
+
+        uri_set = set()
+
+        for uri_map in self._subject_map.values():
+            for variable in uri_binding_list:
+                value = uri_map.get(variable)
+                if value is not None:
+                    uri_set.add(str(value))
+
+        return uri_set
+
+    def iter_solutions(self, get_object: Callable[[str], G | None]) -> Iterator[Solution]:
+        """Yield the solutions, with the objects of URI bindings from get_object.
+        A binding get_object returns None for has no object in the solution."""
+
+        uri_variable_set = {binding.variable for binding in self._binding_map.values()
+                            if binding is not None and binding.value_type == BindingValueType.URIREF}
+
+        for uri_map in self._subject_map.values():
+
+            obj_map = {}
+
+            for variable, value in uri_map.items():
+                if variable in uri_variable_set:
+                    graph_object = get_object(str(value))
+                    if graph_object is not None:
+                        obj_map[variable] = graph_object
+
+            root_binding_obj = obj_map.get(self.root_binding) if self.root_binding else None
+
+            yield Solution(uri_map, obj_map, self.root_binding, root_binding_obj)
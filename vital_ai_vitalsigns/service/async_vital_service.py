@@ -0,0 +1,253 @@
+import asyncio
+from typing import List, TypeVar, Dict, Optional
+
+from vital_ai_vitalsigns.ontology.ontology import Ontology
+from vital_ai_vitalsigns.query.metaql_result import MetaQLResult
+from vital_ai_vitalsigns.query.result_list import ResultList
+from vital_ai_vitalsigns.service.graph.async_graph_service import AsyncVitalGraphService
+from vital_ai_vitalsigns.service.graph.async_graph_service_adapter import AsyncGraphServiceAdapter
+from vital_ai_vitalsigns.service.vital_name_graph import VitalNameGraph
+from vital_ai_vitalsigns.service.vital_service import VitalService
+from vital_ai_vitalsigns.service.vital_service_status import VitalServiceStatus
+from vital_ai_vitalsigns.metaql.metaql_query import SelectQuery as MetaQLSelectQuery
+from vital_ai_vitalsigns.metaql.metaql_query import GraphQuery as MetaQLGraphQuery
+
+G = TypeVar('G', bound=Optional['GraphObject'])
+
+
+class AsyncVitalService:
+    """asyncio facade over a VitalService.
+
+    Graph calls go to an AsyncVitalGraphService, by default an adapter
+    running the service's own graph service in worker threads.  Vector,
+    metaql and administration calls run the VitalService methods in a
+    worker thread.
+    """
+
+    def __init__(self, vital_service: VitalService,
+                 async_graph_service: AsyncVitalGraphService = None):
+        self.vital_service = vital_service
+
+        if async_graph_service is None and vital_service.graph_service is not None:
+            async_graph_service = AsyncGraphServiceAdapter(vital_service.graph_service)
+
+        self.graph_service = async_graph_service
+
+    async def close(self):
+        if self.graph_service is not None:
+            await self.graph_service.close()
+
+    @staticmethod
+    def _service_status(graph_status) -> VitalServiceStatus:
+
+        service_status = VitalServiceStatus(graph_status.get_status(), graph_status.get_message())
+
+        service_status.set_changes(graph_status.get_changes())
+
+        return service_status
+
+    def get_vitalservice_name(self) -> str:
+        return self.vital_service.get_vitalservice_name()
+
+    def get_vitalservice_namespace(self) -> str:
+        return self.vital_service.get_vitalservice_namespace()
+
+    async def get_service_status(self) -> VitalServiceStatus:
+        return await asyncio.to_thread(self.vital_service.get_service_status)
+
+    async def get_service_info(self):
+        return await asyncio.to_thread(self.vital_service.get_service_info)
+
+    async def inspect_service(self) -> Dict:
+        return await asyncio.to_thread(self.vital_service.inspect_service)
+
+    #################################################
+    # Graph functions
+
+    async def get_graph(self, graph_id: str, *,
+                        global_graph: bool = False,
+                        account_id: str | None = None) -> VitalNameGraph:
+
+        return await self.graph_service.get_graph(graph_id,
+                                                  global_graph=global_graph,
+                                                  account_id=account_id)
+
+    async def list_graphs(self, *,
+                          account_id: str | None = None,
+                          include_global: bool = True,
+                          include_private: bool = True
+                          ) -> List[VitalNameGraph]:
+
+        return await self.graph_service.list_graphs(
+            account_id=account_id,
+            include_global=include_global,
+            include_private=include_private
+        )
+
+    async def check_create_graph(self, graph_id: str, *,
+                                 global_graph: bool = False,
+                                 account_id: str | None = None) -> bool:
+        return await self.graph_service.check_create_graph(graph_id,
+                                                           global_graph=global_graph,
+                                                           account_id=account_id)
+
+    async def create_graph(self, graph_id: str, *,
+                           global_graph: bool = False,
+                           account_id: str | None = None) -> bool:
+        return await self.graph_service.create_graph(graph_id,
+                                                     global_graph=global_graph,
+                                                     account_id=account_id)
+
+    async def delete_graph(self, graph_id: str, *,
+                           global_graph: bool = False,
+                           account_id: str | None = None,
+                           update_index: bool = True) -> bool:
+        return await self.graph_service.delete_graph(graph_id,
+                                                     global_graph=global_graph,
+                                                     account_id=account_id)
+
+    async def purge_graph(self, graph_id: str, *,
+                          global_graph: bool = False,
+                          account_id: str | None = None,
+                          update_index: bool = True) -> bool:
+        return await self.graph_service.purge_graph(graph_id,
+                                                    global_graph=global_graph,
+                                                    account_id=account_id)
+
+    async def get_graph_all_objects(self, graph_id: str, *,
+                                    global_graph: bool = False,
+                                    account_id: str | None = None,
+                                    limit: int = 100, offset: int = 0) -> ResultList:
+        return await self.graph_service.get_graph_all_objects(graph_id,
+                                                              global_graph=global_graph,
+                                                              account_id=account_id,
+                                                              limit=limit, offset=offset)
+
+    async def insert_object(self, graph_id: str, graph_object: G, *,
+                            global_graph: bool = False,
+                            account_id: str | None = None,
+                            update_index: bool = True) -> VitalServiceStatus:
+
+        graph_status = await self.graph_service.insert_object(graph_id, graph_object,
+                                                              global_graph=global_graph,
+                                                              account_id=account_id)
+
+        return self._service_status(graph_status)
+
+    async def insert_object_list(self, graph_id: str, graph_object_list: List[G], *,
+                                 global_graph: bool = False,
+                                 account_id: str | None = None,
+                                 update_index: bool = True) -> VitalServiceStatus:
+
+        graph_status = await self.graph_service.insert_object_list(graph_id, graph_object_list,
+                                                                   global_graph=global_graph,
+                                                                   account_id=account_id)
+
+        return self._service_status(graph_status)
+
+    async def update_object(self, graph_object: G, graph_id: str, *,
+                            global_graph: bool = False,
+                            account_id: str | None = None,
+                            upsert: bool = False, update_index: bool = True) -> VitalServiceStatus:
+
+        graph_status = await self.graph_service.update_object(graph_object,
+                                                              graph_id=graph_id,
+                                                              global_graph=global_graph,
+                                                              account_id=account_id,
+                                                              upsert=upsert)
+
+        return self._service_status(graph_status)
+
+    async def update_object_list(self, graph_object_list: List[G], graph_id: str, *,
+                                 global_graph: bool = False,
+                                 account_id: str | None = None,
+                                 upsert: bool = False, update_index: bool = True) -> VitalServiceStatus:
+
+        graph_status = await self.graph_service.update_object_list(graph_object_list,
+                                                                   graph_id=graph_id,
+                                                                   account_id=account_id,
+                                                                   global_graph=global_graph,
+                                                                   upsert=upsert)
+
+        return self._service_status(graph_status)
+
+    async def get_object(self, object_uri: str, graph_id: str, *,
+                         account_id: str | None = None,
+                         global_graph: bool = False) -> G:
+
+        return await self.graph_service.get_object(object_uri,
+                                                   graph_id=graph_id,
+                                                   account_id=account_id,
+                                                   global_graph=global_graph)
+
+    async def get_object_list(self, object_uri_list: List[str], graph_id: str, *,
+                              global_graph: bool = False,
+                              account_id: str | None = None
+                              ) -> ResultList:
+
+        return await self.graph_service.get_object_list(object_uri_list,
+                                                        graph_id=graph_id,
+                                                        account_id=account_id,
+                                                        global_graph=global_graph)
+
+    async def delete_object(self, object_uri: str, graph_id: str, *,
+                            global_graph: bool = False,
+                            account_id: str | None = None,
+                            update_index: bool = True) -> VitalServiceStatus:
+
+        graph_status = await self.graph_service.delete_object(object_uri,
+                                                              graph_id=graph_id,
+                                                              account_id=account_id,
+                                                              global_graph=global_graph)
+
+        return self._service_status(graph_status)
+
+    async def delete_object_list(self, object_uri_list: List[str], graph_id: str, *,
+                                 global_graph: bool = False,
+                                 account_id: str | None = None,
+                                 update_index: bool = True) -> VitalServiceStatus:
+
+        graph_status = await self.graph_service.delete_object_list(object_uri_list,
+                                                                   graph_id=graph_id,
+                                                                   account_id=account_id,
+                                                                   global_graph=global_graph)
+
+        return self._service_status(graph_status)
+
+    async def query(self, sparql_query: str, graph_id: str, uri_binding='uri', *,
+                    account_id: str | None = None,
+                    global_graph: bool = False,
+                    resolve_objects=True) -> ResultList:
+        return await self.graph_service.query(graph_id, sparql_query, uri_binding,
+                                              global_graph=global_graph,
+                                              account_id=account_id,
+                                              resolve_objects=resolve_objects)
+
+    #################################################
+    # Vector functions
+
+    async def init_vector_collections(self):
+        return await asyncio.to_thread(self.vital_service.init_vector_collections)
+
+    async def remove_vector_collections(self):
+        return await asyncio.to_thread(self.vital_service.remove_vector_collections)
+
+    async def get_vector_collection_identifiers(self) -> List[str]:
+        return await asyncio.to_thread(self.vital_service.get_vector_collection_identifiers)
+
+    #################################################
+    # MetaQL Functions
+
+    async def metaql_select_query(self, *,
+                                  select_query: MetaQLSelectQuery,
+                                  namespace_list: List[Ontology]) -> MetaQLResult:
+        return await asyncio.to_thread(self.vital_service.metaql_select_query,
+                                       select_query=select_query,
+                                       namespace_list=namespace_list)
+
+    async def metaql_graph_query(self, *,
+                                 graph_query: MetaQLGraphQuery,
+                                 namespace_list: List[Ontology] = None) -> MetaQLResult:
+        return await asyncio.to_thread(self.vital_service.metaql_graph_query,
+                                       graph_query=graph_query,
+                                       namespace_list=namespace_list)
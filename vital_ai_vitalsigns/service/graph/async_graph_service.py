@@ -0,0 +1,355 @@
+from abc import abstractmethod, ABC
+from typing import TypeVar, List, AsyncIterator
+
+from vital_ai_vitalsigns.metaql.metaql_query import SelectQuery as MetaQLSelectQuery
+from vital_ai_vitalsigns.metaql.metaql_query import GraphQuery as MetaQLGraphQuery
+
+from vital_ai_vitalsigns.ontology.ontology import Ontology
+from vital_ai_vitalsigns.query.metaql_result import MetaQLResult
+from vital_ai_vitalsigns.query.result_list import ResultList
+from vital_ai_vitalsigns.query.solution_list import SolutionList
+from vital_ai_vitalsigns.service.graph.binding import Binding
+from vital_ai_vitalsigns.service.graph.graph_object_generator import GraphObjectGenerator
+from vital_ai_vitalsigns.service.graph.graph_service import VitalGraphService
+from vital_ai_vitalsigns.service.graph.graph_service_status import GraphServiceStatus
+from vital_ai_vitalsigns.service.vital_name_graph import VitalNameGraph
+from vital_ai_vitalsigns.service.graph.vital_graph_status import VitalGraphStatus
+
+from vital_ai_vitalsigns.config.vitalsigns_config import GraphDatabaseConfig
+
+
+G = TypeVar('G', bound='GraphObject')
+
+
+# asyncio version of VitalGraphService, same methods as coroutines
+# so handlers running in an event loop can await graph calls
+
+class AsyncVitalGraphService(ABC):
+    def __init__(self, config: GraphDatabaseConfig, **kwargs):
+        self.config = config
+        self.base_uri = kwargs.get('base_uri')
+        self.namespace = kwargs.get('namespace')
+        super().__init__()
+
+    # graph uri helpers do no io, these are shared with VitalGraphService
+    get_graph_uri = VitalGraphService.get_graph_uri
+
+    get_name_graph = VitalGraphService.get_name_graph
+
+    # release connections
+    async def close(self):
+        pass
+
+    @abstractmethod
+    async def list_graph_uris(self, *,
+                              safety_check: bool = True) -> List[str]:
+        pass
+
+    @abstractmethod
+    async def service_info(self) -> dict:
+        pass
+
+    @abstractmethod
+    async def service_status(self) -> GraphServiceStatus:
+        pass
+
+
+    # initialize, create vital service graph
+    @abstractmethod
+    async def initialize_service(self) -> bool:
+        pass
+
+    # destroy vital service graph and all associated graphs
+    @abstractmethod
+    async def destroy_service(self) -> bool:
+        pass
+
+    @abstractmethod
+    async def is_graph_global(self, graph_id: str, *,
+                              account_id: str|None = None) -> bool:
+        pass
+
+    @abstractmethod
+    async def get_graph(self, graph_id: str, *,
+                        global_graph: bool = False,
+                        account_id: str|None = None,
+                        safety_check: bool = True) -> VitalNameGraph:
+        pass
+
+    @abstractmethod
+    async def list_graphs(self, *,
+                          account_id: str | None = None,
+                          include_global: bool = True,
+                          include_private: bool = True,
+                          safety_check: bool = True) -> List[VitalNameGraph]:
+        pass
+
+    # create graph
+    # store name graph in vital service graph and in the graph itself
+    # a graph needs to have some triples in it to exist
+
+    @abstractmethod
+    async def check_create_graph(self, graph_id: str, *,
+                                 global_graph: bool = False,
+                                 account_id: str|None = None,
+                                 safety_check: bool = True) -> bool:
+        pass
+
+    @abstractmethod
+    async def create_graph(self, graph_id: str, *,
+                           global_graph: bool = False,
+                           account_id: str|None = None,
+                           safety_check: bool = True) -> bool:
+        pass
+
+    # delete graph
+    # delete graph itself plus record in vital service graph
+
+    @abstractmethod
+    async def delete_graph(self, graph_id: str, *,
+                           global_graph: bool = False,
+                           account_id: str|None = None,
+                           safety_check: bool = True) -> bool:
+        pass
+
+    # purge graph (delete all but name graph)
+
+    @abstractmethod
+    async def purge_graph(self, graph_id: str, *,
+                          global_graph: bool = False,
+                          account_id: str|None = None,
+                          safety_check: bool = True) -> bool:
+        pass
+
+    @abstractmethod
+    async def get_graph_all_objects(self, graph_id: str, *,
+                                    global_graph: bool = False,
+                                    account_id: str|None = None,
+                                    limit=100,
+                                    offset=0,
+                                    safety_check: bool = True) -> ResultList:
+        pass
+
+    # insert object into graph (scoped to vital service graph uri, which must exist)
+
+    # insert object list into graph (scoped to vital service graph uri, which must exist)
+
+    @abstractmethod
+    async def insert_object(self, graph_id: str, graph_object: G, *,
+                            global_graph: bool = False,
+                            account_id: str|None = None,
+                            safety_check: bool = True) -> VitalGraphStatus:
+        pass
+
+    @abstractmethod
+    async def insert_object_list(self, graph_id: str, graph_object_list: List[G], *,
+                                 global_graph: bool = False,
+                                 account_id: str|None = None,
+                                 safety_check: bool = True) -> VitalGraphStatus:
+        pass
+
+    # update object into graph (scoped to vital service graph uri, which must exist)
+    # delete old, replace with new
+
+    # update object list into graph (scoped to vital service graph uri, which must exist)
+    # delete old, replace with new
+
+    @abstractmethod
+    async def update_object(self, graph_object: G, *,
+                            graph_id: str = None,
+                            global_graph: bool = False,
+                            account_id: str|None = None,
+                            upsert: bool = False,
+                            safety_check: bool = True) -> VitalGraphStatus:
+        pass
+
+    @abstractmethod
+    async def update_object_list(self, graph_object_list: List[G], *,
+                                 graph_id: str = None,
+                                 global_graph: bool = False,
+                                 account_id: str|None = None,
+                                 upsert: bool = False,
+                                 safety_check: bool = True) -> VitalGraphStatus:
+        pass
+
+    # get object (scoped to all vital service graphs)
+
+    # get object (scoped to specific graph, or graph list)
+
+    # get objects by uri list (scoped to all vital service graphs)
+
+    # get objects by uri list (scoped to specific graph, or graph list)
+
+    @abstractmethod
+    async def get_object(self, object_uri: str, *,
+                         graph_id: str = None,
+                         global_graph: bool = False,
+                         account_id: str|None = None,
+                         safety_check: bool = True) -> G:
+        pass
+
+    @abstractmethod
+    async def get_object_list(self, object_uri_list: List[str], *,
+                              graph_id: str = None,
+                              global_graph: bool = False,
+                              account_id: str|None = None,
+                              safety_check: bool = True) -> ResultList:
+        pass
+
+    # delete uri (scoped to all vital service graphs)
+
+    # delete uri list (scoped to all vital service graphs)
+
+    # delete uri (scoped to graph or graph list)
+
+    # delete uri list (scoped to graph or graph list)
+
+    @abstractmethod
+    async def delete_object(self, object_uri: str, *,
+                            graph_id: str = None,
+                            global_graph: bool = False,
+                            account_id: str|None = None,
+                            safety_check: bool = True) -> VitalGraphStatus:
+        pass
+
+    @abstractmethod
+    async def delete_object_list(self, object_uri_list: List[str], *,
+                                 graph_id: str = None,
+                                 global_graph: bool = False,
+                                 account_id: str|None = None,
+                                 safety_check: bool = True) -> VitalGraphStatus:
+        pass
+
+    # filter graph
+
+    @abstractmethod
+    async def filter_query(self, graph_id: str, sparql_query: str, uri_binding='uri', *,
+                           limit: int = 100,
+                           offset: int = 0,
+                           global_graph: bool = False,
+                           account_id: str|None = None,
+                           resolve_objects: bool = True,
+                           safety_check: bool = True) -> ResultList:
+        pass
+
+    # query graph
+
+    @abstractmethod
+    async def query(self, graph_id: str, sparql_query: str, uri_binding='uri', *,
+                    limit=100,
+                    offset=0,
+                    global_graph: bool = False,
+                    account_id: str|None = None,
+                    resolve_objects=True,
+                    safety_check: bool = True) -> ResultList:
+        pass
+
+    @abstractmethod
+    async def query_construct(self, graph_id: str, sparql_query: str,
+                              namespace_list: List[Ontology],
+                              binding_list: List[Binding], *,
+                              limit=100, offset=0,
+                              global_graph: bool = False,
+                              account_id: str|None = None,
+                              safety_check: bool = True) -> ResultList:
+        pass
+
+    # streaming query graph
+    # yields results as the response is read, by default
+    # these iterate over the results of query and query_construct
+
+    async def iter_query(self, graph_id: str, sparql_query: str, uri_binding='uri', *,
+                         limit=100,
+                         offset=0,
+                         global_graph: bool = False,
+                         account_id: str|None = None,
+                         resolve_objects=True,
+                         safety_check: bool = True) -> AsyncIterator[G]:
+
+        result_list = await self.query(graph_id, sparql_query, uri_binding,
+                                       limit=limit, offset=offset,
+                                       global_graph=global_graph, account_id=account_id,
+                                       resolve_objects=resolve_objects, safety_check=safety_check)
+
+        for result in result_list:
+            yield result.graph_object
+
+    async def iter_construct(self, graph_id: str, sparql_query: str,
+                             namespace_list: List[Ontology],
+                             binding_list: List[Binding], *,
+                             limit=100, offset=0,
+                             global_graph: bool = False,
+                             account_id: str|None = None,
+                             safety_check: bool = True) -> AsyncIterator[G]:
+
+        result_list = await self.query_construct(graph_id, sparql_query, namespace_list, binding_list,
+                                                 limit=limit, offset=offset,
+                                                 global_graph=global_graph, account_id=account_id,
+                                                 safety_check=safety_check)
+
+        for result in result_list:
+            yield result.graph_object
+
+    @abstractmethod
+    async def query_construct_solution(self,
+                                       graph_id: str,
+                                       sparql_query: str,
+                                       namespace_list: List[Ontology],
+                                       binding_list: List[Binding],
+                                       root_binding: str | None = None, *,
+                                       limit=100, offset=0,
+                                       global_graph: bool = False,
+                                       account_id: str|None = None,
+                                       resolve_objects: bool = True,
+                                       safety_check: bool = True) -> SolutionList:
+        pass
+
+    @abstractmethod
+    async def metaql_select_query(self, *,
+                                  select_query: MetaQLSelectQuery,
+                                  namespace_list: List[Ontology],
+                                  account_id: str|None = None, is_global: bool = False) -> MetaQLResult:
+        pass
+
+    @abstractmethod
+    async def metaql_graph_query(self, *,
+                                 graph_query: MetaQLGraphQuery,
+                                 namespace_list: List[Ontology],
+                                 account_id: str|None = None, is_global: bool = False) -> MetaQLResult:
+        pass
+
+    #################################################
+    # Import Functions
+
+    @abstractmethod
+    async def import_graph_batch(self, graph_id: str, object_generator: GraphObjectGenerator,
+                                 *,
+                                 global_graph: bool = False,
+                                 account_id: str | None = None,
+                                 purge_first: bool = True, batch_size: int = 10_000):
+        pass
+
+    @abstractmethod
+    async def import_graph_batch_file(self, graph_id: str, file_path: str,
+                                      *,
+                                      global_graph: bool = False,
+                                      account_id: str | None = None,
+                                      purge_first: bool = True, batch_size: int = 10_000):
+        pass
+
+
+    # multi-graph cases use graph id from the objects
+    # optionally use account id in objects also
+    @abstractmethod
+    async def import_multi_graph_batch(self, object_generator: GraphObjectGenerator,
+                                       *,
+                                       use_account_id: bool = True,
+                                       purge_first: bool = True, batch_size: int = 10_000):
+        pass
+
+    @abstractmethod
+    async def import_multi_graph_batch_file(self, file_path: str,
+                                           *,
+                                           use_account_id: bool = True,
+                                           purge_first: bool = True, batch_size: int = 10_000):
+        pass
@@ -0,0 +1,125 @@
+import asyncio
+from typing import TypeVar
+
+from vital_ai_vitalsigns.service.graph.async_graph_service import AsyncVitalGraphService
+from vital_ai_vitalsigns.service.graph.graph_service import VitalGraphService
+
+
+G = TypeVar('G', bound='GraphObject')
+
+
+class AsyncGraphServiceAdapter(AsyncVitalGraphService):
+    """Runs the calls of a synchronous VitalGraphService in worker threads.
+
+    Arguments are passed through unchanged, so the signatures of the
+    wrapped implementation apply.  With serialize=True calls run one at a
+    time, for implementations that are not thread safe.
+    """
+
+    def __init__(self, graph_service: VitalGraphService, *, serialize: bool = False):
+        self.graph_service = graph_service
+        self._lock = asyncio.Lock() if serialize else None
+        super().__init__(graph_service.config,
+                         base_uri=graph_service.base_uri,
+                         namespace=graph_service.namespace)
+
+    async def _call(self, method, *args, **kwargs):
+
+        if self._lock is None:
+            return await asyncio.to_thread(method, *args, **kwargs)
+
+        async with self._lock:
+            return await asyncio.to_thread(method, *args, **kwargs)
+
+    async def list_graph_uris(self, *args, **kwargs):
+        return await self._call(self.graph_service.list_graph_uris, *args, **kwargs)
+
+    async def service_info(self, *args, **kwargs):
+        return await self._call(self.graph_service.service_info, *args, **kwargs)
+
+    async def service_status(self, *args, **kwargs):
+        return await self._call(self.graph_service.service_status, *args, **kwargs)
+
+    async def initialize_service(self, *args, **kwargs):
+        return await self._call(self.graph_service.initialize_service, *args, **kwargs)
+
+    async def destroy_service(self, *args, **kwargs):
+        return await self._call(self.graph_service.destroy_service, *args, **kwargs)
+
+    async def is_graph_global(self, *args, **kwargs):
+        return await self._call(self.graph_service.is_graph_global, *args, **kwargs)
+
+    async def get_graph(self, *args, **kwargs):
+        return await self._call(self.graph_service.get_graph, *args, **kwargs)
+
+    async def list_graphs(self, *args, **kwargs):
+        return await self._call(self.graph_service.list_graphs, *args, **kwargs)
+
+    async def check_create_graph(self, *args, **kwargs):
+        return await self._call(self.graph_service.check_create_graph, *args, **kwargs)
+
+    async def create_graph(self, *args, **kwargs):
+        return await self._call(self.graph_service.create_graph, *args, **kwargs)
+
+    async def delete_graph(self, *args, **kwargs):
+        return await self._call(self.graph_service.delete_graph, *args, **kwargs)
+
+    async def purge_graph(self, *args, **kwargs):
+        return await self._call(self.graph_service.purge_graph, *args, **kwargs)
+
+    async def get_graph_all_objects(self, *args, **kwargs):
+        return await self._call(self.graph_service.get_graph_all_objects, *args, **kwargs)
+
+    async def insert_object(self, *args, **kwargs):
+        return await self._call(self.graph_service.insert_object, *args, **kwargs)
+
+    async def insert_object_list(self, *args, **kwargs):
+        return await self._call(self.graph_service.insert_object_list, *args, **kwargs)
+
+    async def update_object(self, *args, **kwargs):
+        return await self._call(self.graph_service.update_object, *args, **kwargs)
+
+    async def update_object_list(self, *args, **kwargs):
+        return await self._call(self.graph_service.update_object_list, *args, **kwargs)
+
+    async def get_object(self, *args, **kwargs):
+        return await self._call(self.graph_service.get_object, *args, **kwargs)
+
+    async def get_object_list(self, *args, **kwargs):
+        return await self._call(self.graph_service.get_object_list, *args, **kwargs)
+
+    async def delete_object(self, *args, **kwargs):
+        return await self._call(self.graph_service.delete_object, *args, **kwargs)
+
+    async def delete_object_list(self, *args, **kwargs):
+        return await self._call(self.graph_service.delete_object_list, *args, **kwargs)
+
+    async def filter_query(self, *args, **kwargs):
+        return await self._call(self.graph_service.filter_query, *args, **kwargs)
+
+    async def query(self, *args, **kwargs):
+        return await self._call(self.graph_service.query, *args, **kwargs)
+
+    async def query_construct(self, *args, **kwargs):
+        return await self._call(self.graph_service.query_construct, *args, **kwargs)
+
+    async def query_construct_solution(self, *args, **kwargs):
+        return await self._call(self.graph_service.query_construct_solution, *args, **kwargs)
+
+    async def metaql_select_query(self, *args, **kwargs):
+        return await self._call(self.graph_service.metaql_select_query, *args, **kwargs)
+
+    async def metaql_graph_query(self, *args, **kwargs):
+        return await self._call(self.graph_service.metaql_graph_query, *args, **kwargs)
+
+    async def import_graph_batch(self, *args, **kwargs):
+        return await self._call(self.graph_service.import_graph_batch, *args, **kwargs)
+
+    async def import_graph_batch_file(self, *args, **kwargs):
+        return await self._call(self.graph_service.import_graph_batch_file, *args, **kwargs)
+
+    async def import_multi_graph_batch(self, *args, **kwargs):
+        return await self._call(self.graph_service.import_multi_graph_batch, *args, **kwargs)
+
+    async def import_multi_graph_batch_file(self, *args, **kwargs):
+        return await self._call(self.graph_service.import_multi_graph_batch_file, *args, **kwargs)
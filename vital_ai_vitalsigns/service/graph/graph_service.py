@@ -1,5 +1,5 @@
 from abc import abstractmethod, ABC
-from typing import TypeVar, List
+from typing import TypeVar, List, Iterator
 
 from vital_ai_vitalsigns.metaql.metaql_query import SelectQuery as MetaQLSelectQuery
 from vital_ai_vitalsigns.metaql.metaql_query import GraphQuery as MetaQLGraphQuery
@@ -334,6 +334,42 @@ class VitalGraphService(ABC):
                         safety_check: bool = True) -> ResultList:
         pass
 
+    # streaming query graph
+    # yields results as the response is read, by default
+    # these iterate over the results of query and query_construct
+
+    def iter_query(self, graph_id: str, sparql_query: str, uri_binding='uri', *,
+                   limit=100,
+                   offset=0,
+                   global_graph: bool = False,
+                   account_id: str|None = None,
+                   resolve_objects=True,
+                   safety_check: bool = True) -> Iterator[G]:
+
+        result_list = self.query(graph_id, sparql_query, uri_binding,
+                                 limit=limit, offset=offset,
+                                 global_graph=global_graph, account_id=account_id,
+                                 resolve_objects=resolve_objects, safety_check=safety_check)
+
+        for result in result_list:
+            yield result.graph_object
+
+    def iter_construct(self, graph_id: str, sparql_query: str,
+                       namespace_list: List[Ontology],
+                       binding_list: List[Binding], *,
+                       limit=100, offset=0,
+                       global_graph: bool = False,
+                       account_id: str|None = None,
+                       safety_check: bool = True) -> Iterator[G]:
+
+        result_list = self.query_construct(graph_id, sparql_query, namespace_list, binding_list,
+                                           limit=limit, offset=offset,
+                                           global_graph=global_graph, account_id=account_id,
+                                           safety_check=safety_check)
+
+        for result in result_list:
+            yield result.graph_object
+
     @abstractmethod
     def query_construct_solution(self,
                                  graph_id: str,
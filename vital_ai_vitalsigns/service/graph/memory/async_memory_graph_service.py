@@ -0,0 +1,14 @@
+from vital_ai_vitalsigns.service.graph.async_graph_service_adapter import AsyncGraphServiceAdapter
+from vital_ai_vitalsigns.service.graph.memory.memory_graph_service import MemoryGraphService
+from vital_ai_vitalsigns.config.vitalsigns_config import GraphDatabaseConfig
+
+
+class AsyncMemoryGraphService(AsyncGraphServiceAdapter):
+    """Async wrapper around MemoryGraphService.
+
+    The rdflib dataset is not safe for concurrent writers, so calls run
+    one at a time in a worker thread rather than blocking the event loop.
+    """
+
+    def __init__(self, config: GraphDatabaseConfig, **kwargs):
+        super().__init__(MemoryGraphService(config, **kwargs), serialize=True)
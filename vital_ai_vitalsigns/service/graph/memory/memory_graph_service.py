@@ -22,7 +22,10 @@ class MemoryGraphService(VitalGraphService, RDFlibSparqlImpl):
 
     def __init__(self, config: GraphDatabaseConfig, **kwargs):
 
-        super().__init__(config, multigraph=True, **kwargs)
+        super().__init__(config, **kwargs)
+
+        # the cooperative init chain reaches RDFlibSparqlImpl without arguments
+        RDFlibSparqlImpl.__init__(self, multigraph=True)
 
         # init service graph, domain ontology graph
 
@@ -286,12 +289,16 @@ class MemoryGraphService(VitalGraphService, RDFlibSparqlImpl):
             safety_check=safety_check)
 
     def metaql_select_query(self, *, namespace: str = None, select_query: MetaQLSelectQuery,
-                            namespace_list: List[Ontology]) -> MetaQLResult:
-        pass
+                            namespace_list: List[Ontology] = None,
+                            account_id: str | None = None, is_global: bool = False) -> MetaQLResult:
+
+        return self._metaql_select_query_impl(select_query=select_query)
 
     def metaql_graph_query(self, *, namespace: str = None, graph_query: MetaQLGraphQuery,
-                           namespace_list: List[Ontology]) -> MetaQLResult:
-        pass
+                           namespace_list: List[Ontology] = None,
+                           account_id: str | None = None, is_global: bool = False) -> MetaQLResult:
+
+        return self._metaql_graph_query_impl(graph_query=graph_query)
 
     def is_graph_global(self, graph_id: str, *,
                         account_id: str | None = None) -> bool:
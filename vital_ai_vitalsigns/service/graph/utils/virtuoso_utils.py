@@ -3,27 +3,37 @@ from rdflib import URIRef, BNode, Literal
 
 class VirtuosoUtils:
 
+    @classmethod
+    def to_rdf_term(cls, o, o_type, o_datatype=None, o_lang=None):
+
+        if o_type == "uri":
+            return URIRef(o)
+
+        if o_type == "bnode":
+            return BNode(o)
+
+        # virtuoso reports datatyped values as "typed-literal"
+        if o_datatype:
+            return Literal(o, datatype=URIRef(o_datatype))
+
+        if o_lang:
+            return Literal(o, lang=o_lang)
+
+        # Plain literal
+        return Literal(o)
+
+    @classmethod
+    def binding_to_rdf_term(cls, binding: dict):
+        """Convert one value of a SPARQL JSON result binding to an rdflib term."""
+        return cls.to_rdf_term(binding["value"], binding["type"], binding.get("datatype"), binding.get("xml:lang"))
+
     @classmethod
     def format_as_ntriples(cls, s, p, o, o_type, o_datatype=None, o_lang=None):
 
         s_uri = URIRef(s)
         p_uri = URIRef(p)
 
-        if o_type == "uri":
-            o_uri = URIRef(o)
-        elif o_type == "bnode":
-            o_uri = BNode(o)
-        elif o_type == "literal" and o_datatype:
-            # If datatype is provided, include it
-            o_uri = Literal(o, datatype=URIRef(o_datatype))
-        elif o_type == "literal" and o_lang:
-            # If language is provided, include it
-            o_uri = Literal(o, lang=o_lang)
-        else:
-            # Plain literal
-            o_uri = Literal(o)
+        o_uri = cls.to_rdf_term(o, o_type, o_datatype, o_lang)
 
         # Format as N-Triples
         return f"{s_uri.n3()} {p_uri.n3()} {o_uri.n3()} .\n"
-
-
@@ -0,0 +1,445 @@
+from typing import List, TypeVar
+from vital_ai_vitalsigns.model.GraphObject import GraphObject
+from vital_ai_vitalsigns.query.result_list import ResultList
+from vital_ai_vitalsigns.service.graph.async_graph_service_adapter import AsyncGraphServiceAdapter
+from vital_ai_vitalsigns.service.graph.virtuoso.rest.async_rest_manager import AsyncVirtuosoRESTManager
+from vital_ai_vitalsigns.service.graph.virtuoso.virtuoso_service import VirtuosoGraphService
+from vital_ai_vitalsigns.service.graph.vital_graph_status import VitalGraphStatus
+from vital_ai_vitalsigns.service.vital_name_graph import VitalNameGraph
+from vital_ai_vitalsigns.config.vitalsigns_config import GraphDatabaseConfig
+
+G = TypeVar('G', bound='GraphObject')
+
+
+class AsyncVirtuosoGraphService(AsyncGraphServiceAdapter):
+    """asyncio implementation of the Virtuoso graph service.
+
+    Object reads, writes and queries are sent with the async transport,
+    using the same SPARQL as VirtuosoGraphService.  Service and graph
+    administration, construct solutions, metaql and imports run the
+    synchronous implementation in a worker thread.
+    """
+
+    def __init__(self, config: GraphDatabaseConfig, **kwargs):
+
+        graph_service = VirtuosoGraphService(config, **kwargs)
+
+        super().__init__(graph_service)
+
+        self.rest_manager = AsyncVirtuosoRESTManager(
+            graph_service.sparql_auth_endpoint,
+            graph_service.graph_crud_auth_endpoint,
+            graph_service.username,
+            graph_service.password,
+            pool_size=config.pool_size,
+            max_retries=config.max_retries,
+            backoff_factor=config.retry_backoff_factor
+        )
+
+    async def close(self):
+        await self.rest_manager.close()
+        self.graph_service.rest_manager.close()
+
+    async def _find_graph(self, graph_uri: str, object_uri: str) -> bool:
+
+        query = f"""
+                ASK WHERE {{
+                    GRAPH <{graph_uri}> {{
+                        <{object_uri}> ?p ?o .
+                    }}
+                }}
+            """
+
+        return await self.rest_manager.sparql_ask(query)
+
+    async def _find_graph_uri_list(self, graph_uri: str, object_uri_list: List[str]) -> List[str]:
+
+        values_clause = " ".join(f"<{uri}>" for uri in object_uri_list)
+
+        query = f"""
+                SELECT ?s WHERE {{
+                    GRAPH <{graph_uri}> {{
+                        VALUES ?s {{ {values_clause} }}
+                        ?s ?p ?o .
+                    }}
+                }}
+                """
+
+        results = await self.rest_manager.sparql_select(query)
+
+        existing_uris = {result['s']['value'] for result in results['results']['bindings']}
+
+        return [uri for uri in object_uri_list if uri in existing_uris]
+
+    async def _get_object_map(self, graph_uri: str, object_uri_list: List[str]) -> dict:
+
+        chunk_size = self.graph_service.retrieve_chunk_size
+
+        # unique uris in request order
+        uri_list = list(dict.fromkeys(str(uri) for uri in object_uri_list))
+
+        subject_triples_map: dict = {}
+
+        for start in range(0, len(uri_list), chunk_size):
+
+            query = VirtuosoGraphService._build_object_select(graph_uri, uri_list[start:start + chunk_size])
+
+            try:
+                results = await self.rest_manager.sparql_select(query)
+            except Exception as e:
+                raise ValueError(f"Error retrieving object list: {str(e)}")
+
+            VirtuosoGraphService._add_subject_triples(subject_triples_map, results)
+
+        return VirtuosoGraphService._build_object_map(uri_list, subject_triples_map)
+
+    async def get_graph(self, graph_id: str, *,
+                        global_graph: bool = False,
+                        account_id: str | None = None,
+                        safety_check: bool = True) -> VitalNameGraph:
+
+        graph_uri = self.get_graph_uri(
+            graph_id=graph_id,
+            account_id=account_id,
+            is_global=global_graph
+        )
+
+        query = f"""
+                ASK WHERE {{
+                    GRAPH <{graph_uri}> {{ ?s ?p ?o }}
+                }}
+                """
+
+        result = await self.rest_manager.sparql_ask(query)
+
+        if result:
+            return VitalNameGraph(graph_uri,
+                                  graph_id=graph_id,
+                                  account_id=account_id,
+                                  is_global=global_graph)
+        else:
+            raise ValueError(f"Graph with URI {graph_uri} does not exist.")
+
+    async def insert_object(self, graph_id: str, graph_object: G, *,
+                            global_graph: bool = False,
+                            account_id: str | None = None,
+                            safety_check: bool = True) -> VitalGraphStatus:
+
+        graph_uri = self.get_graph_uri(
+            graph_id=graph_id,
+            account_id=account_id,
+            is_global=global_graph
+        )
+
+        # throws exception if not exists
+        name_graph = await self.get_graph(graph_id,
+                                          account_id=account_id,
+                                          global_graph=global_graph)
+
+        object_uri = str(graph_object.URI)
+
+        if await self._find_graph(graph_uri, object_uri):
+            return VitalGraphStatus(-1, f"Failed to insert graph object.  The object URI already exists.")
+
+        rdf_data = graph_object.to_rdf()
+
+        query = f"""
+                INSERT DATA {{
+                    GRAPH <{graph_uri}> {{
+                        {rdf_data}
+                    }}
+                }}
+                """
+
+        try:
+            await self.rest_manager.sparql_update(query)
+            return VitalGraphStatus(0, "Graph object inserted successfully.")
+        except Exception as e:
+            return VitalGraphStatus(-1, f"Failed to insert graph object: {str(e)}")
+
+    async def insert_object_list(self, graph_id: str, graph_object_list: List[G], *,
+                                 global_graph: bool = False,
+                                 account_id: str | None = None,
+                                 safety_check: bool = True) -> VitalGraphStatus:
+
+        graph_uri = self.get_graph_uri(
+            graph_id=graph_id,
+            account_id=account_id,
+            is_global=global_graph
+        )
+
+        # throws exception if not exists
+        name_graph = await self.get_graph(graph_id,
+                                          account_id=account_id,
+                                          global_graph=global_graph)
+
+        uri_list = [str(g.URI) for g in graph_object_list]
+
+        existing_object_uri_list = await self._find_graph_uri_list(graph_uri, uri_list)
+
+        if len(existing_object_uri_list) > 0:
+            return VitalGraphStatus(-1, f"Failed to insert graph objects.  One or more object uris already exists.")
+
+        rdf_data = GraphObject.to_rdf_list(graph_object_list)
+
+        query = f"""
+                INSERT DATA {{
+                    GRAPH <{graph_uri}> {{
+                        {rdf_data}
+                    }}
+                }}
+                """
+
+        try:
+            await self.rest_manager.sparql_update(query)
+            return VitalGraphStatus(0, "Graph objects inserted successfully.")
+        except Exception as e:
+            return VitalGraphStatus(-1, f"Failed to insert graph objects: {str(e)}")
+
+    async def update_object(self, graph_object: G, *,
+                            graph_id: str = None,
+                            upsert: bool = False,
+                            global_graph: bool = False,
+                            account_id: str | None = None,
+                            safety_check: bool = True) -> VitalGraphStatus:
+
+        status = await self.update_object_list([graph_object],
+                                               graph_id=graph_id,
+                                               upsert=upsert,
+                                               global_graph=global_graph,
+                                               account_id=account_id)
+
+        if status.status == 0:
+            return VitalGraphStatus(0, "Graph object updated successfully.")
+
+        return status
+
+    async def update_object_list(self, graph_object_list: List[G], *,
+                                 graph_id: str = None,
+                                 upsert: bool = False,
+                                 global_graph: bool = False,
+                                 account_id: str | None = None,
+                                 safety_check: bool = True,
+                                 chunk_size: int | None = None) -> VitalGraphStatus:
+        """
+        Replace the objects in the graph, not atomic across chunks, see VirtuosoGraphService.update_object_list.
+        """
+
+        graph_uri = self.get_graph_uri(
+            graph_id=graph_id,
+            account_id=account_id,
+            is_global=global_graph
+        )
+
+        # exception if graph doesn't exist
+        name_graph = await self.get_graph(graph_id,
+                                          account_id=account_id,
+                                          global_graph=global_graph)
+
+        if chunk_size is None:
+            chunk_size = self.graph_service.update_chunk_size
+
+        graph_object_list = self.graph_service._unique_by_uri(graph_object_list)
+
+        object_uri_list = [str(graph_object.URI) for graph_object in graph_object_list]
+
+        # check all objects exist before changing anything
+        if not upsert:
+
+            existing_uri_set = set()
+
+            for start in range(0, len(object_uri_list), chunk_size):
+                existing_uri_set.update(
+                    await self._find_graph_uri_list(graph_uri, object_uri_list[start:start + chunk_size]))
+
+            for object_uri in object_uri_list:
+                if object_uri not in existing_uri_set:
+                    return VitalGraphStatus(-1,
+                                            f"Error: Object {object_uri} not found in provided graph.")
+
+        for start in range(0, len(graph_object_list), chunk_size):
+
+            chunk = graph_object_list[start:start + chunk_size]
+
+            update_query = self.graph_service._build_replace_update(graph_uri, chunk)
+
+            try:
+                await self.rest_manager.sparql_update(update_query)
+            except Exception as e:
+                return self.graph_service._partial_update_status(start, len(chunk), len(graph_object_list), e)
+
+        status = VitalGraphStatus(0, "All graph objects updated successfully.")
+        status.updated_objects = len(graph_object_list)
+
+        return status
+
+    async def get_object(self, object_uri: str, *,
+                         graph_id: str = None,
+                         global_graph: bool = False,
+                         account_id: str | None = None,
+                         safety_check: bool = True) -> G:
+
+        if graph_id is None:
+            raise ValueError("Error: graph_uri is not set.")
+
+        graph_uri = self.get_graph_uri(
+            graph_id=graph_id,
+            account_id=account_id,
+            is_global=global_graph
+        )
+
+        # exception if graph doesn't exist
+        name_graph = await self.get_graph(graph_id,
+                                          account_id=account_id,
+                                          global_graph=global_graph)
+
+        object_map = await self._get_object_map(graph_uri, [object_uri])
+
+        return object_map.get(str(object_uri))
+
+    async def get_object_list(self, object_uri_list: List[str], *,
+                              graph_id: str = None,
+                              global_graph: bool = False,
+                              account_id: str | None = None,
+                              safety_check: bool = True) -> ResultList:
+
+        if graph_id is None:
+            raise ValueError("Error: graph_uri is not set.")
+
+        graph_uri = self.get_graph_uri(
+            graph_id=graph_id,
+            account_id=account_id,
+            is_global=global_graph
+        )
+
+        # exception if graph doesn't exist
+        name_graph = await self.get_graph(graph_id,
+                                          account_id=account_id,
+                                          global_graph=global_graph)
+
+        object_map = await self._get_object_map(graph_uri, object_uri_list)
+
+        result_list = ResultList()
+
+        for object_uri in object_uri_list:
+
+            graph_object = object_map.get(str(object_uri))
+
+            if graph_object is None:
+                raise ValueError(f"Error: Object {object_uri} not found in any provided graphs.")
+
+            result_list.add_result(graph_object)
+
+        return result_list
+
+    async def delete_object(self, object_uri: str, *,
+                            graph_id: str = None,
+                            global_graph: bool = False,
+                            account_id: str | None = None,
+                            safety_check: bool = True) -> VitalGraphStatus:
+
+        status = await self.delete_object_list([object_uri],
+                                               graph_id=graph_id,
+                                               global_graph=global_graph,
+                                               account_id=account_id)
+
+        if status.status == 0:
+            return VitalGraphStatus(0, "Graph object deleted successfully.")
+
+        return status
+
+    async def delete_object_list(self, object_uri_list: List[str], *,
+                                 graph_id: str = None,
+                                 global_graph: bool = False,
+                                 account_id: str | None = None,
+                                 safety_check: bool = True) -> VitalGraphStatus:
+
+        if graph_id is None:
+            return VitalGraphStatus(-1, "Error: graph_uri is not set.")
+
+        graph_uri = self.get_graph_uri(
+            graph_id=graph_id,
+            account_id=account_id,
+            is_global=global_graph
+        )
+
+        # exception if graph doesn't exist
+        name_graph = await self.get_graph(graph_id,
+                                          account_id=account_id,
+                                          global_graph=global_graph)
+
+        object_uri_list = [str(object_uri) for object_uri in object_uri_list]
+
+        existing_uri_set = set(await self._find_graph_uri_list(graph_uri, object_uri_list))
+
+        for object_uri in object_uri_list:
+            if object_uri not in existing_uri_set:
+                return VitalGraphStatus(-1,
+                                        f"Error: Object {object_uri} not found in any provided graphs.")
+
+        values_clause = " ".join(f"<{uri}>" for uri in object_uri_list)
+
+        delete_query = f"""
+                DELETE {{
+                    GRAPH <{graph_uri}> {{
+                        ?s ?p ?o .
+                    }}
+                }}
+                WHERE {{
+                    GRAPH <{graph_uri}> {{
+                        VALUES ?s {{ {values_clause} }}
+                        ?s ?p ?o .
+                    }}
+                }}
+                """
+
+        try:
+            await self.rest_manager.sparql_update(delete_query)
+        except Exception as e:
+            return VitalGraphStatus(-1, f"Error deleting objects: {str(e)}")
+
+        return VitalGraphStatus(0, "All graph objects deleted successfully.")
+
+    async def query(self, graph_id: str, sparql_query: str, uri_binding='uri', *,
+                    limit=100,
+                    offset=0,
+                    resolve_objects=True,
+                    global_graph: bool = False,
+                    account_id: str | None = None,
+                    safety_check: bool = True) -> ResultList | VitalGraphStatus:
+
+        if graph_id is None:
+            return VitalGraphStatus(-1, "Error: graph_uri is not set.")
+
+        graph_uri = self.get_graph_uri(
+            graph_id=graph_id,
+            account_id=account_id,
+            is_global=global_graph
+        )
+
+        # exception if graph doesn't exist
+        name_graph = await self.get_graph(graph_id,
+                                          account_id=account_id,
+                                          global_graph=global_graph)
+
+        query = self.graph_service._build_query(graph_uri, sparql_query, uri_binding, limit, offset)
+
+        results = await self.rest_manager.sparql_select(query)
+
+        object_uri_list = [result[uri_binding]["value"] for result in results["results"]["bindings"]]
+
+        if not object_uri_list:
+            return ResultList()
+
+        if resolve_objects:
+            return await self.get_object_list(object_uri_list,
+                                              graph_id=graph_id,
+                                              account_id=account_id,
+                                              global_graph=global_graph)
+
+        result_list = ResultList()
+
+        for uri in object_uri_list:
+            result_list.add_result(VirtuosoGraphService._uri_statement(uri))
+
+        return result_list
@@ -0,0 +1,180 @@
+import asyncio
+import logging
+from rdflib import Graph
+import aiohttp
+
+
+# handle rest calls from an event loop
+
+class AsyncVirtuosoRESTManager:
+    """asyncio transport for the Virtuoso SPARQL and graph CRUD endpoints.
+
+    The async counterpart of VirtuosoRESTManager: one aiohttp session
+    with a bounded keep-alive pool and digest auth, and the same retry
+    policy for dropped connections and overload status codes: up to
+    max_retries retries after the first attempt, none for SPARQL
+    updates.  The session is opened on first use so it belongs to the
+    running loop.  An aiohttp session cannot be used from another loop,
+    so when the manager is used from a new loop, e.g. a later
+    asyncio.run, a new session is opened for it.  close() closes the
+    session of the loop it is awaited in.
+    """
+
+    # not retried on 500, virtuoso reports query errors with it
+    RETRY_STATUS_CODES = (429, 502, 503, 504)
+
+    def __init__(self, sparql_endpoint: str, graph_crud_endpoint: str,
+                 username: str | None = None, password: str | None = None, *,
+                 pool_size: int = 10,
+                 max_retries: int = 3,
+                 backoff_factor: float = 0.5,
+                 timeout=(10, 300)):
+
+        self.sparql_endpoint = sparql_endpoint
+        self.graph_crud_endpoint = graph_crud_endpoint
+        self.username = username
+        self.password = password
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.timeout = timeout
+
+        self._session = None
+        self._session_loop = None
+
+        self._request_count = 0
+
+    def get_request_count(self) -> int:
+        return self._request_count
+
+    def _get_session(self) -> aiohttp.ClientSession:
+
+        loop = asyncio.get_running_loop()
+
+        if self._session is not None and self._session_loop is not loop:
+            # bound to a loop that is no longer the current one, its
+            # connections are released when that loop's transports close
+            logging.info("Opening a new session for a new event loop")
+            self._session = None
+
+        if self._session is None:
+
+            connect_timeout, read_timeout = self.timeout
+
+            middlewares = ()
+
+            if self.username is not None:
+                middlewares = (aiohttp.DigestAuthMiddleware(self.username, self.password),)
+
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+                timeout=aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout),
+                middlewares=middlewares
+            )
+
+            self._session_loop = loop
+
+        return self._session
+
+    async def send_with_retries(self, method, url, *,
+                                data=None,
+                                headers=None,
+                                max_retries=None) -> aiohttp.ClientResponse:
+        """
+        Sends a request on the pooled session, retrying dropped connections
+        and overload responses with exponential backoff.  The body is read
+        before returning so the connection is back in the pool.
+
+        :param method: HTTP method, e.g., 'PUT', 'POST'
+        :param url: URL to send the request to
+        :param data: Form dict or raw body to be sent in the request
+        :param headers: Headers for the request
+        :param max_retries: Maximum number of retries after the first attempt
+        :return: Response object
+        """
+
+        if max_retries is None:
+            max_retries = self.max_retries
+
+        session = self._get_session()
+
+        attempt = 0
+
+        while True:
+
+            self._request_count += 1
+
+            try:
+                async with session.request(method, url, data=data, headers=headers) as response:
+                    await response.read()
+            # connect failures and connections the server closed mid response
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt >= max_retries:
+                    logging.error(f"Final failure after {attempt + 1} attempts: {e!r}")
+                    raise
+                logging.warning(f"Retry attempt {attempt + 1} for {url} failed with error: {e!r}")
+            else:
+                if response.status not in self.RETRY_STATUS_CODES or attempt >= max_retries:
+                    return response
+
+            await asyncio.sleep(self.backoff_factor * (2 ** attempt))
+
+            attempt += 1
+
+    async def _sparql_request(self, param: str, query: str, accept: str,
+                              max_retries: int | None = None) -> aiohttp.ClientResponse:
+
+        headers = {
+            'Accept': accept
+        }
+
+        response = await self.send_with_retries("POST", self.sparql_endpoint,
+                                                data={param: query},
+                                                headers=headers,
+                                                max_retries=max_retries)
+
+        response.raise_for_status()
+
+        return response
+
+    async def sparql_select(self, query: str) -> dict:
+        """Run a SELECT query and return the parsed SPARQL JSON results."""
+        response = await self._sparql_request('query', query, 'application/sparql-results+json')
+        return await response.json(content_type=None)
+
+    async def sparql_ask(self, query: str) -> bool:
+        response = await self._sparql_request('query', query, 'application/sparql-results+json')
+        return (await response.json(content_type=None))["boolean"]
+
+    async def sparql_construct(self, query: str) -> Graph:
+        """Run a CONSTRUCT query and return the result as an rdflib Graph."""
+        response = await self._sparql_request('query', query, 'application/n-triples')
+        g = Graph()
+        g.parse(data=await response.text(encoding='utf-8'), format='nt')
+        return g
+
+    async def sparql_update(self, update: str):
+        """Run an update once, it is not replayed since a failed request may have been applied."""
+        await self._sparql_request('update', update, '*/*', max_retries=0)
+
+    async def graph_put(self, graph_uri: str, rdf_string: str,
+                        content_type: str = 'application/n-triples') -> aiohttp.ClientResponse:
+        """Replace the contents of a graph using the graph CRUD endpoint."""
+
+        headers = {
+            'Content-Type': content_type
+        }
+
+        return await self.send_with_retries("PUT", self.graph_crud_endpoint + "?graph-uri=" + graph_uri,
+                                            data=rdf_string.encode('utf-8'),
+                                            headers=headers)
+
+    async def graph_delete(self, graph_uri: str) -> aiohttp.ClientResponse:
+        return await self.send_with_retries("DELETE", self.graph_crud_endpoint + "?graph-uri=" + graph_uri)
+
+    async def close(self):
+        if self._session is not None:
+            if self._session_loop is asyncio.get_running_loop():
+                await self._session.close()
+            self._session = None
+            self._session_loop = None
@@ -1,6 +1,193 @@
+import logging
+import threading
+import time
+from typing import Iterator, Tuple
+from rdflib import Graph
+import requests
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPDigestAuth
+from requests.exceptions import ChunkedEncodingError, ConnectionError as RequestsConnectionError
+from urllib3.exceptions import ProtocolError
+from vital_ai_vitalsigns.service.graph.virtuoso.rest.sparql_stream import iter_json_bindings, iter_ntriples
 
-class VirtuosoRESTManager:
-    pass
 
 # handle rest calls
 
+class VirtuosoRESTManager:
+    """Shared HTTP transport for the Virtuoso SPARQL and graph CRUD endpoints.
+
+    All calls go through one requests.Session with a pooled keep-alive
+    adapter.  The digest auth handler keeps the server nonce, so after the
+    first challenge requests are authorized up front instead of paying a
+    401 round trip each time.  Connection failures and overload status
+    codes are retried with exponential backoff, up to max_retries times
+    after the first attempt, in send_with_retries only.  SPARQL updates
+    are not retried, a failed update may still have been applied.
+    """
+
+    # not retried on 500, virtuoso reports query errors with it
+    RETRY_STATUS_CODES = (429, 502, 503, 504)
+
+    # bytes read at a time from streamed responses
+    STREAM_CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, sparql_endpoint: str, graph_crud_endpoint: str,
+                 username: str | None = None, password: str | None = None, *,
+                 pool_size: int = 10,
+                 max_retries: int = 3,
+                 backoff_factor: float = 0.5,
+                 timeout=(10, 300)):
+
+        self.sparql_endpoint = sparql_endpoint
+        self.graph_crud_endpoint = graph_crud_endpoint
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.timeout = timeout
+
+        self._auth = HTTPDigestAuth(username, password) if username is not None else None
+
+        # retries are made by send_with_retries, not by the adapter
+        self._adapter = HTTPAdapter(pool_connections=pool_size,
+                                    pool_maxsize=pool_size,
+                                    max_retries=0)
+
+        self._session = requests.Session()
+        self._session.mount("https://", self._adapter)
+        self._session.mount("http://", self._adapter)
+
+        self._request_count = 0
+        self._count_lock = threading.Lock()
+
+    def get_request_count(self) -> int:
+        return self._request_count
+
+    def send_with_retries(self, method, url, *,
+                          data=None,
+                          headers=None,
+                          auth=None,
+                          timeout=None,
+                          max_retries=None,
+                          stream=False) -> requests.Response:
+        """
+        Sends a request on the pooled session, retrying dropped connections
+        and overload responses with exponential backoff.
+
+        :param method: HTTP method, e.g., 'PUT', 'POST'
+        :param url: URL to send the request to
+        :param data: Data to be sent in the request
+        :param headers: Headers for the request
+        :param auth: Authentication information, defaults to the shared digest auth
+        :param timeout: Tuple of (connect timeout, read timeout)
+        :param max_retries: Maximum number of retries after the first attempt
+        :param stream: Leave the response body unread, to be iterated by the caller
+        :return: Response object
+        """
+
+        if auth is None:
+            auth = self._auth
+
+        if timeout is None:
+            timeout = self.timeout
+
+        if max_retries is None:
+            max_retries = self.max_retries
+
+        attempt = 0
+
+        while True:
+
+            with self._count_lock:
+                self._request_count += 1
+
+            try:
+                response = self._session.request(
+                    method=method,
+                    url=url,
+                    data=data,
+                    headers=headers,
+                    auth=auth,
+                    timeout=timeout,
+                    stream=stream
+                )
+            # connect failures and connections the server closed mid response
+            except (ChunkedEncodingError, ProtocolError, RequestsConnectionError) as e:
+                if attempt >= max_retries:
+                    logging.error(f"Final failure after {attempt + 1} attempts: {e}")
+                    raise
+                logging.warning(f"Retry attempt {attempt + 1} for {url} failed with error: {e}")
+            else:
+                if response.status_code not in self.RETRY_STATUS_CODES or attempt >= max_retries:
+                    return response
+                response.close()
+
+            time.sleep(self.backoff_factor * (2 ** attempt))
+
+            attempt += 1
+
+    def _sparql_request(self, param: str, query: str, accept: str, stream: bool = False,
+                        max_retries: int | None = None) -> requests.Response:
+
+        headers = {
+            'Accept': accept,
+            'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8'
+        }
+
+        response = self.send_with_retries("POST", self.sparql_endpoint,
+                                          data={param: query},
+                                          headers=headers,
+                                          stream=stream,
+                                          max_retries=max_retries)
+
+        if not response.ok:
+            response.close()
+
+        response.raise_for_status()
+
+        return response
+
+    def sparql_select(self, query: str) -> dict:
+        """Run a SELECT query and return the parsed SPARQL JSON results."""
+        return self._sparql_request('query', query, 'application/sparql-results+json').json()
+
+    def sparql_ask(self, query: str) -> bool:
+        return self._sparql_request('query', query, 'application/sparql-results+json').json()["boolean"]
+
+    def sparql_construct(self, query: str) -> Graph:
+        """Run a CONSTRUCT query and return the result as an rdflib Graph."""
+        response = self._sparql_request('query', query, 'application/rdf+xml')
+        g = Graph()
+        g.parse(data=response.content, format='xml')
+        return g
+
+    def iter_sparql_select(self, query: str) -> Iterator[dict]:
+        """Run a SELECT query and yield the result bindings as they are read."""
+        response = self._sparql_request('query', query, 'application/sparql-results+json', stream=True)
+        with response:
+            yield from iter_json_bindings(response.iter_content(self.STREAM_CHUNK_SIZE))
+
+    def iter_sparql_construct(self, query: str) -> Iterator[Tuple]:
+        """Run a CONSTRUCT query and yield the result triples as they are read."""
+        response = self._sparql_request('query', query, 'application/n-triples', stream=True)
+        with response:
+            yield from iter_ntriples(response.iter_content(self.STREAM_CHUNK_SIZE))
+
+    def sparql_update(self, update: str):
+        """Run an update once, it is not replayed since a failed request may have been applied."""
+        self._sparql_request('update', update, '*/*', max_retries=0)
+
+    def graph_put(self, graph_uri: str, rdf_string: str, content_type: str = 'application/n-triples') -> requests.Response:
+        """Replace the contents of a graph using the graph CRUD endpoint."""
+
+        headers = {
+            'Content-Type': content_type
+        }
+
+        return self.send_with_retries("PUT", self.graph_crud_endpoint + "?graph-uri=" + graph_uri,
+                                      data=rdf_string.encode('utf-8'),
+                                      headers=headers)
+
+    def graph_delete(self, graph_uri: str) -> requests.Response:
+        return self.send_with_retries("DELETE", self.graph_crud_endpoint + "?graph-uri=" + graph_uri)
+
+    def close(self):
+        self._session.close()
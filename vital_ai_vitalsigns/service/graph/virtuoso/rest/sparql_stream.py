@@ -0,0 +1,149 @@
+import codecs
+import json
+import re
+from typing import Iterable, Iterator, Tuple, List
+from rdflib.plugins.parsers.ntriples import W3CNTriplesParser
+
+
+# incremental parsers for SPARQL responses read in chunks from the network,
+# results are yielded as soon as they are complete so memory stays
+# bounded by the chunk size and the largest single result
+
+_BINDINGS_START = re.compile(r'"bindings"\s*:\s*\[')
+
+_json_decoder = json.JSONDecoder()
+
+
+def _iter_text(chunks: Iterable[bytes]) -> Iterator[str]:
+
+    decoder = codecs.getincrementaldecoder('utf-8')()
+
+    for chunk in chunks:
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+
+    text = decoder.decode(b'', final=True)
+
+    if text:
+        yield text
+
+
+def iter_json_bindings(chunks: Iterable[bytes]) -> Iterator[dict]:
+    """Yield the bindings of a SPARQL JSON SELECT result one at a time.
+
+    Only the bindings array is parsed, the head and any other members of
+    the result are skipped.
+    """
+
+    text_iter = _iter_text(chunks)
+
+    buffer = ""
+
+    # find the start of the bindings array
+    while True:
+        match = _BINDINGS_START.search(buffer)
+        if match:
+            buffer = buffer[match.end():]
+            break
+        chunk = next(text_iter, None)
+        if chunk is None:
+            raise ValueError("SPARQL JSON result has no bindings.")
+        # keep enough of the tail to match a key split across chunks
+        buffer = buffer[-32:] + chunk
+
+    position = 0
+
+    while True:
+
+        # skip separators between bindings
+        while position < len(buffer) and buffer[position] in ' \t\r\n,':
+            position += 1
+
+        if position < len(buffer):
+
+            if buffer[position] == ']':
+                return
+
+            try:
+                binding, end = _json_decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                # binding not complete yet, read more
+                binding = None
+
+            if binding is not None:
+                yield binding
+                position = end
+                continue
+
+        chunk = next(text_iter, None)
+
+        if chunk is None:
+            raise ValueError("SPARQL JSON result ended inside the bindings.")
+
+        buffer = buffer[position:] + chunk
+        position = 0
+
+
+class _TripleSink:
+
+    def __init__(self):
+        self.triples = []
+
+    def triple(self, s, p, o):
+        self.triples.append((s, p, o))
+
+
+def iter_ntriples(chunks: Iterable[bytes]) -> Iterator[Tuple]:
+    """Yield the triples of an N-Triples response one line at a time."""
+
+    sink = _TripleSink()
+
+    parser = W3CNTriplesParser(sink)
+
+    # blank node labels are shared across lines
+    bnode_context = {}
+
+    pending = ""
+
+    for text in _iter_text(chunks):
+
+        lines = (pending + text).split('\n')
+
+        pending = lines.pop()
+
+        for line in lines:
+            parser.line = line.rstrip('\r')
+            parser.parseline(bnode_context=bnode_context)
+
+        yield from sink.triples
+
+        sink.triples.clear()
+
+    if pending.strip():
+        parser.line = pending
+        parser.parseline(bnode_context=bnode_context)
+        yield from sink.triples
+
+
+def group_by_subject(triples: Iterable[Tuple]) -> Iterator[Tuple[object, List[Tuple]]]:
+    """Group consecutive triples with the same subject.
+
+    Triples must arrive ordered by subject for each subject to be yielded
+    once, otherwise a subject is yielded again for each separate run.
+    """
+
+    subject = None
+    group = []
+
+    for triple in triples:
+
+        if group and triple[0] != subject:
+            yield subject, group
+            group = []
+
+        subject = triple[0]
+        group.append(triple)
+
+    if group:
+        yield subject, group
@@ -1,22 +1,19 @@
 import logging
 import time
-from typing import List, TypeVar
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, TypeVar, Iterator, Tuple
 import pyodbc
 import rdflib.plugins.sparql.aggregates
-import requests
-from SPARQLWrapper import SPARQLWrapper, DIGEST, JSON, POST
 from rdflib import Graph, URIRef, Literal
-from requests.adapters import HTTPAdapter
-from requests.auth import HTTPDigestAuth
-from requests.exceptions import ChunkedEncodingError
-from urllib3 import Retry
-from urllib3.exceptions import ProtocolError
+from vital_ai_vitalsigns.metaql.aggregate.metaql_aggregate import MetaQLAggregate
 from vital_ai_vitalsigns.metaql.arc.metaql_arc import ArcRoot
 from vital_ai_vitalsigns.metaql.query.query_builder import QueryBuilder, AndConstraintList, ClassConstraint
+from vital_ai_vitalsigns.model.GraphObject import GraphObject
 from vital_ai_vitalsigns.ontology.ontology import Ontology
 from vital_ai_vitalsigns.query.metaql_result import MetaQLResult
 from vital_ai_vitalsigns.query.result_list import ResultList
 from vital_ai_vitalsigns.query.solution import Solution
+from vital_ai_vitalsigns.query.solution_assembler import SolutionAssembler
 from vital_ai_vitalsigns.query.solution_list import SolutionList
 from vital_ai_vitalsigns.service.graph.binding import Binding, BindingValueType
 from vital_ai_vitalsigns.service.graph.graph_object_generator import GraphObjectGenerator
@@ -25,8 +22,16 @@ from vital_ai_vitalsigns.service.graph.graph_service_constants import VitalGraph
 from vital_ai_vitalsigns.service.graph.graph_service_status import GraphServiceStatus, GraphServiceStatusType
 from vital_ai_vitalsigns.service.vital_name_graph import VitalNameGraph
 from vital_ai_vitalsigns.service.graph.utils.virtuoso_utils import VirtuosoUtils
+from vital_ai_vitalsigns.service.graph.virtuoso.rest.rest_manager import VirtuosoRESTManager
+from vital_ai_vitalsigns.service.graph.virtuoso.rest.sparql_stream import group_by_subject
 from vital_ai_vitalsigns.service.graph.vital_graph_status import VitalGraphStatus
-from vital_ai_vitalsigns.service.metaql.metaql_sparql_builder import MetaQLSparqlBuilder
+from vital_ai_vitalsigns.service.metaql.metaql_aggregate_impl import build_aggregate_sparql, \
+    build_aggregation_result, AGGREGATE_VALUE_BINDING
+from vital_ai_vitalsigns.service.metaql.metaql_arc_optimizer import MetaQLArcOptimizer, MetaQLGraphStatistics, \
+    MetaQLStatisticsCache
+from vital_ai_vitalsigns.service.metaql.metaql_pagination import build_count_sparql, build_cursor_filter, \
+    decode_cursor, cursor_after, COUNT_BINDING
+from vital_ai_vitalsigns.service.metaql.metaql_plan_cache import MetaQLPlanCache
 from vital_ai_vitalsigns.service.metaql.metaql_sparql_impl import MetaQLSparqlImpl
 from vital_ai_vitalsigns.utils.uri_generator import URIGenerator
 from vital_ai_vitalsigns.config.vitalsigns_config import GraphDatabaseConfig
@@ -40,33 +45,16 @@ from vital_ai_vitalsigns.metaql.metaql_query import GraphQuery as MetaQLGraphQue
 G = TypeVar('G', bound='GraphObject')
 
 
-class CustomHTTPDigestAuth(HTTPDigestAuth):
-    def handle_401(self, r, **kwargs):
-        # Close the connection when a 401 Unauthorized is encountered
-        # try to avoid the issue with chunked transfer exception
-        logging.info(f"HTTPDigestAuth for {r.url}")
-
-        r.request.headers['Connection'] = 'close'
-
-        if hasattr(r.raw, 'release_conn'):
-            logging.info(f"Releasing connection for {r.url}")
-            r.raw.release_conn()
-
-        return super().handle_401(r, **kwargs)
-
+class VirtuosoGraphService(VitalGraphService):
 
-class CustomHTTPAdapter(HTTPAdapter):
-    def send(self, request, **kwargs):
-        try:
-            logging.info(f"Adapter Sending request to {request.url}")
-            return super().send(request, **kwargs)
-        # except (ChunkedEncodingError, ProtocolError) as e:
-        except Exception as e:
-            logging.info(f"Error: {e}, retrying...")
-            raise
+    # objects per request in update_object_list
+    update_chunk_size = 1_000
 
+    # objects per request in bulk retrieval
+    retrieve_chunk_size = 1_000
 
-class VirtuosoGraphService(VitalGraphService):
+    # graphs queried at once by a multi graph metaql query
+    graph_query_workers = 8
 
     def __init__(self, config: GraphDatabaseConfig, **kwargs):
         # Extract configuration values from the database config
@@ -84,7 +72,26 @@ class VirtuosoGraphService(VitalGraphService):
         else:
             self.sparql_auth_endpoint = None
             self.graph_crud_auth_endpoint = None
-            
+
+        # shared keep-alive transport used by all endpoint calls
+        self.rest_manager = VirtuosoRESTManager(
+            self.sparql_auth_endpoint,
+            self.graph_crud_auth_endpoint,
+            self.username,
+            self.password,
+            pool_size=config.pool_size,
+            max_retries=config.max_retries,
+            backoff_factor=config.retry_backoff_factor
+        )
+
+        # compiled metaql graph query plans, keyed by query shape
+        self.metaql_plan_cache = MetaQLPlanCache(maxsize=config.metaql_plan_cache_size)
+
+        # class statistics per segment for ordering metaql query terms
+        self.metaql_optimize_order = config.metaql_optimize_order
+        self.metaql_explain_order = config.metaql_explain_order
+        self.metaql_statistics_cache = MetaQLStatisticsCache()
+
         super().__init__(config, **kwargs)
 
     # keep cache of graphs/namespaces
@@ -103,15 +110,8 @@ class VirtuosoGraphService(VitalGraphService):
                 }}
             """
 
-        sparql = SPARQLWrapper(self.sparql_auth_endpoint)
-        sparql.setCredentials(self.username, self.password)
-        sparql.setHTTPAuth(DIGEST)
-
-        sparql.setQuery(query)
-        sparql.setMethod(POST)
-        sparql.setReturnFormat(JSON)
-        result = sparql.query().convert()
-        return result["boolean"]
+        result = self.rest_manager.sparql_ask(query)
+        return result
 
     def _find_graph_uri_list(self, graph_uri: str, object_uri_list: List[str]) -> List[str]:
 
@@ -128,15 +128,7 @@ class VirtuosoGraphService(VitalGraphService):
                 }}
                 """
 
-        sparql = SPARQLWrapper(self.sparql_auth_endpoint)
-        sparql.setCredentials(self.username, self.password)
-        sparql.setHTTPAuth(DIGEST)
-
-        sparql.setQuery(query)
-        sparql.setMethod(POST)
-        sparql.setReturnFormat(JSON)
-
-        results = sparql.query().convert()
+        results = self.rest_manager.sparql_select(query)
 
         existing_uris = {result['s']['value'] for result in results['results']['bindings']}
 
@@ -155,14 +147,7 @@ class VirtuosoGraphService(VitalGraphService):
             }}
         """
 
-        sparql = SPARQLWrapper(self.sparql_auth_endpoint)
-        sparql.setCredentials(self.username, self.password)
-        sparql.setHTTPAuth(DIGEST)
-
-        sparql.setQuery(query_count_subjects)
-        sparql.setMethod('POST')
-        sparql.setReturnFormat(JSON)
-        results = sparql.query().convert()
+        results = self.rest_manager.sparql_select(query_count_subjects)
 
         count = int(results['results']['bindings'][0]['count']['value'])
 
@@ -188,17 +173,9 @@ class VirtuosoGraphService(VitalGraphService):
                    }}
                    """
 
-        sparql = SPARQLWrapper(self.sparql_auth_endpoint)
-        sparql.setCredentials(self.username, self.password)
-        sparql.setHTTPAuth(DIGEST)
-
-        sparql.setQuery(query)
-        sparql.setMethod(POST)
-        sparql.setReturnFormat(JSON)
+        result = self.rest_manager.sparql_ask(query)
 
-        result = sparql.query().convert()
-
-        if result["boolean"]:
+        if result:
 
             sq = (
                 QueryBuilder.select_query()
@@ -280,15 +257,7 @@ class VirtuosoGraphService(VitalGraphService):
              SELECT DISTINCT ?g WHERE { GRAPH ?g {?s ?p ?o} } ORDER BY ?g
          """
 
-        sparql = SPARQLWrapper(self.sparql_auth_endpoint)
-        sparql.setCredentials(self.username, self.password)
-        sparql.setHTTPAuth(DIGEST)
-
-        sparql.setQuery(query)
-        sparql.setMethod(POST)
-        sparql.setReturnFormat(JSON)
-
-        results = sparql.query().convert()
+        results = self.rest_manager.sparql_select(query)
 
         graph_uri_list = []
 
@@ -314,7 +283,7 @@ class VirtuosoGraphService(VitalGraphService):
                         ?s <http://vital.ai/ontology/vital-core#hasSegmentNamespace> "{namespace}"^^xsd:string .
                         ?s <http://vital.ai/ontology/vital-core#hasSegmentID> "{graph_id}"^^xsd:string .
                         ?s <http://vital.ai/ontology/vital-core#isSegmentGlobal> ?global .
-                        
+
                         ?s <http://vital.ai/ontology/vital-core#vitaltype> <http://vital.ai/ontology/vital-core#VitalSegment> .
                         ?s ?p ?o .
                    }}
@@ -325,15 +294,7 @@ class VirtuosoGraphService(VitalGraphService):
 
         # logging.info(query)
 
-        sparql = SPARQLWrapper(self.sparql_auth_endpoint)
-        sparql.setCredentials(self.username, self.password)
-        sparql.setHTTPAuth(DIGEST)
-
-        sparql.setQuery(query)
-        sparql.setMethod(POST)
-        sparql.setReturnFormat(JSON)
-
-        results = sparql.query().convert()
+        results = self.rest_manager.sparql_select(query)
 
         for result in results["results"]["bindings"]:
             is_global = result["global"]["value"]
@@ -342,7 +303,6 @@ class VirtuosoGraphService(VitalGraphService):
 
         return False
 
-
     # TODO return value for initialized vs error
     def initialize_service(self) -> bool:
 
@@ -365,17 +325,9 @@ class VirtuosoGraphService(VitalGraphService):
                 }}
                 """
 
-        sparql = SPARQLWrapper(self.sparql_auth_endpoint)
-        sparql.setCredentials(self.username, self.password)
-        sparql.setHTTPAuth(DIGEST)
-
-        sparql.setQuery(query)
-        sparql.setMethod('POST')
-        sparql.setReturnFormat('json')
+        result = self.rest_manager.sparql_ask(query)
 
-        result = sparql.query().convert()
-
-        if result["boolean"]:
+        if result:
             logging.info(f"target graph uri exists: {target_graph_uri}")
             return False
 
@@ -421,20 +373,7 @@ class VirtuosoGraphService(VitalGraphService):
 
         logging.info(f"{rdf_string}")
 
-        endpoint_url = f"{self.graph_crud_auth_endpoint}?graph-uri={target_graph_uri}"
-
-        headers = {
-            'Content-Type': 'application/n-triples',
-            'Content-Length': str(len(rdf_string)),
-            'Connection': 'close'
-        }
-
-        response = requests.put(
-            endpoint_url,
-            data=rdf_string,
-            headers=headers,
-            auth=HTTPDigestAuth(self.username, self.password)
-        )
+        response = self.rest_manager.graph_put(target_graph_uri, rdf_string)
 
         if response.status_code in [200, 201]:
             logging.info(f"target graph uri initialized: {target_graph_uri}")
@@ -464,17 +403,9 @@ class VirtuosoGraphService(VitalGraphService):
                     }}
                     """
 
-            sparql = SPARQLWrapper(self.sparql_auth_endpoint)
-            sparql.setCredentials(self.username, self.password)
-            sparql.setHTTPAuth(DIGEST)
-
-            sparql.setQuery(query)
-            sparql.setMethod('POST')
-            sparql.setReturnFormat('json')
-
-            result = sparql.query().convert()
+            result = self.rest_manager.sparql_ask(query)
 
-            if not result["boolean"]:
+            if not result:
                 logging.info(f"target graph uri does not exist: {target_graph_uri}")
                 return False
 
@@ -549,9 +480,9 @@ class VirtuosoGraphService(VitalGraphService):
             }"""
 
         query = f"""
-            
+
             SELECT DISTINCT ?graphID, ?graphGlobal WHERE {{
-            
+
             GRAPH ?g {{
                 ?s <http://vital.ai/ontology/vital-core#hasSegmentNamespace> "{namespace}"^^xsd:string .
                 ?s <http://vital.ai/ontology/vital-core#hasSegmentID> ?graphID .
@@ -568,15 +499,7 @@ class VirtuosoGraphService(VitalGraphService):
 
         # logging.info(query)
 
-        sparql = SPARQLWrapper(self.sparql_auth_endpoint)
-        sparql.setCredentials(self.username, self.password)
-        sparql.setHTTPAuth(DIGEST)
-
-        sparql.setQuery(query)
-        sparql.setMethod(POST)
-        sparql.setReturnFormat(JSON)
-
-        results = sparql.query().convert()
+        results = self.rest_manager.sparql_select(query)
 
         name_graph_list = []
 
@@ -590,7 +513,6 @@ class VirtuosoGraphService(VitalGraphService):
 
             name_graph = VitalNameGraph(g_uri, graph_id=graph_id, is_global=graph_global)
 
-
             name_graph_list.append(name_graph)
 
         return name_graph_list
@@ -615,17 +537,9 @@ class VirtuosoGraphService(VitalGraphService):
                 }}
                 """
 
-        sparql = SPARQLWrapper(self.sparql_auth_endpoint)
-        sparql.setCredentials(self.username, self.password)
-        sparql.setHTTPAuth(DIGEST)
-
-        sparql.setQuery(query)
-        sparql.setMethod(POST)
-        sparql.setReturnFormat(JSON)
+        result = self.rest_manager.sparql_ask(query)
 
-        result = sparql.query().convert()
-
-        if result["boolean"]:
+        if result:
             return VitalNameGraph(graph_uri,
                                   graph_id=graph_id,
                                   account_id=account_id,
@@ -657,17 +571,9 @@ class VirtuosoGraphService(VitalGraphService):
                 }}
                 """
 
-        sparql = SPARQLWrapper(self.sparql_auth_endpoint)
-        sparql.setCredentials(self.username, self.password)
-        sparql.setHTTPAuth(DIGEST)
-
-        sparql.setQuery(query)
-        sparql.setMethod('POST')
-        sparql.setReturnFormat('json')
+        result = self.rest_manager.sparql_ask(query)
 
-        result = sparql.query().convert()
-
-        if result["boolean"]:
+        if result:
             return True
 
         vital_segment = VitalSegment()
@@ -685,20 +591,7 @@ class VirtuosoGraphService(VitalGraphService):
 
         rdf_string = vital_segment.to_rdf()
 
-        endpoint_url = f"{self.graph_crud_auth_endpoint}?graph-uri={graph_uri}"
-
-        headers = {
-            'Content-Type': 'application/rdf+xml',
-            'Content-Length': str(len(rdf_string)),
-            'Connection': 'close'
-        }
-
-        response = requests.put(
-            endpoint_url,
-            data=rdf_string,
-            headers=headers,
-            auth=HTTPDigestAuth(self.username, self.password)
-        )
+        response = self.rest_manager.graph_put(graph_uri, rdf_string)
 
         if response.status_code not in [200, 201]:
             response.raise_for_status()
@@ -708,11 +601,8 @@ class VirtuosoGraphService(VitalGraphService):
     # there is an occasional error with connections,
     # which seems to have something to do with the initial 401 auth failure and
     # subsequent auth with digest.
-    # setting headers seems to help
-    # trying to explicitly close the initial 401 connection
-    # so that a new connection is made
-    # there may be some race condition, which running locally may
-    # cause to happen more frequently.
+    # the rest manager keeps the digest nonce so the 401 happens once per
+    # session rather than once per request, and retries dropped connections
 
     def send_with_retries(
             self,
@@ -722,7 +612,7 @@ class VirtuosoGraphService(VitalGraphService):
             headers=None,
             auth=None,
             timeout=(10, 30),
-            max_retries=5
+            max_retries=None
     ):
         """
         Sends a request with retries on network-related errors.
@@ -733,49 +623,21 @@ class VirtuosoGraphService(VitalGraphService):
         :param headers: Headers for the request
         :param auth: Authentication information
         :param timeout: Tuple of (connect timeout, read timeout)
-        :param max_retries: Maximum number of retries on failure
+        :param max_retries: Maximum number of retries after the first attempt, the configured value when None
         :return: Response object or None if final attempt fails
         """
 
-        # Create session and mount the custom adapter with retry strategy
-        session = requests.Session()
-        retry_strategy = Retry(
-            total=max_retries,  # Retry up to max_retries times
-            backoff_factor=1,  # Backoff time (1 second)
-            status_forcelist=[429, 500, 502, 503, 504],  # Retry on these status codes
-            allowed_methods=[method.upper()],  # Retry for specified method
-        )
-        adapter = CustomHTTPAdapter(max_retries=retry_strategy)
-        session.mount("https://", adapter)
-        session.mount("http://", adapter)
-
-        # Retry loop for handling connection errors manually
-        for attempt in range(max_retries):
-            try:
-
-                logging.info(f"Attempt: {url} {attempt + 1}/{max_retries}")
-
-                response = session.request(
-                    method=method,
-                    url=url,
-                    data=data,
-                    headers=headers,
-                    auth=auth,
-                    timeout=timeout
-                )
-
-                return response
-
-            except (ChunkedEncodingError, ProtocolError, ConnectionError) as e:
-                logging.warning(f"Retry attempt {attempt + 1} failed with error: {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(1)  # Optional: Add backoff between retries
-                else:
-                    logging.error(f"Final failure after {max_retries} attempts: {e}")
-                    return None  # Return None if all retries fail
-            except Exception as e:
-                logging.error(f"Unhandled error: {e}")
-                return None
+        # pooled session shared by all calls of this service
+        try:
+            return self.rest_manager.send_with_retries(method, url,
+                                                       data=data,
+                                                       headers=headers,
+                                                       auth=auth,
+                                                       timeout=timeout,
+                                                       max_retries=max_retries)
+        except Exception as e:
+            logging.error(f"Request failed: {e}")
+            return None
 
     def create_graph(self, graph_id: str, *,
                      global_graph: bool = False,
@@ -791,23 +653,15 @@ class VirtuosoGraphService(VitalGraphService):
             is_global=global_graph
         )
 
-        sparql = SPARQLWrapper(self.sparql_auth_endpoint)
-        sparql.setCredentials(self.username, self.password)
-        sparql.setHTTPAuth(DIGEST)
-
         query = f"""
                 ASK WHERE {{
                     GRAPH <{graph_uri}> {{ ?s ?p ?o }}
                 }}
                 """
 
-        sparql.setQuery(query)
-        sparql.setMethod('POST')
-        sparql.setReturnFormat('json')
-
-        result = sparql.query().convert()
+        result = self.rest_manager.sparql_ask(query)
 
-        if result["boolean"]:
+        if result:
             raise ValueError(f"Graph with URI {graph_uri} already exists.")
 
         vital_segment = VitalSegment()
@@ -824,29 +678,12 @@ class VirtuosoGraphService(VitalGraphService):
 
         rdf_string = vital_segment.to_rdf()
 
-        endpoint_url = f"{self.graph_crud_auth_endpoint}?graph-uri={graph_uri}"
-
-        headers = {
-            'Content-Type': 'application/n-triples',
-            'Content-Length': str(len(rdf_string)),
-            'Connection': 'close'
-        }
-
-        response = self.send_with_retries(
-            method="PUT",
-            url=endpoint_url,
-            data=rdf_string,
-            headers=headers,
-            auth= CustomHTTPDigestAuth(self.username, self.password),
-            timeout=(10, 30),
-            max_retries=3
-        )
-
-        if response:
+        try:
+            response = self.rest_manager.graph_put(graph_uri, rdf_string)
             logging.info(response.status_code)
             logging.info(response.text)
-        else:
-            logging.info("Request failed after retries.")
+        except Exception as e:
+            logging.info(f"Request failed after retries: {e}")
 
         return True
 
@@ -873,25 +710,12 @@ class VirtuosoGraphService(VitalGraphService):
                 }}
                 """
 
-        sparql = SPARQLWrapper(self.sparql_auth_endpoint)
-        sparql.setCredentials(self.username, self.password)
-        sparql.setHTTPAuth(DIGEST)
-
-        sparql.setQuery(query)
-        sparql.setMethod('POST')
-        sparql.setReturnFormat('json')
-
-        result = sparql.query().convert()
+        result = self.rest_manager.sparql_ask(query)
 
-        if not result["boolean"]:
+        if not result:
             raise ValueError(f"Graph with URI {graph_uri} does not exist.")
 
-        endpoint_url = f"{self.graph_crud_auth_endpoint}?graph-uri={graph_uri}"
-
-        response = requests.delete(
-            endpoint_url,
-            auth=HTTPDigestAuth(self.username, self.password)
-        )
+        response = self.rest_manager.graph_delete(graph_uri)
 
         if response.status_code not in [200, 204]:
             response.raise_for_status()
@@ -930,15 +754,7 @@ class VirtuosoGraphService(VitalGraphService):
                 }}
                 """
 
-        sparql = SPARQLWrapper(self.sparql_auth_endpoint)
-        sparql.setCredentials(self.username, self.password)
-        sparql.setHTTPAuth(DIGEST)
-
-        sparql.setQuery(query_vital_segments)
-        sparql.setMethod('POST')
-        sparql.setReturnFormat('json')
-
-        results = sparql.query().convert()
+        results = self.rest_manager.sparql_select(query_vital_segments)
 
         # logging.info(results)
 
@@ -963,23 +779,10 @@ class VirtuosoGraphService(VitalGraphService):
 
         # logging.info(vital_segment.to_rdf())
 
-        endpoint_url = f"{self.graph_crud_auth_endpoint}?graph-uri={graph_uri}"
-
         rdf_string = vital_segment.to_rdf()
 
-        headers = {
-            'Content-Type': 'application/n-triples',
-            'Content-Length': str(len(rdf_string)),
-            'Connection': 'close'
-        }
-
         # put replaces graph with new data (thus deleting existing graph)
-        response = requests.put(
-            endpoint_url,
-            data=rdf_string,
-            headers=headers,
-            auth=HTTPDigestAuth(self.username, self.password)
-        )
+        response = self.rest_manager.graph_put(graph_uri, rdf_string)
 
         if response.status_code in [200, 201]:
             return True
@@ -1015,10 +818,9 @@ class VirtuosoGraphService(VitalGraphService):
         # sort by subject uri
         # count total unique subjects and throw exception if over some number?
 
+        # select ordered by subject so triples of an object arrive together
         query = f"""
-        CONSTRUCT {{
-            ?s ?p ?o .
-        }} 
+        SELECT ?s ?p ?o
         WHERE {{
             {{
                 SELECT DISTINCT ?s WHERE {{
@@ -1032,28 +834,20 @@ class VirtuosoGraphService(VitalGraphService):
                 ?s ?p ?o .
             }}
         }}
+        ORDER BY ?s
         """
 
         # print(query)
 
-        sparql = SPARQLWrapper(self.sparql_auth_endpoint)
-        sparql.setCredentials(self.username, self.password)
-        sparql.setHTTPAuth(DIGEST)
-
-        sparql.setQuery(query)
-        sparql.setMethod('POST')
-        sparql.setReturnFormat('rdf+xml')  # force getting graph back
-
-        # converts to rdflib graph because of CONSTRUCT
-        g = sparql.query().convert()
-
-        subjects = sorted(set(g.subjects()))
+        triples = ((URIRef(binding['s']['value']),
+                    URIRef(binding['p']['value']),
+                    VirtuosoUtils.binding_to_rdf_term(binding['o']))
+                   for binding in self.rest_manager.iter_sparql_select(query))
 
         result_list = ResultList()
 
-        for s in subjects:
-            triples = g.triples((s, None, None))
-            vitalsigns_object = vs.from_triples(triples)
+        for subject, subject_triples in group_by_subject(triples):
+            vitalsigns_object = vs.from_triples(subject_triples)
             result_list.add_result(vitalsigns_object)
 
         return result_list
@@ -1095,15 +889,8 @@ class VirtuosoGraphService(VitalGraphService):
                 }}
                 """
 
-        sparql = SPARQLWrapper(self.sparql_auth_endpoint)
-        sparql.setCredentials(self.username, self.password)
-        sparql.setHTTPAuth(DIGEST)
-
-        sparql.setQuery(query)
-        sparql.setMethod(POST)
-
         try:
-            sparql.query()
+            self.rest_manager.sparql_update(query)
 
             return VitalGraphStatus(0, "Graph object inserted successfully.")
 
@@ -1141,9 +928,7 @@ class VirtuosoGraphService(VitalGraphService):
             # todo return list of current uris
             return VitalGraphStatus(-1, f"Failed to insert graph objects.  One or more object uris already exists.")
 
-        rdf_data_list = [graph_object.to_rdf() for graph_object in
-                         graph_object_list]
-        rdf_data = "\n".join(rdf_data_list)
+        rdf_data = GraphObject.to_rdf_list(graph_object_list)
 
         query = f"""
                 INSERT DATA {{
@@ -1153,14 +938,8 @@ class VirtuosoGraphService(VitalGraphService):
                 }}
                 """
 
-        sparql = SPARQLWrapper(self.sparql_auth_endpoint)
-        sparql.setCredentials(self.username, self.password)
-        sparql.setHTTPAuth(DIGEST)
-        sparql.setQuery(query)
-        sparql.setMethod(POST)
-
         try:
-            sparql.query()
+            self.rest_manager.sparql_update(query)
             return VitalGraphStatus(0, "Graph objects inserted successfully.")
         except Exception as e:
             return VitalGraphStatus(-1, f"Failed to insert graph objects: {str(e)}")
@@ -1207,15 +986,8 @@ class VirtuosoGraphService(VitalGraphService):
                     }}
                 """
 
-        sparql = SPARQLWrapper(self.sparql_auth_endpoint)
-        sparql.setCredentials(self.username, self.password)
-        sparql.setHTTPAuth(DIGEST)
-        sparql.setMethod(POST)
-
-        sparql.setQuery(delete_query)
-
         try:
-            sparql.query()
+            self.rest_manager.sparql_update(delete_query)
         except Exception as e:
             return VitalGraphStatus(-1, f"Error deleting object: {str(e)}")
 
@@ -1229,10 +1001,8 @@ class VirtuosoGraphService(VitalGraphService):
                     }}
                 """
 
-        sparql.setQuery(insert_query)
-
         try:
-            sparql.query()
+            self.rest_manager.sparql_update(insert_query)
             return VitalGraphStatus(0, "Graph object updated successfully.")
         except Exception as e:
             return VitalGraphStatus(-1, f"Error inserting updated object: {str(e)}")
@@ -1242,7 +1012,14 @@ class VirtuosoGraphService(VitalGraphService):
                            upsert: bool = False,
                            global_graph: bool = False,
                            account_id: str | None = None,
-                           safety_check: bool = True) -> VitalGraphStatus:
+                           safety_check: bool = True,
+                           chunk_size: int | None = None) -> VitalGraphStatus:
+        """
+        Replace the objects in the graph, one request per chunk of chunk_size objects.
+        The update is not atomic: when a chunk fails the earlier chunks stay applied,
+        and the status reports how many objects were updated.
+        Of several objects with the same URI the last one is used.
+        """
 
         base_uri = self.base_uri
         namespace = self.namespace
@@ -1256,70 +1033,102 @@ class VirtuosoGraphService(VitalGraphService):
             is_global=global_graph
         )
 
-
         # exception if graph doesn't exist
         name_graph = self.get_graph(graph_id,
                                     account_id=account_id,
                                     global_graph=global_graph)
 
-        # todo check if objects exist
+        if chunk_size is None:
+            chunk_size = self.update_chunk_size
 
-        object_graph_map = {}
+        graph_object_list = self._unique_by_uri(graph_object_list)
 
-        for graph_object in graph_object_list:
-            object_uri = graph_object.URI
-            found = False
+        object_uri_list = [str(graph_object.URI) for graph_object in graph_object_list]
 
-            if self._find_graph(graph_uri, object_uri):
-                object_graph_map[object_uri] = graph_uri
-                found = True
+        # check all objects exist before changing anything
+        if not upsert:
 
-            if not found:
-                return VitalGraphStatus(-1,
-                                        f"Error: Object {object_uri} not found in provided graph.")
+            existing_uri_set = set()
 
-        for graph_object in graph_object_list:
+            for start in range(0, len(object_uri_list), chunk_size):
+                existing_uri_set.update(
+                    self._find_graph_uri_list(graph_uri, object_uri_list[start:start + chunk_size]))
 
-            object_uri = graph_object.URI
-            target_graph = object_graph_map[object_uri]
+            for object_uri in object_uri_list:
+                if object_uri not in existing_uri_set:
+                    return VitalGraphStatus(-1,
+                                            f"Error: Object {object_uri} not found in provided graph.")
 
-            delete_query = f"""
-                DELETE WHERE {{
-                    GRAPH <{target_graph}> {{
-                        <{object_uri}> ?p ?o .
-                    }}
-                }}
-            """
+        # one request per chunk replaces the old triples of the objects with the new ones
+        for start in range(0, len(graph_object_list), chunk_size):
 
-            sparql = SPARQLWrapper(self.sparql_auth_endpoint)
-            sparql.setCredentials(self.username, self.password)
-            sparql.setHTTPAuth(DIGEST)
+            chunk = graph_object_list[start:start + chunk_size]
 
-            sparql.setQuery(delete_query)
+            update_query = self._build_replace_update(graph_uri, chunk)
 
             try:
-                sparql.query()
+                self.rest_manager.sparql_update(update_query)
             except Exception as e:
-                return VitalGraphStatus(-1, f"Error deleting object {object_uri}: {str(e)}")
+                return self._partial_update_status(start, len(chunk), len(graph_object_list), e)
+
+        status = VitalGraphStatus(0, "All graph objects updated successfully.")
+        status.updated_objects = len(graph_object_list)
+
+        return status
+
+    @staticmethod
+    def _unique_by_uri(graph_object_list: List[G]) -> List[G]:
+
+        # the triples of two objects with one URI would be merged in a chunk
+        object_map = {}
+
+        for graph_object in graph_object_list:
+            object_map[str(graph_object.URI)] = graph_object
+
+        if len(object_map) == len(graph_object_list):
+            return graph_object_list
+
+        return list(object_map.values())
+
+    @staticmethod
+    def _partial_update_status(start: int, chunk_length: int, total: int, error: Exception) -> VitalGraphStatus:
+
+        # chunks before start were committed and are not rolled back
+        status = VitalGraphStatus(-1, f"Error updating objects {start} to {start + chunk_length}: {str(error)}. "
+                                      f"{start} of {total} objects were updated, the update is not atomic.")
+        status.updated_objects = start
+
+        return status
+
+    def _build_replace_update(self, graph_uri: str, graph_object_list: List[G]) -> str:
 
-            rdf_data = graph_object.to_rdf()
+        values_clause = " ".join(f"<{str(graph_object.URI)}>" for graph_object in graph_object_list)
 
-            insert_query = f"""
+        rdf_data = GraphObject.to_rdf_list(graph_object_list)
+
+        # a delete and an insert operation sent as one request,
+        # an INSERT template in the same operation would be
+        # instantiated once for every matched triple
+        update_query = f"""
+                DELETE {{
+                    GRAPH <{graph_uri}> {{
+                        ?s ?p ?o .
+                    }}
+                }}
+                WHERE {{
+                    GRAPH <{graph_uri}> {{
+                        VALUES ?s {{ {values_clause} }}
+                        ?s ?p ?o .
+                    }}
+                }} ;
                 INSERT DATA {{
-                    GRAPH <{target_graph}> {{
+                    GRAPH <{graph_uri}> {{
                         {rdf_data}
                     }}
                 }}
             """
 
-            sparql.setQuery(insert_query)
-
-            try:
-                sparql.query()
-            except Exception as e:
-                return VitalGraphStatus(-1, f"Error inserting updated object {object_uri}: {str(e)}")
-
-        return VitalGraphStatus(0, "All graph objects updated successfully.")
+        return update_query
 
     # get object (scoped to all vital service graphs)
     # get object (scoped to specific graph, or graph list)
@@ -1335,8 +1144,6 @@ class VirtuosoGraphService(VitalGraphService):
         base_uri = self.base_uri
         namespace = self.namespace
 
-        vs = VitalSigns()
-
         if graph_id is None:
             raise ValueError("Error: graph_uri is not set.")
 
@@ -1351,45 +1158,10 @@ class VirtuosoGraphService(VitalGraphService):
                                     account_id=account_id,
                                     global_graph=global_graph)
 
-        target_graph = None
-
-        if self._find_graph(graph_uri, object_uri):
-            target_graph = graph_uri
-
-        if not target_graph:
-            # raise ValueError(f"Error: Object {object_uri} not found in any provided graphs.")
-            return None
-
-        query = f"""
-                CONSTRUCT {{
-                    <{object_uri}> ?p ?o .
-                }} WHERE {{
-                    GRAPH <{target_graph}> {{
-                        <{object_uri}> ?p ?o .
-                    }}
-                }}
-                """
-
-        # logging.info(query)
-
-        sparql = SPARQLWrapper(self.sparql_auth_endpoint)
-        sparql.setCredentials(self.username, self.password)
-        sparql.setHTTPAuth(DIGEST)
-
-        sparql.setQuery(query)
-        sparql.setMethod(POST)
-        sparql.setReturnFormat('rdf+xml')  # force returning a graph
-
-        try:
-            graph = sparql.query().convert()
-            # logging.info(f"Triple Count: {len(graph)}")
-
-            graph_object = vs.from_triples(graph.triples((None, None, None)))
+        # one select, none if the object is not in the graph
+        object_map = self._get_object_map(graph_uri, [object_uri])
 
-            return graph_object
-
-        except Exception as e:
-            raise ValueError(f"Error retrieving object {object_uri}: {str(e)}")
+        return object_map.get(str(object_uri))
 
     def get_object_list(self, object_uri_list: List[str], *,
                         graph_id: str = None,
@@ -1400,10 +1172,6 @@ class VirtuosoGraphService(VitalGraphService):
         base_uri = self.base_uri
         namespace = self.namespace
 
-        # TODO do in bulk rather than one at a time
-
-        vs = VitalSigns()
-
         if graph_id is None:
             raise ValueError("Error: graph_uri is not set.")
 
@@ -1418,55 +1186,10 @@ class VirtuosoGraphService(VitalGraphService):
                                     account_id=account_id,
                                     global_graph=global_graph)
 
-        object_graph_map = {}
-
-        for object_uri in object_uri_list:
-            found = False
-            if graph_uri:
-                if self._find_graph(graph_uri, object_uri):
-                    object_graph_map[object_uri] = graph_uri
-                    found = True
-
-            if not found:
-                raise ValueError(f"Error: Object {object_uri} not found in any provided graphs.")
-
-        results = []
-
-        for object_uri in object_uri_list:
-            target_graph = object_graph_map[object_uri]
-
-            query = f"""
-                    CONSTRUCT {{
-                        <{object_uri}> ?p ?o .
-                    }} WHERE {{
-                        GRAPH <{target_graph}> {{
-                            <{object_uri}> ?p ?o .
-                        }}
-                    }}
-                    """
-
-            sparql = SPARQLWrapper(self.sparql_auth_endpoint)
-            sparql.setCredentials(self.username, self.password)
-            sparql.setHTTPAuth(DIGEST)
-
-            sparql.setQuery(query)
-            sparql.setMethod(POST)
-            sparql.setReturnFormat('rdf+xml')
-
-            try:
-                result = sparql.query().convert()
-
-                graph_object = vs.from_triples(result.triples((None, None, None)))
-
-                results.append(graph_object)
-
-            except Exception as e:
-                raise ValueError(f"Error retrieving object {object_uri}: {str(e)}")
-
         result_list = ResultList()
 
-        for r in results:
-            result_list.add_result(r)
+        for graph_object in self._resolve_object_list(graph_uri, object_uri_list):
+            result_list.add_result(graph_object)
 
         return result_list
 
@@ -1479,8 +1202,6 @@ class VirtuosoGraphService(VitalGraphService):
         base_uri = self.base_uri
         namespace = self.namespace
 
-        vs = VitalSigns()
-
         if graph_id is None:
             raise ValueError("Error: graph_uri is not set.")
 
@@ -1495,57 +1216,87 @@ class VirtuosoGraphService(VitalGraphService):
                                     account_id=account_id,
                                     global_graph=global_graph)
 
-        values_clause = " ".join(f"<{uri}>" for uri in object_uri_list)
+        object_map = self._get_object_map(graph_uri, object_uri_list)
+
+        result_list = ResultList()
+
+        # objects not in the graph are skipped
+        for graph_object in object_map.values():
+            result_list.add_result(graph_object)
+
+        return result_list
+
+    def _get_object_map(self, graph_uri: str, object_uri_list: List[str], *,
+                        chunk_size: int | None = None) -> dict:
+
+        # uri to object for the objects found in the graph,
+        # retrieved with one VALUES query per chunk of uris
+
+        if chunk_size is None:
+            chunk_size = self.retrieve_chunk_size
+
+        # unique uris in request order
+        uri_list = list(dict.fromkeys(str(uri) for uri in object_uri_list))
+
+        subject_triples_map: dict = {}
+
+        for start in range(0, len(uri_list), chunk_size):
+
+            query = self._build_object_select(graph_uri, uri_list[start:start + chunk_size])
+
+            try:
+                results = self.rest_manager.sparql_select(query)
+            except Exception as e:
+                raise ValueError(f"Error retrieving object list: {str(e)}")
 
-        results = []
+            self._add_subject_triples(subject_triples_map, results)
+
+        return self._build_object_map(uri_list, subject_triples_map)
+
+    @staticmethod
+    def _build_object_select(graph_uri: str, uri_list: List[str]) -> str:
+
+        values_clause = " ".join(f"<{uri}>" for uri in uri_list)
 
         query = f"""
                 SELECT ?s ?p ?o WHERE {{
-            GRAPH <{graph_uri}> {{
-                VALUES ?s {{ {values_clause} }}
-                ?s ?p ?o .
-            }}
-        }}
-        """
+                    GRAPH <{graph_uri}> {{
+                        VALUES ?s {{ {values_clause} }}
+                        ?s ?p ?o .
+                    }}
+                }}
+                """
 
-        # logging.info(query)
+        return query
 
-        sparql = SPARQLWrapper(self.sparql_auth_endpoint)
-        sparql.setCredentials(self.username, self.password)
-        sparql.setHTTPAuth(DIGEST)
+    @staticmethod
+    def _add_subject_triples(subject_triples_map: dict, results: dict):
 
-        sparql.setQuery(query)
-        sparql.setMethod(POST)
-        sparql.setReturnFormat('json')
+        for binding in results['results']['bindings']:
 
-        try:
-            result = sparql.query().convert()
-            graph = rdflib.Graph()
+            subject_uri = binding['s']['value']
 
-            for result in result['results']['bindings']:
-                s = rdflib.URIRef(result['s']['value'])
-                p = rdflib.URIRef(result['p']['value'])
-                o = rdflib.URIRef(result['o']['value']) if result['o']['type'] == 'uri' else rdflib.Literal(
-                    result['o']['value'])
-                graph.add((s, p, o))
+            triple = (URIRef(subject_uri),
+                      URIRef(binding['p']['value']),
+                      VirtuosoUtils.binding_to_rdf_term(binding['o']))
 
-            unique_subjects = set(graph.subjects())
+            subject_triples_map.setdefault(subject_uri, []).append(triple)
 
-            for subject_uri in unique_subjects:
+    @staticmethod
+    def _build_object_map(uri_list: List[str], subject_triples_map: dict) -> dict:
 
-                graph_object = vs.from_triples(graph.triples((URIRef(subject_uri), None, None)))
+        vs = VitalSigns()
 
-                results.append(graph_object)
+        object_map = {}
 
-        except Exception as e:
-            raise ValueError(f"Error retrieving object list: {str(e)}")
+        for uri in uri_list:
 
-        result_list = ResultList()
+            triples = subject_triples_map.get(uri)
 
-        for r in results:
-            result_list.add_result(r)
+            if triples:
+                object_map[uri] = vs.from_triples(triples)
 
-        return result_list
+        return object_map
 
     # delete uri (scoped to all vital service graphs)
     # delete uri list (scoped to all vital service graphs)
@@ -1592,15 +1343,8 @@ class VirtuosoGraphService(VitalGraphService):
                 }}
                 """
 
-        sparql = SPARQLWrapper(self.sparql_auth_endpoint)
-        sparql.setCredentials(self.username, self.password)
-        sparql.setHTTPAuth(DIGEST)
-
-        sparql.setQuery(delete_query)
-        sparql.setMethod(POST)
-
         try:
-            sparql.query()
+            self.rest_manager.sparql_update(delete_query)
             return VitalGraphStatus(0, "Graph object deleted successfully.")
         except Exception as e:
             return VitalGraphStatus(-1, f"Error deleting object {object_uri}: {str(e)}")
@@ -1656,15 +1400,8 @@ class VirtuosoGraphService(VitalGraphService):
                         }}
                     """
 
-            sparql = SPARQLWrapper(self.sparql_auth_endpoint)
-            sparql.setCredentials(self.username, self.password)
-            sparql.setHTTPAuth(DIGEST)
-
-            sparql.setQuery(delete_query)
-            sparql.setMethod(POST)
-
             try:
-                sparql.query()
+                self.rest_manager.sparql_update(delete_query)
             except Exception as e:
                 return VitalGraphStatus(-1, f"Error deleting object {object_uri}: {str(e)}")
 
@@ -1694,7 +1431,6 @@ class VirtuosoGraphService(VitalGraphService):
             is_global=global_graph
         )
 
-
         # exception if graph doesn't exist
         name_graph = self.get_graph(graph_id,
                                     account_id=account_id,
@@ -1709,15 +1445,7 @@ class VirtuosoGraphService(VitalGraphService):
                 LIMIT {limit} OFFSET {offset}
                 """
 
-        sparql = SPARQLWrapper(self.sparql_auth_endpoint)
-        sparql.setCredentials(self.username, self.password)
-        sparql.setHTTPAuth(DIGEST)
-
-        sparql.setQuery(query)
-        sparql.setMethod(POST)
-        sparql.setReturnFormat(JSON)
-
-        results = sparql.query().convert()
+        results = self.rest_manager.sparql_select(query)
 
         object_uri_list = [result[uri_binding]["value"] for result in results["results"]["bindings"]]
 
@@ -1795,35 +1523,11 @@ class VirtuosoGraphService(VitalGraphService):
                                     account_id=account_id,
                                     global_graph=global_graph)
 
-        query = f"""
-                PREFIX vital-core: <http://vital.ai/ontology/vital-core#>
-                PREFIX vital: <http://vital.ai/ontology/vital#>
-                PREFIX vital-aimp: <http://vital.ai/ontology/vital-aimp#>
-                PREFIX haley: <http://vital.ai/ontology/haley#>
-                PREFIX haley-ai-question: <http://vital.ai/ontology/haley-ai-question#>
-                PREFIX haley-ai-kg: <http://vital.ai/ontology/haley-ai-kg#>
-
-                SELECT DISTINCT ?{uri_binding} WHERE {{
-                    GRAPH <{graph_uri}> {{
-                            {sparql_query}
-                        }}
-                    }} ORDER BY ?{uri_binding}
-                    LIMIT {limit} OFFSET {offset}
-            """
+        query = self._build_query(graph_uri, sparql_query, uri_binding, limit, offset)
 
         logging.info(query)
 
-        sparql = SPARQLWrapper(self.sparql_auth_endpoint)
-        sparql.setCredentials(self.username, self.password)
-        sparql.setHTTPAuth(DIGEST)
-
-        sparql.setQuery(query)
-        sparql.setMethod(POST)
-        sparql.setReturnFormat(JSON)
-
-        results = sparql.query().convert()
-
-        object_uri_list = [result[uri_binding]["value"] for result in results["results"]["bindings"]]
+        object_uri_list = [binding[uri_binding]["value"] for binding in self.rest_manager.iter_sparql_select(query)]
 
         if not object_uri_list:
             return ResultList()
@@ -1842,16 +1546,104 @@ class VirtuosoGraphService(VitalGraphService):
                 # gm.ontologyIRI = uri
                 # result_list.add_result(gm)
 
-                rdf_triple = RDFStatement()
-                rdf_triple.URI = URIGenerator.generate_uri()
-                rdf_triple.rdfSubject = uri
-                rdf_triple.rdfPredicate = ''
-                rdf_triple.rdfObject = ''
-
-                result_list.add_result(rdf_triple)
+                result_list.add_result(self._uri_statement(uri))
 
             return result_list
 
+    def iter_query(self, graph_id: str, sparql_query: str, uri_binding='uri', *,
+                   limit=100,
+                   offset=0,
+                   resolve_objects=True,
+                   global_graph: bool = False,
+                   account_id: str | None = None,
+                   safety_check: bool = True) -> Iterator[G]:
+
+        if graph_id is None:
+            raise ValueError("Error: graph_uri is not set.")
+
+        graph_uri = self.get_graph_uri(
+            graph_id=graph_id,
+            account_id=account_id,
+            is_global=global_graph
+        )
+        # exception if graph doesn't exist
+        name_graph = self.get_graph(graph_id,
+                                    account_id=account_id,
+                                    global_graph=global_graph)
+
+        query = self._build_query(graph_uri, sparql_query, uri_binding, limit, offset)
+
+        uri_iter = (binding[uri_binding]["value"] for binding in self.rest_manager.iter_sparql_select(query))
+
+        if not resolve_objects:
+            for uri in uri_iter:
+                yield self._uri_statement(uri)
+            return
+
+        # resolve objects a chunk at a time while the uris are read
+        chunk = []
+
+        for uri in uri_iter:
+
+            chunk.append(uri)
+
+            if len(chunk) == self.retrieve_chunk_size:
+                yield from self._resolve_object_list(graph_uri, chunk)
+                chunk = []
+
+        if chunk:
+            yield from self._resolve_object_list(graph_uri, chunk)
+
+    def _resolve_object_list(self, graph_uri: str, object_uri_list: List[str]) -> List[G]:
+
+        # the objects in uri order, a uri not in the graph fails as in get_object_list
+
+        object_map = self._get_object_map(graph_uri, object_uri_list)
+
+        object_list = []
+
+        for object_uri in object_uri_list:
+
+            graph_object = object_map.get(str(object_uri))
+
+            if graph_object is None:
+                raise ValueError(f"Error: Object {object_uri} not found in any provided graphs.")
+
+            object_list.append(graph_object)
+
+        return object_list
+
+    def _build_query(self, graph_uri: str, sparql_query: str, uri_binding: str, limit: int, offset: int) -> str:
+
+        query = f"""
+                PREFIX vital-core: <http://vital.ai/ontology/vital-core#>
+                PREFIX vital: <http://vital.ai/ontology/vital#>
+                PREFIX vital-aimp: <http://vital.ai/ontology/vital-aimp#>
+                PREFIX haley: <http://vital.ai/ontology/haley#>
+                PREFIX haley-ai-question: <http://vital.ai/ontology/haley-ai-question#>
+                PREFIX haley-ai-kg: <http://vital.ai/ontology/haley-ai-kg#>
+
+                SELECT DISTINCT ?{uri_binding} WHERE {{
+                    GRAPH <{graph_uri}> {{
+                            {sparql_query}
+                        }}
+                    }} ORDER BY ?{uri_binding}
+                    LIMIT {limit} OFFSET {offset}
+            """
+
+        return query
+
+    @staticmethod
+    def _uri_statement(uri: str) -> RDFStatement:
+
+        rdf_triple = RDFStatement()
+        rdf_triple.URI = URIGenerator.generate_uri()
+        rdf_triple.rdfSubject = uri
+        rdf_triple.rdfPredicate = ''
+        rdf_triple.rdfObject = ''
+
+        return rdf_triple
+
     # sparql query binding to variables with variable, property tuples
     # construct of bnode property variable triple for each bound value
     # constructed statements returned in RdfStatement object result list
@@ -1866,15 +1658,66 @@ class VirtuosoGraphService(VitalGraphService):
                         account_id: str | None = None,
                         safety_check: bool = True) -> ResultList:
 
-        base_uri = self.base_uri
-        namespace = self.namespace
-
         if graph_id is None:
             result_list = ResultList()
             result_list.set_status(-1)
             result_list.set_message("Error: graph_uri is not set.")
             return result_list
 
+        # handle list split into solutions
+        # subjects = sorted(set(g.subjects()))
+        # for s in subjects:
+        #    triples = g.triples((s, None, None))
+
+        result_list = ResultList()
+
+        for rdf_triple in self.iter_construct(graph_id, sparql_query, namespace_list, binding_list,
+                                              limit=limit, offset=offset,
+                                              global_graph=global_graph,
+                                              account_id=account_id):
+            result_list.add_result(rdf_triple)
+
+        return result_list
+
+    def iter_construct(self,
+                       graph_id: str,
+                       sparql_query: str,
+                       namespace_list: List[Ontology],
+                       binding_list: List[Binding], *,
+                       limit=100, offset=0,
+                       global_graph: bool = False,
+                       account_id: str | None = None,
+                       safety_check: bool = True) -> Iterator[RDFStatement]:
+
+        for s, p, o in self._iter_construct_triples(graph_id, sparql_query, namespace_list, binding_list,
+                                                    limit=limit, offset=offset,
+                                                    global_graph=global_graph,
+                                                    account_id=account_id):
+
+            rdf_triple = RDFStatement()
+            rdf_triple.URI = URIGenerator.generate_uri()
+
+            rdf_triple.rdfSubject = str(s)  # blank node subject uri
+            rdf_triple.rdfPredicate = str(p)  # property from binding
+            rdf_triple.rdfObject = str(o)  # uri of matching object
+
+            yield rdf_triple
+
+    def _iter_construct_triples(self,
+                                graph_id: str,
+                                sparql_query: str,
+                                namespace_list: List[Ontology],
+                                binding_list: List[Binding], *,
+                                limit=100, offset=0,
+                                global_graph: bool = False,
+                                account_id: str | None = None) -> Iterator[Tuple]:
+
+        base_uri = self.base_uri
+        namespace = self.namespace
+
+        if graph_id is None:
+            raise ValueError("Error: graph_uri is not set.")
+
         graph_uri = self.get_graph_uri(
             graph_id=graph_id,
             account_id=account_id,
@@ -1888,7 +1731,8 @@ class VirtuosoGraphService(VitalGraphService):
 
         prefix_section = "\n".join([f"PREFIX {ns.prefix}: <{ns.ontology_iri}>" for ns in namespace_list])
 
-        order_by_section = " ".join([binding.variable for binding in binding_list])
+        # string order, the order of the solution keys and of cursors
+        order_by_section = " ".join([f"STR({binding.variable})" for binding in binding_list])
 
         construct_template = "\n".join([f"_:bnode1 <{binding.property_uri}> ?{binding.variable[1:]} ." for binding in binding_list])
 
@@ -1921,48 +1765,10 @@ LIMIT {limit}
 OFFSET {offset}
 """
 
-        print(f"SPARQL Query:\n{query}\n")
-
         logging.info(query)
 
-        sparql = SPARQLWrapper(self.sparql_auth_endpoint)
-        sparql.setCredentials(self.username, self.password)
-        sparql.setHTTPAuth(DIGEST)
-        sparql.setQuery(query)
-        sparql.setMethod(POST)
-
-        sparql.setReturnFormat('rdf+xml')  # force getting graph back
-
-        # converts to rdflib graph because of CONSTRUCT
-        g = sparql.query().convert()
-
-        # handle list split into solutions
-        # subjects = sorted(set(g.subjects()))
-        # for s in subjects:
-        #    triples = g.triples((s, None, None))
-
-        result_list = ResultList()
-
-        triples = g.triples((None, None, None))
-
-        # for result in results["results"]["bindings"]:
-
-        for s, p, o in triples:
-
-            rdf_triple = RDFStatement()
-            rdf_triple.URI = URIGenerator.generate_uri()
-
-            # rdf_triple.rdfSubject = result['s']["value"]
-            # rdf_triple.rdfPredicate = result['p']["value"]
-            # rdf_triple.rdfObject = result['o']["value"]
-
-            rdf_triple.rdfSubject = str(s)  # blank node subject uri
-            rdf_triple.rdfPredicate = str(p)  # property from binding
-            rdf_triple.rdfObject = str(o)  # uri of matching object
-
-            result_list.add_result(rdf_triple)
-
-        return result_list
+        # triples are parsed from the n-triples response as it is read
+        yield from self.rest_manager.iter_sparql_construct(query)
 
     def query_construct_solution(self,
                                  graph_id: str,
@@ -1977,170 +1783,104 @@ OFFSET {offset}
                                  resolve_objects: bool = True,
                                  safety_check: bool = True) -> SolutionList:
 
-        base_uri = self.base_uri
-        namespace = self.namespace
-
-        graph_uri = self.get_graph_uri(
-            graph_id=graph_id,
-            account_id=account_id,
-            is_global=global_graph
-        )
-
-        # object cache to use during query
-        # added bulk retrieval of objects
-        # graph_collection = GraphCollection(use_rdfstore=False, use_vectordb=False)
-
-        graph_map: dict = {}
-
-        result_list = self.query_construct(
+        solutions = list(self.iter_construct_solution(
             graph_id,
             sparql_query,
             namespace_list,
             binding_list,
+            root_binding,
+            limit=limit, offset=offset,
             global_graph=global_graph,
-            account_id=account_id,
-            limit=limit, offset=offset)
-
-        graph = Graph()
-
-        for result in result_list:
-            rs = result.graph_object
-            if isinstance(rs, RDFStatement):
-                s = rs.rdfSubject
-                p = rs.rdfPredicate
-
-                value_type = BindingValueType.URIREF
-
-                for binding in binding_list:
-                    if binding.property_uri == str(p):
-                        value_type = binding.value_type
-                        break
-
-                o = rs.rdfObject
-                if value_type == BindingValueType.URIREF:
-                    graph.add((URIRef(str(s)), URIRef(str(p)), URIRef(str(o))))
-                else:
-                    graph.add((URIRef(str(s)), URIRef(str(p)), Literal(str(o))))
-
-        solutions = []
-
-        unique_objects = set(graph.objects())
-
-        uri_objects = {o for o in unique_objects if isinstance(o, URIRef)}
-
-        retrieve_list: List[str] = []
-
-        for obj_uri in uri_objects:
-            object_uri_str = str(obj_uri)
-            # print(f"object uri: {object_uri_str}")
-            retrieve_list.append(object_uri_str)
-
-        # print(f"Bulk Retrieving URIs length: {len(retrieve_list)}")
-
-        total_objects = len(retrieve_list)
-
-        start_index = 0
-
-        chunk_size = 1_000
-
-        while start_index < total_objects:
-            end_index = min(start_index + chunk_size, total_objects)
-            chunk = retrieve_list[start_index:end_index]
-
-            # print(f"Bulk Retrieving URIs Chunk length: {len(chunk)}")
-
-            result_list = self.get_object_list_bulk(chunk,
-                                                    graph_id=graph_id,
-                                                    account_id=account_id,
-                                                    global_graph=global_graph)
-
-            for re in result_list:
-                graph_object = re.graph_object
-                # graph_collection.add(graph_object)
-                graph_map[str(graph_object.URI)] = graph_object
-
-            start_index += chunk_size
-
-        # print(f"Bulk Retrieving URIs Complete length: {len(retrieve_list)}")
-
-        # is necessary?
-        # does construct create duplicates?
-        unique_triples = set(graph.triples((None, None, None)))
-
-        unique_graph = Graph()
-
-        for triple in unique_triples:
-            unique_graph.add(triple)
-
-        unique_subjects = set(unique_graph.subjects())
-
-        solution_count = 0
-
-        for subject in unique_subjects:
-
-            uri_map = {}
-            obj_map = {}
-
-            # root_binding_uri = None
-            root_binding_obj = None
-
-            # created unique set of all triples instead
-            # triples = set(graph.triples((subject, None, None)))
-
-            triples = unique_graph.triples((subject, None, None))
-
-            for s, p, o in triples:
-
-                matching_bindings = [binding for binding in binding_list if binding.property_uri == str(p)]
-
-                if len(matching_bindings) == 1:
-
-                    matching_binding = matching_bindings[0]
-
-                    binding_var = matching_binding.variable
-
-                    binding_value = o
-
-                    # set to string instead of Node
-                    uri_map[binding_var] = str(binding_value)
-
-                    if matching_binding.value_type == BindingValueType.URIREF:
-
-                        # cache individual objects
-                        # should already be cached
-
-                        # cache_obj = graph_collection.get(str(o))
-
-                        cache_obj = graph_map[str(o)]
-
-                        if cache_obj is None:
-
-                            # print(f"Retrieving cache miss: {str(o)}")
-
-                            binding_obj = self.get_object(str(o), graph_id=graph_id)
-                            # graph_collection.add(binding_obj)
-                            graph_map[str(o)] = binding_obj
-
-                        else:
-                            binding_obj = cache_obj
-
-                        obj_map[binding_var] = binding_obj
-
-                        if binding_var == root_binding:
-                            # root_binding_uri = binding_value
-                            root_binding_obj = binding_obj
-
-            solution_count += 1
-            # print(f"Adding Solution: {solution_count}")
-            solution = Solution(uri_map, obj_map, root_binding, root_binding_obj)
-
-            solutions.append(solution)
-
-        solution_list = SolutionList(solutions, limit, offset)
+            account_id=account_id))
+
+        return SolutionList(solutions, limit, offset)
+
+    def iter_construct_solution(self,
+                                graph_id: str,
+                                sparql_query: str,
+                                namespace_list: List[Ontology],
+                                binding_list: List[Binding],
+                                root_binding: str | None = None, *,
+                                limit=100,
+                                offset=0,
+                                global_graph: bool = False,
+                                account_id: str | None = None) -> Iterator[Solution]:
 
-        # logging.info(f"Completed Solutions: {solution_count}")
+        graph_uri = self.get_graph_uri(
+            graph_id=graph_id,
+            account_id=account_id,
+            is_global=global_graph
+        )
 
-        return solution_list
+        assembler = SolutionAssembler(binding_list, root_binding)
+
+        # the triples of a solution are grouped as the response is read
+        for s, p, o in self._iter_construct_triples(graph_id, sparql_query, namespace_list, binding_list,
+                                                    limit=limit, offset=offset,
+                                                    global_graph=global_graph,
+                                                    account_id=account_id):
+            assembler.add(s, p, str(o))
+
+        # objects of the solutions retrieved in bulk, a uri not in the graph is left unbound
+        graph_map: dict = self._get_object_map(graph_uri, list(assembler.get_object_uri_set()))
+
+        yield from assembler.iter_solutions(graph_map.get)
+
+    def _query_construct_solution_graph_list(self,
+                                             graph_id_list: List[str],
+                                             sparql_query: str,
+                                             namespace_list: List[Ontology],
+                                             binding_list: List[Binding],
+                                             root_binding: str | None = None, *,
+                                             limit=100,
+                                             offset=0,
+                                             global_graph: bool = False,
+                                             account_id: str | None = None) -> SolutionList:
+
+        if len(graph_id_list) == 1:
+            return self.query_construct_solution(
+                graph_id_list[0],
+                sparql_query,
+                namespace_list,
+                binding_list,
+                root_binding,
+                account_id=account_id,
+                global_graph=global_graph,
+                limit=limit, offset=offset)
+
+        # each graph returns its first offset + limit solutions in the
+        # query order, so the page over all graphs is within their union
+
+        def graph_solutions(graph_id: str) -> SolutionList:
+            return self.query_construct_solution(
+                graph_id,
+                sparql_query,
+                namespace_list,
+                binding_list,
+                root_binding,
+                account_id=account_id,
+                global_graph=global_graph,
+                limit=offset + limit, offset=0)
+
+        workers = min(len(graph_id_list), self.graph_query_workers)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            graph_solution_list = list(executor.map(graph_solutions, graph_id_list))
+
+        # same ordering as the ORDER BY of the construct query
+        def solution_key(solution: Solution):
+            return tuple(solution.uri_map.get(binding.variable, "") for binding in binding_list)
+
+        solution_map = {}
+
+        for solution_list in graph_solution_list:
+            for solution in solution_list.solution_list:
+                # a solution found in several graphs is kept once
+                solution_map.setdefault(solution_key(solution), solution)
+
+        solutions = [solution_map[key] for key in sorted(solution_map)]
+
+        return SolutionList(solutions[offset:offset + limit], limit, offset)
 
     def metaql_select_query(self, *,
                             select_query: MetaQLSelectQuery,
@@ -2165,7 +1905,6 @@ OFFSET {offset}
 
         graph_id_list = select_query.get('graph_id_list', [])
 
-
         offset = select_query.get('offset', 0)
         limit = select_query.get('limit', 10)
 
@@ -2235,28 +1974,24 @@ OFFSET {offset}
 
         logging.info(query_str)
 
-        # graph_uri = graph_uri_list[0]
-
-        # TODO handle list instead of single graph_id
-
-        graph_id = graph_id_list[0]
-
-        # name_graph = self.get_name_graph(graph_uri)
-
-        # graph_id = name_graph.get_graph_id()
-
-        # account_id = name_graph.get_account_id()
-
-        # is_global = name_graph.is_global()
-
-        solutions = self.query_construct_solution(
-            graph_id,
+        if select_query.get('metaql_class', None) == 'AggregateSelectQuery':
+            return self._metaql_aggregate_query(
+                graph_id_list,
+                query_str,
+                "uri",
+                select_query.get('aggregate', None),
+                account_id=account_id,
+                is_global=is_global)
+
+        solutions, next_cursor, total_count = self._metaql_solution_page(
+            select_query,
+            graph_id_list,
             query_str,
             namespace_list,
             binding_list,
             root_binding,
             account_id=account_id,
-            global_graph=is_global,
+            is_global=is_global,
             limit=limit, offset=offset)
 
         # logging.info(f"Solution Count: {len(solutions.solution_list)}")
@@ -2270,17 +2005,131 @@ OFFSET {offset}
                 # print(obj.to_rdf())
                 rl.add_result(obj, 1.0)
 
-        total_result_count = len(rl)
+        total_result_count = len(rl) if total_count is None else total_count
 
         metaql_result = MetaQLResult(
             offset=offset,
             limit=limit,
             total_result_count=total_result_count,
+            next_cursor=next_cursor,
             result_list=rl
         )
 
         return metaql_result
 
+    def _metaql_solution_page(self, metaql_query: MetaQLSelectQuery | MetaQLGraphQuery,
+                              graph_id_list: List[str], query_string: str,
+                              namespace_list: List[Ontology], binding_list: List[Binding],
+                              root_binding: str | None = None, *,
+                              limit=100, offset=0,
+                              account_id: str | None = None,
+                              is_global: bool = False) -> Tuple[SolutionList, str | None, int | None]:
+        """A page of solutions, the cursor of the page after it and the total count if requested.
+
+        With a cursor the page starts after the cursor solution instead of
+        at the offset, so Virtuoso doesn't compute the solutions before it.
+        """
+
+        variable_list = [binding.variable for binding in binding_list]
+
+        cursor = metaql_query.get('cursor', None)
+
+        page_query_string = query_string
+
+        if cursor:
+            page_query_string = f"""
+        {query_string}
+        {build_cursor_filter(variable_list, decode_cursor(cursor))}
+        """
+            offset = 0
+
+        solutions = self._query_construct_solution_graph_list(
+            graph_id_list,
+            page_query_string,
+            namespace_list,
+            binding_list,
+            root_binding,
+            account_id=account_id,
+            global_graph=is_global,
+            limit=limit, offset=offset)
+
+        key_list = [tuple(solution.uri_map.get(variable, "") for variable in variable_list)
+                    for solution in solutions.solution_list]
+
+        total_count = None
+
+        if metaql_query.get('total_count', False):
+
+            graph_uri_list = [self.get_graph_uri(graph_id=graph_id, account_id=account_id, is_global=is_global)
+                              for graph_id in graph_id_list]
+
+            query = build_count_sparql(
+                prefix_section="\n".join([f"PREFIX {ns.prefix}: <{ns.ontology_iri}>" for ns in namespace_list or []]),
+                graph_uri_list=graph_uri_list,
+                query_string=query_string,
+                variable_list=variable_list)
+
+            logging.info(query)
+
+            results = self.rest_manager.sparql_select(query)
+
+            total_count = 0
+
+            for result in results["results"]["bindings"]:
+                if COUNT_BINDING in result:
+                    total_count = int(result[COUNT_BINDING]["value"])
+
+        return solutions, cursor_after(key_list, limit), total_count
+
+    def _metaql_aggregate_query(self, graph_id_list: List[str], query_string: str, binding: str,
+                                aggregate: MetaQLAggregate, *,
+                                account_id: str | None = None, is_global: bool = False) -> MetaQLResult:
+        """Compute an aggregate in Virtuoso, only the aggregate value is returned."""
+
+        graph_uri_list = [self.get_graph_uri(graph_id=graph_id, account_id=account_id, is_global=is_global)
+                          for graph_id in graph_id_list]
+
+        query = build_aggregate_sparql(
+            graph_uri_list=graph_uri_list,
+            query_string=query_string,
+            binding=binding,
+            aggregate=aggregate)
+
+        logging.info(query)
+
+        results = self.rest_manager.sparql_select(query)
+
+        value = None
+
+        for result in results["results"]["bindings"]:
+            if AGGREGATE_VALUE_BINDING in result:
+                value = float(result[AGGREGATE_VALUE_BINDING]["value"])
+
+        return build_aggregation_result(aggregate, value)
+
+    def _load_metaql_statistics(self, graph_uri: str) -> MetaQLGraphStatistics:
+        """Count the instances of each class in a graph."""
+
+        query = f"""
+            SELECT ?type (COUNT(?s) AS ?count) WHERE {{
+                GRAPH <{graph_uri}> {{ ?s a ?type }}
+            }}
+            GROUP BY ?type
+        """
+
+        try:
+            results = self.rest_manager.sparql_select(query)
+        except Exception as e:
+            logging.warning(f"no class statistics for graph {graph_uri}: {e}")
+            return MetaQLGraphStatistics()
+
+        class_cardinality = {}
+
+        for binding in results["results"]["bindings"]:
+            class_cardinality[binding["type"]["value"]] = int(binding["count"]["value"])
+
+        return MetaQLGraphStatistics(class_cardinality)
+
     def metaql_graph_query(self, *,
                            graph_query: MetaQLGraphQuery,
                            namespace_list: List[Ontology] = None,
@@ -2289,28 +2138,23 @@ OFFSET {offset}
         base_uri = self.base_uri
         namespace = self.namespace
 
-        sparql_builder = MetaQLSparqlBuilder()
-
-        sparql_impl: MetaQLSparqlImpl = sparql_builder.build_sparql(graph_query)
+        sparql_impl: MetaQLSparqlImpl = self.metaql_plan_cache.build_sparql(graph_query)
 
         limit = sparql_impl.get_limit()
 
         offset = sparql_impl.get_offset()
 
-        # graph_uri = sparql_impl.get_graph_uri_list()[0]
-
-        # TODO handle list instead of single graph_id
+        graph_id_list = sparql_impl.get_graph_id_list()
 
-        graph_id = sparql_impl.get_graph_id_list()[0]
+        if self.metaql_optimize_order:
 
+            statistics = MetaQLGraphStatistics.merge([
+                self.metaql_statistics_cache.get(
+                    self.get_graph_uri(graph_id=graph_id, account_id=account_id, is_global=is_global),
+                    self._load_metaql_statistics)
+                for graph_id in graph_id_list])
 
-        # name_graph = self.get_name_graph(graph_uri)
-
-        # graph_id = name_graph.get_graph_id()
-
-        # account_id = name_graph.get_account_id()
-
-        # is_global = name_graph.is_global()
+            MetaQLArcOptimizer(statistics).optimize(sparql_impl, explain=self.metaql_explain_order)
 
         resolve_objects = sparql_impl.get_resolve_objects()
 
@@ -2335,14 +2179,29 @@ OFFSET {offset}
         {bind_constraint_list}
         """
 
-        solutions = self.query_construct_solution(
-            graph_id,
+        if graph_query.get('metaql_class', None) == 'AggregateGraphQuery':
+
+            aggregate = graph_query.get('aggregate', None)
+
+            aggregate_binding = aggregate.get('binding', None) if aggregate else None
+
+            return self._metaql_aggregate_query(
+                graph_id_list,
+                query_string,
+                aggregate_binding or sparql_impl.get_root_binding(),
+                aggregate,
+                account_id=account_id,
+                is_global=is_global)
+
+        solutions, next_cursor, total_count = self._metaql_solution_page(
+            graph_query,
+            graph_id_list,
             query_string,
             namespace_list,
             binding_list,
             root_binding,
             account_id=account_id,
-            global_graph=is_global,
+            is_global=is_global,
             limit=limit, offset=offset)
 
         logging.info(f"Solution Count: {len(solutions.solution_list)}")
@@ -2388,7 +2247,8 @@ OFFSET {offset}
         metaql_result = MetaQLResult(
             offset=offset,
             limit=limit,
-            total_result_count=count,
+            total_result_count=count if total_count is None else total_count,
+            next_cursor=next_cursor,
             binding_list=binding_string_list,
             result_list=rl,
             result_object_list=result_object_list
@@ -2531,6 +2391,3 @@ OFFSET {offset}
                                      use_account_id: bool = True,
                                      batch_size: int = 10_000):
         pass
-
-
-
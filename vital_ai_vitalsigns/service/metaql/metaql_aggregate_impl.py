@@ -0,0 +1,138 @@
+from typing import Iterable, List
+from vital_ai_vitalsigns.metaql.aggregate.metaql_aggregate import MetaQLAggregate
+from vital_ai_vitalsigns.query.metaql_result import MetaQLResult
+from vital_ai_vitalsigns.query.result_list import ResultList
+from vital_ai_vitalsigns.utils.uri_generator import URIGenerator
+from vital_ai_vitalsigns_core.model.AggregationResult import AggregationResult
+
+
+# aggregate type -> sparql aggregate function
+AGGREGATE_FUNCTION_MAP = {
+    "AVERAGE": "AVG",
+    "SUM": "SUM",
+    "MAXIMUM": "MAX",
+    "MINIMUM": "MIN",
+    "COUNT": "COUNT"
+}
+
+AGGREGATE_VALUE_BINDING = "aggregate_value"
+AGGREGATE_INPUT_BINDING = "aggregate_input"
+AGGREGATE_GRAPH_BINDING = "aggregate_graph"
+
+PREFIX_SECTION = """
+PREFIX vital-core: <http://vital.ai/ontology/vital-core#>
+PREFIX vital: <http://vital.ai/ontology/vital#>
+PREFIX vital-aimp: <http://vital.ai/ontology/vital-aimp#>
+PREFIX haley: <http://vital.ai/ontology/haley>
+PREFIX haley-ai-question: <http://vital.ai/ontology/haley-ai-question#>
+PREFIX haley-ai-kg: <http://vital.ai/ontology/haley-ai-kg#>"""
+
+
+def get_aggregate_type(aggregate: MetaQLAggregate) -> str:
+
+    aggregate_type = aggregate.get('aggregate_type', None) if aggregate else None
+
+    if aggregate_type not in AGGREGATE_FUNCTION_MAP:
+        raise ValueError(f"Unsupported MetaQL aggregate type: {aggregate_type}")
+
+    return aggregate_type
+
+
+def build_aggregate_sparql(*,
+                           graph_uri_list: List[str],
+                           query_string: str,
+                           binding: str,
+                           aggregate: MetaQLAggregate) -> str:
+    """A SELECT computing the aggregate of a pattern across graphs in one row."""
+
+    function = AGGREGATE_FUNCTION_MAP[get_aggregate_type(aggregate)]
+
+    property_uri = aggregate.get('property_uri', None)
+
+    graph_values = " ".join(f"<{graph_uri}>" for graph_uri in graph_uri_list)
+
+    # each node or (node, value) pair counts once, over all the matches and graphs
+    if property_uri:
+        inner_select = f"?{binding} ?{AGGREGATE_INPUT_BINDING}"
+        value_term = f"?{binding} <{property_uri}> ?{AGGREGATE_INPUT_BINDING} ."
+        aggregate_expression = f"{function}(?{AGGREGATE_INPUT_BINDING})"
+    else:
+        inner_select = f"?{binding}"
+        value_term = ""
+        aggregate_expression = f"{function}(?{binding})"
+
+    return f"""
+{PREFIX_SECTION}
+
+SELECT ({aggregate_expression} AS ?{AGGREGATE_VALUE_BINDING}) WHERE {{
+    {{
+        SELECT DISTINCT {inner_select} WHERE {{
+            VALUES ?{AGGREGATE_GRAPH_BINDING} {{ {graph_values} }}
+            GRAPH ?{AGGREGATE_GRAPH_BINDING} {{
+                {query_string}
+                {value_term}
+            }}
+        }}
+    }}
+}}
+"""
+
+
+def aggregate_values(aggregate: MetaQLAggregate, value_list: Iterable) -> float | None:
+    """The aggregate of values the way the SPARQL aggregate functions compute it."""
+
+    aggregate_type = get_aggregate_type(aggregate)
+
+    value_list = list(value_list)
+
+    if aggregate_type == "COUNT":
+        return float(len(value_list))
+
+    number_list = []
+
+    for value in value_list:
+        try:
+            number_list.append(float(value))
+        except (TypeError, ValueError):
+            raise ValueError(f"MetaQL {aggregate_type} of a non-numeric value: {value!r}")
+
+    if aggregate_type == "SUM":
+        return float(sum(number_list))
+
+    if aggregate_type == "AVERAGE":
+        return sum(number_list) / len(number_list) if number_list else 0.0
+
+    # no maximum or minimum of nothing, unbound in SPARQL
+    if not number_list:
+        return None
+
+    if aggregate_type == "MAXIMUM":
+        return max(number_list)
+
+    return min(number_list)
+
+
+def build_aggregation_result(aggregate: MetaQLAggregate, value: float | None) -> MetaQLResult:
+    """A MetaQLResult holding a single AggregationResult."""
+
+    aggregation_result = AggregationResult()
+    aggregation_result.URI = URIGenerator.generate_uri()
+    aggregation_result.aggregationType = get_aggregate_type(aggregate)
+
+    provides_name = aggregate.get('provides_name', None)
+
+    if provides_name:
+        aggregation_result.name = provides_name
+
+    if value is not None:
+        aggregation_result.value = value
+
+    rl = ResultList()
+    rl.add_result(aggregation_result, 1.0)
+
+    return MetaQLResult(
+        offset=0,
+        limit=1,
+        total_result_count=1,
+        result_list=rl
+    )
@@ -0,0 +1,181 @@
+import logging
+import re
+import threading
+import time
+from typing import Callable, Dict, List, Tuple
+from vital_ai_vitalsigns.service.metaql.metaql_sparql_impl import MetaQLSparqlImpl
+
+
+# estimated matches of a term when the graph statistics don't cover it
+URI_VALUE_COST = 10.0
+TEXT_CONTAINS_COST = 100.0
+CLASS_COST = 100_000.0
+PROPERTY_COST = 1_000_000.0
+EDGE_COST = 1_000_000.0
+UNKNOWN_COST = 1_000_000.0
+
+_VARIABLE_PATTERN = re.compile(r"\?(\w+)")
+
+_CLASS_TERM = re.compile(r"^\?\w+\s+a\s+<([^>]+)>\s*\.$")
+_URI_VALUE_TERM = re.compile(r"^\?\w+\s+<[^>]+>\s+<[^>]+>\s*\.$")
+_PROPERTY_TERM = re.compile(r"^\?\w+\s+<[^>]+>\s+\?\w+\s*\.$")
+_EDGE_TERM = re.compile(r"^\?\w+\s+vital-core:hasEdge(Source|Destination)\s+\?\w+\s*\.$")
+_VALUES_BLOCK = re.compile(r"VALUES\s+\?\w+\s*\{([^}]*)\}", re.S)
+_URI = re.compile(r"<([^>]+)>")
+
+
+class MetaQLGraphStatistics:
+    """Class cardinalities of a graph, counted from its type triples."""
+
+    def __init__(self, class_cardinality: Dict[str, int] | None = None):
+        self.class_cardinality: Dict[str, int] = class_cardinality or {}
+
+    @classmethod
+    def merge(cls, statistics_list: List['MetaQLGraphStatistics']) -> 'MetaQLGraphStatistics':
+
+        merged = cls()
+
+        for statistics in statistics_list:
+            for type_uri, cardinality in statistics.class_cardinality.items():
+                merged.class_cardinality[type_uri] = merged.class_cardinality.get(type_uri, 0) + cardinality
+
+        return merged
+
+    def class_cost(self, class_uri: str) -> float:
+
+        if not self.class_cardinality:
+            return CLASS_COST
+
+        # a class with no instances matches nothing
+        return float(self.class_cardinality.get(class_uri, 1))
+
+
+class MetaQLStatisticsCache:
+    """Graph statistics per segment, loaded on first use and kept for ttl seconds."""
+
+    def __init__(self, ttl: float = 600.0):
+        self.ttl = ttl
+        self._statistics: Dict[str, Tuple[float, MetaQLGraphStatistics]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, graph_uri: str, loader: Callable[[str], MetaQLGraphStatistics]) -> MetaQLGraphStatistics:
+
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._statistics.get(graph_uri)
+
+        if entry is not None and now - entry[0] < self.ttl:
+            return entry[1]
+
+        statistics = loader(graph_uri)
+
+        with self._lock:
+            self._statistics[graph_uri] = (now, statistics)
+
+        return statistics
+
+    def invalidate(self, graph_uri: str | None = None):
+        with self._lock:
+            if graph_uri is None:
+                self._statistics.clear()
+            else:
+                self._statistics.pop(graph_uri, None)
+
+
+class MetaQLArcOptimizer:
+    """Orders the terms of a built MetaQL query by estimated selectivity.
+
+    The cheapest term is placed first, then terms that share a variable
+    with the ones already placed are added cheapest first, so the query
+    starts from its most selective constraint and follows the arcs from
+    there instead of the order of the request.  UNION blocks are placed
+    as a whole.  Costs are class cardinalities from the graph statistics
+    and fixed estimates for the other kinds of term.
+    """
+
+    def __init__(self, statistics: MetaQLGraphStatistics | None = None):
+        self.statistics = statistics or MetaQLGraphStatistics()
+
+    def term_cost(self, term: str) -> float:
+
+        text = term.strip()
+
+        values_block = _VALUES_BLOCK.search(text)
+
+        if values_block and "UNION" not in text:
+            # class with its subclasses
+            return sum(self.statistics.class_cost(uri) for uri in _URI.findall(values_block.group(1)))
+
+        if "UNION" in text or text.startswith("{"):
+            # a match of any branch, each branch as its cheapest line
+            branch_count = text.count("UNION") + 1
+            line_cost_list = [self.term_cost(line) for line in text.splitlines()
+                              if line.strip() and line.strip() not in ("{", "}", "UNION")]
+            return branch_count * min(line_cost_list, default=UNKNOWN_COST)
+
+        if "bif:contains" in text:
+            return TEXT_CONTAINS_COST
+
+        class_term = _CLASS_TERM.match(text)
+
+        if class_term:
+            return self.statistics.class_cost(class_term.group(1))
+
+        if _EDGE_TERM.match(text):
+            return EDGE_COST
+
+        if _URI_VALUE_TERM.match(text):
+            return URI_VALUE_COST
+
+        if _PROPERTY_TERM.match(text):
+            return PROPERTY_COST
+
+        return UNKNOWN_COST
+
+    def order_terms(self, term_list: List[str]) -> List[Tuple[str, float]]:
+        """The terms in the chosen order, with their estimated cost."""
+
+        remaining = [(i, term, self.term_cost(term), set(_VARIABLE_PATTERN.findall(term)))
+                     for i, term in enumerate(term_list)]
+
+        bound = set()
+
+        ordered = []
+
+        # connected terms first, so no cartesian product is started
+        # while a join is available, then the cheapest, then request order.
+        # a term on variables that are all bound only filters
+        def priority(entry):
+            i, term, cost, variables = entry
+            connected = not bound or bool(variables & bound)
+            if bound and variables <= bound:
+                cost = 0.0
+            return not connected, cost, i
+
+        while remaining:
+
+            entry = min(remaining, key=priority)
+
+            remaining.remove(entry)
+
+            bound |= entry[3]
+
+            ordered.append((entry[1], entry[2]))
+
+        return ordered
+
+    def optimize(self, sparql_impl: MetaQLSparqlImpl, *, explain: bool = False) -> MetaQLSparqlImpl:
+        """Reorder the arc constraints of sparql_impl in place."""
+
+        ordered = self.order_terms(sparql_impl.get_arc_constraint_list())
+
+        if explain:
+            logging.info("MetaQL term order:")
+            for position, (term, cost) in enumerate(ordered):
+                summary = " ".join(term.split())
+                logging.info(f"{position}: cost {cost:.0f}: {summary}")
+
+        sparql_impl.get_arc_constraint_list()[:] = [term for term, _ in ordered]
+
+        return sparql_impl
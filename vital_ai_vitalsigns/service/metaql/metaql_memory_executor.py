@@ -0,0 +1,687 @@
+from typing import Dict, Iterator, List, Tuple
+from rdflib import URIRef
+from vital_ai_vitalsigns.impl.rdflib.subject_index_store import GraphSubjectIndex
+from vital_ai_vitalsigns.metaql.arc.metaql_arc import ArcRoot, Arc, ARC_TRAVERSE_TYPE_EDGE, ARC_TRAVERSE_TYPE_PROPERTY, \
+    ARC_DIRECTION_TYPE_REVERSE
+from vital_ai_vitalsigns.metaql.arc_list.metaql_arc_list import MetaQLArcList
+from vital_ai_vitalsigns.metaql.constraint_list.metaql_constraint_list import MetaQLConstraintList
+from vital_ai_vitalsigns.metaql.metaql_query import GraphQuery, SelectQuery, AggregateSelectQuery, AggregateGraphQuery
+from vital_ai_vitalsigns.query.metaql_result import MetaQLResult
+from vital_ai_vitalsigns.query.result_list import ResultList
+from vital_ai_vitalsigns.service.metaql.metaql_pagination import decode_cursor, cursor_after
+from vital_ai_vitalsigns.service.metaql.metaql_aggregate_impl import aggregate_values, build_aggregation_result, \
+    get_aggregate_type
+from vital_ai_vitalsigns.utils.uri_generator import URIGenerator
+from vital_ai_vitalsigns_core.model.GraphMatch import GraphMatch
+
+EDGE_SOURCE = URIRef('http://vital.ai/ontology/vital-core#hasEdgeSource')
+EDGE_DESTINATION = URIRef('http://vital.ai/ontology/vital-core#hasEdgeDestination')
+
+# a partial solution, binding name -> rdflib term
+Bindings = Dict[str, object]
+
+
+class _ClassConstraint:
+
+    def __init__(self, class_uri_list: List[str]):
+        self.type_list = [URIRef(class_uri) for class_uri in class_uri_list]
+
+    def candidates(self, index: GraphSubjectIndex):
+        if len(self.type_list) == 1:
+            return index.types.get(self.type_list[0], set())
+        return set().union(*(index.types.get(t, ()) for t in self.type_list))
+
+    def matches(self, index: GraphSubjectIndex, value) -> bool:
+        return any(value in index.types.get(t, ()) for t in self.type_list)
+
+
+class _ValueConstraint:
+
+    def __init__(self, property_uri: str, value):
+        self.property_uri = URIRef(property_uri)
+        self.value = value
+
+    def candidates(self, index: GraphSubjectIndex):
+        return index.value_index(self.property_uri).get(self.value, set())
+
+    def matches(self, index: GraphSubjectIndex, value) -> bool:
+        return (self.property_uri, self.value) in index.subjects.get(value, ())
+
+
+class _StringConstraint:
+
+    # stands in for bif:contains with a case-insensitive substring match
+
+    def __init__(self, property_uri: str, string_value: str):
+        self.property_uri = URIRef(property_uri)
+        self.string_value = str(string_value).lower()
+
+    def _value_matches(self, value) -> bool:
+        return self.string_value in str(value).lower()
+
+    def candidates(self, index: GraphSubjectIndex):
+        subjects = set()
+        for value, subject_set in index.value_index(self.property_uri).items():
+            if self._value_matches(value):
+                subjects.update(subject_set)
+        return subjects
+
+    def matches(self, index: GraphSubjectIndex, value) -> bool:
+        return any(p == self.property_uri and self._value_matches(o) for p, o in index.subjects.get(value, ()))
+
+
+class _ConstraintGroup:
+
+    def __init__(self, constraint_list: list, is_or: bool):
+        self.constraint_list = constraint_list
+        self.is_or = is_or
+
+    def candidates(self, index: GraphSubjectIndex):
+        # None when the group does not restrict the node
+
+        if not self.constraint_list:
+            return None
+
+        if self.is_or:
+            return set().union(*(c.candidates(index) for c in self.constraint_list))
+
+        return min((c.candidates(index) for c in self.constraint_list), key=len)
+
+    def matches(self, index: GraphSubjectIndex, value) -> bool:
+
+        if not self.constraint_list:
+            return True
+
+        if self.is_or:
+            return any(c.matches(index, value) for c in self.constraint_list)
+
+        return all(c.matches(index, value) for c in self.constraint_list)
+
+
+class _NodeStep:
+
+    def __init__(self, name: str, group_list: List[_ConstraintGroup]):
+        self.name = name
+        self.group_list = group_list
+
+    def candidates(self, index: GraphSubjectIndex):
+
+        candidate_list = [c for c in (g.candidates(index) for g in self.group_list) if c is not None]
+
+        if not candidate_list:
+            return None
+
+        smallest = min(candidate_list, key=len)
+
+        return [v for v in smallest if self.matches(index, v)]
+
+    def matches(self, index: GraphSubjectIndex, value) -> bool:
+        return all(g.matches(index, value) for g in self.group_list)
+
+    def extend(self, index: GraphSubjectIndex, bindings: Bindings) -> Iterator[Bindings]:
+
+        value = bindings.get(self.name)
+
+        if value is not None:
+            if self.matches(index, value):
+                yield bindings
+            return
+
+        candidates = self.candidates(index)
+
+        if candidates is None:
+            # unconstrained, bound by a traversal
+            yield bindings
+            return
+
+        for value in candidates:
+            yield {**bindings, self.name: value}
+
+
+class _EdgeStep:
+
+    def __init__(self, edge_name: str, source_name: str, destination_name: str):
+        self.edge_name = edge_name
+        self.source_name = source_name
+        self.destination_name = destination_name
+
+    def extend(self, index: GraphSubjectIndex, bindings: Bindings) -> Iterator[Bindings]:
+
+        edge = bindings.get(self.edge_name)
+        source = bindings.get(self.source_name)
+        destination = bindings.get(self.destination_name)
+
+        # hash join on whichever end is already bound
+        if edge is not None:
+            edges = (edge,)
+        elif source is not None:
+            edges = index.value_index(EDGE_SOURCE).get(source, ())
+        elif destination is not None:
+            edges = index.value_index(EDGE_DESTINATION).get(destination, ())
+        else:
+            edges = [e for edge_set in index.value_index(EDGE_SOURCE).values() for e in edge_set]
+
+        for e in edges:
+            for s in index.objects(e, EDGE_SOURCE):
+                if source is not None and s != source:
+                    continue
+                for d in index.objects(e, EDGE_DESTINATION):
+                    if destination is not None and d != destination:
+                        continue
+                    yield {**bindings, self.edge_name: e, self.source_name: s, self.destination_name: d}
+
+
+class _PropertyStep:
+
+    def __init__(self, subject_name: str, property_uri: str, object_name: str):
+        self.subject_name = subject_name
+        self.property_uri = URIRef(property_uri)
+        self.object_name = object_name
+
+    def extend(self, index: GraphSubjectIndex, bindings: Bindings) -> Iterator[Bindings]:
+
+        subject = bindings.get(self.subject_name)
+        obj = bindings.get(self.object_name)
+
+        if subject is not None:
+            for o in index.objects(subject, self.property_uri):
+                if obj is None or o == obj:
+                    yield {**bindings, self.object_name: o}
+        elif obj is not None:
+            for s in index.value_index(self.property_uri).get(obj, ()):
+                yield {**bindings, self.subject_name: s}
+        else:
+            for o, subject_set in index.value_index(self.property_uri).items():
+                for s in subject_set:
+                    yield {**bindings, self.subject_name: s, self.object_name: o}
+
+
+class _Group:
+    """Steps joined together, followed by BIND copies like a SPARQL group."""
+
+    def __init__(self):
+        self.step_list: list = []
+        self.bind_list: List[Tuple[str, str]] = []
+
+    def evaluate(self, index: GraphSubjectIndex, bindings: Bindings) -> Iterator[Bindings]:
+
+        for solution in self._join(0, index, bindings):
+            for source_name, target_name in self.bind_list:
+                value = solution.get(source_name)
+                if value is None:
+                    continue
+                current = solution.get(target_name)
+                if current is None:
+                    solution = {**solution, target_name: value}
+                elif current != value:
+                    break
+            else:
+                yield solution
+
+    def _join(self, position: int, index: GraphSubjectIndex, bindings: Bindings) -> Iterator[Bindings]:
+
+        if position == len(self.step_list):
+            yield bindings
+            return
+
+        for extended in self.step_list[position].extend(index, bindings):
+            yield from self._join(position + 1, index, extended)
+
+
+class _UnionStep:
+
+    def __init__(self, group_list: List[_Group]):
+        self.group_list = group_list
+
+    def extend(self, index: GraphSubjectIndex, bindings: Bindings) -> Iterator[Bindings]:
+        for group in self.group_list:
+            yield from group.evaluate(index, bindings)
+
+
+def _solution_key(solution: Bindings, binding_list: List[str]) -> tuple:
+    return tuple(str(solution[b]) if b in solution else "" for b in binding_list)
+
+
+class MetaQLMemoryExecutor:
+    """Runs MetaQL queries directly over the subject indexes of in-memory graphs.
+
+    The arc tree is compiled into the same pattern the MetaQLSparqlBuilder
+    produces: node constraints become index lookups or filters, edge arcs
+    join on the hasEdgeSource/hasEdgeDestination indexes, OR arc lists
+    become unions.  Solutions are distinct and ordered by the binding list
+    like the ORDER BY of the Virtuoso query, and matching stops once a
+    page is complete.
+    """
+
+    def __init__(self, index_list: List[GraphSubjectIndex]):
+        self.index_list = index_list
+        self._edge_count = 0
+
+    def metaql_select_query(self, select_query: SelectQuery) -> MetaQLResult:
+
+        offset = select_query.get('offset', 0)
+        limit = select_query.get('limit', 10)
+
+        arc: ArcRoot = select_query.get('arc', None)
+
+        if arc is None:
+            return MetaQLResult()
+
+        group = self._compile_select_query(select_query)
+
+        rl = ResultList()
+
+        page, next_cursor, total_count = self._page(select_query, group, 'uri', ['uri'], limit, offset)
+
+        for index, solution in page:
+            uri = solution.get('uri')
+            graph_object = index.get_object(uri) if uri is not None else None
+            if graph_object is not None:
+                rl.add_result(graph_object, 1.0)
+
+        return MetaQLResult(
+            offset=offset,
+            limit=limit,
+            total_result_count=len(rl) if total_count is None else total_count,
+            next_cursor=next_cursor,
+            result_list=rl
+        )
+
+    def metaql_graph_query(self, graph_query: GraphQuery) -> MetaQLResult:
+
+        offset = graph_query.get('offset', 0)
+        limit = graph_query.get('limit', 100)
+
+        group, root_name, binding_list = self._compile_graph_query(graph_query)
+
+        result_object_map = {}
+
+        rl = ResultList()
+
+        count = 0
+
+        page, next_cursor, total_count = self._page(graph_query, group, root_name, binding_list, limit, offset)
+
+        for index, solution in page:
+
+            count += 1
+
+            gm = GraphMatch()
+            gm.URI = URIGenerator.generate_uri()
+
+            for binding in binding_list:
+
+                value = solution.get(binding)
+
+                if value is None:
+                    continue
+
+                gm.set_property(binding, str(value))
+
+                if isinstance(value, URIRef) and str(value) not in result_object_map:
+                    graph_object = index.get_object(value)
+                    if graph_object is not None:
+                        result_object_map[str(value)] = graph_object
+
+            rl.add_result(gm, 1.0)
+
+        return MetaQLResult(
+            offset=offset,
+            limit=limit,
+            total_result_count=count if total_count is None else total_count,
+            next_cursor=next_cursor,
+            binding_list=binding_list,
+            result_list=rl,
+            result_object_list=list(result_object_map.values())
+        )
+
+    def metaql_aggregate_query(self, aggregate_query: AggregateSelectQuery | AggregateGraphQuery) -> MetaQLResult:
+        """Compute the aggregate of an aggregate select or graph query.
+
+        Like the Virtuoso query, each node bound to the aggregate binding
+        counts once, or each distinct (node, value) pair when the aggregate
+        has a property, over all the matches in all the graphs.
+        """
+
+        aggregate = aggregate_query.get('aggregate', None)
+
+        get_aggregate_type(aggregate)
+
+        if aggregate_query.get('metaql_class', None) == 'AggregateSelectQuery':
+            group = self._compile_select_query(aggregate_query)
+            binding = 'uri'
+        else:
+            group, root_name, binding_list = self._compile_graph_query(aggregate_query)
+            binding = aggregate.get('binding', None) or root_name
+
+        property_uri = aggregate.get('property_uri', None)
+
+        property_uri = URIRef(property_uri) if property_uri else None
+
+        node_set = set()
+
+        value_set = set()
+
+        for index in self.index_list:
+            for solution in group.evaluate(index, {}):
+                node = solution.get(binding)
+                if node is None:
+                    continue
+                if property_uri is None:
+                    node_set.add(node)
+                elif node not in node_set:
+                    node_set.add(node)
+                    for value in index.objects(node, property_uri):
+                        value_set.add((node, value))
+            if property_uri is not None:
+                # the values of a node in the next graph are its own
+                node_set.clear()
+
+        if property_uri is None:
+            value_list = list(node_set)
+        else:
+            value_list = [value.toPython() for _, value in value_set]
+
+        return build_aggregation_result(aggregate, aggregate_values(aggregate, value_list))
+
+    def _compile_select_query(self, select_query: SelectQuery) -> _Group:
+
+        arc: ArcRoot = select_query.get('arc', None)
+
+        # the select query joins all the class and string constraints of the root
+        constraint_list = []
+
+        for cl in arc.get('constraint_list_list', []):
+            for constraint in cl.get('constraint_list', []):
+                metaql_class = constraint.get('metaql_class')
+                if metaql_class == 'NodeConstraint':
+                    constraint_list.append(_ClassConstraint([constraint.get('class_uri')]))
+                if metaql_class == 'StringPropertyConstraint':
+                    constraint_list.append(_StringConstraint(constraint.get('property_uri'),
+                                                             constraint.get('string_value')))
+
+        group = _Group()
+        group.step_list.append(_NodeStep('uri', [_ConstraintGroup(constraint_list, False)]))
+
+        return group
+
+    def _compile_graph_query(self, graph_query: GraphQuery) -> Tuple[_Group, str, List[str]]:
+
+        arc_root: ArcRoot = graph_query.get('arc', None)
+
+        node_binding = arc_root.get('node_binding', None) if arc_root else None
+
+        if node_binding is None:
+            raise ValueError("MetaQL graph query requires a root arc with a node binding.")
+
+        root_name = node_binding.get('binding')
+
+        # binding names in the order the sparql builder adds them
+        binding_map: Dict[str, None] = {}
+
+        self._edge_count = 0
+
+        group = _Group()
+
+        self._add_arc_bindings(arc_root, binding_map)
+
+        group.step_list.append(self._node_step(root_name, arc_root))
+
+        arc: Arc | None = arc_root.get('arc', None)
+
+        if arc:
+            self._compile_arc(arc, group, binding_map, root_name)
+
+        self._compile_arclist_list(arc_root.get('arclist_list', None) or [], group, binding_map, root_name)
+
+        return group, root_name, list(binding_map)
+
+    def _solution_page(self, group: _Group, root_name: str, binding_list: List[str],
+                       limit: int, offset: int,
+                       after: tuple | None = None) -> List[Tuple[GraphSubjectIndex, Bindings]]:
+
+        # each graph is matched separately, as the Virtuoso service does,
+        # and a solution found in several graphs is kept once.
+        # with a cursor only the solutions after it are kept
+
+        def solution_key(solution: Bindings) -> tuple:
+            return _solution_key(solution, binding_list)
+
+        def after_cursor(key: tuple) -> bool:
+            return after is None or key > after
+
+        early_stop = bool(binding_list) and binding_list[0] == root_name
+
+        solution_map = {}
+
+        for index in self.index_list:
+
+            graph_solution_map = {}
+
+            root_step: _NodeStep = group.step_list[0]
+
+            candidates = root_step.candidates(index) if early_stop else None
+
+            if candidates is None:
+                for solution in group.evaluate(index, {}):
+                    key = solution_key(solution)
+                    if after_cursor(key):
+                        graph_solution_map.setdefault(key, solution)
+            else:
+                # roots in order, every solution of a root sorts before the next root
+                for root in sorted(candidates, key=str):
+                    if after is not None and str(root) < after[0]:
+                        continue
+                    for solution in group.evaluate(index, {root_name: root}):
+                        key = solution_key(solution)
+                        if after_cursor(key):
+                            graph_solution_map.setdefault(key, solution)
+                    if len(graph_solution_map) >= offset + limit:
+                        break
+
+            for key in sorted(graph_solution_map)[:offset + limit]:
+                solution_map.setdefault(key, (index, graph_solution_map[key]))
+
+        return [solution_map[key] for key in sorted(solution_map)[offset:offset + limit]]
+
+    def _solution_count(self, group: _Group, binding_list: List[str]) -> int:
+        """The number of distinct solutions over all the graphs."""
+
+        key_set = set()
+
+        for index in self.index_list:
+            for solution in group.evaluate(index, {}):
+                key_set.add(_solution_key(solution, binding_list))
+
+        return len(key_set)
+
+    def _page(self, metaql_query: SelectQuery | GraphQuery, group: _Group, root_name: str,
+              binding_list: List[str], limit: int, offset: int):
+        """The page of solutions of a query, the cursor after it and the total count if requested."""
+
+        cursor = metaql_query.get('cursor', None)
+
+        after = None
+
+        if cursor:
+            after = tuple(decode_cursor(cursor))
+            if len(after) != len(binding_list):
+                raise ValueError("MetaQL cursor does not match the query bindings.")
+            offset = 0
+
+        page = self._solution_page(group, root_name, binding_list, limit, offset, after)
+
+        key_list = [_solution_key(solution, binding_list) for _, solution in page]
+
+        total_count = None
+
+        if metaql_query.get('total_count', False):
+            total_count = self._solution_count(group, binding_list)
+
+        return page, cursor_after(key_list, limit), total_count
+
+    @staticmethod
+    def _add_arc_bindings(arc: Arc | ArcRoot, binding_map: Dict[str, None]):
+        for binding_type in ('node_binding', 'edge_binding', 'path_binding', 'solution_binding'):
+            binding = arc.get(binding_type, None)
+            if binding:
+                binding_map.setdefault(binding.get('binding'), None)
+
+    @staticmethod
+    def _node_step(name: str, arc: Arc | ArcRoot) -> _NodeStep:
+
+        # the constraints translated by the sparql builder, others are skipped there as well
+
+        group_list = []
+
+        constraint_list_list: List[MetaQLConstraintList] = arc.get('constraint_list_list', None) or []
+
+        for metaql_constraint_list in constraint_list_list:
+
+            metaql_class = metaql_constraint_list.get('metaql_class', None)
+
+            if metaql_class not in ('AndConstraintList', 'OrConstraintList'):
+                continue
+
+            constraint_list = []
+
+            for constraint in metaql_constraint_list.get('constraint_list', None) or []:
+
+                constraint_class = constraint.get('metaql_class', None)
+
+                if constraint_class == "NodeConstraint":
+
+                    class_uri = constraint.get('class_uri', None)
+
+                    if constraint.get('include_subclasses', False):
+                        from vital_ai_vitalsigns.vitalsigns import VitalSigns
+                        class_uri_list = VitalSigns().get_ontology_manager().get_subclass_uri_list(class_uri)
+                    else:
+                        class_uri_list = [class_uri]
+
+                    constraint_list.append(_ClassConstraint(class_uri_list))
+
+                if constraint_class == "URIPropertyConstraint":
+                    constraint_list.append(_ValueConstraint(constraint.get('property_uri', None),
+                                                            URIRef(constraint.get('uri_value', None))))
+
+                if constraint_class == "StringPropertyConstraint":
+                    constraint_list.append(_StringConstraint(constraint.get('property_uri'),
+                                                             constraint.get('string_value')))
+
+            group_list.append(_ConstraintGroup(constraint_list, metaql_class == 'OrConstraintList'))
+
+        return _NodeStep(name, group_list)
+
+    def _compile_arc(self, arc: Arc, group: _Group, binding_map: Dict[str, None], parent_name: str):
+
+        self._add_arc_bindings(arc, binding_map)
+
+        node_binding = arc.get('node_binding', None)
+
+        if node_binding is None:
+            raise ValueError("MetaQL arc requires a node binding.")
+
+        name = node_binding.get('binding')
+
+        edge_binding = arc.get('edge_binding', None)
+        path_binding = arc.get('path_binding', None)
+        solution_binding = arc.get('solution_binding', None)
+
+        arc_traverse_type = arc.get('arc_traverse_type', None)
+
+        reverse = arc.get('arc_direction_type', None) == ARC_DIRECTION_TYPE_REVERSE
+
+        if arc_traverse_type == ARC_TRAVERSE_TYPE_EDGE:
+
+            if edge_binding:
+                edge_name = edge_binding.get('binding')
+            else:
+                self._edge_count += 1
+                edge_name = f"_edge_{self._edge_count}"
+
+            if reverse:
+                group.step_list.append(_EdgeStep(edge_name, name, parent_name))
+            else:
+                group.step_list.append(_EdgeStep(edge_name, parent_name, name))
+
+        if arc_traverse_type == ARC_TRAVERSE_TYPE_PROPERTY:
+
+            property_path = arc.get('property_path_list_list')[0][0]
+
+            property_uri = property_path.get('property_uri', None)
+
+            if reverse:
+                group.step_list.append(_PropertyStep(name, property_uri, parent_name))
+            else:
+                group.step_list.append(_PropertyStep(parent_name, property_uri, name))
+
+            if path_binding:
+                group.bind_list.append((name if reverse else parent_name, path_binding.get('binding')))
+
+        group.step_list.append(self._node_step(name, arc))
+
+        sub_arc: Arc | None = arc.get('arc', None)
+
+        if sub_arc:
+            self._compile_arc(sub_arc, group, binding_map, name)
+
+        self._compile_arclist_list(arc.get('arclist_list', None) or [], group, binding_map, name)
+
+        if solution_binding:
+            group.bind_list.append((name, solution_binding.get('binding')))
+
+    def _compile_arclist_list(self, arclist_list: List[MetaQLArcList], group: _Group,
+                              binding_map: Dict[str, None], parent_name: str):
+
+        for arclist in arclist_list:
+
+            metaql_class = arclist.get('metaql_class', None)
+
+            if metaql_class == 'OrArcList':
+                self._compile_or_arc_list(arclist, group, binding_map, parent_name)
+
+            if metaql_class == 'AndArcList':
+                self._compile_and_arc_list(arclist, group, binding_map, parent_name)
+
+    def _compile_and_arc_list(self, arclist: MetaQLArcList, group: _Group,
+                              binding_map: Dict[str, None], parent_name: str):
+
+        for arc in arclist.get('arc_list', None) or []:
+            self._compile_arc(arc, group, binding_map, parent_name)
+
+        self._compile_arclist_list(arclist.get('arclist_list', None) or [], group, binding_map, parent_name)
+
+    def _compile_or_arc_list(self, arclist: MetaQLArcList, group: _Group,
+                             binding_map: Dict[str, None], parent_name: str):
+
+        # as in the sparql builder, arcs directly in the list are joined and
+        # each AND arc list within it is one alternative of the union
+
+        for arc in arclist.get('arc_list', None) or []:
+            self._compile_arc(arc, group, binding_map, parent_name)
+
+        union_group_list = []
+
+        union_binding_map_list = []
+
+        for sub_arclist in arclist.get('arclist_list', None) or []:
+
+            metaql_class = sub_arclist.get('metaql_class', None)
+
+            if metaql_class == 'OrArcList':
+                self._compile_or_arc_list(sub_arclist, group, binding_map, parent_name)
+
+            if metaql_class == 'AndArcList':
+                union_group = _Group()
+                union_binding_map = {}
+                self._compile_and_arc_list(sub_arclist, union_group, union_binding_map, parent_name)
+                union_group_list.append(union_group)
+                union_binding_map_list.append(union_binding_map)
+
+        if union_group_list:
+            group.step_list.append(_UnionStep(union_group_list))
+
+        for union_binding_map in union_binding_map_list:
+            for binding in union_binding_map:
+                binding_map.setdefault(binding, None)
@@ -0,0 +1,91 @@
+import base64
+import binascii
+import json
+from typing import List, Sequence
+from rdflib import Literal
+
+
+COUNT_BINDING = "total_count"
+COUNT_GRAPH_BINDING = "count_graph"
+
+
+# A cursor is the binding values of the last solution of a page, in
+# binding order.  Solutions are ordered by the string values of their
+# bindings, so the next page is the solutions after the cursor and is
+# found with a filter instead of an offset.
+
+def encode_cursor(value_list: Sequence[str]) -> str:
+
+    data = json.dumps([str(value) for value in value_list], separators=(',', ':'))
+
+    return base64.urlsafe_b64encode(data.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> List[str]:
+
+    try:
+        value_list = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8"))
+    except (binascii.Error, UnicodeError, ValueError):
+        raise ValueError(f"Invalid MetaQL cursor: {cursor!r}")
+
+    if not isinstance(value_list, list) or not all(isinstance(value, str) for value in value_list):
+        raise ValueError(f"Invalid MetaQL cursor: {cursor!r}")
+
+    return value_list
+
+
+def cursor_after(key_list: List[tuple], limit: int) -> str | None:
+    """The cursor after a page of solution keys, None when it is the last page."""
+
+    if not key_list or len(key_list) < limit:
+        return None
+
+    return encode_cursor(max(key_list))
+
+
+def build_cursor_filter(variable_list: List[str], value_list: List[str]) -> str:
+    """A FILTER for the solutions ordered after value_list."""
+
+    if len(variable_list) != len(value_list):
+        raise ValueError("MetaQL cursor does not match the query bindings.")
+
+    condition = ""
+
+    # compared as a tuple, innermost binding last
+    for variable, value in reversed(list(zip(variable_list, value_list))):
+
+        literal = Literal(value).n3()
+
+        if condition:
+            condition = f"(STR({variable}) > {literal} || (STR({variable}) = {literal} && {condition}))"
+        else:
+            condition = f"STR({variable}) > {literal}"
+
+    return f"FILTER ({condition})"
+
+
+def build_count_sparql(*,
+                       prefix_section: str,
+                       graph_uri_list: List[str],
+                       query_string: str,
+                       variable_list: List[str]) -> str:
+    """A SELECT counting the distinct solutions of a pattern across graphs."""
+
+    graph_values = " ".join(f"<{graph_uri}>" for graph_uri in graph_uri_list)
+
+    variables = " ".join(variable_list)
+
+    return f"""
+{prefix_section}
+
+SELECT (COUNT(*) AS ?{COUNT_BINDING}) WHERE {{
+    {{
+        SELECT DISTINCT {variables} WHERE {{
+            VALUES ?{COUNT_GRAPH_BINDING} {{ {graph_values} }}
+            GRAPH ?{COUNT_GRAPH_BINDING} {{
+                {query_string}
+            }}
+        }}
+    }}
+}}
+"""
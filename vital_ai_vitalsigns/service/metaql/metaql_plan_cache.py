@@ -0,0 +1,189 @@
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+from vital_ai_vitalsigns.metaql.metaql_query import MetaQLQuery
+from vital_ai_vitalsigns.service.metaql.metaql_sparql_builder import MetaQLSparqlBuilder
+from vital_ai_vitalsigns.service.metaql.metaql_sparql_impl import MetaQLSparqlImpl
+
+
+# constraint values the builder writes into the query text,
+# the rest of the query dict is the shape of the plan
+_STRING_PARAMETER = 'string_value'
+_URI_PARAMETER = 'uri_value'
+
+# query level values that are carried on the MetaQLSparqlImpl
+# and not in the terms
+_QUERY_PARAMETERS = ('limit', 'offset', 'resolve_objects', 'graph_uri_list', 'graph_id_list', 'cursor', 'total_count')
+
+_PLACEHOLDER_PATTERN = re.compile(r"__metaql_param_(\d+)__")
+
+# characters not allowed in a SPARQL IRIREF
+_INVALID_URI_PATTERN = re.compile(r'[<>"{}|^`\\\x00-\x20]')
+
+_STRING_ESCAPES = {
+    '\\': '\\\\',
+    '"': '\\"',
+    '\n': '\\n',
+    '\r': '\\r',
+    '\t': '\\t',
+}
+
+
+def _escape_string(value: str) -> str:
+    return "".join(_STRING_ESCAPES.get(c, c) for c in str(value))
+
+
+def _check_uri(value: str) -> str:
+    value = str(value)
+    if _INVALID_URI_PATTERN.search(value):
+        raise ValueError(f"Invalid URI value in MetaQL query: {value!r}")
+    return value
+
+
+class _SparqlPlan:
+
+    __slots__ = ('arc_constraint_list', 'bind_constraint_list', 'filter_list',
+                 'binding_list', 'root_binding')
+
+    def __init__(self, sparql_impl: MetaQLSparqlImpl):
+        self.arc_constraint_list: List[str] = list(sparql_impl.get_arc_constraint_list())
+        self.bind_constraint_list: List[str] = list(sparql_impl.get_bind_constraint_list())
+        self.filter_list: List[str] = list(sparql_impl.get_filter_list())
+        self.binding_list: List[str] = sparql_impl.get_binding_list()
+        self.root_binding: str | None = sparql_impl.get_root_binding()
+
+
+class MetaQLPlanCache:
+    """LRU cache of compiled MetaQL graph query plans.
+
+    Queries are keyed by a hash of their shape: the query dict with the
+    string and URI constraint values, limit, offset and graph lists taken
+    out.  A plan holds the SPARQL terms built for the shape with
+    placeholders where the values go, and the values of each query are
+    substituted in, strings escaped and URIs checked, so queries that
+    differ only in their values are built once.
+
+    Plans capture the subclass lists of include_subclasses constraints,
+    so the cache should be cleared when the ontologies change.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._plans: OrderedDict[str, _SparqlPlan] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def build_sparql(self, metaql_query: MetaQLQuery, **kwargs) -> MetaQLSparqlImpl | None:
+
+        if metaql_query.get('metaql_class', None) not in ('GraphQuery', 'AggregateGraphQuery'):
+            return MetaQLSparqlBuilder().build_sparql(metaql_query, **kwargs)
+
+        parameter_list: List[Tuple[str, str]] = []
+
+        shape = {k: self._shape(v, parameter_list) for k, v in metaql_query.items() if k not in _QUERY_PARAMETERS}
+
+        key = hashlib.sha256(
+            json.dumps(shape, sort_keys=True, separators=(',', ':'), default=str).encode('utf-8')).hexdigest()
+
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is not None:
+                self._plans.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if plan is None:
+
+            # build the shape with the placeholders in place of the values
+            template_query = dict(shape)
+
+            for name in _QUERY_PARAMETERS:
+                if name in metaql_query:
+                    template_query[name] = metaql_query[name]
+
+            plan = _SparqlPlan(MetaQLSparqlBuilder().build_sparql(template_query, **kwargs))
+
+            with self._lock:
+                self._plans[key] = plan
+                self._plans.move_to_end(key)
+                while len(self._plans) > self.maxsize:
+                    self._plans.popitem(last=False)
+
+        return self._bind(plan, metaql_query, parameter_list)
+
+    def _shape(self, value, parameter_list: List[Tuple[str, str]]):
+
+        if isinstance(value, dict):
+            shape = {}
+            for k, v in value.items():
+                if k in (_STRING_PARAMETER, _URI_PARAMETER) and isinstance(v, str):
+                    shape[k] = f"__metaql_param_{len(parameter_list)}__"
+                    parameter_list.append((k, v))
+                else:
+                    shape[k] = self._shape(v, parameter_list)
+            return shape
+
+        if isinstance(value, (list, tuple)):
+            return [self._shape(v, parameter_list) for v in value]
+
+        return value
+
+    @staticmethod
+    def _bind(plan: _SparqlPlan, metaql_query: MetaQLQuery,
+              parameter_list: List[Tuple[str, str]]) -> MetaQLSparqlImpl:
+
+        value_list = []
+
+        for name, value in parameter_list:
+            if name == _URI_PARAMETER:
+                value_list.append(_check_uri(value))
+            else:
+                value_list.append(_escape_string(value))
+
+        def substitute(term: str) -> str:
+            return _PLACEHOLDER_PATTERN.sub(lambda m: value_list[int(m.group(1))], term)
+
+        sparql_impl = MetaQLSparqlImpl()
+
+        sparql_impl.set_limit(metaql_query.get('limit', None))
+        sparql_impl.set_offset(metaql_query.get('offset', None))
+        sparql_impl.set_resolve_objects(metaql_query.get('resolve_objects', None))
+        sparql_impl.set_graph_uri_list(metaql_query.get('graph_uri_list', None))
+        sparql_impl.set_graph_id_list(metaql_query.get('graph_id_list', None))
+
+        if plan.root_binding is not None:
+            sparql_impl.set_root_binding(plan.root_binding)
+
+        for binding in plan.binding_list:
+            sparql_impl.add_binding(binding)
+
+        for term in plan.arc_constraint_list:
+            sparql_impl.add_arc_constraint(substitute(term))
+
+        for term in plan.bind_constraint_list:
+            sparql_impl.add_bind_constraint(substitute(term))
+
+        for term in plan.filter_list:
+            sparql_impl.add_filter(substitute(term))
+
+        return sparql_impl
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._plans),
+                'maxsize': self.maxsize
+            }
+
+    def clear(self):
+        with self._lock:
+            self._plans.clear()
+            self.hits = 0
+            self.misses = 0
@@ -15,13 +15,13 @@ from vital_ai_vitalsigns.vitalsigns import VitalSigns
 
 class MetaQLSparqlBuilder:
 
-    # switch to instance variables
     root_arc_id = 0
-    current_arc_id: int = 1
 
-    global_term_id: int = 1
-
-    binding_map: Dict[int,str] = {}
+    def __init__(self):
+        # per build state, the builder is used from several threads
+        self.current_arc_id: int = 1
+        self.global_term_id: int = 1
+        self.binding_map: Dict[int, str] = {}
 
     # idea to implement the OR-case optimization
     # generate list of terms within the deepest OR
@@ -74,7 +74,8 @@ class MetaQLSparqlBuilder:
             # TODO
             pass
 
-        if metaql_class == 'GraphQuery':
+        # an aggregate graph query matches the same pattern
+        if metaql_class in ('GraphQuery', 'AggregateGraphQuery'):
 
             sparql_impl = MetaQLSparqlImpl()
 
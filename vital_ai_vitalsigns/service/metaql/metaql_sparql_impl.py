@@ -1,4 +1,4 @@
-from typing import List, Set
+from typing import Dict, List
 
 
 class MetaQLSparqlImpl:
@@ -7,7 +7,8 @@ class MetaQLSparqlImpl:
 
         self._filter_list: List[str] = []
         self._constraint_list: List[str] = []
-        self._binding_list: Set[str] = set()
+        # insertion ordered, the root binding first
+        self._binding_list: Dict[str, None] = {}
         self._bind_constraint_list: List[str] = []
         self._limit: int = 0
         self._offset: int = 0
@@ -71,10 +72,10 @@ class MetaQLSparqlImpl:
         return self._bind_constraint_list
 
     def add_binding(self, binding: str):
-        self._binding_list.add(binding)
+        self._binding_list.setdefault(binding, None)
 
-    def get_binding_list(self) -> Set[str]:
-        return self._binding_list
+    def get_binding_list(self) -> List[str]:
+        return list(self._binding_list)
 
 
 
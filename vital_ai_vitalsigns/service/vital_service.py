@@ -426,7 +426,7 @@ class VitalService(BaseService):
               account_id: str | None = None,
               global_graph: bool = False,
               resolve_objects=True) -> ResultList:
-        return self.graph_service.query(sparql_query, graph_id, uri_binding,
+        return self.graph_service.query(graph_id, sparql_query, uri_binding,
                                         global_graph=global_graph,
                                         account_id=account_id,
                                         resolve_objects=resolve_objects)
@@ -3,6 +3,8 @@ import weakref
 import json
 from typing import List, TypeVar, Generator, Tuple, Optional, Set
 from vital_ai_vitalsigns.impl.vitalsigns_registry import VitalSignsRegistry
+from vital_ai_vitalsigns.impl.graph_object_tracker import GraphObjectTracker, GraphObjectTrackingPolicy
+from vital_ai_vitalsigns.impl.vitalsigns_snapshot import VitalSignsSnapshotCache
 from vital_ai_vitalsigns.collection.graph_collection import GraphCollection
 from vital_ai_vitalsigns.model.GraphObject import GraphObject
 import threading
@@ -10,7 +12,8 @@ import time
 from vital_ai_vitalsigns.ontology.vitalsigns_ontology_manager import VitalSignsOntologyManager
 from vital_ai_vitalsigns.service.vitalservice_manager import VitalServiceManager
 from vital_ai_vitalsigns.utils.find_vitalhome import find_vitalhome
-from vital_ai_vitalsigns.config.vitalsigns_config import VitalSignsConfigLoader, VitalSignsConfig
+from vital_ai_vitalsigns.config.vitalsigns_config import VitalSignsConfigLoader, VitalSignsConfig, RegistrySnapshotConfig, \
+    RegistryConfig
 import os
 
 
@@ -35,22 +38,33 @@ class VitalSigns(metaclass=VitalSignsMeta):
 
         os.environ['TRANSFORMERS_NO_ADVISORY_WARNINGS'] = '1'
 
+        vital_home = find_vitalhome()
+
+        self._vital_home = vital_home
+
+        self._vitalsigns_config = VitalSignsConfigLoader.vitalsigns_load_config(vital_home)
+
         self._ont_manager = VitalSignsOntologyManager()
         self._registry = VitalSignsRegistry(ontology_manager=self._ont_manager)
         self._embedding_model_registry = {}
-        self._registry.build_registry()
+
+        registry_config = self._vitalsigns_config.registry or RegistryConfig()
+
+        self._registry.build_registry(snapshot_cache=self._get_snapshot_cache(),
+                                      lazy_import=registry_config.lazy_import)
+
         self._graph_collection_map = {}
-        self._graph_object_map = {}
+        self._graph_object_tracker = GraphObjectTracker(GraphObjectTrackingPolicy.FULL)
         self._vitalsigns_lock = threading.RLock()
         self._background_thread = None
         self._running = False
 
+        tracking_config = self._vitalsigns_config.graph_object_tracking
 
-        vital_home = find_vitalhome()
-
-        self._vital_home = vital_home
-
-        self._vitalsigns_config = VitalSignsConfigLoader.vitalsigns_load_config(vital_home)
+        if tracking_config:
+            self.set_graph_object_tracking(tracking_config.policy, sample_interval=tracking_config.sample_interval)
+        else:
+            self._graph_object_tracker.activate()
 
         # Use the new VitalServiceManager constructor with full config
         self._vitalservice_manager = VitalServiceManager(vitalsigns_config=self._vitalsigns_config)
@@ -60,9 +74,17 @@ class VitalSigns(metaclass=VitalSignsMeta):
         if background_task:
             self.start()
 
+    def _get_snapshot_cache(self) -> VitalSignsSnapshotCache | None:
+
+        snapshot_config = self._vitalsigns_config.registry_snapshot or RegistrySnapshotConfig()
+
+        if not snapshot_config.enabled:
+            return None
+
+        return VitalSignsSnapshotCache.for_vital_home(self._vital_home, snapshot_config.cache_dir)
+
     def cleanup_task(self):
         with self._vitalsigns_lock:
-            self.clean_graph_object_map()
             self.clean_graph_collection_map()
             self.gc()
 
@@ -123,24 +145,25 @@ class VitalSigns(metaclass=VitalSignsMeta):
         """Retrieve a model instance from the registry by its name."""
         return self._embedding_model_registry.get(name)
 
-    def include_graph_object(self, graph_object: G):
-        go_id = id(graph_object)
+    def set_graph_object_tracking(self, policy: str, *, sample_interval: int = 100):
+        """Set the policy for tracking live graph objects: off, sampled, or full."""
+        tracker = GraphObjectTracker(policy, sample_interval=sample_interval)
+        self._graph_object_tracker = tracker
+        tracker.activate()
 
-        weak_obj = weakref.ref(graph_object)
+    def get_graph_object_tracker(self) -> GraphObjectTracker:
+        return self._graph_object_tracker
 
-        self._graph_object_map[go_id] = weak_obj
+    def include_graph_object(self, graph_object: G):
+        self._graph_object_tracker.track(graph_object)
 
     def remove_graph_object(self, graph_object: G):
-        go_id = id(graph_object)
-        del self._graph_object_map[go_id]
+        self._graph_object_tracker.untrack(graph_object)
 
     def clean_graph_object_map(self):
-        try:
-            dead_keys = [key for key, weak_obj in self._graph_object_map.items() if weak_obj() is None]
-            for key in dead_keys:
-                del self._graph_object_map[key]
-        except RuntimeError as e:
-            pass
+        """No-op, kept for callers: the graph object tracker holds weak references,
+        so collected objects drop out on their own without a sweep."""
+        pass
 
     def include_graph_collection(self, graph_collection: GraphCollection):
         gc_id = id(graph_collection)
@@ -204,10 +227,4 @@ class VitalSigns(metaclass=VitalSignsMeta):
         return json.dumps(json_list, indent=2)
 
     def to_rdf(self, graph_object_list: List[G]) -> str:
-        rdf_strings = []
-
-        for obj in graph_object_list:
-            rdf_data = obj.to_rdf()
-            rdf_strings.append(rdf_data)
-
-        return "\n".join(rdf_strings)
+        return GraphObject.to_rdf_list(graph_object_list)
@@ -14,6 +14,8 @@ from vital_ai_vitalsigns.model.VITAL_Node import VITAL_Node
 
 
 class Dataset(VITAL_Node):
+    __slots__ = ()
+
     _allowed_properties = [
         {'uri': 'http://vital.ai/ontology/vital-core#hasDateRetrieved', 'prop_class': DateTimeProperty}, 
         {'uri': 'http://vital.ai/ontology/vital-core#hasSourceName', 'prop_class': StringProperty}, 
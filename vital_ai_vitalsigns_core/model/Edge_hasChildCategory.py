@@ -14,6 +14,8 @@ from vital_ai_vitalsigns_core.model.VITAL_TaxonomyEdge import VITAL_TaxonomyEdge
 
 
 class Edge_hasChildCategory(VITAL_TaxonomyEdge):
+    __slots__ = ()
+
     _allowed_properties = [
     ]
 
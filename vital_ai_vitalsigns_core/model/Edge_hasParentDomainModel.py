@@ -14,6 +14,8 @@ from vital_ai_vitalsigns_core.model.VITAL_PeerEdge import VITAL_PeerEdge
 
 
 class Edge_hasParentDomainModel(VITAL_PeerEdge):
+    __slots__ = ()
+
     _allowed_properties = [
     ]
 
@@ -14,6 +14,8 @@ from vital_ai_vitalsigns_core.model.DatabaseConnection import DatabaseConnection
 
 
 class SparqlDatabaseConnection(DatabaseConnection):
+    __slots__ = ()
+
     _allowed_properties = [
         {'uri': 'http://vital.ai/ontology/vital-core#hasCatalogName', 'prop_class': StringProperty}, 
         {'uri': 'http://vital.ai/ontology/vital-core#hasRepositoryName', 'prop_class': StringProperty}, 
@@ -14,6 +14,8 @@ from vital_ai_vitalsigns_core.model.DatabaseConnection import DatabaseConnection
 
 
 class SqlDatabaseConnection(DatabaseConnection):
+    __slots__ = ()
+
     _allowed_properties = [
         {'uri': 'http://vital.ai/ontology/vital-core#hasDatabase', 'prop_class': StringProperty}, 
     ]
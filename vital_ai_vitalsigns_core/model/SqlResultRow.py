@@ -14,6 +14,8 @@ from vital_ai_vitalsigns.model.VITAL_GraphContainerObject import VITAL_GraphCont
 
 
 class SqlResultRow(VITAL_GraphContainerObject):
+    __slots__ = ()
+
     _allowed_properties = [
     ]
 
@@ -14,6 +14,8 @@ from vital_ai_vitalsigns.model.VITAL_Node import VITAL_Node
 
 
 class VITAL_Category(VITAL_Node):
+    __slots__ = ()
+
     _allowed_properties = [
     ]
 
@@ -14,6 +14,8 @@ from vital_ai_vitalsigns_core.model.VITAL_Query import VITAL_Query
 
 
 class VITAL_PathQuery(VITAL_Query):
+    __slots__ = ()
+
     _allowed_properties = [
     ]
 
@@ -14,6 +14,8 @@ from vital_ai_vitalsigns.model.VITAL_Node import VITAL_Node
 
 
 class VITAL_PayloadNode(VITAL_Node):
+    __slots__ = ()
+
     _allowed_properties = [
         {'uri': 'http://vital.ai/ontology/vital-core#hasSerializedJSON', 'prop_class': StringProperty}, 
         {'uri': 'http://vital.ai/ontology/vital-core#hasSerializedRDF', 'prop_class': StringProperty}, 
@@ -14,6 +14,8 @@ from vital_ai_vitalsigns.model.VITAL_Edge import VITAL_Edge
 
 
 class VITAL_PeerEdge(VITAL_Edge):
+    __slots__ = ()
+
     _allowed_properties = [
     ]
 
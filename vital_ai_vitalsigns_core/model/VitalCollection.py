@@ -14,6 +14,8 @@ from vital_ai_vitalsigns.model.VITAL_Node import VITAL_Node
 
 
 class VitalCollection(VITAL_Node):
+    __slots__ = ()
+
     _allowed_properties = [
         {'uri': 'http://vital.ai/ontology/vital-core#hasCollectionClassName', 'prop_class': StringProperty}, 
         {'uri': 'http://vital.ai/ontology/vital-core#hasCollectionClassURI', 'prop_class': URIProperty}, 
@@ -14,6 +14,8 @@ from vital_ai_vitalsigns.model.VITAL_Node import VITAL_Node
 
 
 class VitalSegment(VITAL_Node):
+    __slots__ = ()
+
     _allowed_properties = [
         {'uri': 'http://vital.ai/ontology/vital-core#hasSegmentGraphURI', 'prop_class': StringProperty}, 
         {'uri': 'http://vital.ai/ontology/vital-core#hasSegmentID', 'prop_class': StringProperty}, 
@@ -14,6 +14,8 @@ from vital_ai_vitalsigns_core.model.VitalAuthKey import VitalAuthKey
 
 
 class VitalServiceAdminKey(VitalAuthKey):
+    __slots__ = ()
+
     _allowed_properties = [
     ]
 
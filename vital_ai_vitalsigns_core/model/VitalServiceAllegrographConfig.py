@@ -14,6 +14,8 @@ from vital_ai_vitalsigns_core.model.VitalServiceConfig import VitalServiceConfig
 
 
 class VitalServiceAllegrographConfig(VitalServiceConfig):
+    __slots__ = ()
+
     _allowed_properties = [
         {'uri': 'http://vital.ai/ontology/vital-core#hasCatalogName', 'prop_class': StringProperty}, 
         {'uri': 'http://vital.ai/ontology/vital-core#hasPassword', 'prop_class': StringProperty}, 
@@ -14,6 +14,8 @@ from vital_ai_vitalsigns_core.model.VitalServiceConfig import VitalServiceConfig
 
 
 class VitalServiceLuceneDiskConfig(VitalServiceConfig):
+    __slots__ = ()
+
     _allowed_properties = [
         {'uri': 'http://vital.ai/ontology/vital-core#hasRootPath', 'prop_class': StringProperty}, 
     ]
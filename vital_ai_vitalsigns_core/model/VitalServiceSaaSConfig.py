@@ -14,6 +14,8 @@ from vital_ai_vitalsigns_core.model.VitalServiceConfig import VitalServiceConfig
 
 
 class VitalServiceSaaSConfig(VitalServiceConfig):
+    __slots__ = ()
+
     _allowed_properties = [
     ]
 
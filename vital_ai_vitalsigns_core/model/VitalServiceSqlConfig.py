@@ -14,6 +14,8 @@ from vital_ai_vitalsigns_core.model.VitalServiceConfig import VitalServiceConfig
 
 
 class VitalServiceSqlConfig(VitalServiceConfig):
+    __slots__ = ()
+
     _allowed_properties = [
         {'uri': 'http://vital.ai/ontology/vital-core#hasDbType', 'prop_class': StringProperty}, 
         {'uri': 'http://vital.ai/ontology/vital-core#hasEndpointURL', 'prop_class': StringProperty}, 
@@ -14,6 +14,8 @@ from vital_ai_vitalsigns.model.VITAL_Node import VITAL_Node
 
 
 class VitalTransaction(VITAL_Node):
+    __slots__ = ()
+
     _allowed_properties = [
         {'uri': 'http://vital.ai/ontology/vital-core#hasTransactionID', 'prop_class': StringProperty}, 
         {'uri': 'http://vital.ai/ontology/vital-core#hasTransactionState', 'prop_class': StringProperty}, 
@@ -23,16 +23,27 @@ class VitalSignsClassGenerator:
                               parent_class_name: str,
                               class_name: str,
                               class_uri: str,
-                              property_list: list[dict]):
+                              property_list: list[dict],
+                              compact: bool = False):
 
         property_list_string = cls.generate_property_list_string(property_list)
 
+        # compact classes have no instance __dict__ and keep property
+        # values in positional storage, see GraphObject._compact_storage,
+        # the __dict__ is only dropped if every parent class declares
+        # __slots__ too, as the vital model and core model classes do
+        if compact:
+            storage_string = "\n    __slots__ = ()\n    _compact_storage = True\n"
+        else:
+            storage_string = ""
+
         class_string = f"""
 {property_import_string}
 from {parent_class_import} import {parent_class_name}
 
   
 class {class_name}({parent_class_name}):
+{storage_string}
     _allowed_properties = [
 {property_list_string}
     ]
@@ -2,8 +2,8 @@ from vital_ai_vitalsigns_generate.vitalsigns_ontology_generator import VitalSign
 
 
 class VitalSignsCoreGenerator(VitalSignsOntologyGenerator):
-    def __init__(self):
-        pass
+    def __init__(self, compact_storage: bool = False):
+        super().__init__(compact_storage=compact_storage)
 
     def generate(self, iri_to_file_map: dict):
         pass
@@ -6,6 +6,7 @@ import sys
 from owlready2 import get_ontology, onto_path, set_log_level, IRIS, default_world, ObjectProperty, DataProperty, \
     AnnotationProperty, Or, owl, ThingClass, ObjectPropertyClass
 from rdflib import XSD, RDF, OWL, URIRef, RDFS
+from vital_ai_vitalsigns.impl.vitalsigns_manifest import VitalSignsManifest
 from vital_ai_vitalsigns_generate.generate.class_generator import VitalSignsClassGenerator
 from vital_ai_vitalsigns_generate.generate.domain_ontology_class_generator import DomainOntologyClassGenerator
 from vital_ai_vitalsigns_generate.generate.property_trait_generator import VitalSignsPropertyTraitGenerator
@@ -14,8 +15,8 @@ from vital_ai_vitalsigns_generate.vitalsigns_ontology_generator import VitalSign
 
 class VitalSignsDomainListGenerator(VitalSignsOntologyGenerator):
 
-    def __init__(self):
-        pass
+    def __init__(self, compact_storage: bool = False):
+        super().__init__(compact_storage=compact_storage)
 
     def add_init_py(self, directory):
         # Ensure the directory exists
@@ -127,6 +128,10 @@ class VitalSignsDomainListGenerator(VitalSignsOntologyGenerator):
         with open(domain_ontology_file_path, 'w') as file:
             file.write(domain_ontology_class)
 
+        # class and property references for the registry manifest
+        manifest_classes = {}
+        manifest_properties = {}
+
         for ont_prop in ontology_model.properties():
 
             # print(f"Ont Prop: {ont_prop.name}")
@@ -146,6 +151,11 @@ class VitalSignsDomainListGenerator(VitalSignsOntologyGenerator):
             with open(property_trait_file_path, 'w') as file:
                 file.write(prop_trait_code)
 
+            property_trait_class_name = 'Property_' + ont_prop.name
+
+            manifest_properties[ont_prop.namespace.base_iri + ont_prop.name] = \
+                f"{package_name}.model.properties.{property_trait_class_name}:{property_trait_class_name}"
+
         for ont_class in ontology_model.classes():
             # print(f"Class: {ont_class.namespace.base_iri} {ont_class.name}")
             class_code = self.generate_class_code(ontology_list, ontology_model, ont_class)
@@ -162,6 +172,8 @@ class VitalSignsDomainListGenerator(VitalSignsOntologyGenerator):
             with open(class_file_path, 'w') as file:
                 file.write(class_code)
 
+            manifest_classes[ont_class.iri] = f"{package_name}.model.{ont_class.name}:{ont_class.name}"
+
             class_interface_code = self.generate_class_interface_code(ontology_list, ontology_model, ont_class)
             # print(class_interface_code)
 
@@ -176,6 +188,16 @@ class VitalSignsDomainListGenerator(VitalSignsOntologyGenerator):
             with open(class_interface_file_path, 'w') as file:
                 file.write(class_interface_code)
 
+        # lets the registry import the generated modules on first use
+        manifest = VitalSignsManifest(package_name,
+                                      manifest_classes,
+                                      manifest_properties,
+                                      [f"{package_name}.model.DomainOntology:DomainOntology"])
+
+        manifest_path = manifest.write(package_dir_path)
+
+        print(f"Manifest File: {manifest_path}")
+
         for ont_individual in ontology_model.individuals():
             # print(f"Individual: {ont_individual.name}")
             pass
@@ -80,8 +80,9 @@ class VitalSignsGenerator:
     # path to domain list
     # directories to use for resolving ontologies
     # path to output
+    # compact_storage to emit classes with slotted positional storage
 
-    def generate_domain_list(self):
+    def generate_domain_list(self, compact_storage: bool = False):
 
         onto_path.append("../vital_home_test/vital-ontology/")
 
@@ -93,7 +94,7 @@ class VitalSignsGenerator:
 
         print(iri_to_file_map)
 
-        generator = VitalSignsDomainListGenerator()
+        generator = VitalSignsDomainListGenerator(compact_storage=compact_storage)
 
         generator.generate(iri_to_file_map)
 
@@ -0,0 +1,49 @@
+import importlib
+import sys
+from pathlib import Path
+from vital_ai_vitalsigns.impl.vitalsigns_manifest import VitalSignsManifest
+from vital_ai_vitalsigns.impl.vitalsigns_registry import scan_vitalsigns_package_parallel
+
+
+class VitalSignsManifestGenerator:
+
+    def __init__(self):
+        pass
+
+    def create_manifest(self, package_name: str) -> VitalSignsManifest:
+        """Create the manifest of an importable package by scanning all of its modules."""
+
+        package = importlib.import_module(package_name)
+
+        ontologies, classes, properties = scan_vitalsigns_package_parallel(package.__path__, package.__name__)
+
+        # modules also expose the classes they import from other packages
+        prefix = package.__name__ + '.'
+
+        def in_package(cls):
+            return cls.__module__.startswith(prefix)
+
+        return VitalSignsManifest.from_classes(
+            package.__name__,
+            {uri: cls for uri, cls in classes.items() if in_package(cls)},
+            {uri: cls for uri, cls in properties.items() if in_package(cls)},
+            [cls for cls in ontologies if in_package(cls)])
+
+    def generate(self, package_name: str) -> Path:
+
+        manifest = self.create_manifest(package_name)
+
+        package = importlib.import_module(package_name)
+
+        manifest_path = manifest.write(Path(package.__file__).parent)
+
+        print(f"Manifest for {package_name}: {len(manifest.classes)} classes, "
+              f"{len(manifest.properties)} properties: {manifest_path}")
+
+        return manifest_path
+
+
+if __name__ == "__main__":
+    generator = VitalSignsManifestGenerator()
+    for name in sys.argv[1:]:
+        generator.generate(name)
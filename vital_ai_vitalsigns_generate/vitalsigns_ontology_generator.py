@@ -13,8 +13,10 @@ class VitalSignsOntologyGenerator:
     has_multi_values_ann_iri = "http://vital.ai/ontology/vital-core#hasMultipleValues"
     default_package_iri = "http://vital.ai/ontology/vital-core#hasDefaultPackage"
 
-    def __init__(self):
-        pass
+    def __init__(self, compact_storage: bool = False):
+        # emit classes using compact slotted storage, see GraphObject._compact_storage,
+        # which only saves the instance __dict__ when all parent classes are slotted
+        self.compact_storage = compact_storage
 
 
     def is_model_class(self, class_name):
@@ -125,7 +127,8 @@ class VitalSignsOntologyGenerator:
             parent_class_name,
             class_name,
             class_uri,
-            property_list)
+            property_list,
+            compact=self.compact_storage)
 
         return class_code
 